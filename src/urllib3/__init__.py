@@ -17,7 +17,7 @@ from ._collections import HTTPHeaderDict
 from ._version import __version__
 from .connectionpool import HTTPConnectionPool, HTTPSConnectionPool, connection_from_url
 from .filepost import _TYPE_FIELDS, encode_multipart_formdata
-from .poolmanager import PoolManager, ProxyManager, proxy_from_url
+from .poolmanager import PoolManager, ProxyManager, RequestResult, proxy_from_url
 from .response import BaseHTTPResponse, HTTPResponse
 from .util.request import make_headers
 from .util.retry import Retry
@@ -55,6 +55,7 @@ __all__ = (
     "HTTPSConnectionPool",
     "PoolManager",
     "ProxyManager",
+    "RequestResult",
     "HTTPResponse",
     "Retry",
     "Timeout",
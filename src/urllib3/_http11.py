@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import email.parser
+import http.client
+import re
+import typing
+from http.client import HTTPMessage, UnknownProtocol
+
+from ._collections import HTTPHeaderDict
+
+# Same limits as http.client for the length of a line and the number of
+# lines of a response head.
+_MAXLINE: int = http.client._MAXLINE  # type: ignore[attr-defined]
+_MAXHEADERS: int = http.client._MAXHEADERS  # type: ignore[attr-defined]
+
+# A header line which the email package parses into the same name and value.
+# Anything else, like folded lines, lines without a name or characters the
+# email package treats as line breaks, is left to the email package.
+_HEADER_FIELD_RE = re.compile(
+    r"^([!-9;-~]+):[ \t]*([^\r\n\x0b\x0c\x1c-\x1e\x85]*)\r?\n", re.MULTILINE
+)
+
+
+def read_header_block(fp: typing.IO[bytes]) -> bytes:
+    """
+    Reads the header lines of a response head, including the empty line
+    which ends them, with the same limits as :mod:`http.client`.
+
+    If the whole head was received already, it's taken from the read buffer
+    of ``fp`` in one go instead of line by line.
+    """
+    peek = getattr(fp, "peek", None)
+    if peek is not None:
+        data = peek(_MAXLINE)
+        if data.startswith(b"\r\n"):
+            return fp.read(2)
+        if data.startswith(b"\n"):
+            return fp.read(1)
+        ends = [
+            end + size
+            for end, size in ((data.find(b"\n\r\n"), 3), (data.find(b"\n\n"), 2))
+            if end >= 0
+        ]
+        if ends:
+            length = min(ends)
+            if length <= _MAXLINE and data.count(b"\n", 0, length) <= _MAXHEADERS:
+                return fp.read(length)
+
+    lines = []
+    while True:
+        line = fp.readline(_MAXLINE + 1)
+        if len(line) > _MAXLINE:
+            raise http.client.LineTooLong("header line")
+        lines.append(line)
+        if len(lines) > _MAXHEADERS:
+            raise http.client.HTTPException("got more than %d headers" % _MAXHEADERS)
+        if line in (b"\r\n", b"\n", b""):
+            break
+    return b"".join(lines)
+
+
+def parse_header_block(
+    block: bytes,
+) -> tuple[HTTPMessage, HTTPHeaderDict | None]:
+    """
+    Parses the header lines read by :func:`read_header_block`.
+
+    :return:
+        The headers as :class:`http.client.HTTPMessage`, like
+        :func:`http.client.parse_headers` returns them, and as
+        :class:`~urllib3.HTTPHeaderDict`. The latter is ``None`` if the block
+        isn't made up of plain header lines and was parsed by the email
+        package instead, which reports the problems it found as
+        ``defects`` of the message.
+    """
+    text = block.decode("iso-8859-1")
+    fields = _HEADER_FIELD_RE.findall(text)
+    # Every line except the empty one at the end has to be a header field.
+    if len(fields) != text.count("\n") - 1 or not text.endswith("\n"):
+        return email.parser.Parser(_class=HTTPMessage).parsestr(text), None
+
+    msg = HTTPMessage()
+    # What HTTPMessage.set_raw() does for each field.
+    msg._headers = fields  # type: ignore[attr-defined]
+
+    # What HTTPHeaderDict.add() does for each field, without its checks.
+    headers = HTTPHeaderDict()
+    container = headers._container
+    for name, value in fields:
+        values = container.setdefault(name.lower(), [name])
+        values.append(value)
+    return msg, headers
+
+
+class HTTP11Response(http.client.HTTPResponse):
+    """
+    :class:`http.client.HTTPResponse` which parses the response head itself.
+
+    The header lines are matched in one pass over the read buffer and put
+    into an :class:`~urllib3.HTTPHeaderDict` right away, instead of feeding
+    them through the email package line by line. The framing of the body,
+    chunked or by ``Content-Length``, is derived from that dict. The body is
+    read by :class:`http.client.HTTPResponse` as usual.
+    """
+
+    #: The headers of the response, or ``None`` if they weren't plain header
+    #: lines and were left to the email package.
+    header_dict: HTTPHeaderDict | None = None
+
+    def begin(self) -> None:
+        if self.headers is not None:
+            # we've already started reading the response
+            return
+
+        # read until we get a non-100 response
+        while True:
+            version, status, reason = self._read_status()
+            if status != http.client.CONTINUE:
+                break
+            # skip the header from the 100 response
+            skipped_headers = read_header_block(self.fp)
+            if self.debuglevel > 0:
+                print("headers:", skipped_headers.splitlines(keepends=True))
+            del skipped_headers
+
+        self.code = self.status = status
+        self.reason = reason.strip()
+        if version in ("HTTP/1.0", "HTTP/0.9"):
+            # Some servers might still return "0.9", treat it as 1.0 anyway
+            self.version = 10
+        elif version.startswith("HTTP/1."):
+            self.version = 11  # use HTTP/1.1 code for HTTP/1.x where x>=1
+        else:
+            raise UnknownProtocol(version)
+
+        msg, self.header_dict = parse_header_block(read_header_block(self.fp))
+        self.headers = self.msg = msg
+
+        if self.debuglevel > 0:
+            for hdr, val in msg.items():
+                print("header:", hdr + ":", val)
+
+        # are we using the chunked-style of transfer encoding?
+        tr_enc = self._get_header("transfer-encoding")
+        if tr_enc and tr_enc.lower() == "chunked":
+            self.chunked = True
+            self.chunk_left = None
+        else:
+            self.chunked = False
+
+        # will the connection close at the end of the response?
+        self.will_close = self._check_close()
+
+        # do we have a Content-Length?
+        self.length = None
+        length = self._get_header("content-length")
+        if length and not self.chunked:
+            try:
+                self.length = int(length)
+            except ValueError:
+                self.length = None
+            else:
+                if self.length < 0:  # ignore nonsensical negative lengths
+                    self.length = None
+
+        # does the body have a fixed length? (of zero)
+        if (
+            status == http.client.NO_CONTENT
+            or status == http.client.NOT_MODIFIED
+            or 100 <= status < 200  # 1xx codes
+            or self._method == "HEAD"
+        ):
+            self.length = 0
+
+        # if the connection remains open, and we aren't using chunked, and
+        # a content-length was not provided, then assume that the connection
+        # WILL close.
+        if not self.will_close and not self.chunked and self.length is None:
+            self.will_close = True
+
+    def _get_header(self, name: str) -> str | None:
+        # The first value like HTTPMessage.get(), without scanning all lines.
+        if self.header_dict is None:
+            return self.msg.get(name)
+        values = self.header_dict.getlist(name)
+        return values[0] if values else None
+
+    def _check_close(self) -> bool:
+        conn = self._get_header("connection")
+        if self.version == 11:
+            # An HTTP/1.1 proxy is assumed to stay open unless
+            # explicitly closed.
+            return bool(conn and "close" in conn.lower())
+
+        # For older HTTP, Keep-Alive indicates persistent connection.
+        if self._get_header("keep-alive"):
+            return False
+
+        # At least Akamai returns a "Connection: Keep-Alive" header,
+        # which was supposed to be sent by the client.
+        if conn and "keep-alive" in conn.lower():
+            return False
+
+        # Proxy-Connection is a netscape hack.
+        pconn = self._get_header("proxy-connection")
+        if pconn and "keep-alive" in pconn.lower():
+            return False
+
+        # otherwise, assume it will close
+        return True
@@ -8,6 +8,7 @@ import re
 import socket
 import sys
 import threading
+import time
 import typing
 import warnings
 from http.client import HTTPConnection as _HTTPConnection
@@ -21,6 +22,7 @@ if typing.TYPE_CHECKING:
     from .util.ssltransport import SSLTransport
 
 from ._collections import HTTPHeaderDict
+from ._http11 import HTTP11Response
 from .http2 import probe as http2_probe
 from .util.response import assert_header_parsing
 from .util.timeout import _DEFAULT_TIMEOUT, _TYPE_TIMEOUT, Timeout
@@ -51,10 +53,10 @@ from .exceptions import (
     SystemTimeWarning,
 )
 from .util import SKIP_HEADER, SKIPPABLE_HEADERS, connection, ssl_
-from .util.request import body_to_chunks
+from .util.request import body_to_chunks, file_body_length
+from .util.resolver import BaseResolver
 from .util.ssl_ import assert_fingerprint as _assert_fingerprint
 from .util.ssl_ import (
-    create_urllib3_context,
     is_ipaddress,
     resolve_cert_reqs,
     resolve_ssl_version,
@@ -78,6 +80,10 @@ RECENT_DATE = datetime.date(2025, 1, 1)
 
 _CONTAINS_CONTROL_CHAR_RE = re.compile(r"[^-!#$%&'*+.^_`|~0-9a-zA-Z]")
 
+# Up to this size, buffers which can't be sent with one sendmsg() call are
+# joined into one send() instead of being sent one by one.
+_SEND_JOIN_LIMIT = 2**16
+
 
 class HTTPConnection(_HTTPConnection):
     """
@@ -102,6 +108,14 @@ class HTTPConnection(_HTTPConnection):
          ]
 
       Or you may want to disable the defaults by passing an empty list (e.g., ``[]``).
+
+    - ``happy_eyeballs``: Race connection attempts to all addresses the host resolves
+      to as described in :rfc:`8305` instead of trying them one after another. Pass
+      ``True`` to start a new attempt every 250 ms or a number of seconds to use a
+      different delay.
+    - ``resolver``: A :class:`~urllib3.util.resolver.BaseResolver` used to resolve
+      the host instead of :func:`socket.getaddrinfo`, for example a
+      :class:`~urllib3.util.resolver.CachingResolver`.
     """
 
     default_port: typing.ClassVar[int] = port_by_scheme["http"]  # type: ignore[misc]
@@ -116,6 +130,10 @@ class HTTPConnection(_HTTPConnection):
         typing.Final[connection._TYPE_SOCKET_OPTIONS]
     ] = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
 
+    #: Parses the response head without going through the email package,
+    #: see :class:`urllib3._http11.HTTP11Response`.
+    response_class = HTTP11Response
+
     #: Whether this connection verifies the host's certificate.
     is_verified: bool = False
 
@@ -126,12 +144,21 @@ class HTTPConnection(_HTTPConnection):
     blocksize: int
     source_address: tuple[str, int] | None
     socket_options: connection._TYPE_SOCKET_OPTIONS | None
+    happy_eyeballs: bool | float
+    resolver: BaseResolver | None
 
     _has_connected_to_proxy: bool
     _response_options: _ResponseOptions | None
+    # Number of bytes sent over the connection, and how long the last TLS
+    # handshake took until it's collected by the pool's statistics.
+    _bytes_sent: int
+    _tls_handshake_time: float | None
     _tunnel_host: str | None
     _tunnel_port: int | None
     _tunnel_scheme: str | None
+    # Request head which is sent together with the start of the body.
+    _pending_head: bytes | None
+    _defer_head: bool
 
     def __init__(
         self,
@@ -146,6 +173,8 @@ class HTTPConnection(_HTTPConnection):
         ) = default_socket_options,
         proxy: Url | None = None,
         proxy_config: ProxyConfig | None = None,
+        happy_eyeballs: bool | float = False,
+        resolver: BaseResolver | None = None,
     ) -> None:
         super().__init__(
             host=host,
@@ -155,14 +184,20 @@ class HTTPConnection(_HTTPConnection):
             blocksize=blocksize,
         )
         self.socket_options = socket_options
+        self.happy_eyeballs = happy_eyeballs
+        self.resolver = resolver
         self.proxy = proxy
         self.proxy_config = proxy_config
 
         self._has_connected_to_proxy = False
         self._response_options = None
+        self._bytes_sent = 0
+        self._tls_handshake_time = None
         self._tunnel_host: str | None = None
         self._tunnel_port: int | None = None
         self._tunnel_scheme: str | None = None
+        self._pending_head = None
+        self._defer_head = False
 
     def __str__(self) -> str:
         return f"{type(self).__name__}(host={self.host!r}, port={self.port!r})"
@@ -210,6 +245,8 @@ class HTTPConnection(_HTTPConnection):
                 self.timeout,
                 source_address=self.source_address,
                 socket_options=self.socket_options,
+                happy_eyeballs=self.happy_eyeballs,
+                resolver=self.resolver,
             )
         except socket.gaierror as e:
             raise NameResolutionError(self.host, self, e) from e
@@ -422,6 +459,7 @@ class HTTPConnection(_HTTPConnection):
             self._tunnel_host = None
             self._tunnel_port = None
             self._tunnel_scheme = None
+            self._pending_head = None
 
     def putrequest(
         self,
@@ -443,6 +481,65 @@ class HTTPConnection(_HTTPConnection):
             method, url, skip_host=skip_host, skip_accept_encoding=skip_accept_encoding
         )
 
+    def send(self, data: typing.Any) -> None:
+        super().send(data)
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            self._bytes_sent += memoryview(data).nbytes
+
+    def _send_output(
+        self, message_body: typing.Any = None, encode_chunked: bool = False
+    ) -> None:
+        if not self._defer_head or message_body is not None:
+            return super()._send_output(  # type: ignore[misc,no-any-return]
+                message_body, encode_chunked=encode_chunked
+            )
+        # Keep the head of the request for _send_buffers().
+        buffer: list[bytes] = self._buffer  # type: ignore[attr-defined]
+        buffer.extend((b"", b""))
+        self._pending_head = b"\r\n".join(buffer)
+        del buffer[:]
+
+    def _send_buffers(self, buffers: typing.Sequence[bytes | memoryview[int]]) -> None:
+        """
+        Sends ``buffers`` preceded by the pending request head. Plain sockets
+        send them with one sendmsg() call where possible, without joining
+        them or adding a syscall per buffer.
+        """
+        views = [memoryview(b).cast("B") for b in buffers if len(b)]
+        if self._pending_head is not None:
+            views.insert(0, memoryview(self._pending_head))
+            self._pending_head = None
+        if not views:
+            return
+
+        if self.sock is None:
+            if not self.auto_open:
+                raise http.client.NotConnected()
+            self.connect()
+        if type(self.sock) is not socket.socket or not hasattr(self.sock, "sendmsg"):
+            if len(views) > 1 and sum(v.nbytes for v in views) <= _SEND_JOIN_LIMIT:
+                views = [memoryview(b"".join(views))]
+            for view in views:
+                self.send(view)
+            return
+
+        if self.debuglevel > 0:
+            print("sendmsg:", [bytes(view) for view in views])
+        while views:
+            sent = self.sock.sendmsg(views)
+            self._bytes_sent += sent
+            # Drop what was sent, the rest is sent with the next call.
+            while views and sent >= views[0].nbytes:
+                sent -= views.pop(0).nbytes
+            if sent:
+                views[0] = views[0][sent:]
+
+    def _sendfile(self, body: typing.BinaryIO, count: int) -> None:
+        assert self.sock is not None
+        if self.debuglevel > 0:
+            print("sendfile:", count)
+        self._bytes_sent += self.sock.sendfile(body, offset=body.tell(), count=count)
+
     def putheader(self, header: str, *values: str) -> None:  # type: ignore[override]
         """"""
         if not any(isinstance(v, str) and v == SKIP_HEADER for v in values):
@@ -505,6 +602,20 @@ class HTTPConnection(_HTTPConnection):
         chunks = chunks_and_cl.chunks
         content_length = chunks_and_cl.content_length
 
+        # Regular files are sent with sendfile() when the socket is a plain
+        # one, the kernel copies them without passing through Python. The
+        # file's length is known, so no framing is needed for the body.
+        sendfile_length = None
+        if not chunked and "transfer-encoding" not in header_keys:
+            sendfile_length = file_body_length(body)
+            if sendfile_length is not None:
+                if self.sock is None:
+                    self.connect()
+                if type(self.sock) is socket.socket:
+                    content_length = sendfile_length
+                else:
+                    sendfile_length = None
+
         # When chunked is explicit set to 'True' we respect that.
         if chunked:
             if "transfer-encoding" not in header_keys:
@@ -533,10 +644,23 @@ class HTTPConnection(_HTTPConnection):
             self.putheader("User-Agent", _get_default_user_agent())
         for header, value in headers.items():
             self.putheader(header, value)
-        self.endheaders()
+        # The head of the request is sent together with the start of the
+        # body, chunks are sent together with their framing.
+        self._pending_head = None
+        self._defer_head = True
+        try:
+            self.endheaders()
+        finally:
+            self._defer_head = False
+
+        buffers: list[bytes | memoryview[int]] = []
+        if sendfile_length is not None:
+            self._send_buffers(buffers)
+            if sendfile_length:
+                self._sendfile(typing.cast(typing.BinaryIO, body), sendfile_length)
 
         # If we're given a body we start sending that in chunks.
-        if chunks is not None:
+        elif chunks is not None:
             for chunk in chunks:
                 # Sending empty chunks isn't allowed for TE: chunked
                 # as it indicates the end of the body.
@@ -545,14 +669,20 @@ class HTTPConnection(_HTTPConnection):
                 if isinstance(chunk, str):
                     chunk = chunk.encode("utf-8")
                 if chunked:
-                    self.send(b"%x\r\n%b\r\n" % (len(chunk), chunk))
+                    buffers += (b"%x\r\n" % len(chunk), chunk, b"\r\n")
                 else:
-                    self.send(chunk)
+                    buffers.append(chunk)
+                # Bodies in memory are sent at once, chunks of iterables as
+                # soon as they're produced.
+                if not isinstance(chunks, tuple):
+                    self._send_buffers(buffers)
+                    buffers = []
 
         # Regardless of whether we have a body or not, if we're in
         # chunked mode we want to send an explicit empty chunk.
         if chunked:
-            self.send(b"0\r\n\r\n")
+            buffers.append(b"0\r\n\r\n")
+        self._send_buffers(buffers)
 
     def request_chunked(
         self,
@@ -606,17 +736,21 @@ class HTTPConnection(_HTTPConnection):
         # Get the response from http.client.HTTPConnection
         httplib_response = super().getresponse()
 
-        try:
-            assert_header_parsing(httplib_response.msg)
-        except (HeaderParsingError, TypeError) as hpe:
-            log.warning(
-                "Failed to parse headers (url=%s): %s",
-                _url_from_connection(self, resp_options.request_url),
-                hpe,
-                exc_info=True,
-            )
+        # Heads made up of plain header lines come parsed already, anything
+        # else went through the email package which may have found defects.
+        headers = getattr(httplib_response, "header_dict", None)
+        if headers is None:
+            try:
+                assert_header_parsing(httplib_response.msg)
+            except (HeaderParsingError, TypeError) as hpe:
+                log.warning(
+                    "Failed to parse headers (url=%s): %s",
+                    _url_from_connection(self, resp_options.request_url),
+                    hpe,
+                    exc_info=True,
+                )
 
-        headers = HTTPHeaderDict(httplib_response.msg.items())
+            headers = HTTPHeaderDict(httplib_response.msg.items())
 
         response = HTTPResponse(
             body=httplib_response,
@@ -652,8 +786,14 @@ class HTTPSConnection(HTTPConnection):
     ssl_minimum_version: int | None = None
     ssl_maximum_version: int | None = None
     assert_fingerprint: str | None = None
+    tls_session_cache: ssl_.TLSSessionCache | None = None
     _connect_callback: typing.Callable[..., None] | None = None
 
+    #: Whether the most recent TLS handshake resumed a session from
+    #: ``tls_session_cache``. ``None`` if no session cache is used or
+    #: the connection was never established.
+    session_reused: bool | None = None
+
     def __init__(
         self,
         host: str,
@@ -681,6 +821,9 @@ class HTTPSConnection(HTTPConnection):
         cert_file: str | None = None,
         key_file: str | None = None,
         key_password: str | None = None,
+        tls_session_cache: ssl_.TLSSessionCache | None = None,
+        happy_eyeballs: bool | float = False,
+        resolver: BaseResolver | None = None,
     ) -> None:
         super().__init__(
             host,
@@ -691,6 +834,8 @@ class HTTPSConnection(HTTPConnection):
             socket_options=socket_options,
             proxy=proxy,
             proxy_config=proxy_config,
+            happy_eyeballs=happy_eyeballs,
+            resolver=resolver,
         )
 
         self.key_file = key_file
@@ -706,6 +851,8 @@ class HTTPSConnection(HTTPConnection):
         self.ca_certs = ca_certs and os.path.expanduser(ca_certs)
         self.ca_cert_dir = ca_cert_dir and os.path.expanduser(ca_cert_dir)
         self.ca_cert_data = ca_cert_data
+        self.tls_session_cache = tls_session_cache
+        self.session_reused = None
 
         # cert_reqs depends on ssl_context so calculate last.
         if cert_reqs is None:
@@ -757,17 +904,18 @@ class HTTPSConnection(HTTPConnection):
         self.ca_cert_dir = ca_cert_dir and os.path.expanduser(ca_cert_dir)
         self.ca_cert_data = ca_cert_data
 
+    def _origin(self) -> tuple[str, int]:
+        """Host and port of the origin, even if it's reached through a tunnel."""
+        if self._tunnel_host is not None and self._tunnel_port is not None:
+            return self._tunnel_host, self._tunnel_port
+        return self.host, self.port
+
     def connect(self) -> None:
         # Today we don't need to be doing this step before the /actual/ socket
         # connection, however in the future we'll need to decide whether to
         # create a new socket or re-use an existing "shared" socket as a part
         # of the HTTP/2 handshake dance.
-        if self._tunnel_host is not None and self._tunnel_port is not None:
-            probe_http2_host = self._tunnel_host
-            probe_http2_port = self._tunnel_port
-        else:
-            probe_http2_host = self.host
-            probe_http2_port = self.port
+        probe_http2_host, probe_http2_port = self._origin()
 
         # Check if the target origin supports HTTP/2.
         # If the value comes back as 'None' it means that the current thread
@@ -843,6 +991,7 @@ class HTTPSConnection(HTTPConnection):
             else:
                 ssl_context = self.ssl_context
 
+            handshake_started = time.monotonic()
             sock_and_verified = _ssl_wrap_socket_and_match_hostname(
                 sock=sock,
                 cert_reqs=self.cert_reqs,
@@ -860,8 +1009,12 @@ class HTTPSConnection(HTTPConnection):
                 tls_in_tls=tls_in_tls,
                 assert_hostname=self.assert_hostname,
                 assert_fingerprint=self.assert_fingerprint,
+                tls_session_cache=None if tls_in_tls else self.tls_session_cache,
+                tls_session_origin=(probe_http2_host, probe_http2_port),
             )
             self.sock = sock_and_verified.socket
+            self.session_reused = sock_and_verified.session_reused
+            self._tls_handshake_time = time.monotonic() - handshake_started
 
         # If an error occurs during connection/handshake we may need to release
         # our lock so another connection can probe the origin.
@@ -908,6 +1061,33 @@ class HTTPSConnection(HTTPConnection):
         if self._has_connected_to_proxy and self.proxy_is_verified is None:
             self.proxy_is_verified = sock_and_verified.is_verified
 
+    def getresponse(  # type: ignore[override]
+        self,
+    ) -> HTTPResponse:
+        response = super().getresponse()
+        # Origins answering over HTTP/1.1 may advertise HTTP/2 support, which
+        # saves the next connections from probing for it.
+        if "h2" in ssl_.ALPN_PROTOCOLS and not self.proxy_is_forwarding:
+            alt_svc = response.headers.get("alt-svc")
+            if alt_svc is not None:
+                host, port = self._origin()
+                http2_probe.http2_support_cache.update_from_alt_svc(host, port, alt_svc)
+        return response
+
+    def close(self) -> None:
+        # Keep the session of a finished connection around so that the
+        # next connection to this origin can resume it.
+        if self.tls_session_cache is not None and isinstance(self.sock, ssl.SSLSocket):
+            try:
+                _store_tls_session(
+                    self.tls_session_cache,
+                    self.sock,
+                    (self._tunnel_host or self.host, self._tunnel_port or self.port),
+                )
+            except (OSError, ValueError):
+                pass
+        super().close()
+
     def _connect_tls_proxy(self, hostname: str, sock: socket.socket) -> ssl.SSLSocket:
         """
         Establish a TLS connection to the proxy using the provided SSL context.
@@ -946,6 +1126,27 @@ class _WrappedAndVerifiedSocket(typing.NamedTuple):
 
     socket: ssl.SSLSocket | SSLTransport
     is_verified: bool
+    session_reused: bool | None = None
+
+
+def _tls_session_key(
+    context: ssl.SSLContext,
+    server_hostname: str | None,
+    origin: tuple[str, int | None],
+) -> tuple[typing.Any, ...]:
+    # Sessions can only be resumed with the SSLContext that created them
+    # and must only be offered to the server they were established with.
+    return (context, server_hostname, origin)
+
+
+def _store_tls_session(
+    cache: ssl_.TLSSessionCache,
+    sock: ssl.SSLSocket,
+    origin: tuple[str, int | None],
+) -> None:
+    session = sock.session
+    if session is not None:
+        cache.put(_tls_session_key(sock.context, sock.server_hostname, origin), session)
 
 
 def _ssl_wrap_socket_and_match_hostname(
@@ -966,28 +1167,16 @@ def _ssl_wrap_socket_and_match_hostname(
     server_hostname: str | None,
     ssl_context: ssl.SSLContext | None,
     tls_in_tls: bool = False,
+    tls_session_cache: ssl_.TLSSessionCache | None = None,
+    tls_session_origin: tuple[str, int | None] | None = None,
 ) -> _WrappedAndVerifiedSocket:
     """Logic for constructing an SSLContext from all TLS parameters, passing
     that down into ssl_wrap_socket, and then doing certificate verification
     either via hostname or fingerprint. This function exists to guarantee
     that both proxies and targets have the same behavior when connecting via TLS.
     """
-    default_ssl_context = False
-    if ssl_context is None:
-        default_ssl_context = True
-        context = create_urllib3_context(
-            ssl_version=resolve_ssl_version(ssl_version),
-            ssl_minimum_version=ssl_minimum_version,
-            ssl_maximum_version=ssl_maximum_version,
-            cert_reqs=resolve_cert_reqs(cert_reqs),
-        )
-    else:
-        context = ssl_context
-
-    context.verify_mode = resolve_cert_reqs(cert_reqs)
-
     # In some cases, we want to verify hostnames ourselves
-    if (
+    verify_hostname_ourselves = bool(
         # `ssl` can't verify fingerprints or alternate hostnames
         assert_fingerprint
         or assert_hostname
@@ -997,20 +1186,34 @@ def _ssl_wrap_socket_and_match_hostname(
         # hostnames easily: https://github.com/pyca/pyopenssl/pull/933
         or ssl_.IS_PYOPENSSL
         or not ssl_.HAS_NEVER_CHECK_COMMON_NAME
-    ):
-        context.check_hostname = False
-
-    # Try to load OS default certs if none are given. We need to do the hasattr() check
-    # for custom pyOpenSSL SSLContext objects because they don't support
-    # load_default_certs().
-    if (
-        not ca_certs
-        and not ca_cert_dir
-        and not ca_cert_data
-        and default_ssl_context
-        and hasattr(context, "load_default_certs")
-    ):
-        context.load_default_certs()
+    )
+
+    default_ssl_context = False
+    if ssl_context is None:
+        default_ssl_context = True
+        # Contexts built from our own defaults are shared process-wide, which
+        # avoids loading the CA certificates again for every new connection.
+        # The shared context already has all certificates loaded.
+        context = ssl_.get_cached_urllib3_context(
+            ssl_version=resolve_ssl_version(ssl_version),
+            ssl_minimum_version=ssl_minimum_version,
+            ssl_maximum_version=ssl_maximum_version,
+            cert_reqs=resolve_cert_reqs(cert_reqs),
+            ca_certs=ca_certs,
+            ca_cert_dir=ca_cert_dir,
+            ca_cert_data=ca_cert_data,
+            cert_file=cert_file,
+            key_file=key_file,
+            key_password=key_password,
+            check_hostname=not verify_hostname_ourselves,
+        )
+        ca_certs = ca_cert_dir = ca_cert_data = None
+        cert_file = key_file = key_password = None
+    else:
+        context = ssl_context
+        context.verify_mode = resolve_cert_reqs(cert_reqs)
+        if verify_hostname_ourselves:
+            context.check_hostname = False
 
     # Ensure that IPv6 addresses are in the proper format and don't have a
     # scope ID. Python's SSL module fails to recognize scoped IPv6 addresses
@@ -1022,6 +1225,12 @@ def _ssl_wrap_socket_and_match_hostname(
         if is_ipaddress(normalized):
             server_hostname = normalized
 
+    session = None
+    if tls_session_cache is not None and tls_session_origin is not None:
+        session = tls_session_cache.get(
+            _tls_session_key(context, server_hostname, tls_session_origin)
+        )
+
     ssl_sock = ssl_wrap_socket(
         sock=sock,
         keyfile=key_file,
@@ -1033,6 +1242,7 @@ def _ssl_wrap_socket_and_match_hostname(
         server_hostname=server_hostname,
         ssl_context=context,
         tls_in_tls=tls_in_tls,
+        session=session,
     )
 
     try:
@@ -1063,10 +1273,16 @@ def _ssl_wrap_socket_and_match_hostname(
                 hostname_checks_common_name,
             )
 
+        session_reused = None
+        if tls_session_cache is not None:
+            session_reused = bool(getattr(ssl_sock, "session_reused", False))
+            tls_session_cache.record(session_reused)
+
         return _WrappedAndVerifiedSocket(
             socket=ssl_sock,
             is_verified=context.verify_mode == ssl.CERT_REQUIRED
             or bool(assert_fingerprint),
+            session_reused=session_reused,
         )
     except BaseException:
         ssl_sock.close()
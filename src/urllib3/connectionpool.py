@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import errno
+import functools
 import logging
 import queue
 import sys
+import threading
+import time
 import typing
 import warnings
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 from socket import timeout as SocketTimeout
 from types import TracebackType
 
@@ -39,12 +43,13 @@ from .exceptions import (
     SSLError,
     TimeoutError,
 )
-from .response import BaseHTTPResponse
+from .response import BaseHTTPResponse, HTTPResponse
 from .util.connection import is_connection_dropped
 from .util.proxy import connection_requires_http_tunnel
 from .util.request import _TYPE_BODY_POSITION, set_file_position
 from .util.retry import Retry
 from .util.ssl_match_hostname import CertificateError
+from .util.stats import PoolStats
 from .util.timeout import _DEFAULT_TIMEOUT, _TYPE_DEFAULT, Timeout
 from .util.url import Url, _encode_target
 from .util.url import _normalize_host as normalize_host
@@ -62,6 +67,22 @@ log = logging.getLogger(__name__)
 
 _TYPE_TIMEOUT = typing.Union[Timeout, float, _TYPE_DEFAULT, None]
 
+_BodyT = typing.TypeVar("_BodyT")
+
+# Maximum number of threads used to open connections in prewarm().
+_PREWARM_MAX_WORKERS = 8
+
+# Pool options only HTTP/2 connections take, dropped for other connections so
+# that they can be set whether or not HTTP/2 is used.
+_HTTP2_CONN_KW = frozenset(
+    (
+        "h2_sessions",
+        "h2_initial_window_size",
+        "h2_connection_window_size",
+        "h2_max_frame_size",
+    )
+)
+
 
 # Pool objects
 class ConnectionPool:
@@ -112,6 +133,47 @@ class ConnectionPool:
         Close all pooled connections and disable the pool.
         """
 
+    def is_same_host(self, url: str) -> bool:
+        """
+        Check if the given ``url`` is a member of the same host as this
+        connection pool.
+        """
+        if url.startswith("/"):
+            return True
+
+        # TODO: Add optional support for socket.gethostbyname checking.
+        scheme, _, host, port, *_ = parse_url(url)
+        scheme = scheme or "http"
+        if host is not None:
+            host = _normalize_host(host, scheme=scheme)
+
+        # Use explicit default port for comparison when none is given
+        if self.port is not None and port is None:
+            port = port_by_scheme.get(scheme)
+        elif self.port is None and port == port_by_scheme.get(scheme):
+            port = None
+
+        return (scheme, host, port) == (self.scheme, self.host, self.port)
+
+    def _raise_timeout(
+        self,
+        err: BaseSSLError | OSError | SocketTimeout,
+        url: str,
+        timeout_value: _TYPE_TIMEOUT | None,
+    ) -> None:
+        """Is the error actually a timeout? Will raise a ReadTimeout or pass"""
+
+        if isinstance(err, SocketTimeout):
+            raise ReadTimeoutError(
+                self, url, f"Read timed out. (read timeout={timeout_value})"
+            ) from err
+
+        # See the above comment about EAGAIN in Python 3.
+        if hasattr(err, "errno") and err.errno in _blocking_errnos:
+            raise ReadTimeoutError(
+                self, url, f"Read timed out. (read timeout={timeout_value})"
+            ) from err
+
 
 # This is taken from http://hg.python.org/cpython/file/7aaba721ebc0/Lib/socket.py#l252
 _blocking_errnos = {errno.EAGAIN, errno.EWOULDBLOCK}
@@ -156,6 +218,39 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
     :param retries:
         Retry configuration to use by default with requests in this pool.
 
+    :param max_idle_time:
+        Number of seconds a connection may sit unused in the pool. Connections
+        that were idle for longer are closed instead of being reused, which
+        avoids sending requests on sockets a server or load balancer already
+        gave up on.
+
+    :param max_connection_lifetime:
+        Number of seconds after which a connection is closed and reopened
+        instead of being reused, regardless of how busy it is. This caps how
+        long requests stick to one backend behind a load balancer.
+
+    :param reaper_interval:
+        If set, a background thread closes idle connections that exceeded
+        ``max_idle_time`` or ``max_connection_lifetime`` every
+        ``reaper_interval`` seconds, instead of only when they're checked out.
+
+    The pool's usage is counted in :attr:`stats`, a
+    :class:`~urllib3.util.stats.PoolStats` instance.
+
+    :param h2_initial_window_size:
+    :param h2_connection_window_size:
+    :param h2_max_frame_size:
+        Flow control windows and maximum frame size of HTTP/2 connections, see
+        :class:`urllib3.http2.connection.HTTP2Connection`. Ignored by HTTP/1.1
+        connections.
+
+    :param http2_prior_knowledge:
+        If True, requests to an ``http://`` origin are sent over HTTP/2 without
+        TLS right away, see
+        :class:`urllib3.http2.connection.HTTP2CleartextConnection`. Only use
+        this for servers which are known to speak HTTP/2. Ignored by HTTPS
+        pools, which negotiate HTTP/2 with ALPN, and by proxied pools.
+
     :param _proxy:
         Parsed proxy URL, should not be used directly, instead, see
         :class:`urllib3.ProxyManager`
@@ -184,6 +279,10 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         _proxy: Url | None = None,
         _proxy_headers: typing.Mapping[str, str] | None = None,
         _proxy_config: ProxyConfig | None = None,
+        max_idle_time: float | None = None,
+        max_connection_lifetime: float | None = None,
+        reaper_interval: float | None = None,
+        http2_prior_knowledge: bool = False,
         **conn_kw: typing.Any,
     ):
         ConnectionPool.__init__(self, host, port)
@@ -209,10 +308,26 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         for _ in range(maxsize):
             self.pool.put(None)
 
+        self.max_idle_time = max_idle_time
+        self.max_connection_lifetime = max_connection_lifetime
+        # When connections were last returned to the pool and when they
+        # were last (re)connected, used to expire them.
+        self._conn_idle_since: weakref.WeakKeyDictionary[BaseHTTPConnection, float] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._conn_opened_at: weakref.WeakKeyDictionary[BaseHTTPConnection, float] = (
+            weakref.WeakKeyDictionary()
+        )
+
         # These are mostly for testing and debugging purposes.
         self.num_connections = 0
         self.num_requests = 0
+        self.num_connections_reaped = 0
+        self.stats = PoolStats(idle=functools.partial(_count_idle_conns, self.pool))
         self.conn_kw = conn_kw
+        # Shared sockets of connections which multiplex requests, see _new_conn_kw().
+        self._conn_sessions: typing.Any = None
+        self._conn_sessions_lock = threading.Lock()
 
         if self.proxy:
             # Enable Nagle's algorithm for proxies, to avoid packet fragmentation.
@@ -222,6 +337,10 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
 
             self.conn_kw["proxy"] = self.proxy
             self.conn_kw["proxy_config"] = self.proxy_config
+        elif http2_prior_knowledge and self.scheme == "http":
+            from .http2.connection import HTTP2CleartextConnection
+
+            self.ConnectionCls = HTTP2CleartextConnection
 
         # Do not pass 'self' as callback to 'finalize'.
         # Then the 'finalize' would keep an endless living (leak) to self.
@@ -233,6 +352,41 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         # HTTPConnectionPool object is garbage collected.
         weakref.finalize(self, _close_pool_connections, pool)
 
+        self._reaper_stopped = threading.Event()
+        if reaper_interval is not None and (
+            max_idle_time is not None or max_connection_lifetime is not None
+        ):
+            reaper = threading.Thread(
+                target=_reap_pool_connections,
+                args=(weakref.ref(self), self._reaper_stopped, reaper_interval),
+                name=f"urllib3-reaper-{self.host}:{self.port}",
+                daemon=True,
+            )
+            reaper.start()
+            weakref.finalize(self, self._reaper_stopped.set)
+
+    def _new_conn_kw(self) -> dict[str, typing.Any]:
+        """
+        Keyword arguments for new connections besides the pool's settings.
+
+        Connection classes which multiplex requests over a shared socket, like
+        :class:`urllib3.http2.connection.HTTP2Connection`, name the class of
+        their session registry in ``SessionsCls``. All connections of the pool
+        get the same registry so that they share their sockets. Other
+        connections don't get the pool's HTTP/2 options.
+        """
+        sessions_cls = getattr(self.ConnectionCls, "SessionsCls", None)
+        if sessions_cls is None:
+            if _HTTP2_CONN_KW.isdisjoint(self.conn_kw):
+                return self.conn_kw
+            return {k: v for k, v in self.conn_kw.items() if k not in _HTTP2_CONN_KW}
+        if "h2_sessions" in self.conn_kw:
+            return self.conn_kw
+        with self._conn_sessions_lock:
+            if not isinstance(self._conn_sessions, sessions_cls):
+                self._conn_sessions = sessions_cls()
+        return {**self.conn_kw, "h2_sessions": self._conn_sessions}
+
     def _new_conn(self) -> BaseHTTPConnection:
         """
         Return a fresh :class:`HTTPConnection`.
@@ -249,7 +403,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             host=self.host,
             port=self.port,
             timeout=self.timeout.connect_timeout,
-            **self.conn_kw,
+            **self._new_conn_kw(),
         )
         return conn
 
@@ -270,6 +424,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         if self.pool is None:
             raise ClosedPoolError(self, "Pool is closed.")
 
+        checkout_started = time.monotonic()
         try:
             conn = self.pool.get(block=self.block, timeout=timeout)
 
@@ -284,12 +439,34 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 ) from None
             pass  # Oh well, we'll create a new connection then
 
+        finally:
+            self.stats.checkout_wait_seconds.observe(
+                time.monotonic() - checkout_started
+            )
+
+        if conn and self._is_conn_expired(conn, time.monotonic()):
+            log.debug("Closing expired connection: %s", self.host)
+            conn.close()
+            self.num_connections_reaped += 1
+            self.stats.connections_expired += 1
+
         # If this is a persistent connection, check if it got disconnected
         if conn and is_connection_dropped(conn):
             log.debug("Resetting dropped connection: %s", self.host)
+            if not conn.is_closed:
+                self.stats.connections_dropped += 1
             conn.close()
 
-        return conn or self._new_conn()
+        conn = conn or self._new_conn()
+        if conn.is_closed:
+            # The connection is (re)established for this request.
+            self.stats.connections_opened += 1
+            if self.max_connection_lifetime is not None:
+                self._conn_opened_at[conn] = time.monotonic()
+        else:
+            self.stats.connections_reused += 1
+        self.stats._add_in_use(1)
+        return conn
 
     def _put_conn(self, conn: BaseHTTPConnection | None) -> None:
         """
@@ -305,6 +482,11 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
 
         If the pool is closed, then the connection will be closed and discarded.
         """
+        if conn is not None:
+            self.stats._add_in_use(-1)
+            if self.max_idle_time is not None:
+                self._conn_idle_since[conn] = time.monotonic()
+
         if self.pool is not None:
             try:
                 self.pool.put(conn, block=False)
@@ -316,6 +498,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 # Connection never got put back into the pool, close it.
                 if conn:
                     conn.close()
+                    self.stats.connections_discarded += 1
 
                 if self.block:
                     # This should never happen if you got the conn from self._get_conn
@@ -334,11 +517,63 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         if conn:
             conn.close()
 
+    def _is_conn_expired(self, conn: BaseHTTPConnection, now: float) -> bool:
+        """
+        Whether a pooled connection exceeded ``max_idle_time`` or
+        ``max_connection_lifetime`` and should be closed instead of reused.
+        """
+        if conn.is_closed:
+            return False
+        if self.max_idle_time is not None:
+            idle_since = self._conn_idle_since.get(conn)
+            if idle_since is not None and now - idle_since >= self.max_idle_time:
+                return True
+        if self.max_connection_lifetime is not None:
+            opened_at = self._conn_opened_at.get(conn)
+            if (
+                opened_at is not None
+                and now - opened_at >= self.max_connection_lifetime
+            ):
+                return True
+        return False
+
+    def _reap_expired_conns(self) -> int:
+        """
+        Close idle connections in the pool which exceeded ``max_idle_time`` or
+        ``max_connection_lifetime``. Returns the number of connections closed.
+        """
+        pool = self.pool
+        if pool is None:
+            return 0
+
+        reaped = 0
+        now = time.monotonic()
+        # Connections in the queue aren't in use, and holding the queue's
+        # lock keeps them from being checked out while they're closed.
+        with pool.mutex:
+            for conn in pool.queue:
+                if conn and self._is_conn_expired(conn, now):
+                    conn.close()
+                    reaped += 1
+
+        if reaped:
+            log.debug("Closed %d expired connection(s): %s", reaped, self.host)
+            self.num_connections_reaped += reaped
+            self.stats.connections_expired += reaped
+        return reaped
+
     def _validate_conn(self, conn: BaseHTTPConnection) -> None:
         """
         Called right before a request is made, after the socket is created.
         """
 
+    def _record_tls_handshake(self, conn: BaseHTTPConnection) -> None:
+        """Adds the handshake duration of a newly connected connection to :attr:`stats`."""
+        handshake_time = getattr(conn, "_tls_handshake_time", None)
+        if handshake_time is not None:
+            self.stats.tls_handshake_seconds.observe(handshake_time)
+            conn._tls_handshake_time = None  # type: ignore[attr-defined]
+
     def _prepare_proxy(self, conn: BaseHTTPConnection) -> None:
         # Nothing to do for HTTP connections.
         pass
@@ -355,25 +590,6 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             # can be removed later
             return Timeout.from_float(timeout)
 
-    def _raise_timeout(
-        self,
-        err: BaseSSLError | OSError | SocketTimeout,
-        url: str,
-        timeout_value: _TYPE_TIMEOUT | None,
-    ) -> None:
-        """Is the error actually a timeout? Will raise a ReadTimeout or pass"""
-
-        if isinstance(err, SocketTimeout):
-            raise ReadTimeoutError(
-                self, url, f"Read timed out. (read timeout={timeout_value})"
-            ) from err
-
-        # See the above comment about EAGAIN in Python 3.
-        if hasattr(err, "errno") and err.errno in _blocking_errnos:
-            raise ReadTimeoutError(
-                self, url, f"Read timed out. (read timeout={timeout_value})"
-            ) from err
-
     def _make_request(
         self,
         conn: BaseHTTPConnection,
@@ -388,6 +604,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         preload_content: bool = True,
         decode_content: bool = True,
         enforce_content_length: bool = True,
+        read_ahead: int | None = None,
     ) -> BaseHTTPResponse:
         """
         Perform a request on a given urllib connection object taken from our
@@ -451,8 +668,14 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         :param enforce_content_length:
             Enforce content length checking. Body returned by server must match
             value of Content-Length header, if present. Otherwise, raise error.
+
+        :param read_ahead:
+            If set, the body is read and decoded in a background thread up to
+            this many bytes ahead of the reads of a response which isn't
+            preloaded.
         """
         self.num_requests += 1
+        self.stats.requests += 1
 
         timeout_obj = self._get_timeout(timeout)
         timeout_obj.start_connect()
@@ -487,6 +710,10 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 new_e = _wrap_proxy_error(new_e, conn.proxy.scheme)
             raise new_e
 
+        self._record_tls_handshake(conn)
+        # Connections which don't count the bytes they send are left out.
+        bytes_sent = getattr(conn, "_bytes_sent", None)
+
         # conn.request() calls http.client.*.request, not the method in
         # urllib3.request. It also calls makefile (recv) on the socket.
         try:
@@ -514,6 +741,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             if e.errno != errno.EPROTOTYPE and e.errno != errno.ECONNRESET:
                 raise
 
+        if bytes_sent is not None:
+            self.stats.bytes_sent += getattr(conn, "_bytes_sent", 0) - bytes_sent
+
         # Reset the timeout for the recv() on the socket
         read_timeout = timeout_obj.read_timeout
 
@@ -540,6 +770,12 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         response.retries = retries
         response._connection = response_conn  # type: ignore[attr-defined]
         response._pool = self  # type: ignore[attr-defined]
+        if isinstance(response, HTTPResponse):
+            # Count the body bytes which were preloaded before the response
+            # knew about the pool, the rest is counted as it's read.
+            self.stats.bytes_received += response._bytes_received
+            if read_ahead is not None:
+                response._start_read_ahead(read_ahead)
 
         log.debug(
             '%s://%s:%s "%s %s %s" %s %s',
@@ -555,6 +791,113 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
 
         return response
 
+    def prewarm(
+        self, n: int | None = None, timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT
+    ) -> int:
+        """
+        Open connections ahead of time so that the first requests don't pay
+        for connection setup.
+
+        Up to ``n`` connections are opened in parallel, including the TLS
+        handshake for HTTPS and the ``CONNECT`` tunnel through a proxy, and
+        are put in the pool ready to be reused. Connections which are already
+        open in the pool count towards ``n``. Connections which fail to open
+        are discarded and logged instead of raising an error.
+
+        :param n:
+            Number of connections to have open in the pool. Defaults to the
+            pool's ``maxsize``.
+
+        :param timeout:
+            Connect timeout for each connection. Defaults to the pool's timeout.
+
+        :return:
+            Number of connections which were opened.
+        """
+        pool = self.pool
+        if pool is None:
+            raise ClosedPoolError(self, "Pool is closed.")
+        if n is None:
+            n = pool.maxsize
+        connect_timeout = Timeout.resolve_default_timeout(
+            self._get_timeout(timeout).connect_timeout
+        )
+
+        # Take the slots out of the pool so that nobody else checks out
+        # the connections while they're being opened.
+        conns: list[BaseHTTPConnection | None] = []
+        try:
+            while len(conns) < n:
+                conns.append(pool.get(block=False))
+        except queue.Empty:
+            pass
+        self.stats._add_in_use(sum(conn is not None for conn in conns))
+
+        opened = 0
+        try:
+            now = time.monotonic()
+            to_connect = []
+            for i, conn in enumerate(conns):
+                if conn is None:
+                    conn = conns[i] = self._new_conn()
+                    self.stats._add_in_use(1)
+                elif self._is_conn_expired(conn, now):
+                    conn.close()
+                    self.num_connections_reaped += 1
+                    self.stats.connections_expired += 1
+                if is_connection_dropped(conn):
+                    conn.close()
+                    to_connect.append(conn)
+            if not to_connect:
+                return 0
+            self.stats.connections_opened += len(to_connect)
+
+            with ThreadPoolExecutor(
+                max_workers=min(len(to_connect), _PREWARM_MAX_WORKERS),
+                thread_name_prefix="urllib3-prewarm",
+            ) as executor:
+                futures = [
+                    (conn, executor.submit(self._prewarm_conn, conn, connect_timeout))
+                    for conn in to_connect
+                ]
+                for conn, future in futures:
+                    try:
+                        future.result()
+                    except (
+                        TimeoutError,
+                        HTTPException,
+                        OSError,
+                        BaseSSLError,
+                        SSLError,
+                        CertificateError,
+                        ProxyError,
+                    ) as e:
+                        log.warning(
+                            "Failed to prewarm connection to %s: %r", self.host, e
+                        )
+                        conn.close()
+                        continue
+                    opened += 1
+                    self._record_tls_handshake(conn)
+                    if self.max_connection_lifetime is not None:
+                        self._conn_opened_at[conn] = time.monotonic()
+        finally:
+            for conn in conns:
+                self._put_conn(conn)
+
+        log.debug("Prewarmed %d connection(s): %s", opened, self.host)
+        return opened
+
+    def _prewarm_conn(self, conn: BaseHTTPConnection, timeout: float | None) -> None:
+        """Opens a connection the same way a request through this pool would."""
+        conn.timeout = timeout
+        if self.proxy is not None and connection_requires_http_tunnel(
+            self.proxy, self.proxy_config, self.scheme
+        ):
+            self._prepare_proxy(conn)
+        else:
+            conn.connect()
+
     def close(self) -> None:
         """
         Close all pooled connections and disable the pool.
@@ -563,32 +906,11 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             return
         # Disable access to the pool
         old_pool, self.pool = self.pool, None
+        self._reaper_stopped.set()
 
         # Close all the HTTPConnections in the pool.
         _close_pool_connections(old_pool)
 
-    def is_same_host(self, url: str) -> bool:
-        """
-        Check if the given ``url`` is a member of the same host as this
-        connection pool.
-        """
-        if url.startswith("/"):
-            return True
-
-        # TODO: Add optional support for socket.gethostbyname checking.
-        scheme, _, host, port, *_ = parse_url(url)
-        scheme = scheme or "http"
-        if host is not None:
-            host = _normalize_host(host, scheme=scheme)
-
-        # Use explicit default port for comparison when none is given
-        if self.port is not None and port is None:
-            port = port_by_scheme.get(scheme)
-        elif self.port is None and port == port_by_scheme.get(scheme):
-            port = None
-
-        return (scheme, host, port) == (self.scheme, self.host, self.port)
-
     def urlopen(  # type: ignore[override]
         self,
         method: str,
@@ -701,16 +1023,15 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             Position to seek to in file-like body in the event of a retry or
             redirect. Typically this won't need to be set because urllib3 will
             auto-populate the value when needed.
+
+        :param int read_ahead:
+            If set together with ``preload_content=False``, the body is read
+            and decoded in a background thread while it's consumed, so that
+            receiving and decompressing it overlap. At most this many bytes of
+            decoded data are buffered ahead of the reads.
         """
         # Ensure that the URL we're connecting to is properly encoded
-        if url.startswith("/"):
-            # URLs starting with / are inherently schemeless.
-            url = to_str(_encode_target(url))
-            destination_scheme = None
-        else:
-            parsed_url = parse_url(url)
-            destination_scheme = parsed_url.scheme
-            url = to_str(parsed_url._replace(fragment=None).url)
+        url, destination_scheme = _prepare_url(url)
 
         if headers is None:
             headers = self.headers
@@ -821,22 +1142,10 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             # Discard the connection for these exceptions. It will be
             # replaced during the next _get_conn() call.
             clean_exit = False
-            new_e: Exception = e
-            if isinstance(e, (BaseSSLError, CertificateError)):
-                new_e = SSLError(e)
-            if isinstance(
-                new_e,
-                (
-                    OSError,
-                    NewConnectionError,
-                    TimeoutError,
-                    SSLError,
-                    HTTPException,
-                ),
-            ) and (conn and conn.proxy and not conn.has_connected_to_proxy):
-                new_e = _wrap_proxy_error(new_e, conn.proxy.scheme)
-            elif isinstance(new_e, (OSError, HTTPException)):
-                new_e = ProtocolError("Connection aborted.", new_e)
+            proxy_scheme = None
+            if conn and conn.proxy and not conn.has_connected_to_proxy:
+                proxy_scheme = conn.proxy.scheme
+            new_e = _retry_error(e, proxy_scheme)
 
             retries = retries.increment(
                 method, url, error=new_e, _pool=self, _stacktrace=sys.exc_info()[2]
@@ -855,6 +1164,8 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 if conn:
                     conn.close()
                     conn = None
+                    # Its slot is put back into the pool below.
+                    self.stats._add_in_use(-1)
                 release_this_conn = True
 
             if release_this_conn:
@@ -889,24 +1200,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         # Handle redirect?
         redirect_location = redirect and response.get_redirect_location()
         if redirect_location:
-            if response.status == 303:
-                # Change the method according to RFC 9110, Section 15.4.4.
-                method = "GET"
-                # And lose the body not to transfer anything sensitive.
-                body = None
-                headers = HTTPHeaderDict(headers)._prepare_for_method_change()
-
-            # Strip headers marked as unsafe to forward to the redirected location.
-            # Check remove_headers_on_redirect to avoid a potential network call within
-            # self.is_same_host() which may use socket.gethostbyname() in the future.
-            if retries.remove_headers_on_redirect and not self.is_same_host(
-                redirect_location
-            ):
-                new_headers = headers.copy()  # type: ignore[union-attr]
-                for header in headers:
-                    if header.lower() in retries.remove_headers_on_redirect:
-                        new_headers.pop(header, None)
-                headers = new_headers
+            method, body, headers = _redirect_request(
+                self, retries, response.status, redirect_location, method, body, headers
+            )
 
             try:
                 retries = retries.increment(method, url, response=response, _pool=self)
@@ -1091,7 +1387,7 @@ class HTTPSConnectionPool(HTTPConnectionPool):
             ssl_version=self.ssl_version,
             ssl_minimum_version=self.ssl_minimum_version,
             ssl_maximum_version=self.ssl_maximum_version,
-            **self.conn_kw,
+            **self._new_conn_kw(),
         )
 
     def _validate_conn(self, conn: BaseHTTPConnection) -> None:
@@ -1172,6 +1468,67 @@ def _normalize_host(host: str | None, scheme: str | None) -> str | None:
     return host
 
 
+def _prepare_url(url: str) -> tuple[str, str | None]:
+    """
+    Returns ``url`` percent-encoded and without its fragment, and the scheme
+    of its destination if it has one.
+    """
+    if url.startswith("/"):
+        # URLs starting with / are inherently schemeless.
+        return to_str(_encode_target(url)), None
+    parsed_url = parse_url(url)
+    return to_str(parsed_url._replace(fragment=None).url), parsed_url.scheme
+
+
+def _retry_error(e: Exception, proxy_scheme: str | None = None) -> Exception:
+    """
+    Returns the error which a request that failed with ``e`` is retried for.
+    ``proxy_scheme`` is set if the connection to a proxy wasn't established.
+    """
+    if isinstance(e, (BaseSSLError, CertificateError)):
+        e = SSLError(e)
+    if proxy_scheme is not None and isinstance(
+        e, (OSError, NewConnectionError, TimeoutError, SSLError, HTTPException)
+    ):
+        return _wrap_proxy_error(e, proxy_scheme)
+    if isinstance(e, (OSError, HTTPException)):
+        return ProtocolError("Connection aborted.", e)
+    return e
+
+
+def _redirect_request(
+    pool: ConnectionPool,
+    retries: Retry,
+    status: int,
+    redirect_location: str,
+    method: str,
+    body: _BodyT,
+    headers: typing.Mapping[str, str],
+) -> tuple[str, _BodyT | None, typing.Mapping[str, str]]:
+    """
+    Returns the method, body and headers of the request which follows a
+    redirect from ``pool`` with ``status`` to ``redirect_location``.
+    """
+    new_body: _BodyT | None = body
+    if status == 303:
+        # Change the method according to RFC 9110, Section 15.4.4.
+        method = "GET"
+        # And lose the body not to transfer anything sensitive.
+        new_body = None
+        headers = HTTPHeaderDict(headers)._prepare_for_method_change()
+
+    # Strip headers marked as unsafe to forward to the redirected location.
+    # Check remove_headers_on_redirect to avoid a potential network call within
+    # pool.is_same_host() which may use socket.gethostbyname() in the future.
+    if retries.remove_headers_on_redirect and not pool.is_same_host(redirect_location):
+        new_headers = headers.copy()  # type: ignore[attr-defined]
+        for header in headers:
+            if header.lower() in retries.remove_headers_on_redirect:
+                new_headers.pop(header, None)
+        headers = new_headers
+    return method, new_body, headers
+
+
 def _url_from_pool(
     pool: HTTPConnectionPool | HTTPSConnectionPool, path: str | None = None
 ) -> str:
@@ -1179,6 +1536,32 @@ def _url_from_pool(
     return Url(scheme=pool.scheme, host=pool.host, port=pool.port, path=path).url
 
 
+def _count_idle_conns(pool: queue.LifoQueue[typing.Any]) -> int:
+    """Returns the number of open connections waiting in a pool's queue."""
+    with pool.mutex:
+        return sum(1 for conn in pool.queue if conn and not conn.is_closed)
+
+
+def _reap_pool_connections(
+    pool_ref: weakref.ReferenceType[HTTPConnectionPool],
+    stopped: threading.Event,
+    interval: float,
+) -> None:
+    """Periodically closes expired connections of a pool until it's closed.
+
+    Only a weak reference to the pool is kept in between sweeps so that the
+    reaper doesn't keep an otherwise unused pool alive.
+    """
+    while not stopped.wait(interval):
+        pool = pool_ref()
+        if pool is None or pool.pool is None:
+            return
+        try:
+            pool._reap_expired_conns()
+        finally:
+            del pool
+
+
 def _close_pool_connections(pool: queue.LifoQueue[typing.Any]) -> None:
     """Drains a queue of connections and closes each one."""
     try:
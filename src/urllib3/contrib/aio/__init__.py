@@ -0,0 +1,56 @@
+"""
+This module provides connection pools for :mod:`asyncio` applications. They
+speak HTTP/1.1 over :mod:`asyncio` streams, so thousands of requests can be
+in flight from a single thread without an executor.
+
+The API mirrors the synchronous one: :class:`AsyncPoolManager` and
+:class:`AsyncHTTPConnectionPool` take the same parameters as
+:class:`urllib3.PoolManager` and :class:`urllib3.HTTPConnectionPool` and use
+the same :class:`~urllib3.util.Retry`, :class:`~urllib3.util.Timeout` and
+content decoders, but :meth:`~AsyncPoolManager.request` and
+:meth:`~AsyncPoolManager.urlopen` are awaitable:
+
+.. code-block:: python
+
+    import asyncio
+
+    from urllib3.contrib.aio import AsyncPoolManager
+
+    async def main():
+        async with AsyncPoolManager() as http:
+            resp = await http.request("GET", "https://example.com")
+            print(resp.status, resp.data)
+
+            # Stream a large body instead of preloading it.
+            resp = await http.request(
+                "GET", "https://example.com/large", preload_content=False
+            )
+            async for chunk in resp:
+                ...
+
+    asyncio.run(main())
+
+Pools and their connections belong to the event loop they're first used from.
+Proxies and HTTP/2 aren't supported.
+"""
+
+from __future__ import annotations
+
+from .connection import AsyncHTTPConnection, AsyncHTTPSConnection
+from .connectionpool import (
+    AsyncHTTPConnectionPool,
+    AsyncHTTPSConnectionPool,
+    connection_from_url,
+)
+from .poolmanager import AsyncPoolManager
+from .response import AsyncHTTPResponse
+
+__all__ = (
+    "AsyncHTTPConnection",
+    "AsyncHTTPConnectionPool",
+    "AsyncHTTPResponse",
+    "AsyncHTTPSConnection",
+    "AsyncHTTPSConnectionPool",
+    "AsyncPoolManager",
+    "connection_from_url",
+)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import typing
+
+from ..._request_methods import _TYPE_ENCODE_URL_FIELDS, RequestMethods
+from ...filepost import _TYPE_FIELDS
+from .response import AsyncHTTPResponse
+
+__all__ = ["AsyncRequestMethods"]
+
+
+class AsyncRequestMethods(RequestMethods):
+    """
+    Same as :class:`urllib3._request_methods.RequestMethods` for classes
+    which implement an awaitable :meth:`urlopen`. Fields and JSON are encoded
+    the same way and each method returns an awaitable response.
+    """
+
+    async def urlopen(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        body: typing.Any | None = None,
+        headers: typing.Mapping[str, str] | None = None,
+        encode_multipart: bool = True,
+        multipart_boundary: str | None = None,
+        **kw: typing.Any,
+    ) -> AsyncHTTPResponse:  # Abstract
+        raise NotImplementedError(
+            "Classes extending AsyncRequestMethods must implement "
+            "their own ``urlopen`` method."
+        )
+
+    # The synchronous implementations only encode the request and return
+    # whatever urlopen() returns, which here is a coroutine to await.
+    async def request(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        body: typing.Any | None = None,
+        fields: _TYPE_FIELDS | None = None,
+        headers: typing.Mapping[str, str] | None = None,
+        json: typing.Any | None = None,
+        **urlopen_kw: typing.Any,
+    ) -> AsyncHTTPResponse:
+        """
+        Same as :meth:`urllib3.PoolManager.request`, but awaitable.
+        """
+        return await super().request(  # type: ignore[no-any-return,misc]
+            method,
+            url,
+            body=body,
+            fields=fields,
+            headers=headers,
+            json=json,
+            **urlopen_kw,
+        )
+
+    async def request_encode_url(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        fields: _TYPE_ENCODE_URL_FIELDS | None = None,
+        headers: typing.Mapping[str, str] | None = None,
+        **urlopen_kw: typing.Any,
+    ) -> AsyncHTTPResponse:
+        """
+        Same as :meth:`urllib3.PoolManager.request_encode_url`, but awaitable.
+        """
+        return await super().request_encode_url(  # type: ignore[no-any-return,misc]
+            method, url, fields=fields, headers=headers, **urlopen_kw
+        )
+
+    async def request_encode_body(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        fields: _TYPE_FIELDS | None = None,
+        headers: typing.Mapping[str, str] | None = None,
+        encode_multipart: bool = True,
+        multipart_boundary: str | None = None,
+        **urlopen_kw: typing.Any,
+    ) -> AsyncHTTPResponse:
+        """
+        Same as :meth:`urllib3.PoolManager.request_encode_body`, but awaitable.
+        """
+        return await super().request_encode_body(  # type: ignore[no-any-return,misc]
+            method,
+            url,
+            fields=fields,
+            headers=headers,
+            encode_multipart=encode_multipart,
+            multipart_boundary=multipart_boundary,
+            **urlopen_kw,
+        )
@@ -0,0 +1,545 @@
+from __future__ import annotations
+
+import asyncio
+import http.client
+import os
+import re
+import socket
+import typing
+from socket import timeout as SocketTimeout
+
+from ..._collections import HTTPHeaderDict
+from ...connection import (
+    _CONTAINS_CONTROL_CHAR_RE,
+    BaseSSLError,
+    HTTPConnection,
+    _get_default_user_agent,
+    _match_hostname,
+    port_by_scheme,
+)
+from ...exceptions import (
+    ConnectTimeoutError,
+    NameResolutionError,
+    NewConnectionError,
+    SSLError,
+)
+from ...util import SKIP_HEADER, SKIPPABLE_HEADERS, connection, ssl_
+from ...util.request import body_to_chunks
+from ...util.ssl_ import assert_fingerprint as _assert_fingerprint
+from ...util.ssl_ import resolve_cert_reqs, resolve_ssl_version
+from ...util.timeout import _DEFAULT_TIMEOUT, _TYPE_TIMEOUT, Timeout
+from ...util.util import to_str
+from .response import AsyncHTTPResponse
+
+try:  # Compiled with SSL?
+    import ssl
+except ImportError:
+    ssl = None  # type: ignore[assignment]
+
+if typing.TYPE_CHECKING:
+    from ...util.ssl_ import _TYPE_PEER_CERT_RET_DICT
+
+__all__ = ["AsyncHTTPConnection", "AsyncHTTPSConnection"]
+
+# Same limits as http.client.
+_MAXLINE = 65536
+_MAXHEADERS = 100
+
+# Characters which may not appear in the request target, see http.client.
+_CONTAINS_DISALLOWED_URL_CHAR_RE = re.compile("[\x00-\x20\x7f]")
+_CONTAINS_DISALLOWED_HEADER_VALUE_RE = re.compile(r"\n(?![ \t])|\r(?![ \t\n])")
+
+_TYPE_ASYNC_BODY = typing.Union[typing.AsyncIterable[bytes], typing.Any]
+
+_T = typing.TypeVar("_T")
+
+
+class AsyncHTTPConnection:
+    """
+    HTTP/1.1 connection using :mod:`asyncio` streams.
+
+    Unlike :class:`urllib3.connection.HTTPConnection` this doesn't block the
+    thread while connecting, sending or receiving, so many connections can be
+    used concurrently from a single event loop.
+
+    :param timeout:
+        Timeout in seconds for connecting, sending and each read from the
+        connection.
+    :param source_address:
+        ``(host, port)`` to bind the local end of the connection to.
+    :param socket_options:
+        Options set on the socket after it's connected, defaults to
+        :attr:`urllib3.connection.HTTPConnection.default_socket_options`.
+    """
+
+    default_port: typing.ClassVar[int] = port_by_scheme["http"]
+    default_socket_options: typing.ClassVar[connection._TYPE_SOCKET_OPTIONS] = (
+        HTTPConnection.default_socket_options
+    )
+
+    #: Whether this connection verifies the host's certificate.
+    is_verified: bool = False
+
+    def __init__(
+        self,
+        host: str,
+        port: int | None = None,
+        *,
+        timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT,
+        source_address: tuple[str, int] | None = None,
+        blocksize: int = 16384,
+        socket_options: None | (
+            connection._TYPE_SOCKET_OPTIONS
+        ) = HTTPConnection.default_socket_options,
+    ) -> None:
+        self.host = host
+        self.port = port or self.default_port
+        self.timeout = timeout
+        self.source_address = source_address
+        self.blocksize = blocksize
+        self.socket_options = socket_options
+
+        #: Timeout of each read while receiving the response, set by the pool.
+        self.read_timeout: float | None = Timeout.resolve_default_timeout(timeout)
+
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}(host={self.host!r}, port={self.port!r})>"
+
+    @property
+    def is_closed(self) -> bool:
+        return self._writer is None
+
+    @property
+    def is_connected(self) -> bool:
+        if self._reader is None or self._writer is None:
+            return False
+        # The stream sees EOF once the peer closed the connection.
+        return not (self._writer.is_closing() or self._reader.at_eof())
+
+    async def connect(self) -> None:
+        """Opens the connection, including the TLS handshake for HTTPS."""
+        timeout = Timeout.resolve_default_timeout(self.timeout)
+        try:
+            reader, writer = await _wait_for(self._open_connection(), timeout)
+        except SocketTimeout as e:
+            raise ConnectTimeoutError(
+                self,
+                f"Connection to {self.host} timed out. (connect timeout={timeout})",
+            ) from e
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e  # type: ignore[arg-type]
+        except BaseSSLError:
+            raise
+        except OSError as e:
+            raise NewConnectionError(
+                self, f"Failed to establish a new connection: {e}"  # type: ignore[arg-type]
+            ) from e
+
+        self._reader, self._writer = reader, writer
+        sock = writer.get_extra_info("socket")
+        if sock is not None and self.socket_options:
+            for opt in self.socket_options:
+                sock.setsockopt(*opt)
+
+    async def _open_connection(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_connection(
+            self.host.strip("[]"),
+            self.port,
+            local_addr=self.source_address,
+            limit=_MAXLINE,
+        )
+
+    def close(self) -> None:
+        """Closes the connection without waiting for the transport to shut down."""
+        writer, self._writer, self._reader = self._writer, None, None
+        if writer is not None:
+            writer.close()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: _TYPE_ASYNC_BODY | None = None,
+        headers: typing.Mapping[str, str] | None = None,
+        *,
+        chunked: bool = False,
+    ) -> None:
+        """
+        Sends a request. ``body`` may be anything accepted by
+        :meth:`urllib3.connection.HTTPConnection.request` or an asynchronous
+        iterable of :class:`bytes`, which is sent with chunked encoding unless
+        a ``Content-Length`` header is given.
+        """
+        if self._writer is None:
+            await self.connect()
+        assert self._writer is not None
+
+        match = _CONTAINS_CONTROL_CHAR_RE.search(method)
+        if match:
+            raise ValueError(
+                f"Method cannot contain non-token characters {method!r} (found at least {match.group()!r})"
+            )
+        match = _CONTAINS_DISALLOWED_URL_CHAR_RE.search(url)
+        if match:
+            raise http.client.InvalidURL(
+                f"URL can't contain control characters. {url!r} (found at least {match.group()!r})"
+            )
+
+        if headers is None:
+            headers = {}
+        header_keys = frozenset(to_str(k.lower()) for k in headers)
+
+        lines = [f"{method} {url} HTTP/1.1"]
+        if "host" not in header_keys:
+            lines.append(f"Host: {self._host_header()}")
+        if "accept-encoding" not in header_keys:
+            lines.append("Accept-Encoding: identity")
+
+        async_chunks: typing.AsyncIterable[bytes] | None = None
+        if hasattr(body, "__aiter__"):
+            async_chunks, chunks, content_length = body, None, None
+        else:
+            chunks_and_cl = body_to_chunks(
+                body, method=method, blocksize=self.blocksize
+            )
+            chunks = chunks_and_cl.chunks
+            content_length = chunks_and_cl.content_length
+
+        # Framing follows the same rules as HTTPConnection.request().
+        if chunked:
+            if "transfer-encoding" not in header_keys:
+                lines.append("Transfer-Encoding: chunked")
+        elif "content-length" in header_keys:
+            chunked = False
+        elif "transfer-encoding" in header_keys:
+            chunked = True
+        elif content_length is None:
+            if chunks is not None or async_chunks is not None:
+                chunked = True
+                lines.append("Transfer-Encoding: chunked")
+        else:
+            lines.append(f"Content-Length: {content_length}")
+
+        if "user-agent" not in header_keys:
+            lines.append(f"User-Agent: {_get_default_user_agent()}")
+        for header, value in headers.items():
+            line = _format_header(header, value)
+            if line is not None:
+                lines.append(line)
+
+        lines.append("\r\n")
+        self._writer.write("\r\n".join(lines).encode("latin-1"))
+
+        if chunks is not None:
+            for chunk in chunks:
+                await self._send_chunk(chunk, chunked)
+        elif async_chunks is not None:
+            async for chunk in async_chunks:
+                await self._send_chunk(chunk, chunked)
+
+        if chunked:
+            self._writer.write(b"0\r\n\r\n")
+        await self._drain()
+
+    async def _send_chunk(self, chunk: bytes | str, chunked: bool) -> None:
+        assert self._writer is not None
+        # Sending empty chunks isn't allowed for TE: chunked
+        # as it indicates the end of the body.
+        if not chunk:
+            return
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        if chunked:
+            self._writer.write(b"%x\r\n%b\r\n" % (len(chunk), chunk))
+        else:
+            self._writer.write(chunk)
+        await self._drain()
+
+    async def _drain(self) -> None:
+        assert self._writer is not None
+        await _wait_for(
+            self._writer.drain(),
+            Timeout.resolve_default_timeout(self.timeout),
+        )
+
+    def _host_header(self) -> str:
+        host = self.host
+        if ":" in host and not host.startswith("["):
+            host = f"[{host}]"
+        if self.port == self.default_port:
+            return host
+        return f"{host}:{self.port}"
+
+    async def getresponse(
+        self,
+        *,
+        request_method: str,
+        request_url: str,
+        decode_content: bool = True,
+        enforce_content_length: bool = True,
+    ) -> AsyncHTTPResponse:
+        """
+        Reads the status line and headers of the response. The body is read
+        through the returned :class:`AsyncHTTPResponse`.
+        """
+        while True:
+            line = await self._readline()
+            if not line:
+                raise http.client.RemoteDisconnected(
+                    "Remote end closed connection without response"
+                )
+            version_string, status, reason = _parse_status_line(line)
+            headers = await self._read_headers()
+            # Skip interim responses such as "100 Continue".
+            if not (100 <= status < 200) or status == 101:
+                break
+
+        return AsyncHTTPResponse(
+            headers=headers,
+            status=status,
+            version=11 if version_string == "HTTP/1.1" else 10,
+            version_string=version_string,
+            reason=reason,
+            decode_content=decode_content,
+            request_method=request_method,
+            request_url=request_url,
+            connection=self,
+            enforce_content_length=enforce_content_length,
+        )
+
+    async def _read_headers(self) -> HTTPHeaderDict:
+        headers = HTTPHeaderDict()
+        last: tuple[str, str] | None = None
+        count = 0
+        while True:
+            line = await self._readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            count += 1
+            if count > _MAXHEADERS:
+                raise http.client.HTTPException(f"got more than {_MAXHEADERS} headers")
+            text = line.decode("iso-8859-1").rstrip("\r\n")
+            if text[:1] in (" ", "\t") and last is not None:
+                # Obsolete line folding continues the previous header.
+                name, value = last
+                last = (name, f"{value} {text.strip()}")
+                continue
+            if last is not None:
+                headers.add(*last)
+            name, sep, value = text.partition(":")
+            if not sep:
+                raise http.client.HTTPException(f"Invalid header line: {text!r}")
+            last = (name.strip(), value.strip())
+        if last is not None:
+            headers.add(*last)
+        return headers
+
+    async def _readline(self) -> bytes:
+        assert self._reader is not None
+        try:
+            return await _wait_for(self._reader.readline(), self.read_timeout)
+        except ValueError:
+            raise http.client.LineTooLong("header line") from None
+
+    async def _read(self, amt: int) -> bytes:
+        assert self._reader is not None
+        return await _wait_for(self._reader.read(amt), self.read_timeout)
+
+    async def _readexactly(self, amt: int) -> bytes:
+        assert self._reader is not None
+        return await _wait_for(self._reader.readexactly(amt), self.read_timeout)
+
+
+class AsyncHTTPSConnection(AsyncHTTPConnection):
+    """
+    Same as :class:`AsyncHTTPConnection`, but HTTPS. Certificates are verified
+    with the same parameters as :class:`urllib3.connection.HTTPSConnection`.
+    """
+
+    default_port = port_by_scheme["https"]
+
+    def __init__(
+        self,
+        host: str,
+        port: int | None = None,
+        *,
+        timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT,
+        source_address: tuple[str, int] | None = None,
+        blocksize: int = 16384,
+        socket_options: None | (
+            connection._TYPE_SOCKET_OPTIONS
+        ) = HTTPConnection.default_socket_options,
+        cert_reqs: int | str | None = None,
+        assert_hostname: None | str | typing.Literal[False] = None,
+        assert_fingerprint: str | None = None,
+        server_hostname: str | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+        ca_certs: str | None = None,
+        ca_cert_dir: str | None = None,
+        ca_cert_data: None | str | bytes = None,
+        ssl_minimum_version: int | None = None,
+        ssl_maximum_version: int | None = None,
+        ssl_version: int | str | None = None,  # Deprecated
+        cert_file: str | None = None,
+        key_file: str | None = None,
+        key_password: str | None = None,
+    ) -> None:
+        super().__init__(
+            host,
+            port=port,
+            timeout=timeout,
+            source_address=source_address,
+            blocksize=blocksize,
+            socket_options=socket_options,
+        )
+        self.key_file = key_file
+        self.cert_file = cert_file
+        self.key_password = key_password
+        self.ssl_context = ssl_context
+        self.server_hostname = server_hostname
+        self.assert_hostname = assert_hostname
+        self.assert_fingerprint = assert_fingerprint
+        self.ssl_version = ssl_version
+        self.ssl_minimum_version = ssl_minimum_version
+        self.ssl_maximum_version = ssl_maximum_version
+        self.ca_certs = ca_certs and os.path.expanduser(ca_certs)
+        self.ca_cert_dir = ca_cert_dir and os.path.expanduser(ca_cert_dir)
+        self.ca_cert_data = ca_cert_data
+
+        # cert_reqs depends on ssl_context so calculate last.
+        if cert_reqs is None:
+            if self.ssl_context is not None:
+                cert_reqs = self.ssl_context.verify_mode
+            else:
+                cert_reqs = resolve_cert_reqs(None)
+        self.cert_reqs = cert_reqs
+
+    def _verify_hostname_ourselves(self) -> bool:
+        return bool(
+            self.assert_fingerprint
+            or self.assert_hostname
+            or self.assert_hostname is False
+            or not ssl_.HAS_NEVER_CHECK_COMMON_NAME
+        )
+
+    def _ssl_context(self) -> ssl.SSLContext:
+        if self.ssl_context is not None:
+            context = self.ssl_context
+            context.verify_mode = resolve_cert_reqs(self.cert_reqs)
+            if self._verify_hostname_ourselves():
+                context.check_hostname = False
+            return context
+        return ssl_.get_cached_urllib3_context(
+            ssl_version=resolve_ssl_version(self.ssl_version),
+            ssl_minimum_version=self.ssl_minimum_version,
+            ssl_maximum_version=self.ssl_maximum_version,
+            cert_reqs=resolve_cert_reqs(self.cert_reqs),
+            ca_certs=self.ca_certs,
+            ca_cert_dir=self.ca_cert_dir,
+            ca_cert_data=self.ca_cert_data,
+            cert_file=self.cert_file,
+            key_file=self.key_file,
+            key_password=self.key_password,
+            check_hostname=not self._verify_hostname_ourselves(),
+            # Only HTTP/1.1 is spoken, even if HTTP/2 support is injected.
+            alpn_protocols=["http/1.1"],
+        )
+
+    async def _open_connection(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        context = self._ssl_context()
+
+        server_hostname = (self.server_hostname or self.host).strip("[]")
+        if "%" in server_hostname:
+            server_hostname = server_hostname[: server_hostname.rfind("%")]
+
+        reader, writer = await asyncio.open_connection(
+            self.host.strip("[]"),
+            self.port,
+            local_addr=self.source_address,
+            limit=_MAXLINE,
+            ssl=context,
+            server_hostname=server_hostname,
+        )
+        try:
+            self._verify(writer.get_extra_info("ssl_object"), context, server_hostname)
+        except BaseException:
+            writer.close()
+            raise
+        return reader, writer
+
+    def _verify(
+        self, ssl_object: ssl.SSLObject, context: ssl.SSLContext, server_hostname: str
+    ) -> None:
+        if self.assert_fingerprint:
+            _assert_fingerprint(
+                ssl_object.getpeercert(binary_form=True), self.assert_fingerprint
+            )
+        elif (
+            context.verify_mode != ssl.CERT_NONE
+            and not context.check_hostname
+            and self.assert_hostname is not False
+        ):
+            cert: _TYPE_PEER_CERT_RET_DICT = ssl_object.getpeercert()  # type: ignore[assignment]
+            hostname_checks_common_name = self.ssl_context is not None and bool(
+                getattr(context, "hostname_checks_common_name", False)
+            )
+            _match_hostname(
+                cert,
+                self.assert_hostname or server_hostname,
+                hostname_checks_common_name,
+            )
+
+        # Only HTTP/1.1 is spoken over these connections, even if a given
+        # ssl_context also offers HTTP/2.
+        protocol = ssl_object.selected_alpn_protocol()
+        if protocol not in (None, "http/1.1"):
+            raise SSLError(f"Server selected unsupported ALPN protocol {protocol!r}")
+
+        self.is_verified = context.verify_mode == ssl.CERT_REQUIRED or bool(
+            self.assert_fingerprint
+        )
+
+
+async def _wait_for(aw: typing.Awaitable[_T], timeout: float | None) -> _T:
+    """Awaits ``aw`` and raises :class:`socket.timeout` after ``timeout`` seconds."""
+    if timeout is None:
+        return await aw
+    try:
+        return await asyncio.wait_for(aw, timeout)
+    except asyncio.TimeoutError:
+        raise SocketTimeout("timed out") from None
+
+
+def _format_header(header: str, value: str) -> str | None:
+    if isinstance(value, str) and value == SKIP_HEADER:
+        if to_str(header.lower()) not in SKIPPABLE_HEADERS:
+            skippable_headers = "', '".join(
+                [str.title(header) for header in sorted(SKIPPABLE_HEADERS)]
+            )
+            raise ValueError(
+                f"urllib3.util.SKIP_HEADER only supports '{skippable_headers}'"
+            )
+        return None
+    header = to_str(header, "latin-1")
+    value = to_str(value, "latin-1") if isinstance(value, bytes) else str(value)
+    if _CONTAINS_CONTROL_CHAR_RE.search(header):
+        raise ValueError(f"Invalid header name {header!r}")
+    if _CONTAINS_DISALLOWED_HEADER_VALUE_RE.search(value):
+        raise ValueError(f"Invalid header value {value!r}")
+    return f"{header}: {value}"
+
+
+def _parse_status_line(line: bytes) -> tuple[str, int, str]:
+    text = line.decode("iso-8859-1").rstrip("\r\n")
+    version, _, rest = text.partition(" ")
+    status, _, reason = rest.partition(" ")
+    if not version.startswith("HTTP/") or len(status) != 3 or not status.isdigit():
+        raise http.client.BadStatusLine(text)
+    return version, int(status), reason.strip()
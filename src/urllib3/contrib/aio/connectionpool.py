@@ -0,0 +1,731 @@
+from __future__ import annotations
+
+import asyncio
+import errno
+import logging
+import time
+import typing
+from http.client import HTTPException
+from socket import timeout as SocketTimeout
+
+from ...connection import BaseSSLError, port_by_scheme
+from ...connectionpool import (
+    ConnectionPool,
+    _prepare_url,
+    _redirect_request,
+    _retry_error,
+)
+from ...exceptions import (
+    ClosedPoolError,
+    EmptyPoolError,
+    FullPoolError,
+    HostChangedError,
+    LocationValueError,
+    MaxRetryError,
+    ProtocolError,
+    ReadTimeoutError,
+    SSLError,
+    TimeoutError,
+)
+from ...util.request import _TYPE_BODY_POSITION, set_file_position
+from ...util.retry import Retry
+from ...util.ssl_match_hostname import CertificateError
+from ...util.stats import PoolStats
+from ...util.timeout import _DEFAULT_TIMEOUT, Timeout
+from ...util.url import parse_url
+from ._request_methods import AsyncRequestMethods
+from .connection import _TYPE_ASYNC_BODY, AsyncHTTPConnection, AsyncHTTPSConnection
+from .response import AsyncHTTPResponse
+
+if typing.TYPE_CHECKING:
+    import ssl
+
+    from typing_extensions import Self
+
+    from ...connectionpool import _TYPE_TIMEOUT
+
+__all__ = ["AsyncHTTPConnectionPool", "AsyncHTTPSConnectionPool"]
+
+log = logging.getLogger(__name__)
+
+
+class AsyncHTTPConnectionPool(ConnectionPool, AsyncRequestMethods):
+    """
+    Connection pool for one host, like :class:`urllib3.HTTPConnectionPool` but
+    for use from :mod:`asyncio` code. :meth:`urlopen` and :meth:`request` are
+    awaitable and return an :class:`~urllib3.contrib.aio.AsyncHTTPResponse`.
+
+    All connections of a pool are used from the event loop that made its first
+    request, the pool isn't thread-safe.
+
+    :param timeout:
+        Timeout in seconds for connecting and for each read, or an instance of
+        :class:`urllib3.util.Timeout`. ``Timeout.total`` is not supported.
+
+    :param maxsize:
+        Number of connections to save that can be reused. If ``block`` is set
+        to False, more connections will be opened but they will not be saved
+        once they've been used.
+
+    :param block:
+        If set to True, no more than ``maxsize`` connections will be used at
+        a time. Requests wait for a connection to be released instead.
+
+    :param headers:
+        Headers to include with all requests, unless other headers are given
+        explicitly.
+
+    :param retries:
+        Retry configuration to use by default with requests in this pool.
+
+    :param \\**conn_kw:
+        Additional parameters are used to create fresh
+        :class:`~urllib3.contrib.aio.AsyncHTTPConnection` instances.
+    """
+
+    scheme = "http"
+    ConnectionCls: type[AsyncHTTPConnection] = AsyncHTTPConnection
+
+    def __init__(
+        self,
+        host: str,
+        port: int | None = None,
+        timeout: _TYPE_TIMEOUT | None = _DEFAULT_TIMEOUT,
+        maxsize: int = 1,
+        block: bool = False,
+        headers: typing.Mapping[str, str] | None = None,
+        retries: Retry | bool | int | None = None,
+        **conn_kw: typing.Any,
+    ):
+        ConnectionPool.__init__(self, host, port)
+        AsyncRequestMethods.__init__(self, headers)
+
+        if not isinstance(timeout, Timeout):
+            timeout = Timeout.from_float(timeout)
+
+        if retries is None:
+            retries = Retry.DEFAULT
+
+        self.timeout = timeout
+        self.retries = retries
+
+        self.pool: asyncio.LifoQueue[AsyncHTTPConnection | None] | None = (
+            asyncio.LifoQueue(maxsize)
+        )
+        self.block = block
+
+        # Fill the queue up so that waiting on it works properly
+        for _ in range(maxsize):
+            self.pool.put_nowait(None)
+
+        # These are mostly for testing and debugging purposes.
+        self.num_connections = 0
+        self.num_requests = 0
+        # Open connections waiting in the queue, they don't change state there.
+        self._num_idle_conns = 0
+        self.stats = PoolStats(idle=self._count_idle_conns)
+        self.conn_kw = conn_kw
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _count_idle_conns(self) -> int:
+        return 0 if self.pool is None else self._num_idle_conns
+
+    def _take_from_queue(self, conn: AsyncHTTPConnection | None) -> None:
+        """Accounts for ``conn`` being taken out of the queue."""
+        if conn and not conn.is_closed:
+            self._num_idle_conns -= 1
+
+    def _new_conn(self) -> AsyncHTTPConnection:
+        """
+        Return a fresh :class:`~urllib3.contrib.aio.AsyncHTTPConnection`.
+        """
+        self.num_connections += 1
+        log.debug(
+            "Starting new HTTP connection (%d): %s:%s",
+            self.num_connections,
+            self.host,
+            self.port or "80",
+        )
+
+        return self.ConnectionCls(
+            host=self.host,
+            port=self.port,
+            timeout=self.timeout.connect_timeout,
+            **self.conn_kw,
+        )
+
+    async def _get_conn(self, timeout: float | None = None) -> AsyncHTTPConnection:
+        """
+        Get a connection. Will return a pooled connection if one is available.
+
+        If no connections are available and :prop:`.block` is ``False``, then a
+        fresh connection is returned.
+
+        :param timeout:
+            Seconds to wait before giving up and raising
+            :class:`urllib3.exceptions.EmptyPoolError` if the pool is empty and
+            :prop:`.block` is ``True``.
+        """
+        conn = None
+
+        if self.pool is None:
+            raise ClosedPoolError(self, "Pool is closed.")
+
+        checkout_started = time.monotonic()
+        try:
+            if self.block:
+                conn = await asyncio.wait_for(self.pool.get(), timeout)
+            else:
+                conn = self.pool.get_nowait()
+        except asyncio.TimeoutError:
+            raise EmptyPoolError(
+                self,
+                "Pool is empty and a new connection can't be opened due to blocking mode.",
+            ) from None
+        except asyncio.QueueEmpty:
+            pass  # Oh well, we'll create a new connection then
+        finally:
+            self.stats.checkout_wait_seconds.observe(
+                time.monotonic() - checkout_started
+            )
+        self._take_from_queue(conn)
+
+        # If this is a persistent connection, check if it got disconnected
+        if conn and not conn.is_closed and not conn.is_connected:
+            log.debug("Resetting dropped connection: %s", self.host)
+            self.stats.connections_dropped += 1
+            conn.close()
+
+        conn = conn or self._new_conn()
+        if conn.is_closed:
+            self.stats.connections_opened += 1
+        else:
+            self.stats.connections_reused += 1
+        self.stats._add_in_use(1)
+        return conn
+
+    def _put_conn(self, conn: AsyncHTTPConnection | None) -> None:
+        """
+        Put a connection back into the pool.
+
+        If the pool is already full, the connection is closed and discarded
+        because we exceeded maxsize. If connections are discarded frequently,
+        then maxsize should be increased.
+
+        If the pool is closed, then the connection will be closed and discarded.
+        """
+        if conn is not None:
+            self.stats._add_in_use(-1)
+        if self.pool is not None:
+            try:
+                self.pool.put_nowait(conn)
+                if conn and not conn.is_closed:
+                    self._num_idle_conns += 1
+                return  # Everything is dandy, done.
+            except asyncio.QueueFull:
+                # Connection never got put back into the pool, close it.
+                if conn:
+                    conn.close()
+                    self.stats.connections_discarded += 1
+
+                if self.block:
+                    # This should never happen if you got the conn from self._get_conn
+                    raise FullPoolError(
+                        self,
+                        "Pool reached maximum size and no more connections are allowed.",
+                    ) from None
+
+                log.warning(
+                    "Connection pool is full, discarding connection: %s. Connection pool size: %s",
+                    self.host,
+                    self.pool.qsize(),
+                )
+
+        # Connection never got put back into the pool, close it.
+        if conn:
+            conn.close()
+
+    def _get_timeout(self, timeout: _TYPE_TIMEOUT) -> Timeout:
+        """Helper that always returns a :class:`urllib3.util.Timeout`"""
+        if timeout is _DEFAULT_TIMEOUT:
+            return self.timeout.clone()
+
+        if isinstance(timeout, Timeout):
+            return timeout.clone()
+        return Timeout.from_float(timeout)
+
+    async def _make_request(
+        self,
+        conn: AsyncHTTPConnection,
+        method: str,
+        url: str,
+        body: _TYPE_ASYNC_BODY | None = None,
+        headers: typing.Mapping[str, str] | None = None,
+        retries: Retry | None = None,
+        timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT,
+        chunked: bool = False,
+        response_conn: AsyncHTTPConnection | None = None,
+        preload_content: bool = True,
+        decode_content: bool = True,
+        enforce_content_length: bool = True,
+    ) -> AsyncHTTPResponse:
+        """
+        Perform a request on a given urllib connection object taken from our
+        pool, see :meth:`urllib3.HTTPConnectionPool._make_request`.
+        """
+        self.num_requests += 1
+        self.stats.requests += 1
+
+        timeout_obj = self._get_timeout(timeout)
+        timeout_obj.start_connect()
+        conn.timeout = Timeout.resolve_default_timeout(timeout_obj.connect_timeout)
+
+        try:
+            if conn.is_closed:
+                await conn.connect()
+        except (SocketTimeout, BaseSSLError) as e:
+            self._raise_timeout(err=e, url=url, timeout_value=conn.timeout)
+            raise
+
+        try:
+            await conn.request(method, url, body=body, headers=headers, chunked=chunked)
+        except BrokenPipeError:
+            # The server may have already sent a response, for example
+            # "413 Payload Too Large", read it below.
+            pass
+        except OSError as e:
+            # MacOS/Linux
+            # EPROTOTYPE and ECONNRESET are needed on macOS
+            # https://erickt.github.io/blog/2014/11/19/adventures-in-debugging-a-potential-osx-kernel-bug/
+            if e.errno != errno.EPROTOTYPE and e.errno != errno.ECONNRESET:
+                raise
+
+        # Reset the timeout for the reads from the connection
+        read_timeout = timeout_obj.read_timeout
+        if read_timeout == 0:
+            raise ReadTimeoutError(
+                self, url, f"Read timed out. (read timeout={read_timeout})"
+            )
+        conn.read_timeout = Timeout.resolve_default_timeout(read_timeout)
+
+        try:
+            response = await conn.getresponse(
+                request_method=method,
+                request_url=url,
+                decode_content=decode_content,
+                enforce_content_length=enforce_content_length,
+            )
+        except (SocketTimeout, BaseSSLError, OSError) as e:
+            self._raise_timeout(err=e, url=url, timeout_value=read_timeout)
+            raise
+
+        # Set properties that are used by the pooling layer.
+        response.retries = retries
+        response._connection = response_conn
+        response._pool = self
+
+        log.debug(
+            '%s://%s:%s "%s %s %s" %s %s',
+            self.scheme,
+            self.host,
+            self.port,
+            method,
+            url,
+            response.version_string,
+            response.status,
+            response.length_remaining,
+        )
+
+        if preload_content:
+            await response.read(cache_content=True)
+        return response
+
+    def close(self) -> None:
+        """
+        Close all pooled connections and disable the pool.
+        """
+        if self.pool is None:
+            return
+        # Disable access to the pool
+        old_pool, self.pool = self.pool, None
+        self._num_idle_conns = 0
+
+        while not old_pool.empty():
+            conn = old_pool.get_nowait()
+            if conn:
+                conn.close()
+
+    async def prewarm(
+        self, count: int | None = None, timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT
+    ) -> int:
+        """
+        Open up to ``count`` connections concurrently and put them into the
+        pool, like :meth:`urllib3.HTTPConnectionPool.prewarm`.
+
+        :return:
+            Number of connections which were opened.
+        """
+        if self.pool is None:
+            raise ClosedPoolError(self, "Pool is closed.")
+        if count is None:
+            count = self.pool.maxsize
+
+        conns: list[AsyncHTTPConnection | None] = []
+        try:
+            while len(conns) < count:
+                conns.append(self.pool.get_nowait())
+                self._take_from_queue(conns[-1])
+        except asyncio.QueueEmpty:
+            pass
+        self.stats._add_in_use(sum(conn is not None for conn in conns))
+
+        to_connect = []
+        for i, conn in enumerate(conns):
+            if conn is None:
+                conn = conns[i] = self._new_conn()
+                self.stats._add_in_use(1)
+            if not conn.is_connected:
+                conn.close()
+                conn.timeout = Timeout.resolve_default_timeout(
+                    self._get_timeout(timeout).connect_timeout
+                )
+                to_connect.append(conn)
+        self.stats.connections_opened += len(to_connect)
+
+        opened = 0
+        try:
+            results = await asyncio.gather(
+                *(conn.connect() for conn in to_connect), return_exceptions=True
+            )
+            for conn, result in zip(to_connect, results):
+                if isinstance(result, BaseException):
+                    log.warning(
+                        "Failed to prewarm connection to %s:%s: %r",
+                        self.host,
+                        self.port,
+                        result,
+                    )
+                    conn.close()
+                else:
+                    opened += 1
+        finally:
+            for conn in conns:
+                self._put_conn(conn)
+        return opened
+
+    async def urlopen(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        body: _TYPE_ASYNC_BODY | None = None,
+        headers: typing.Mapping[str, str] | None = None,
+        retries: Retry | bool | int | None = None,
+        redirect: bool = True,
+        assert_same_host: bool = True,
+        timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT,
+        pool_timeout: int | None = None,
+        release_conn: bool | None = None,
+        chunked: bool = False,
+        body_pos: _TYPE_BODY_POSITION | None = None,
+        preload_content: bool = True,
+        decode_content: bool = True,
+        **response_kw: typing.Any,
+    ) -> AsyncHTTPResponse:
+        """
+        Get a connection from the pool and perform an HTTP request, see
+        :meth:`urllib3.HTTPConnectionPool.urlopen` for the parameters.
+
+        ``body`` may also be an asynchronous iterable of :class:`bytes`, such
+        a body can't be rewound for retries and redirects.
+
+        With ``preload_content=False`` the body is read with
+        :meth:`AsyncHTTPResponse.read() <urllib3.contrib.aio.AsyncHTTPResponse.read>`
+        or by iterating over the response with ``async for``, which releases
+        the connection once the body was read completely.
+        """
+        # Ensure that the URL we're connecting to is properly encoded
+        url, _ = _prepare_url(url)
+
+        if headers is None:
+            headers = self.headers
+
+        if not isinstance(retries, Retry):
+            retries = Retry.from_int(retries, redirect=redirect, default=self.retries)
+
+        if release_conn is None:
+            release_conn = preload_content
+
+        # Check host
+        if assert_same_host and not self.is_same_host(url):
+            raise HostChangedError(self, url, retries)
+
+        conn = None
+
+        # Track whether `conn` needs to be released before
+        # returning/raising/recursing, see HTTPConnectionPool.urlopen().
+        release_this_conn = release_conn
+
+        # Must keep the exception bound to a separate variable or else Python 3
+        # complains about UnboundLocalError.
+        err = None
+
+        # Keep track of whether we cleanly exited the except block. This
+        # ensures we do proper cleanup in finally.
+        clean_exit = False
+
+        # Rewind body position, if needed. Record current position
+        # for future rewinds in the event of a redirect/retry.
+        body_pos = set_file_position(body, body_pos)
+
+        timeout_obj = self._get_timeout(timeout)
+        try:
+            # Request a connection from the queue.
+            conn = await self._get_conn(timeout=pool_timeout)
+
+            # If we're going to release the connection in ``finally:``, then
+            # the response doesn't need to know about the connection.
+            response_conn = conn if not release_conn else None
+
+            # Make the request on the connection object
+            response = await self._make_request(
+                conn,
+                method,
+                url,
+                timeout=timeout_obj,
+                body=body,
+                headers=headers,
+                chunked=chunked,
+                retries=retries,
+                response_conn=response_conn,
+                preload_content=preload_content,
+                decode_content=decode_content,
+                **response_kw,
+            )
+
+            # Everything went great!
+            clean_exit = True
+
+        except EmptyPoolError:
+            # Didn't get a connection from the pool, no need to clean up
+            clean_exit = True
+            release_this_conn = False
+            raise
+
+        except (
+            TimeoutError,
+            HTTPException,
+            OSError,
+            ProtocolError,
+            BaseSSLError,
+            SSLError,
+            CertificateError,
+        ) as e:
+            # Discard the connection for these exceptions. It will be
+            # replaced during the next _get_conn() call.
+            clean_exit = False
+            retries = retries.increment(method, url, error=_retry_error(e), _pool=self)
+            await _sleep(retries)
+
+            # Keep track of the error for the retry warning.
+            err = e
+
+        finally:
+            if not clean_exit:
+                # We hit some kind of exception, handled or otherwise. We need
+                # to throw the connection away unless explicitly told not to.
+                if conn:
+                    conn.close()
+                    conn = None
+                    # Its slot is put back into the pool below.
+                    self.stats._add_in_use(-1)
+                release_this_conn = True
+
+            if release_this_conn:
+                # Put the connection back to be reused. It can't be reused
+                # if the response wasn't read completely.
+                if conn and (response._will_close or not response.isclosed()):
+                    conn.close()
+                self._put_conn(conn)
+
+        if not conn:
+            # Try again
+            log.warning(
+                "Retrying (%r) after connection broken by '%r': %s", retries, err, url
+            )
+            return await self.urlopen(
+                method,
+                url,
+                body,
+                headers,
+                retries,
+                redirect,
+                assert_same_host,
+                timeout=timeout,
+                pool_timeout=pool_timeout,
+                release_conn=release_conn,
+                chunked=chunked,
+                body_pos=body_pos,
+                preload_content=preload_content,
+                decode_content=decode_content,
+                **response_kw,
+            )
+
+        # Handle redirect?
+        redirect_location = redirect and response.get_redirect_location()
+        if redirect_location:
+            method, body, headers = _redirect_request(
+                self, retries, response.status, redirect_location, method, body, headers
+            )
+
+            try:
+                retries = retries.increment(method, url, response=response, _pool=self)
+            except MaxRetryError:
+                if retries.raise_on_redirect:
+                    await response.drain_conn()
+                    raise
+                return response
+
+            await response.drain_conn()
+            await _sleep_for_retry(retries, response)
+            log.debug("Redirecting %s -> %s", url, redirect_location)
+            return await self.urlopen(
+                method,
+                redirect_location,
+                body,
+                headers,
+                retries=retries,
+                redirect=redirect,
+                assert_same_host=assert_same_host,
+                timeout=timeout,
+                pool_timeout=pool_timeout,
+                release_conn=release_conn,
+                chunked=chunked,
+                body_pos=body_pos,
+                preload_content=preload_content,
+                decode_content=decode_content,
+                **response_kw,
+            )
+
+        # Check if we should retry the HTTP response.
+        has_retry_after = bool(response.headers.get("Retry-After"))
+        if retries.is_retry(method, response.status, has_retry_after):
+            try:
+                retries = retries.increment(method, url, response=response, _pool=self)
+            except MaxRetryError:
+                if retries.raise_on_status:
+                    await response.drain_conn()
+                    raise
+                return response
+
+            await response.drain_conn()
+            await _sleep(retries, response)
+            log.debug("Retry: %s", url)
+            return await self.urlopen(
+                method,
+                url,
+                body,
+                headers,
+                retries=retries,
+                redirect=redirect,
+                assert_same_host=assert_same_host,
+                timeout=timeout,
+                pool_timeout=pool_timeout,
+                release_conn=release_conn,
+                chunked=chunked,
+                body_pos=body_pos,
+                preload_content=preload_content,
+                decode_content=decode_content,
+                **response_kw,
+            )
+
+        return response
+
+
+class AsyncHTTPSConnectionPool(AsyncHTTPConnectionPool):
+    """
+    Same as :class:`AsyncHTTPConnectionPool`, but HTTPS. TLS parameters such
+    as ``ca_certs``, ``cert_reqs`` and ``ssl_context`` are passed to
+    :class:`~urllib3.contrib.aio.AsyncHTTPSConnection`.
+    """
+
+    scheme = "https"
+    ConnectionCls = AsyncHTTPSConnection
+
+    def __init__(
+        self,
+        host: str,
+        port: int | None = None,
+        timeout: _TYPE_TIMEOUT | None = _DEFAULT_TIMEOUT,
+        maxsize: int = 1,
+        block: bool = False,
+        headers: typing.Mapping[str, str] | None = None,
+        retries: Retry | bool | int | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+        **conn_kw: typing.Any,
+    ) -> None:
+        super().__init__(
+            host,
+            port,
+            timeout,
+            maxsize,
+            block,
+            headers,
+            retries,
+            ssl_context=ssl_context,
+            **conn_kw,
+        )
+
+    def _new_conn(self) -> AsyncHTTPConnection:
+        self.num_connections += 1
+        log.debug(
+            "Starting new HTTPS connection (%d): %s:%s",
+            self.num_connections,
+            self.host,
+            self.port or "443",
+        )
+        return self.ConnectionCls(
+            host=self.host,
+            port=self.port,
+            timeout=self.timeout.connect_timeout,
+            **self.conn_kw,
+        )
+
+
+def connection_from_url(url: str, **kw: typing.Any) -> AsyncHTTPConnectionPool:
+    """
+    Given a url, return an :class:`AsyncHTTPConnectionPool` or
+    :class:`AsyncHTTPSConnectionPool` instance, see
+    :func:`urllib3.connectionpool.connection_from_url`.
+    """
+    scheme, _, host, port, *_ = parse_url(url)
+    scheme = scheme or "http"
+    port = port or port_by_scheme.get(scheme, 80)
+    if not host:
+        raise LocationValueError("No host specified.")
+    if scheme == "https":
+        return AsyncHTTPSConnectionPool(host, port=port, **kw)
+    return AsyncHTTPConnectionPool(host, port=port, **kw)
+
+
+async def _sleep_for_retry(retries: Retry, response: AsyncHTTPResponse) -> bool:
+    """Waits for the response's ``Retry-After``, like :meth:`Retry.sleep_for_retry`."""
+    retry_after = retries.get_retry_after(response)
+    if retry_after:
+        await asyncio.sleep(retry_after)
+        return True
+    return False
+
+
+async def _sleep(retries: Retry, response: AsyncHTTPResponse | None = None) -> None:
+    """Waits between retry attempts like :meth:`Retry.sleep` without blocking the loop."""
+    if retries.respect_retry_after_header and response:
+        if await _sleep_for_retry(retries, response):
+            return
+    backoff = retries.get_backoff_time()
+    if backoff > 0:
+        await asyncio.sleep(backoff)
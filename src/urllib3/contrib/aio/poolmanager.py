@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing
+import warnings
+from urllib.parse import urljoin
+
+from ..._collections import RecentlyUsedContainer
+from ...connectionpool import HTTPConnectionPool, _redirect_request
+from ...exceptions import MaxRetryError
+from ...poolmanager import (
+    _REQUEST_MANY_MAX_CONCURRENCY,
+    _TYPE_BATCH_REQUEST,
+    PoolManager,
+    RequestResult,
+    _BatchItem,
+    _dispose_pool,
+    _RequestManyScheduler,
+)
+from ...util.retry import Retry
+from ...util.timeout import _DEFAULT_TIMEOUT
+from ...util.url import parse_url
+from ._request_methods import AsyncRequestMethods
+from .connectionpool import AsyncHTTPConnectionPool, AsyncHTTPSConnectionPool
+from .response import AsyncHTTPResponse
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from ...connectionpool import _TYPE_TIMEOUT
+
+__all__ = ["AsyncPoolManager"]
+
+log = logging.getLogger(__name__)
+
+pool_classes_by_scheme = {
+    "http": AsyncHTTPConnectionPool,
+    "https": AsyncHTTPSConnectionPool,
+}
+
+
+class AsyncPoolManager(PoolManager, AsyncRequestMethods):
+    """
+    Same as :class:`urllib3.PoolManager`, but for use from :mod:`asyncio`
+    code. Requests are awaitable and return an
+    :class:`~urllib3.contrib.aio.AsyncHTTPResponse`, connections are kept in
+    :class:`~urllib3.contrib.aio.AsyncHTTPConnectionPool` instances.
+
+    Proxies aren't supported.
+
+    Example:
+
+    .. code-block:: python
+
+        import asyncio
+
+        from urllib3.contrib.aio import AsyncPoolManager
+
+        async def main():
+            async with AsyncPoolManager(maxsize=10) as http:
+                responses = await asyncio.gather(
+                    *(http.request("GET", f"https://example.com/{i}") for i in range(100))
+                )
+                print([r.status for r in responses])
+
+        asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        num_pools: int = 10,
+        headers: typing.Mapping[str, str] | None = None,
+        **connection_pool_kw: typing.Any,
+    ) -> None:
+        super().__init__(num_pools, headers, **connection_pool_kw)
+        # Evicted pools are closed right away, their connections can't be
+        # closed from a finalizer outside of the event loop.
+        retired_stats = self._retired_stats
+        http2_sessions = self._http2_sessions
+
+        def dispose(pool: HTTPConnectionPool) -> None:
+            _dispose_pool(retired_stats, http2_sessions, pool)
+            pool.close()
+
+        self.pools = RecentlyUsedContainer(num_pools, dispose_func=dispose)
+        self.pool_classes_by_scheme = pool_classes_by_scheme  # type: ignore[assignment]
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.clear()
+
+    async def prewarm(  # type: ignore[override]
+        self,
+        urls: typing.Iterable[str],
+        per_host: int | None = None,
+        timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT,
+    ) -> int:
+        """
+        Open connections to each of ``urls`` concurrently ahead of time, see
+        :meth:`urllib3.PoolManager.prewarm`.
+
+        :return:
+            Total number of connections which were opened.
+        """
+        pools: dict[int, AsyncHTTPConnectionPool] = {}
+        for url in urls:
+            pool = typing.cast(AsyncHTTPConnectionPool, self.connection_from_url(url))
+            pools[id(pool)] = pool
+        opened = await asyncio.gather(
+            *(pool.prewarm(per_host, timeout) for pool in pools.values())
+        )
+        return sum(opened)
+
+    def request_many(  # type: ignore[override]
+        self,
+        requests: typing.Iterable[_TYPE_BATCH_REQUEST],
+        max_concurrency: int = _REQUEST_MANY_MAX_CONCURRENCY,
+        per_host_limit: int | None = None,
+    ) -> typing.AsyncIterator[RequestResult]:
+        """
+        Make many requests concurrently and yield their results as they
+        complete, see :meth:`urllib3.PoolManager.request_many`. The requests
+        run as tasks on the current event loop:
+
+        .. code-block:: python
+
+            async for result in http.request_many(requests, max_concurrency=16):
+                ...
+        """
+        scheduler = _RequestManyScheduler(
+            self, requests, max_concurrency, per_host_limit
+        )
+        return self._request_many(scheduler)
+
+    async def _request_many(  # type: ignore[override]
+        self, scheduler: _RequestManyScheduler
+    ) -> typing.AsyncIterator[RequestResult]:
+        tasks: dict[asyncio.Task[AsyncHTTPResponse], _BatchItem] = {}
+        try:
+            while not scheduler.finished:
+                to_start, failed = scheduler.start()
+                for item in to_start:
+                    task = asyncio.create_task(
+                        self.request(item.method, item.url, **item.kw)
+                    )
+                    tasks[task] = item
+                for result in failed:
+                    yield result
+                if not tasks:
+                    continue
+
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    item = tasks.pop(task)
+                    scheduler.done(item)
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        yield RequestResult(
+                            item.position, item.method, item.url, None, e
+                        )
+                    else:
+                        yield RequestResult(
+                            item.position, item.method, item.url, response, None
+                        )
+        finally:
+            # Iteration stopped early: cancel the requests nobody will see.
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.wait(tasks)
+            for task in tasks:
+                if not task.cancelled() and task.exception() is None:
+                    task.result().close()
+
+    async def urlopen(  # type: ignore[override]
+        self, method: str, url: str, redirect: bool = True, **kw: typing.Any
+    ) -> AsyncHTTPResponse:
+        """
+        Same as :meth:`urllib3.PoolManager.urlopen`, but awaitable.
+
+        The given ``url`` parameter must be absolute, such that an appropriate
+        :class:`~urllib3.contrib.aio.AsyncHTTPConnectionPool` can be chosen for it.
+        """
+        u = parse_url(url)
+
+        if u.scheme is None:
+            warnings.warn(
+                "URLs without a scheme (ie 'https://') are deprecated and will raise an error "
+                "in urllib3 v3.0. To avoid this FutureWarning ensure all URLs "
+                "start with 'https://' or 'http://'. Read more in this issue: "
+                "https://github.com/urllib3/urllib3/issues/2920",
+                category=FutureWarning,
+                stacklevel=2,
+            )
+
+        conn = typing.cast(
+            AsyncHTTPConnectionPool,
+            self.connection_from_host(u.host, port=u.port, scheme=u.scheme),
+        )
+
+        kw["assert_same_host"] = False
+        kw["redirect"] = False
+
+        if "headers" not in kw:
+            kw["headers"] = self.headers
+
+        response = await conn.urlopen(method, u.request_uri, **kw)
+
+        redirect_location = redirect and response.get_redirect_location()
+        if not redirect_location:
+            return response
+
+        # Support relative URLs for redirecting.
+        redirect_location = urljoin(url, redirect_location)
+
+        retries = kw.get("retries", response.retries)
+        if not isinstance(retries, Retry):
+            retries = Retry.from_int(retries, redirect=redirect)
+
+        method, kw["body"], kw["headers"] = _redirect_request(
+            conn,
+            retries,
+            response.status,
+            redirect_location,
+            method,
+            kw.get("body"),
+            kw["headers"],
+        )
+
+        try:
+            retries = retries.increment(method, url, response=response, _pool=conn)
+        except MaxRetryError:
+            if retries.raise_on_redirect:
+                await response.drain_conn()
+                raise
+            return response
+
+        kw["retries"] = retries
+        kw["redirect"] = redirect
+
+        log.info("Redirecting %s -> %s", url, redirect_location)
+
+        await response.drain_conn()
+        return await self.urlopen(method, redirect_location, **kw)
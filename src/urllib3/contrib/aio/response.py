@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+from contextlib import contextmanager
+from http.client import HTTPException
+from socket import timeout as SocketTimeout
+
+from ...connection import BaseSSLError
+from ...exceptions import (
+    IncompleteRead,
+    InvalidChunkLength,
+    InvalidHeader,
+    ProtocolError,
+    ReadTimeoutError,
+    SSLError,
+)
+from ...response import _READ_CHUNK_SIZE, BaseHTTPResponse, BytesQueueBuffer
+from ...util.retry import Retry
+
+if typing.TYPE_CHECKING:
+    from .connection import AsyncHTTPConnection
+    from .connectionpool import AsyncHTTPConnectionPool
+
+__all__ = ["AsyncHTTPResponse"]
+
+
+class AsyncHTTPResponse(BaseHTTPResponse):
+    """
+    Response of an :class:`~urllib3.contrib.aio.AsyncHTTPConnectionPool`.
+
+    Headers, status and redirect handling work like
+    :class:`urllib3.response.HTTPResponse`, but the body is read with
+    awaitable methods. The response is also an asynchronous iterable of body
+    chunks:
+
+    .. code-block:: python
+
+        async for chunk in response:
+            ...
+
+    The body is decoded with the same content decoders as
+    :class:`urllib3.response.HTTPResponse`. Once the body was read completely
+    the connection is released back into the pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        headers: typing.Mapping[str, str] | None = None,
+        status: int,
+        version: int,
+        version_string: str,
+        reason: str | None,
+        decode_content: bool = True,
+        request_method: str | None = None,
+        request_url: str | None = None,
+        retries: Retry | None = None,
+        connection: AsyncHTTPConnection | None = None,
+        pool: AsyncHTTPConnectionPool | None = None,
+        enforce_content_length: bool = True,
+    ) -> None:
+        super().__init__(
+            headers=headers,
+            status=status,
+            version=version,
+            version_string=version_string,
+            reason=reason,
+            decode_content=decode_content,
+            request_url=request_url,
+            retries=retries,
+        )
+        self.enforce_content_length = enforce_content_length
+        self._body: bytes | None = None
+        # Connection the body is read from, and the one to release into the
+        # pool, which is only set if the pool doesn't release it itself.
+        self._fp = connection
+        self._connection = connection
+        self._pool = pool
+        self._decoded_buffer = BytesQueueBuffer()
+        self._fp_bytes_read = 0
+        self._chunk_left: int | None = None
+
+        self.length_remaining = self._init_length(request_method)
+        # Without a length the body ends when the server closes the connection.
+        self._will_close = self._init_will_close()
+        # Responses to HEAD requests and 1xx, 204 and 304 responses have no
+        # body, even if they're chunked.
+        self._body_done = self.length_remaining == 0
+
+    def _init_length(self, request_method: str | None) -> int | None:
+        if self.status in (204, 304) or 100 <= self.status < 200:
+            return 0
+        if request_method == "HEAD":
+            return 0
+        if self.chunked:
+            return None
+        content_length = self.headers.get("content-length")
+        if content_length is None:
+            return None
+        try:
+            lengths = {int(val) for val in content_length.split(",")}
+        except ValueError:
+            return None
+        if len(lengths) > 1:
+            raise InvalidHeader(
+                "Content-Length contained multiple "
+                "unmatching values (%s)" % content_length
+            )
+        length = lengths.pop()
+        return length if length >= 0 else None
+
+    def _init_will_close(self) -> bool:
+        tokens = {
+            token.strip().lower()
+            for token in self.headers.get("connection", "").split(",")
+        }
+        if "close" in tokens:
+            return True
+        if self.version == 10 and "keep-alive" not in tokens:
+            return True
+        return self.length_remaining is None and not self.chunked
+
+    @property
+    def data(self) -> bytes:
+        """
+        The body of a preloaded response, or one read completely with
+        ``await response.read(cache_content=True)``.
+        """
+        if self._body is None:
+            raise RuntimeError(
+                "The response body wasn't read yet, use 'await response.read()'"
+            )
+        return self._body
+
+    @property
+    def url(self) -> str | None:
+        return self._request_url
+
+    @url.setter
+    def url(self, url: str | None) -> None:
+        self._request_url = url
+
+    @property
+    def connection(self) -> AsyncHTTPConnection | None:  # type: ignore[override]
+        return self._connection
+
+    def isclosed(self) -> bool:
+        return self._body_done
+
+    def tell(self) -> int:
+        """
+        Number of bytes of the raw body read so far. Useful with
+        ``decode_content=True`` to know how many bytes were received.
+        """
+        return self._fp_bytes_read
+
+    @property
+    def decoded_buffer_high_water_mark(self) -> int:
+        """
+        The largest number of decoded bytes that were buffered at once while
+        reading the body.
+        """
+        return self._decoded_buffer.high_water_mark
+
+    def release_conn(self) -> None:
+        if not self._pool or not self._connection:
+            return None
+        # A connection with unread body left can't be reused.
+        if not self._body_done or self._will_close:
+            self._connection.close()
+        self._pool._put_conn(self._connection)
+        self._connection = None
+
+    async def drain_conn(self) -> None:  # type: ignore[override]
+        """
+        Reads and discards the rest of the body so that the connection can be
+        reused, then releases it.
+        """
+        try:
+            while not self._body_done:
+                await self._raw_read(_READ_CHUNK_SIZE)
+        except (HTTPException, OSError, BaseSSLError, ProtocolError):
+            pass
+        self.release_conn()
+
+    def close(self) -> None:
+        if self._fp and not self._body_done:
+            self._fp.close()
+        self._body_done = True
+        self.release_conn()
+
+    def shutdown(self) -> None:
+        self.close()
+
+    async def read(  # type: ignore[override]
+        self,
+        amt: int | None = None,
+        decode_content: bool | None = None,
+        cache_content: bool = False,
+    ) -> bytes:
+        """
+        Reads up to ``amt`` bytes of the body, decoded unless
+        ``decode_content=False``, or all of the rest of the body.
+
+        :param cache_content:
+            If ``True``, the body is stored in :attr:`data` after reading all
+            of it.
+        """
+        if decode_content is None:
+            decode_content = self.decode_content
+        self._init_decoder()
+
+        if amt is not None and amt < 0:
+            amt = None
+
+        if amt is None:
+            if self._body_done:
+                # The decoder was already flushed when the body ended.
+                data = self._decoded_buffer.get_all()
+            else:
+                data = await self._raw_read(None)
+                data = self._decode(data, decode_content, flush_decoder=True)
+                if self._decoded_buffer:
+                    data = self._decoded_buffer.get_all() + data
+            if cache_content:
+                self._body = data
+            return data
+
+        while len(self._decoded_buffer) < amt and not self._body_done:
+            data = await self._raw_read(amt)
+            data = self._decode(data, decode_content, flush_decoder=self._body_done)
+            self._decoded_buffer.put(data)
+        return self._decoded_buffer.get(min(amt, len(self._decoded_buffer)))
+
+    async def stream(  # type: ignore[override]
+        self, amt: int | None = _READ_CHUNK_SIZE, decode_content: bool | None = None
+    ) -> typing.AsyncGenerator[bytes]:
+        """
+        Yields the body in chunks of up to ``amt`` bytes until it was read
+        completely.
+        """
+        while not self._body_done or self._decoded_buffer:
+            data = await self.read(amt=amt, decode_content=decode_content)
+            if data:
+                yield data
+
+    def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        return self.stream()
+
+    async def _raw_read(self, amt: int | None) -> bytes:
+        """Reads up to ``amt`` bytes of the raw body, or all of it if ``amt`` is None."""
+        if self._body_done or self._fp is None:
+            return b""
+        with self._error_catcher():
+            if self.chunked:
+                data = await self._read_chunked(amt)
+            elif self.length_remaining is not None:
+                data = await self._read_length(amt)
+            else:
+                data = await self._read_until_close(amt)
+        self._fp_bytes_read += len(data)
+        if self._pool is not None:
+            self._pool.stats.bytes_received += len(data)
+        if self._body_done:
+            self._fp = None
+            self.release_conn()
+        return data
+
+    async def _read_length(self, amt: int | None) -> bytes:
+        assert self._fp is not None and self.length_remaining is not None
+        if amt is None or amt > self.length_remaining:
+            amt = self.length_remaining
+        try:
+            data = await self._fp._readexactly(amt)
+        except asyncio.IncompleteReadError as e:
+            self._body_done = True
+            if self.enforce_content_length:
+                raise IncompleteRead(
+                    self._fp_bytes_read + len(e.partial),
+                    self.length_remaining - len(e.partial),
+                ) from e
+            return e.partial
+        self.length_remaining -= len(data)
+        self._body_done = self.length_remaining == 0
+        return data
+
+    async def _read_until_close(self, amt: int | None) -> bytes:
+        assert self._fp is not None
+        data = await self._fp._read(-1 if amt is None else amt)
+        if amt is None or not data:
+            self._body_done = True
+        return data
+
+    async def _read_chunked(self, amt: int | None) -> bytes:
+        assert self._fp is not None
+        chunks = []
+        while not self._body_done:
+            if self._chunk_left is None:
+                line = await self._fp._readline()
+                try:
+                    self._chunk_left = int(line.split(b";", 1)[0], 16)
+                except ValueError:
+                    raise InvalidChunkLength(self, line) from None  # type: ignore[arg-type]
+                if self._chunk_left == 0:
+                    await self._read_trailers()
+                    break
+            size = self._chunk_left
+            if amt is not None:
+                size = min(size, amt)
+            try:
+                chunk = await self._fp._readexactly(size)
+            except asyncio.IncompleteReadError as e:
+                raise IncompleteRead(len(e.partial), size - len(e.partial)) from e
+            self._chunk_left -= size
+            if self._chunk_left == 0:
+                # Toss the CRLF at the end of the chunk.
+                await self._fp._readexactly(2)
+                self._chunk_left = None
+            chunks.append(chunk)
+            if amt is not None:
+                break
+        return b"".join(chunks)
+
+    async def _read_trailers(self) -> None:
+        assert self._fp is not None
+        while True:
+            line = await self._fp._readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+        self._chunk_left = None
+        self._body_done = True
+
+    @contextmanager
+    def _error_catcher(self) -> typing.Generator[None]:
+        """
+        Re-raises low-level exceptions as urllib3 exceptions and closes the
+        connection if reading the body failed.
+        """
+        clean_exit = False
+        try:
+            try:
+                yield
+            except SocketTimeout as e:
+                raise ReadTimeoutError(self._pool, None, "Read timed out.") from e  # type: ignore[arg-type]
+            except BaseSSLError as e:
+                raise SSLError(e) from e
+            except IncompleteRead as e:
+                raise ProtocolError(f"Connection broken: {e!r}", e) from e
+            except asyncio.IncompleteReadError as e:
+                raise ProtocolError(f"Connection broken: {e!r}", e) from e
+            except (HTTPException, OSError) as e:
+                raise ProtocolError(f"Connection broken: {e!r}", e) from e
+            clean_exit = True
+        finally:
+            if not clean_exit:
+                self._body_done = True
+                if self._fp:
+                    self._fp.close()
+                    self._fp = None
+                self.release_conn()
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from importlib.metadata import version
 
+from .probe import HTTP2SupportCache, http2_support_cache
+
 __all__ = [
+    "HTTP2SupportCache",
+    "http2_support_cache",
     "inject_into_urllib3",
     "extract_from_urllib3",
 ]
@@ -2,19 +2,39 @@ from __future__ import annotations
 
 import logging
 import re
+import ssl
 import threading
 import types
 import typing
+from socket import timeout as SocketTimeout
 
 import h2.config
 import h2.connection
+import h2.errors
 import h2.events
+import h2.exceptions
+import h2.settings
 
 from .._base_connection import _TYPE_BODY
 from .._collections import HTTPHeaderDict
-from ..connection import HTTPSConnection, _get_default_user_agent
-from ..exceptions import ConnectionError
-from ..response import BaseHTTPResponse
+from ..connection import (
+    HTTPConnection,
+    HTTPSConnection,
+    _get_default_user_agent,
+    _ResponseOptions,
+    port_by_scheme,
+)
+from ..exceptions import ConnectionError, IncompleteRead, ProtocolError
+from ..response import BytesQueueBuffer, HTTPResponse
+from ..util.connection import _getaddrinfo
+from ..util.ssl_match_hostname import CertificateError, match_hostname
+from ..util.timeout import Timeout
+from ..util.wait import wait_for_read
+
+if typing.TYPE_CHECKING:
+    import socket
+
+    from ..util.ssl_ import _TYPE_PEER_CERT_RET_DICT
 
 orig_HTTPSConnection = HTTPSConnection
 
@@ -25,6 +45,15 @@ log = logging.getLogger(__name__)
 RE_IS_LEGAL_HEADER_NAME = re.compile(rb"^[!#$%&'*+\-.^_`|~0-9a-z]+$")
 RE_IS_ILLEGAL_HEADER_VALUE = re.compile(rb"[\0\x00\x0a\x0d\r\n]|^[ \r\n\t]|[ \r\n\t]$")
 
+# Flow control window of a new connection, before it's raised with
+# ``h2_connection_window_size``.
+_DEFAULT_CONNECTION_WINDOW_SIZE = 65535
+
+# Streams opened on one connection at most, even if the server allows more.
+# Servers only announce their limit after the connection was set up, before
+# that h2 assumes there's none.
+_MAX_CONCURRENT_STREAMS = 100
+
 
 def _is_legal_header_name(name: bytes) -> bool:
     """
@@ -51,6 +80,17 @@ def _is_illegal_header_value(value: bytes) -> bool:
     return bool(RE_IS_ILLEGAL_HEADER_VALUE.search(value))
 
 
+def _raise_for_stream_error(stream_id: int, event: h2.events.Event) -> None:
+    if isinstance(event, h2.events.StreamReset):
+        raise ProtocolError(
+            f"Stream {stream_id} was reset by the server: {event.error_code!r}"
+        )
+    if isinstance(event, h2.events.ConnectionTerminated):
+        raise ProtocolError(
+            f"Connection was terminated by the server: {event.error_code!r}"
+        )
+
+
 class _LockedObject(typing.Generic[T]):
     """
     A wrapper class that hides a specific object behind a lock.
@@ -82,11 +122,231 @@ class _LockedObject(typing.Generic[T]):
         self.lock.release()
 
 
+class _HTTP2Session:
+    """
+    The socket and HTTP/2 state of one TCP connection, shared by all of the
+    :class:`HTTP2Connection` objects which multiplex their requests over it.
+
+    Each request is a stream. Whichever connection waits for a response reads
+    from the socket and puts the events for other streams aside in
+    :attr:`streams` for the connections waiting on them.
+    """
+
+    def __init__(self, h2_conn: _LockedObject[h2.connection.H2Connection]) -> None:
+        self.h2_conn = h2_conn
+        self.sock: socket.socket | ssl.SSLSocket | None = None
+        self.is_verified = False
+        #: Number of HTTP2Connection objects using this session.
+        self.users = 1
+        #: Events received for each open stream, guarded by ``h2_conn``.
+        self.streams: dict[int, list[h2.events.Event]] = {}
+        #: Only one connection reads from the socket at a time.
+        self.read_lock = threading.Lock()
+        #: Notified when streams close or the server's settings change.
+        self.streams_changed = threading.Condition(h2_conn.lock)
+        #: Set once the server sent GOAWAY, no new streams can be opened.
+        self.terminated = False
+        #: Set once the socket was closed or broke, no more events will come.
+        self.eof = False
+        #: Set once the connection which opens the socket is done, whether it
+        #: succeeded or not. Connections joining before then wait for it.
+        self.ready = threading.Event()
+        #: ``(host, port)`` the socket was opened for.
+        self.origin: tuple[str, int] | None = None
+        #: Address of the server and its verified certificate, only set if
+        #: requests to other origins may be coalesced onto this session.
+        self.peer_address: str | None = None
+        self.peer_cert: _TYPE_PEER_CERT_RET_DICT | None = None
+        #: Hosts the server answered with 421 (Misdirected Request) here.
+        self.misdirected: set[str] = set()
+
+    def max_concurrent_streams(self, conn: h2.connection.H2Connection) -> int:
+        return min(conn.remote_settings.max_concurrent_streams, _MAX_CONCURRENT_STREAMS)
+
+    def has_capacity(self) -> bool:
+        with self.h2_conn as conn:
+            return (
+                not self.terminated
+                and not self.eof
+                and self.users < self.max_concurrent_streams(conn)
+            )
+
+    def is_authoritative(self, host: str, port: int) -> bool:
+        """
+        Whether the server of this session is authoritative for ``host`` too,
+        going by its certificate alone (:rfc:`9113#section-9.1.1`).
+        """
+        if (
+            self.peer_cert is None
+            or self.origin is None
+            or self.origin[1] != port
+            or host in self.misdirected
+        ):
+            return False
+        try:
+            match_hostname(self.peer_cert, host)
+        except (CertificateError, ValueError):
+            return False
+        return True
+
+
+class _HTTP2Sessions:
+    """
+    The HTTP/2 sessions of a connection pool. New connections of the pool join
+    a session with room for another stream instead of opening a new TCP
+    connection, so that ``maxsize`` connections share as few sockets as the
+    server's ``SETTINGS_MAX_CONCURRENT_STREAMS`` allows.
+
+    With ``coalesce=True`` the registry is shared by the pools of different
+    origins, see :meth:`coalesce`.
+    """
+
+    def __init__(self, coalesce: bool = False) -> None:
+        self.coalesce_origins = coalesce
+        self._lock = threading.Lock()
+        self._sessions: list[_HTTP2Session] = []
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def join(self, origin: tuple[str, int] | None = None) -> _HTTP2Session | None:
+        """
+        Returns a session with room for another connection, if there is one.
+        The session may still be connecting, see :attr:`_HTTP2Session.ready`.
+        """
+        with self._lock:
+            for session in self._sessions:
+                if (
+                    origin is None or session.origin == origin
+                ) and session.has_capacity():
+                    session.users += 1
+                    return session
+        return None
+
+    def coalesce(
+        self,
+        host: str,
+        port: int,
+        resolve: typing.Callable[[], typing.Collection[str]],
+    ) -> _HTTP2Session | None:
+        """
+        Returns an open session to another origin which requests to ``host``
+        can be sent over too, if there is one (:rfc:`9113#section-9.1.1`).
+        That's the case if the certificate of the session's server is valid
+        for ``host`` and ``host`` resolves to the server's address.
+
+        ``resolve`` returns the addresses of ``host``, it's only called if
+        there's a session with a matching certificate.
+        """
+        with self._lock:
+            candidates = [
+                session
+                for session in self._sessions
+                if session.ready.is_set() and session.is_authoritative(host, port)
+            ]
+        if not candidates:
+            return None
+
+        addresses = resolve()
+        with self._lock:
+            for session in candidates:
+                if (
+                    session.peer_address in addresses
+                    and session in self._sessions
+                    and session.has_capacity()
+                ):
+                    session.users += 1
+                    return session
+        return None
+
+    def add(self, session: _HTTP2Session) -> None:
+        """Adds a session which is about to connect."""
+        with self._lock:
+            self._sessions.append(session)
+
+    def leave(self, session: _HTTP2Session) -> bool:
+        """
+        Removes a connection from ``session``. Returns whether it was the last
+        one, in which case the caller closes the socket.
+        """
+        with self._lock:
+            session.users -= 1
+            if session.users > 0:
+                return False
+            if session in self._sessions:
+                self._sessions.remove(session)
+            return True
+
+
 class HTTP2Connection(HTTPSConnection):
+    """
+    An HTTP/2 connection for one request at a time, like other connections.
+
+    Connections created by the same pool multiplex their requests as separate
+    streams over a shared TCP connection: :meth:`connect` joins an open
+    session if one has room for another stream, and only opens a new socket
+    otherwise.
+
+    :param h2_initial_window_size:
+        Flow control window of each stream in bytes, which is how much of a
+        response body the server sends ahead of the reader. The default is
+        the protocol's 65,535 bytes.
+
+    :param h2_connection_window_size:
+        Flow control window of the whole connection in bytes, shared by all of
+        its streams. The default is the protocol's 65,535 bytes.
+
+    :param h2_max_frame_size:
+        Largest frame the server may send in bytes, between 16,384 (the
+        default) and 16,777,215.
+
+    Larger windows let high-bandwidth, high-latency transfers fill the pipe,
+    at the cost of buffering up to that much unread data per response.
+    """
+
+    #: Class of the registry of shared sessions which pools pass to their
+    #: connections as ``h2_sessions``.
+    SessionsCls = _HTTP2Sessions
+
+    #: Value of the ``:scheme`` pseudo-header of requests.
+    _h2_scheme = b"https"
+
     def __init__(
-        self, host: str, port: int | None = None, **kwargs: typing.Any
+        self,
+        host: str,
+        port: int | None = None,
+        *,
+        h2_sessions: _HTTP2Sessions | None = None,
+        h2_initial_window_size: int | None = None,
+        h2_connection_window_size: int | None = None,
+        h2_max_frame_size: int | None = None,
+        **kwargs: typing.Any,
     ) -> None:
-        self._h2_conn = self._new_h2_conn()
+        self._h2_sessions = h2_sessions
+        self._h2_settings: dict[h2.settings.SettingCodes, int] = {}
+        if h2_initial_window_size is not None:
+            self._h2_settings[h2.settings.SettingCodes.INITIAL_WINDOW_SIZE] = (
+                h2_initial_window_size
+            )
+        if h2_max_frame_size is not None:
+            self._h2_settings[h2.settings.SettingCodes.MAX_FRAME_SIZE] = (
+                h2_max_frame_size
+            )
+        try:
+            h2.settings.Settings(client=True, initial_values=self._h2_settings)
+        except h2.exceptions.InvalidSettingsValueError as e:
+            raise ValueError(str(e)) from None
+        if h2_connection_window_size is not None and not (
+            _DEFAULT_CONNECTION_WINDOW_SIZE <= h2_connection_window_size < 2**31
+        ):
+            raise ValueError(
+                "h2_connection_window_size must be between "
+                f"{_DEFAULT_CONNECTION_WINDOW_SIZE} and {2**31 - 1}, "
+                f"got {h2_connection_window_size}"
+            )
+        self._h2_connection_window_size = h2_connection_window_size
+        self._session = _HTTP2Session(self._new_h2_conn())
         self._h2_stream: int | None = None
         self._headers: list[tuple[bytes, bytes]] = []
 
@@ -98,16 +358,118 @@ class HTTP2Connection(HTTPSConnection):
         if self._tunnel_host is not None:
             raise NotImplementedError("Tunneling isn't supported with HTTP/2")
 
+    @property
+    def _h2_conn(self) -> _LockedObject[h2.connection.H2Connection]:
+        return self._session.h2_conn
+
     def _new_h2_conn(self) -> _LockedObject[h2.connection.H2Connection]:
         config = h2.config.H2Configuration(client_side=True)
-        return _LockedObject(h2.connection.H2Connection(config=config))
+        conn = h2.connection.H2Connection(config=config)
+        if self._h2_settings:
+            conn.local_settings = h2.settings.Settings(
+                client=True, initial_values=self._h2_settings
+            )
+        return _LockedObject(conn)
 
     def connect(self) -> None:
+        if self._h2_sessions is not None:
+            session = self._h2_sessions.join((self.host, self.port))
+            if (
+                session is None
+                and self._h2_sessions.coalesce_origins
+                and self._can_coalesce()
+            ):
+                session = self._h2_sessions.coalesce(
+                    self.host, self.port, self._resolve_addresses
+                )
+            if session is not None:
+                session.ready.wait()
+                if session.sock is not None and not session.eof:
+                    self._session = session
+                    self.sock = session.sock
+                    self.is_verified = session.is_verified
+                    return
+                # Opening the shared connection failed, try on our own.
+                self._h2_sessions.leave(session)
+
+        # Add the session before connecting so that connections of the pool
+        # created meanwhile wait for this socket instead of opening their own.
+        session = self._session
+        session.origin = (self.host, self.port)
+        if self._h2_sessions is not None:
+            self._h2_sessions.add(session)
+        try:
+            self._connect_socket()
+            with self._h2_conn as conn:
+                conn.initiate_connection()
+                if self._h2_connection_window_size is not None:
+                    if increment := (
+                        self._h2_connection_window_size
+                        - _DEFAULT_CONNECTION_WINDOW_SIZE
+                    ):
+                        conn.increment_flow_control_window(increment)
+                if data_to_send := conn.data_to_send():
+                    self.sock.sendall(data_to_send)
+        except BaseException:
+            session.eof = True
+            raise
+        else:
+            session.sock = self.sock
+            session.is_verified = self.is_verified
+            if (
+                self._h2_sessions is not None
+                and self._h2_sessions.coalesce_origins
+                and self.is_verified
+                and self._can_coalesce()
+            ):
+                session.peer_address = self.sock.getpeername()[0]
+                session.peer_cert = self.sock.getpeercert()  # type: ignore[union-attr]
+        finally:
+            session.ready.set()
+
+    def _connect_socket(self) -> None:
+        """Opens the socket which HTTP/2 frames are exchanged over."""
         super().connect()
-        with self._h2_conn as conn:
-            conn.initiate_connection()
-            if data_to_send := conn.data_to_send():
-                self.sock.sendall(data_to_send)
+
+    def _can_coalesce(self) -> bool:
+        """
+        Whether requests of this connection may share a session with other
+        origins. Not if the certificate is checked against anything but the
+        host, the certificate decides which origins a session can serve.
+        """
+        return (
+            self.server_hostname is None
+            and self.assert_hostname is None
+            and self.assert_fingerprint is None
+        )
+
+    def _resolve_addresses(self) -> set[str]:
+        try:
+            addrinfos = _getaddrinfo(
+                self._dns_host.strip("[]"), self.port, self.resolver
+            )
+        except OSError:
+            # Connecting on our own reports the error.
+            return set()
+        return {addrinfo[4][0] for addrinfo in addrinfos}  # type: ignore[misc]
+
+    @property
+    def is_connected(self) -> bool:
+        session = self._session
+        if self.sock is None or session.terminated or session.eof:
+            return False
+        # Frames which arrived while the connection was idle, like PING or
+        # GOAWAY, are processed here. If another connection is reading, the
+        # socket is alive anyway.
+        if session.read_lock.acquire(blocking=False):
+            try:
+                while self._has_data_to_read(timeout=0.0):
+                    self._read_frames()
+            except OSError:
+                pass
+            finally:
+                session.read_lock.release()
+        return not (session.terminated or session.eof)
 
     def putrequest(  # type: ignore[override]
         self,
@@ -127,12 +489,13 @@ class HTTP2Connection(HTTPSConnection):
         self._request_url = url or "/"
         self._validate_path(url)  # type: ignore[attr-defined]
 
+        port = self.port or self.default_port
         if ":" in self.host:
-            authority = f"[{self.host}]:{self.port or 443}"
+            authority = f"[{self.host}]:{port}"
         else:
-            authority = f"{self.host}:{self.port or 443}"
+            authority = f"{self.host}:{port}"
 
-        self._headers.append((b":scheme", b"https"))
+        self._headers.append((b":scheme", self._h2_scheme))
         self._headers.append((b":method", method.encode()))
         self._headers.append((b":authority", authority.encode()))
         self._headers.append((b":path", url.encode()))
@@ -157,7 +520,19 @@ class HTTP2Connection(HTTPSConnection):
         if self._h2_stream is None:
             raise ConnectionError("Must call `putrequest` first.")
 
+        session = self._session
         with self._h2_conn as conn:
+            # Wait for a stream to close if the server's limit is reached.
+            while conn.open_outbound_streams >= session.max_concurrent_streams(conn):
+                if session.eof or not session.streams_changed.wait(
+                    timeout=self._resolved_timeout()
+                ):
+                    raise SocketTimeout("Timed out waiting for a free stream.")
+
+            # Other connections sharing the session may have opened streams
+            # since putrequest(), and stream IDs have to be used in order.
+            self._h2_stream = conn.get_next_available_stream_id()
+            session.streams[self._h2_stream] = []
             conn.send_headers(
                 stream_id=self._h2_stream,
                 headers=self._headers,
@@ -179,38 +554,96 @@ class HTTP2Connection(HTTPSConnection):
             if data_to_send := conn.data_to_send():
                 self.sock.sendall(data_to_send)
 
-            if hasattr(data, "read"):  # file-like objects
-                while True:
-                    chunk = data.read(self.blocksize)
-                    if not chunk:
-                        break
-                    if isinstance(chunk, str):
-                        chunk = chunk.encode()
-                    conn.send_data(self._h2_stream, chunk, end_stream=False)
-                    if data_to_send := conn.data_to_send():
-                        self.sock.sendall(data_to_send)
-                conn.end_stream(self._h2_stream)
-                return
+        if hasattr(data, "read"):  # file-like objects
+            while True:
+                chunk = data.read(self.blocksize)
+                if not chunk:
+                    break
+                if isinstance(chunk, str):
+                    chunk = chunk.encode()
+                self._send_data(chunk, end_stream=False)
+            self._end_request_stream()
+            return
 
-            if isinstance(data, str):  # str -> bytes
-                data = data.encode()
+        if isinstance(data, str):  # str -> bytes
+            data = data.encode()
 
-            try:
-                if isinstance(data, bytes):
-                    conn.send_data(self._h2_stream, data, end_stream=True)
+        try:
+            if isinstance(data, bytes):
+                self._send_data(data, end_stream=True)
+            else:
+                for chunk in data:
+                    self._send_data(chunk, end_stream=False)
+                self._end_request_stream()
+        except TypeError:
+            raise TypeError(
+                "`data` should be str, bytes, iterable, or file. got %r" % type(data)
+            )
+
+    def _send_data(self, data: bytes, end_stream: bool) -> None:
+        """
+        Sends ``data`` on the request's stream in frames no larger than the
+        server allows, waiting for the server to open the flow control window
+        whenever it's used up.
+        """
+        stream_id = self._h2_stream
+        assert stream_id is not None
+        view = memoryview(data)
+        while view or end_stream:
+            with self._h2_conn as conn:
+                try:
+                    window = conn.local_flow_control_window(stream_id)
+                except h2.exceptions.StreamClosedError:
+                    # The server already responded or reset the stream, the
+                    # response tells which.
+                    return
+                if window > 0 or not view:
+                    size = min(len(view), window, conn.max_outbound_frame_size)
+                    conn.send_data(
+                        stream_id,
+                        bytes(view[:size]),
+                        end_stream=end_stream and size == len(view),
+                    )
+                    view = view[size:]
                     if data_to_send := conn.data_to_send():
                         self.sock.sendall(data_to_send)
-                else:
-                    for chunk in data:
-                        conn.send_data(self._h2_stream, chunk, end_stream=False)
-                        if data_to_send := conn.data_to_send():
-                            self.sock.sendall(data_to_send)
-                    conn.end_stream(self._h2_stream)
-            except TypeError:
-                raise TypeError(
-                    "`data` should be str, bytes, iterable, or file. got %r"
-                    % type(data)
-                )
+                    if not view:
+                        return
+                    continue
+            self._wait_for_window(stream_id)
+
+    def _end_request_stream(self) -> None:
+        stream_id = self._h2_stream
+        assert stream_id is not None
+        with self._h2_conn as conn:
+            try:
+                conn.end_stream(stream_id)
+            except h2.exceptions.StreamClosedError:
+                return
+            if data_to_send := conn.data_to_send():
+                self.sock.sendall(data_to_send)
+
+    def _wait_for_window(self, stream_id: int) -> None:
+        """Reads from the socket until the server sent a WINDOW_UPDATE."""
+        session = self._session
+        timeout = self._resolved_timeout()
+        # Another connection may be reading already, it'll process the update.
+        if not session.read_lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise SocketTimeout("Timed out waiting for the flow control window.")
+        try:
+            with self._h2_conn as conn:
+                try:
+                    if conn.local_flow_control_window(stream_id) > 0:
+                        return
+                except h2.exceptions.StreamClosedError:
+                    return
+                if session.eof:
+                    raise ProtocolError("Connection was closed by the server.")
+            if not self._has_data_to_read(timeout=timeout):
+                raise SocketTimeout("Timed out waiting for the flow control window.")
+            self._read_frames()
+        finally:
+            session.read_lock.release()
 
     def set_tunnel(
         self,
@@ -226,45 +659,171 @@ class HTTP2Connection(HTTPSConnection):
     def getresponse(  # type: ignore[override]
         self,
     ) -> HTTP2Response:
+        if self._h2_stream is None:
+            raise ConnectionError("Must call `putrequest` first.")
+
+        stream_id = self._h2_stream
+        resp_options = self._response_options
+        self._response_options = None
         status = None
-        data = bytearray()
-        with self._h2_conn as conn:
-            end_stream = False
-            while not end_stream:
-                # TODO: Arbitrary read value.
-                if received_data := self.sock.recv(65535):
-                    events = conn.receive_data(received_data)
-                    for event in events:
-                        if isinstance(event, h2.events.ResponseReceived):
-                            headers = HTTPHeaderDict()
-                            for header, value in event.headers:
-                                if header == b":status":
-                                    status = int(value.decode())
-                                else:
-                                    headers.add(
-                                        header.decode("ascii"), value.decode("ascii")
-                                    )
-
-                        elif isinstance(event, h2.events.DataReceived):
-                            data += event.data
-                            conn.acknowledge_received_data(
-                                event.flow_controlled_length, event.stream_id
-                            )
-
-                        elif isinstance(event, h2.events.StreamEnded):
-                            end_stream = True
+        headers = HTTPHeaderDict()
+        try:
+            while status is None:
+                events = self._receive_events(stream_id)
+                for i, event in enumerate(events):
+                    if isinstance(event, h2.events.ResponseReceived):
+                        for header, value in event.headers:
+                            if header == b":status":
+                                status = int(value.decode())
+                            else:
+                                headers.add(
+                                    header.decode("ascii"), value.decode("ascii")
+                                )
+                        # The body's events are left for the response to read.
+                        with self._h2_conn:
+                            self._session.streams[stream_id][:0] = events[i + 1 :]
+                        break
 
-                if data_to_send := conn.data_to_send():
-                    self.sock.sendall(data_to_send)
+                    _raise_for_stream_error(stream_id, event)
+        except BaseException:
+            self._end_stream(stream_id)
+            raise
+
+        if status == 421:
+            # The server doesn't serve this origin over this session after all,
+            # don't coalesce its requests onto it again.
+            with self._h2_conn:
+                self._session.misdirected.add(self.host)
 
-        assert status is not None
         return HTTP2Response(
             status=status,
             headers=headers,
             request_url=self._request_url,
-            data=bytes(data),
+            body=_HTTP2Stream(self, stream_id),
+            request_method=resp_options.request_method if resp_options else None,
+            preload_content=resp_options.preload_content if resp_options else True,
+            decode_content=resp_options.decode_content if resp_options else True,
+            enforce_content_length=(
+                resp_options.enforce_content_length if resp_options else True
+            ),
         )
 
+    def _acknowledge_data(self, stream_id: int, amt: int) -> None:
+        """
+        Gives ``amt`` bytes of the flow control windows back to the server
+        once the data was consumed.
+        """
+        if not amt or self.sock is None:
+            return
+        with self._h2_conn as conn:
+            conn.acknowledge_received_data(amt, stream_id)
+            if data_to_send := conn.data_to_send():
+                self.sock.sendall(data_to_send)
+
+    def _end_stream(self, stream_id: int) -> None:
+        session = self._session
+        with self._h2_conn:
+            session.streams.pop(stream_id, None)
+            session.streams_changed.notify_all()
+        if self._h2_stream == stream_id:
+            self._h2_stream = None
+
+    def _resolved_timeout(self) -> float | None:
+        return Timeout.resolve_default_timeout(self.timeout)
+
+    def _has_data_to_read(self, timeout: float | None) -> bool:
+        # Data which the TLS layer already decrypted doesn't show up as
+        # readable on the socket.
+        if isinstance(self.sock, ssl.SSLSocket):
+            with self._h2_conn:
+                if self.sock.pending():
+                    return True
+        return wait_for_read(self.sock, timeout=timeout)
+
+    def _read_frames(self) -> None:
+        """
+        Reads what arrived on the socket and hands the events to the streams
+        they belong to. Must be called with the session's ``read_lock`` held,
+        once :meth:`_has_data_to_read` returned True.
+        """
+        session = self._session
+        # Waiting for data happens without the HTTP/2 state locked, so that the
+        # other streams can send meanwhile. The socket itself is only used with
+        # it locked though, a TLS connection can't send and receive at once.
+        with self._h2_conn as conn:
+            sock = self.sock
+            timeout = sock.gettimeout()
+            sock.setblocking(False)
+            try:
+                received_data = sock.recv(65535)
+            except (BlockingIOError, ssl.SSLWantReadError, ssl.SSLWantWriteError):
+                # Only part of a TLS record arrived, wait for the rest.
+                return
+            except OSError:
+                session.eof = True
+                session.streams_changed.notify_all()
+                raise
+            finally:
+                sock.settimeout(timeout)
+
+            if not received_data:
+                session.eof = True
+                session.streams_changed.notify_all()
+                return
+
+            for event in conn.receive_data(received_data):
+                if isinstance(event, h2.events.ConnectionTerminated):
+                    session.terminated = True
+                    # Streams the server didn't get to won't be answered.
+                    for stream_id, events in session.streams.items():
+                        if (
+                            event.last_stream_id is None
+                            or stream_id > event.last_stream_id
+                        ):
+                            events.append(event)
+                    continue
+
+                event_stream_id: int | None = getattr(event, "stream_id", None)
+                if event_stream_id in session.streams:
+                    session.streams[event_stream_id].append(event)
+                # Events for streams which were already reset are dropped.
+
+            if data_to_send := conn.data_to_send():
+                self.sock.sendall(data_to_send)
+            session.streams_changed.notify_all()
+
+    def _receive_events(self, stream_id: int) -> list[h2.events.Event]:
+        """
+        Returns the events received for ``stream_id`` since the last call,
+        reading from the socket until there are any.
+        """
+        session = self._session
+        timeout = self._resolved_timeout()
+        while True:
+            with self._h2_conn:
+                events = session.streams.get(stream_id)
+                if events:
+                    session.streams[stream_id] = []
+                    return events
+                if session.eof:
+                    raise ProtocolError("Connection was closed by the server.")
+
+            # Another connection may be reading already, it'll put the events
+            # for this stream aside.
+            if not session.read_lock.acquire(
+                timeout=-1 if timeout is None else timeout
+            ):
+                raise SocketTimeout("Read timed out.")
+            try:
+                with self._h2_conn:
+                    if session.streams.get(stream_id) or session.eof:
+                        continue
+                if not self._has_data_to_read(timeout=timeout):
+                    raise SocketTimeout("Read timed out.")
+                self._read_frames()
+            finally:
+                session.read_lock.release()
+
     def request(  # type: ignore[override]
         self,
         method: str,
@@ -283,10 +842,20 @@ class HTTP2Connection(HTTPSConnection):
             # raise NotImplementedError("`chunked` isn't supported with HTTP/2")
             pass
 
-        if self.sock is not None:
-            self.sock.settimeout(self.timeout)
+        if self.sock is None:
+            # Pools only connect HTTPS connections ahead of the request.
+            self.connect()
+        # The socket may be shared with other connections, the timeout only
+        # applies to waiting for this request's response.
 
         self.putrequest(method, url)
+        self._response_options = _ResponseOptions(
+            request_method=method,
+            request_url=url,
+            preload_content=preload_content,
+            decode_content=decode_content,
+            enforce_content_length=enforce_content_length,
+        )
 
         headers = headers or {}
         for k, v in headers.items():
@@ -305,52 +874,257 @@ class HTTP2Connection(HTTPSConnection):
             self.endheaders()
 
     def close(self) -> None:
-        with self._h2_conn as conn:
-            try:
-                conn.close_connection()
-                if data := conn.data_to_send():
-                    self.sock.sendall(data)
-            except Exception:
-                pass
+        session = self._session
+        stream_id = self._h2_stream
+        if stream_id is not None:
+            self._end_stream(stream_id)
+
+        if self._h2_sessions is not None:
+            last_user = self._h2_sessions.leave(session)
+        else:
+            session.users -= 1
+            last_user = session.users <= 0
+
+        if last_user:
+            with session.h2_conn as conn:
+                try:
+                    conn.close_connection()
+                    if data := conn.data_to_send():
+                        self.sock.sendall(data)
+                except Exception:
+                    pass
+        else:
+            # Other connections still use the socket, only cancel the stream
+            # of this connection's request if it's still going.
+            with session.h2_conn as conn:
+                try:
+                    if stream_id is not None:
+                        conn.reset_stream(stream_id, h2.errors.ErrorCodes.CANCEL)
+                        if data := conn.data_to_send():
+                            self.sock.sendall(data)
+                except Exception:
+                    pass
+            self.sock = None
 
         # Reset all our HTTP/2 connection state.
-        self._h2_conn = self._new_h2_conn()
+        self._session = _HTTP2Session(self._new_h2_conn())
         self._h2_stream = None
         self._headers = []
 
         super().close()
 
 
-class HTTP2Response(BaseHTTPResponse):
-    # TODO: This is a woefully incomplete response object, but works for non-streaming.
+class HTTP2CleartextConnection(HTTP2Connection):
+    """
+    An HTTP/2 connection to an ``http://`` origin over plain TCP ("h2c").
+
+    There's no negotiation: the connection starts speaking HTTP/2 right away,
+    which is only possible with prior knowledge that the server supports it
+    (:rfc:`9113#section-3.3`), like sidecar proxies of a service mesh. Servers
+    which only speak HTTP/1.1 close the connection.
+
+    Use ``http2_prior_knowledge=True`` on :class:`~urllib3.HTTPConnectionPool`
+    or :class:`~urllib3.PoolManager` rather than this class directly.
+    """
+
+    default_port = port_by_scheme["http"]  # type: ignore[misc]
+    _h2_scheme = b"http"
+
+    def _connect_socket(self) -> None:
+        HTTPConnection.connect(self)
+
+
+class _HTTP2Stream:
+    """
+    File-like reader of the body of one response stream, which
+    :class:`HTTP2Response` reads from like :class:`~urllib3.response.HTTPResponse`
+    reads from :class:`http.client.HTTPResponse`.
+
+    Data is only acknowledged to the server once it was read from here, or
+    when a read has to wait for more of it, so the server can't send more than
+    the flow control window ahead of the reader.
+    """
+
+    def __init__(self, conn: HTTP2Connection, stream_id: int) -> None:
+        self._conn = conn
+        self._stream_id = stream_id
+        self._buffer = BytesQueueBuffer()
+        # The buffer starts with data which was acknowledged already, the
+        # last ``_unacknowledged`` bytes weren't.
+        self._unacknowledged = 0
+        self._ended = False
+        self._closed = False
+
+    def _receive(self) -> None:
+        # All of the buffered data will be read by the caller waiting for more,
+        # the server may need the window back to send the rest.
+        self._acknowledge(self._unacknowledged)
+        try:
+            events = self._conn._receive_events(self._stream_id)
+        except BaseException:
+            self.close()
+            raise
+        for event in events:
+            if isinstance(event, h2.events.DataReceived):
+                self._buffer.put(event.data)
+                self._unacknowledged += len(event.data)
+                # Padding is never read, give it back right away.
+                if padding := event.flow_controlled_length - len(event.data):
+                    self._conn._acknowledge_data(self._stream_id, padding)
+            elif isinstance(event, h2.events.StreamEnded):
+                self._ended = True
+            else:
+                try:
+                    _raise_for_stream_error(self._stream_id, event)
+                except ProtocolError:
+                    self.close()
+                    raise
+
+    def _get(self, amt: int | None) -> bytes:
+        # Only the part of data which wasn't acknowledged yet counts.
+        acknowledged = len(self._buffer) - self._unacknowledged
+        if amt is None or amt >= len(self._buffer):
+            data = self._buffer.get_all()
+        else:
+            data = self._buffer.get(amt)
+        self._acknowledge(len(data) - acknowledged)
+        if self._ended and not self._buffer:
+            self.close()
+        return data
+
+    def _acknowledge(self, amt: int) -> None:
+        """Acknowledges the oldest ``amt`` of the unacknowledged bytes."""
+        if amt > 0:
+            self._unacknowledged -= amt
+            self._conn._acknowledge_data(self._stream_id, amt)
+
+    def read(self, amt: int | None = None) -> bytes:
+        while not self._closed and not self._ended:
+            if amt is not None and len(self._buffer) >= amt:
+                break
+            self._receive()
+        return b"" if self._closed else self._get(amt)
+
+    def read1(self, amt: int | None = None) -> bytes:
+        while not self._closed and not self._ended and not self._buffer:
+            self._receive()
+        return b"" if self._closed else self._get(amt)
+
+    def read_frames(self) -> typing.Iterator[bytes]:
+        """Yields the body in pieces as the server sent them in DATA frames."""
+        while data := self.read1():
+            yield data
+
+    def isclosed(self) -> bool:
+        return self._closed
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        # Data which won't be read anymore still counts against the
+        # connection's flow control window.
+        self._acknowledge(self._unacknowledged)
+        self._buffer = BytesQueueBuffer()
+        if self._ended:
+            self._conn._end_stream(self._stream_id)
+
+
+class HTTP2Response(HTTPResponse):
+    """
+    Response to a request over :class:`HTTP2Connection`.
+
+    The body is read from the stream as the caller reads from the response,
+    and decoded with the same content decoders as
+    :class:`~urllib3.response.HTTPResponse`. With ``preload_content=False``
+    no more than the stream's flow control window is buffered until it's read.
+    """
+
     def __init__(
         self,
         status: int,
         headers: HTTPHeaderDict,
         request_url: str,
-        data: bytes,
-        decode_content: bool = False,  # TODO: support decoding
+        body: _HTTP2Stream | bytes = b"",
+        request_method: str | None = None,
+        preload_content: bool = True,
+        decode_content: bool = True,
+        enforce_content_length: bool = True,
     ) -> None:
         super().__init__(
-            status=status,
+            body=body,  # type: ignore[arg-type]
             headers=headers,
+            status=status,
             # Following CPython, we map HTTP versions to major * 10 + minor integers
             version=20,
             version_string="HTTP/2",
             # No reason phrase in HTTP/2
             reason=None,
+            preload_content=preload_content,
             decode_content=decode_content,
+            original_response=body if isinstance(body, _HTTP2Stream) else None,  # type: ignore[arg-type]
+            enforce_content_length=enforce_content_length,
+            request_method=request_method,
             request_url=request_url,
         )
-        self._data = data
-        self.length_remaining = 0
 
-    @property
-    def data(self) -> bytes:
-        return self._data
+    def _fp_read(self, amt: int | None = None, *, read1: bool = False) -> bytes:
+        data = super()._fp_read(amt, read1=read1)
+        # http.client raises this itself when reading the whole body.
+        if (
+            amt is None
+            and not read1
+            and self.enforce_content_length
+            and self.length_remaining is not None
+            and len(data) < self.length_remaining
+        ):
+            raise IncompleteRead(
+                self._fp_bytes_read + len(data), self.length_remaining - len(data)
+            )
+        return data
 
-    def get_redirect_location(self) -> None:
-        return None
+    def supports_chunked_reads(self) -> bool:
+        return isinstance(self._fp, _HTTP2Stream)
 
-    def close(self) -> None:
-        pass
+    def read_chunked(
+        self, amt: int | None = None, decode_content: bool | None = None
+    ) -> typing.Generator[bytes]:
+        """
+        Similar to :meth:`urllib3.response.HTTPResponse.read_chunked`. HTTP/2
+        has no chunked transfer coding, the body is yielded as the server sent
+        it in DATA frames instead, split into pieces of at most ``amt`` bytes.
+        """
+        self._init_decoder()
+        if not isinstance(self._fp, _HTTP2Stream) or amt == 0:
+            return None
+        if amt is not None and amt < 0:
+            amt = None
+
+        with self._error_catcher():
+            for data in self._fp.read_frames():
+                self._uncached_read_occurred = True
+                self._fp_bytes_read += len(data)
+                self._record_bytes_received(len(data))
+                if self.length_remaining is not None:
+                    self.length_remaining -= len(data)
+                for i in range(0, len(data), amt or len(data)):
+                    piece = data[i : i + amt] if amt else data
+                    decoded = self._decode(piece, decode_content, flush_decoder=False)
+                    if decoded:
+                        yield decoded
+
+            if (
+                self.enforce_content_length
+                and self.length_remaining is not None
+                and self.length_remaining != 0
+            ):
+                raise IncompleteRead(self._fp_bytes_read, self.length_remaining)
+
+            if decode_content:
+                decoded = self._flush_decoder()
+                if decoded:
+                    yield decoded
@@ -1,87 +1,305 @@
 from __future__ import annotations
 
+import collections
+import json
+import os
+import re
 import threading
+import time
 
+# Alternatives of an Alt-Svc header (RFC 7838 section 3) and their parameters.
+_ALT_SVC_VALUE_RE = re.compile(
+    r'([^\s=,;]+)\s*=\s*"([^"]*)"((?:\s*;\s*[^\s=,;]+\s*=\s*(?:"[^"]*"|[^\s,;]*))*)'
+)
+_ALT_SVC_PARAM_RE = re.compile(r';\s*([^\s=,;]+)\s*=\s*("[^"]*"|[^\s,;]*)')
 
-class _HTTP2ProbeCache:
-    __slots__ = (
-        "_lock",
-        "_cache_locks",
-        "_cache_values",
-    )
+# Max age of an Alt-Svc alternative without an explicit "ma" parameter.
+_ALT_SVC_DEFAULT_MAX_AGE = 86400
+
+# Version of the snapshot format written by HTTP2SupportCache.save().
+_SNAPSHOT_VERSION = 1
+
+
+class _Entry:
+    __slots__ = ("lock", "probing", "value", "expires_at")
 
     def __init__(self) -> None:
+        # Held by the thread probing the origin, which is set in ``probing``.
+        self.lock = threading.RLock()
+        self.probing = False
+        self.value: bool | None = None
+        # Wall clock time, so that it means the same in other processes.
+        self.expires_at = 0.0
+
+
+class HTTP2SupportCache:
+    """
+    Remembers which origins support HTTP/2.
+
+    The first connection to an origin probes it with ALPN while connections
+    opened at the same time wait for the result, afterwards connections use
+    the cached result right away. Results are also learned from the
+    ``Alt-Svc`` headers of HTTP/1.1 responses.
+
+    Results expire so that origins which start or stop supporting HTTP/2 are
+    probed again. A snapshot of the cache can be saved to a file and loaded
+    by other processes, so that new workers don't each have to probe the
+    same origins again:
+
+    .. code-block:: python
+
+        import atexit
+
+        from urllib3.http2 import http2_support_cache
+
+        http2_support_cache.load("/var/cache/myapp/http2.json")
+        atexit.register(http2_support_cache.save, "/var/cache/myapp/http2.json")
+
+    :param ttl:
+        Number of seconds an origin is known to support HTTP/2 for.
+    :param negative_ttl:
+        Number of seconds an origin is known not to support HTTP/2 for.
+    :param maxsize:
+        Maximum number of origins to remember. The least recently used origin
+        is discarded when the cache is full.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 86400.0,
+        negative_ttl: float = 3600.0,
+        maxsize: int = 1024,
+    ) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
         self._lock = threading.Lock()
-        self._cache_locks: dict[tuple[str, int], threading.RLock] = {}
-        self._cache_values: dict[tuple[str, int], bool | None] = {}
+        self._entries: collections.OrderedDict[tuple[str, int], _Entry] = (
+            collections.OrderedDict()
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(ttl={self.ttl}, "
+            f"negative_ttl={self.negative_ttl}, maxsize={self.maxsize})"
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
 
     def acquire_and_get(self, host: str, port: int) -> bool | None:
-        # By the end of this block we know that
-        # _cache_[values,locks] is available.
-        value = None
+        """
+        Returns whether the origin supports HTTP/2. If that's not known yet,
+        this waits for another thread which is probing the origin, or returns
+        None if the calling thread has to probe it. In that case it must
+        report back with :meth:`set_and_release`.
+        """
+        key = (host, port)
         with self._lock:
-            key = (host, port)
-            try:
-                value = self._cache_values[key]
-                # If it's a known value we return right away.
-                if value is not None:
-                    return value
-            except KeyError:
-                self._cache_locks[key] = threading.RLock()
-                self._cache_values[key] = None
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+                self._evict()
+            elif entry.value is not None:
+                if entry.expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    return entry.value
+                # The result expired, the origin is probed again.
+                entry.value = None
 
         # If the value is unknown, we acquire the lock to signal
         # to the requesting thread that the probe is in progress
         # or that the current thread needs to return their findings.
-        key_lock = self._cache_locks[key]
-        key_lock.acquire()
+        entry.lock.acquire()
         try:
-            # If the by the time we get the lock the value has been
-            # updated we want to return the updated value.
-            value = self._cache_values[key]
+            with self._lock:
+                if self._entries.get(key) is not entry:
+                    # The result was discarded while we were waiting, start
+                    # over with the entry which is locked by this thread.
+                    self._entries[key] = entry
+                    entry.value = None
+                value = entry.value
+                entry.probing = value is None
 
         # In case an exception like KeyboardInterrupt is raised here.
-        except BaseException as e:  # Defensive:
-            assert not isinstance(e, KeyError)  # KeyError shouldn't be possible.
-            key_lock.release()
+        except BaseException:  # Defensive:
+            entry.lock.release()
             raise
 
+        # Another thread finished probing while we were waiting, there's
+        # nothing left for this thread to report back.
+        if value is not None:
+            entry.lock.release()
         return value
 
     def set_and_release(
         self, host: str, port: int, supports_http2: bool | None
     ) -> None:
+        """
+        Reports the result of probing the origin, or None if the probe failed
+        so that the next connection probes it again.
+        """
+        with self._lock:
+            entry = self._entries[(host, port)]
+            entry.probing = False
+            # A failed probe keeps what was learned from Alt-Svc meanwhile.
+            if supports_http2 is not None:
+                entry.value = supports_http2
+                ttl = self.ttl if supports_http2 else self.negative_ttl
+                entry.expires_at = time.time() + ttl
+        entry.lock.release()
+
+    def update_from_alt_svc(self, host: str, port: int, alt_svc: str) -> None:
+        """
+        Learns from the ``Alt-Svc`` header of a response of the origin whether
+        it supports HTTP/2 (:rfc:`7838`). Only HTTP/2 on the same host and
+        port is taken into account, alternatives on other hosts or ports
+        aren't used for requests.
+        """
         key = (host, port)
-        key_lock = self._cache_locks[key]
-        with key_lock:  # Uses an RLock, so can be locked again from same thread.
-            if supports_http2 is None and self._cache_values[key] is not None:
+        if alt_svc.strip().lower() == "clear":
+            with self._lock:
+                entry = self._entries.get(key)
+                # Unless a probe is in progress, the origin is probed again.
+                if entry is not None and not entry.probing:
+                    del self._entries[key]
+            return
+
+        for protocol, authority, params in _ALT_SVC_VALUE_RE.findall(alt_svc):
+            if protocol != "h2":
+                continue
+            alt_host, _, alt_port = authority.rpartition(":")
+            if alt_host.strip("[]") not in ("", host) or alt_port != str(port):
+                continue
+            max_age = _ALT_SVC_DEFAULT_MAX_AGE
+            for name, value in _ALT_SVC_PARAM_RE.findall(params):
+                if name == "ma":
+                    try:
+                        max_age = int(value.strip('"'))
+                    except ValueError:
+                        pass
+            self._update(key, True, time.time() + min(max_age, self.ttl))
+            return
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """
+        Writes the results which haven't expired yet to ``path``. The file is
+        replaced atomically, so processes loading it never see a partial
+        snapshot.
+        """
+        now = time.time()
+        with self._lock:
+            origins = [
+                [host, port, entry.value, entry.expires_at]
+                for (host, port), entry in self._entries.items()
+                if entry.value is not None and entry.expires_at > now
+            ]
+        data = json.dumps({"version": _SNAPSHOT_VERSION, "origins": origins})
+
+        tmp_path = f"{os.fspath(path)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def load(self, path: str | os.PathLike[str]) -> int:
+        """
+        Adds the results of a snapshot written by :meth:`save` which haven't
+        expired yet, unless newer results are known already. A missing file
+        is treated like an empty snapshot.
+
+        :return: Number of origins which were added.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return 0
+
+        if not isinstance(data, dict) or data.get("version") != _SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported HTTP/2 support cache snapshot: {path!r}")
+
+        now = time.time()
+        loaded = 0
+        for origin in data.get("origins", ()):
+            try:
+                host, port, value, expires_at = origin
+            except (TypeError, ValueError):
+                raise ValueError(
+                    f"Invalid origin in HTTP/2 support cache snapshot: {origin!r}"
+                ) from None
+            if (
+                not isinstance(host, str)
+                or not isinstance(port, int)
+                or not isinstance(value, bool)
+                or not isinstance(expires_at, (int, float))
+            ):
                 raise ValueError(
-                    "Cannot reset HTTP/2 support for origin after value has been set."
-                )  # Defensive: not expected in normal usage
+                    f"Invalid origin in HTTP/2 support cache snapshot: {origin!r}"
+                )
+            if expires_at > now and self._update((host, port), value, expires_at):
+                loaded += 1
+        return loaded
+
+    def clear(self) -> None:
+        """Discards all results, except for probes which are in progress."""
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if not entry.probing:
+                    del self._entries[key]
+
+    def _update(self, key: tuple[str, int], value: bool, expires_at: float) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+            elif entry.value is not None and entry.expires_at >= expires_at:
+                return False
+            # If a probe is in progress its result replaces this one later.
+            entry.value = value
+            entry.expires_at = expires_at
+            self._entries.move_to_end(key)
+            self._evict()
+        return True
 
-        self._cache_values[key] = supports_http2
-        key_lock.release()
+    def _evict(self) -> None:
+        # Origins which are being probed stay, their prober reports back.
+        excess = len(self._entries) - self.maxsize
+        if excess <= 0:
+            return
+        evictable = [key for key, entry in self._entries.items() if not entry.probing]
+        for key in evictable[:excess]:
+            del self._entries[key]
 
     def _values(self) -> dict[tuple[str, int], bool | None]:
         """This function is for testing purposes only. Gets the current state of the probe cache"""
         with self._lock:
-            return {k: v for k, v in self._cache_values.items()}
+            return {k: entry.value for k, entry in self._entries.items()}
 
     def _reset(self) -> None:
         """This function is for testing purposes only. Reset the cache values"""
         with self._lock:
-            self._cache_locks = {}
-            self._cache_values = {}
+            self._entries = collections.OrderedDict()
 
 
-_HTTP2_PROBE_CACHE = _HTTP2ProbeCache()
+#: The cache of all connections of the process.
+http2_support_cache = HTTP2SupportCache()
 
-set_and_release = _HTTP2_PROBE_CACHE.set_and_release
-acquire_and_get = _HTTP2_PROBE_CACHE.acquire_and_get
-_values = _HTTP2_PROBE_CACHE._values
-_reset = _HTTP2_PROBE_CACHE._reset
+set_and_release = http2_support_cache.set_and_release
+acquire_and_get = http2_support_cache.acquire_and_get
+_values = http2_support_cache._values
+_reset = http2_support_cache._reset
 
 __all__ = [
+    "HTTP2SupportCache",
+    "http2_support_cache",
     "set_and_release",
     "acquire_and_get",
 ]
@@ -2,15 +2,25 @@ from __future__ import annotations
 
 import functools
 import logging
+import threading
 import typing
 import warnings
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from types import TracebackType
 from urllib.parse import urljoin
 
-from ._collections import HTTPHeaderDict, RecentlyUsedContainer
+from ._collections import RecentlyUsedContainer
 from ._request_methods import RequestMethods
 from .connection import ProxyConfig
-from .connectionpool import HTTPConnectionPool, HTTPSConnectionPool, port_by_scheme
+from .connectionpool import (
+    _PREWARM_MAX_WORKERS,
+    _TYPE_TIMEOUT,
+    HTTPConnectionPool,
+    HTTPSConnectionPool,
+    _redirect_request,
+    port_by_scheme,
+)
 from .exceptions import (
     LocationValueError,
     MaxRetryError,
@@ -21,7 +31,8 @@ from .response import BaseHTTPResponse
 from .util.connection import _TYPE_SOCKET_OPTIONS
 from .util.proxy import connection_requires_http_tunnel
 from .util.retry import Retry
-from .util.timeout import Timeout
+from .util.stats import PoolStats
+from .util.timeout import _DEFAULT_TIMEOUT, Timeout
 from .util.url import Url, parse_url
 
 if typing.TYPE_CHECKING:
@@ -29,7 +40,11 @@ if typing.TYPE_CHECKING:
 
     from typing_extensions import Self
 
-__all__ = ["PoolManager", "ProxyManager", "proxy_from_url"]
+    from .http2.connection import _HTTP2Sessions
+    from .util.resolver import BaseResolver
+    from .util.ssl_ import TLSSessionCache
+
+__all__ = ["PoolManager", "ProxyManager", "RequestResult", "proxy_from_url"]
 
 
 log = logging.getLogger(__name__)
@@ -49,11 +64,19 @@ SSL_KEYWORDS = (
     "server_hostname",
     "assert_hostname",
     "assert_fingerprint",
+    "tls_session_cache",
 )
 # Default value for `blocksize` - a new parameter introduced to
 # http.client.HTTPConnection & http.client.HTTPSConnection in Python 3.7
 _DEFAULT_BLOCKSIZE = 16384
 
+# Default number of requests request_many() has in flight at once.
+_REQUEST_MANY_MAX_CONCURRENCY = 32
+
+# A request for request_many(): either a ``(method, url)`` tuple or a mapping
+# of keyword arguments for request() including "method" and "url".
+_TYPE_BATCH_REQUEST = typing.Union[tuple[str, str], typing.Mapping[str, typing.Any]]
+
 
 class PoolKey(typing.NamedTuple):
     """
@@ -82,6 +105,9 @@ class PoolKey(typing.NamedTuple):
     key_ca_cert_dir: str | None
     key_ssl_context: ssl.SSLContext | None
     key_maxsize: int | None
+    key_max_idle_time: float | None
+    key_max_connection_lifetime: float | None
+    key_reaper_interval: float | None
     key_headers: frozenset[tuple[str, str]] | None
     key__proxy: Url | None
     key__proxy_headers: frozenset[tuple[str, str]] | None
@@ -92,6 +118,13 @@ class PoolKey(typing.NamedTuple):
     key_assert_fingerprint: str | None
     key_server_hostname: str | None
     key_blocksize: int | None
+    key_tls_session_cache: TLSSessionCache | None
+    key_happy_eyeballs: bool | float | None
+    key_resolver: BaseResolver | None
+    key_h2_initial_window_size: int | None
+    key_h2_connection_window_size: int | None
+    key_h2_max_frame_size: int | None
+    key_http2_prior_knowledge: bool | None
 
 
 def _default_key_normalizer(
@@ -161,6 +194,233 @@ key_fn_by_scheme = {
 pool_classes_by_scheme = {"http": HTTPConnectionPool, "https": HTTPSConnectionPool}
 
 
+class RequestResult(typing.NamedTuple):
+    """
+    Outcome of one of the requests made by :meth:`PoolManager.request_many`.
+
+    Exactly one of ``response`` and ``error`` is set.
+    """
+
+    #: Position of the request in the iterable given to ``request_many()``.
+    position: int
+    method: str
+    url: str
+    response: BaseHTTPResponse | None
+    error: Exception | None
+
+    def result(self) -> BaseHTTPResponse:
+        """
+        Returns the response, or raises the exception the request failed with.
+        """
+        if self.error is not None:
+            raise self.error
+        assert self.response is not None
+        return self.response
+
+
+class _BatchItem(typing.NamedTuple):
+    position: int
+    method: str
+    url: str
+    kw: dict[str, typing.Any]
+    host_key: tuple[str, str, int | None]
+
+
+class _RequestManyScheduler:
+    """
+    Bookkeeping for :meth:`PoolManager.request_many`: decides which of the
+    requests may be started without going over ``max_concurrency`` requests
+    in total or ``per_host_limit`` requests to the same host.
+
+    Requests to a host which is at its limit are parked until one of its
+    requests completes, so they don't hold up requests to other hosts.
+    """
+
+    def __init__(
+        self,
+        manager: PoolManager,
+        requests: typing.Iterable[_TYPE_BATCH_REQUEST],
+        max_concurrency: int,
+        per_host_limit: int | None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if per_host_limit is not None and per_host_limit < 1:
+            raise ValueError("per_host_limit must be at least 1")
+
+        self._manager = manager
+        self._requests = enumerate(requests)
+        self._exhausted = False
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+
+        self.in_flight = 0
+        self._parked: dict[tuple[str, str, int | None], deque[_BatchItem]] = {}
+        self._num_parked = 0
+        self._active: dict[tuple[str, str, int | None], int] = {}
+        self._limits: dict[tuple[str, str, int | None], int] = {}
+
+    @property
+    def finished(self) -> bool:
+        return self._exhausted and not self.in_flight and not self._num_parked
+
+    def start(self) -> tuple[list[_BatchItem], list[RequestResult]]:
+        """
+        Returns the requests to start now, and the results of requests which
+        failed before they could be started, e.g. because of an invalid URL.
+        """
+        to_start: list[_BatchItem] = []
+        failed: list[RequestResult] = []
+
+        # Requests which waited for their host go first.
+        for host_key, parked in list(self._parked.items()):
+            while parked and self._has_room(host_key):
+                to_start.append(self._take(parked.popleft()))
+                self._num_parked -= 1
+            if not parked:
+                del self._parked[host_key]
+
+        # Parked requests are bounded too so that a long iterable of requests
+        # to one host isn't read into memory at once.
+        while (
+            not self._exhausted
+            and self.in_flight < self.max_concurrency
+            and self._num_parked < self.max_concurrency
+        ):
+            try:
+                position, request = next(self._requests)
+            except StopIteration:
+                self._exhausted = True
+                break
+
+            try:
+                item = self._prepare(position, request)
+            except Exception as e:
+                method, url = _describe_request(request)
+                failed.append(RequestResult(position, method, url, None, e))
+                continue
+
+            if self._has_room(item.host_key):
+                to_start.append(self._take(item))
+            else:
+                self._parked.setdefault(item.host_key, deque()).append(item)
+                self._num_parked += 1
+
+        return to_start, failed
+
+    def done(self, item: _BatchItem) -> None:
+        self.in_flight -= 1
+        self._active[item.host_key] -= 1
+
+    def _prepare(self, position: int, request: _TYPE_BATCH_REQUEST) -> _BatchItem:
+        if isinstance(request, typing.Mapping):
+            kw = dict(request)
+            method = kw.pop("method")
+            url = kw.pop("url")
+        else:
+            method, url = request
+            kw = {}
+
+        pool = self._manager.connection_from_url(url)
+        host_key = (pool.scheme, pool.host, pool.port)
+        if host_key not in self._limits:
+            # More requests to a host than its pool has connections would only
+            # open connections which are discarded afterwards.
+            maxsize = pool.pool.maxsize if pool.pool is not None else 1
+            limit = maxsize
+            if self.per_host_limit is not None:
+                limit = min(self.per_host_limit, maxsize)
+            self._limits[host_key] = max(limit, 1)
+        return _BatchItem(position, method, url, kw, host_key)
+
+    def _has_room(self, host_key: tuple[str, str, int | None]) -> bool:
+        return (
+            self.in_flight < self.max_concurrency
+            and self._active.get(host_key, 0) < self._limits[host_key]
+        )
+
+    def _take(self, item: _BatchItem) -> _BatchItem:
+        self.in_flight += 1
+        self._active[item.host_key] = self._active.get(item.host_key, 0) + 1
+        return item
+
+
+def _describe_request(request: typing.Any) -> tuple[str, str]:
+    """Best effort ``(method, url)`` of a malformed request for its result."""
+    if isinstance(request, typing.Mapping):
+        return str(request.get("method", "")), str(request.get("url", ""))
+    try:
+        method, url = request
+    except (TypeError, ValueError):
+        return "", ""
+    return str(method), str(url)
+
+
+def _pool_stats(pool: typing.Any) -> PoolStats | None:
+    """Statistics of ``pool``, custom pool classes may not keep any."""
+    return getattr(pool, "stats", None)
+
+
+def _retire_pool_stats(retired: PoolStats, pool: typing.Any) -> None:
+    """Folds the statistics of a pool which is dropped into ``retired``."""
+    stats = _pool_stats(pool)
+    if stats is not None:
+        retired.merge(stats)
+
+
+class _CoalescedHTTP2Sessions:
+    """
+    Registries of HTTP/2 sessions which a :class:`PoolManager` shares between
+    the pools whose keys only differ in the host, so that their connections
+    can be coalesced. A registry is dropped with the last pool using it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._registries: dict[PoolKey, _HTTP2Sessions] = {}
+        self._pools: dict[PoolKey, int] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._registries)
+
+    def share(
+        self, pool_key: PoolKey, sessions_cls: type[_HTTP2Sessions]
+    ) -> _HTTP2Sessions:
+        """Returns the registry for a new pool with ``pool_key``."""
+        key = pool_key._replace(key_host="")
+        with self._lock:
+            registry = self._registries.get(key)
+            if registry is None:
+                registry = self._registries[key] = sessions_cls(coalesce=True)
+            self._pools[key] = self._pools.get(key, 0) + 1
+            return registry
+
+    def release(self, pool: typing.Any) -> None:
+        """Drops ``pool`` from the registry it was given, if any."""
+        conn_kw = getattr(pool, "conn_kw", None)
+        registry = conn_kw.get("h2_sessions") if conn_kw else None
+        if registry is None:
+            return
+        with self._lock:
+            for key, shared in self._registries.items():
+                if shared is registry:
+                    self._pools[key] -= 1
+                    if not self._pools[key]:
+                        del self._registries[key], self._pools[key]
+                    return
+
+
+def _dispose_pool(
+    retired_stats: PoolStats,
+    http2_sessions: _CoalescedHTTP2Sessions,
+    pool: typing.Any,
+) -> None:
+    """Called for the pools which a :class:`PoolManager` drops."""
+    _retire_pool_stats(retired_stats, pool)
+    http2_sessions.release(pool)
+
+
 class PoolManager(RequestMethods):
     """
     Allows for arbitrary requests while transparently keeping track of
@@ -174,6 +434,14 @@ class PoolManager(RequestMethods):
         Headers to include with all requests, unless other headers are given
         explicitly.
 
+    :param http2_coalescing:
+        If True, HTTP/2 connections are shared between origins
+        (:rfc:`9113#section-9.1.1`): requests to another host with the same
+        port and pool settings reuse an open connection if the hostname
+        resolves to that connection's server address and the server's
+        certificate is valid for it. Servers answering such requests with
+        421 (Misdirected Request) are no longer used for that host.
+
     :param \\**connection_pool_kw:
         Additional parameters are used to create fresh
         :class:`urllib3.connectionpool.ConnectionPool` instances.
@@ -202,6 +470,7 @@ class PoolManager(RequestMethods):
         self,
         num_pools: int = 10,
         headers: typing.Mapping[str, str] | None = None,
+        http2_coalescing: bool = False,
         **connection_pool_kw: typing.Any,
     ) -> None:
         super().__init__(headers)
@@ -221,8 +490,18 @@ class PoolManager(RequestMethods):
                 connection_pool_kw["retries"] = retries
         self.connection_pool_kw = connection_pool_kw
 
+        self.http2_coalescing = http2_coalescing
+        self._http2_sessions = _CoalescedHTTP2Sessions()
+        # Counters of the pools which were evicted or cleared, so that the
+        # counters of ``stats`` never go down.
+        self._retired_stats = PoolStats()
         self.pools: RecentlyUsedContainer[PoolKey, HTTPConnectionPool]
-        self.pools = RecentlyUsedContainer(num_pools)
+        self.pools = RecentlyUsedContainer(
+            num_pools,
+            dispose_func=functools.partial(
+                _dispose_pool, self._retired_stats, self._http2_sessions
+            ),
+        )
 
         # Locally set the pool classes and keys so other PoolManagers can
         # override them.
@@ -289,6 +568,18 @@ class PoolManager(RequestMethods):
         """
         self.pools.clear()
 
+    @property
+    def stats(self) -> PoolStats:
+        """
+        Combined :class:`~urllib3.util.stats.PoolStats` of the pools currently
+        managed. The counters of pools which were evicted or cleared are kept,
+        their gauges are dropped.
+        """
+        pool_stats = (_pool_stats(pool) for pool in self.pools.values())
+        return PoolStats.combine(
+            [self._retired_stats, *(stats for stats in pool_stats if stats is not None)]
+        )
+
     def connection_from_host(
         self,
         host: str | None,
@@ -365,10 +656,25 @@ class PoolManager(RequestMethods):
             host = request_context["host"]
             port = request_context["port"]
             pool = self._new_pool(scheme, host, port, request_context=request_context)
+            if self.http2_coalescing:
+                self._share_http2_sessions(pool_key, pool)
             self.pools[pool_key] = pool
 
         return pool
 
+    def _share_http2_sessions(
+        self, pool_key: PoolKey, pool: HTTPConnectionPool
+    ) -> None:
+        """
+        Gives ``pool`` the same registry of HTTP/2 sessions as the pools of
+        other hosts with the same settings, so that their connections can be
+        coalesced.
+        """
+        sessions_cls = getattr(pool.ConnectionCls, "SessionsCls", None)
+        if sessions_cls is None or pool.scheme != "https" or self.proxy is not None:
+            return
+        pool.conn_kw["h2_sessions"] = self._http2_sessions.share(pool_key, sessions_cls)
+
     def connection_from_url(
         self, url: str, pool_kwargs: dict[str, typing.Any] | None = None
     ) -> HTTPConnectionPool:
@@ -387,6 +693,144 @@ class PoolManager(RequestMethods):
             u.host, port=u.port, scheme=u.scheme, pool_kwargs=pool_kwargs
         )
 
+    def prewarm(
+        self,
+        urls: typing.Iterable[str],
+        per_host: int | None = None,
+        timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT,
+    ) -> int:
+        """
+        Open connections to each of ``urls`` ahead of time so that the first
+        requests don't pay for connection setup.
+
+        The pools for all hosts are warmed up in parallel, see
+        :meth:`urllib3.HTTPConnectionPool.prewarm`. URLs which share a pool
+        only warm it up once.
+
+        :param urls:
+            URLs of the hosts to open connections to. Only the scheme, host
+            and port are used.
+
+        :param per_host:
+            Number of connections to have open for each host. Defaults to the
+            ``maxsize`` of each pool.
+
+        :param timeout:
+            Connect timeout for each connection. Defaults to the pool's timeout.
+
+        :return:
+            Total number of connections which were opened.
+        """
+        pools: dict[int, HTTPConnectionPool] = {}
+        for url in urls:
+            pool = self.connection_from_url(url)
+            pools[id(pool)] = pool
+        if not pools:
+            return 0
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(pools), _PREWARM_MAX_WORKERS),
+            thread_name_prefix="urllib3-prewarm",
+        ) as executor:
+            futures = [
+                executor.submit(pool.prewarm, per_host, timeout)
+                for pool in pools.values()
+            ]
+            return sum(future.result() for future in futures)
+
+    def request_many(
+        self,
+        requests: typing.Iterable[_TYPE_BATCH_REQUEST],
+        max_concurrency: int = _REQUEST_MANY_MAX_CONCURRENCY,
+        per_host_limit: int | None = None,
+    ) -> typing.Generator[RequestResult, None, None]:
+        """
+        Make many requests concurrently and yield their results as they
+        complete.
+
+        Each request is either a ``(method, url)`` tuple or a mapping of
+        keyword arguments for :meth:`request`, which must include ``method``
+        and ``url``. The requests run on a thread pool which is shut down once
+        iteration stops. A request failing doesn't stop the others, its
+        exception is returned in the :class:`RequestResult` instead:
+
+        .. code-block:: python
+
+            import urllib3
+
+            http = urllib3.PoolManager(maxsize=4)
+
+            requests = [("GET", f"https://example.com/{i}") for i in range(100)]
+            for result in http.request_many(requests, max_concurrency=16):
+                if result.error is not None:
+                    print(result.url, result.error)
+                else:
+                    print(result.url, result.response.status)
+
+        :param requests:
+            The requests to make. The iterable is consumed as requests are
+            started, not all at once.
+
+        :param max_concurrency:
+            Maximum number of requests in flight at the same time.
+
+        :param per_host_limit:
+            Maximum number of requests in flight to the same host. Defaults to,
+            and is capped at, the ``maxsize`` of the host's pool so that no
+            more connections are opened than the pool can keep.
+
+        :return:
+            An iterator of :class:`RequestResult` in order of completion.
+            ``RequestResult.position`` is the position of the request in
+            ``requests``.
+        """
+        scheduler = _RequestManyScheduler(
+            self, requests, max_concurrency, per_host_limit
+        )
+        return self._request_many(scheduler)
+
+    def _request_many(
+        self, scheduler: _RequestManyScheduler
+    ) -> typing.Generator[RequestResult, None, None]:
+        futures: dict[Future[BaseHTTPResponse], _BatchItem] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=scheduler.max_concurrency,
+            thread_name_prefix="urllib3-request-many",
+        )
+        try:
+            while not scheduler.finished:
+                to_start, failed = scheduler.start()
+                for item in to_start:
+                    future = executor.submit(
+                        self.request, item.method, item.url, **item.kw
+                    )
+                    futures[future] = item
+                yield from failed
+                if not futures:
+                    continue
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = futures.pop(future)
+                    scheduler.done(item)
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        yield RequestResult(
+                            item.position, item.method, item.url, None, e
+                        )
+                    else:
+                        yield RequestResult(
+                            item.position, item.method, item.url, response, None
+                        )
+        finally:
+            # Iteration stopped early: don't start the remaining requests and
+            # give the connections of responses nobody will see back.
+            executor.shutdown(wait=True, cancel_futures=True)
+            for future in futures:
+                if not future.cancelled() and future.exception() is None:
+                    future.result().drain_conn()
+
     def _merge_pool_kwargs(
         self, override: dict[str, typing.Any] | None
     ) -> dict[str, typing.Any]:
@@ -465,28 +909,19 @@ class PoolManager(RequestMethods):
         # Support relative URLs for redirecting.
         redirect_location = urljoin(url, redirect_location)
 
-        if response.status == 303:
-            # Change the method according to RFC 9110, Section 15.4.4.
-            method = "GET"
-            # And lose the body not to transfer anything sensitive.
-            kw["body"] = None
-            kw["headers"] = HTTPHeaderDict(kw["headers"])._prepare_for_method_change()
-
         retries = kw.get("retries", response.retries)
         if not isinstance(retries, Retry):
             retries = Retry.from_int(retries, redirect=redirect)
 
-        # Strip headers marked as unsafe to forward to the redirected location.
-        # Check remove_headers_on_redirect to avoid a potential network call within
-        # conn.is_same_host() which may use socket.gethostbyname() in the future.
-        if retries.remove_headers_on_redirect and not conn.is_same_host(
-            redirect_location
-        ):
-            new_headers = kw["headers"].copy()
-            for header in kw["headers"]:
-                if header.lower() in retries.remove_headers_on_redirect:
-                    new_headers.pop(header, None)
-            kw["headers"] = new_headers
+        method, kw["body"], kw["headers"] = _redirect_request(
+            conn,
+            retries,
+            response.status,
+            redirect_location,
+            method,
+            kw.get("body"),
+            kw["headers"],
+        )
 
         try:
             retries = retries.increment(method, url, response=response, _pool=conn)
@@ -4,14 +4,21 @@ import collections
 import io
 import json as _json
 import logging
+import os
 import socket
+import stat
 import sys
+import threading
+import time
 import typing
 import warnings
+import weakref
 import zlib
 from contextlib import contextmanager
 from http.client import HTTPMessage as _HttplibHTTPMessage
 from http.client import HTTPResponse as _HttplibHTTPResponse
+from http.client import IncompleteRead as _HttplibIncompleteRead
+from http.client import LineTooLong
 from socket import timeout as SocketTimeout
 
 if typing.TYPE_CHECKING:
@@ -28,6 +35,7 @@ except ImportError:
 from . import util
 from ._base_connection import _TYPE_BODY
 from ._collections import HTTPHeaderDict
+from ._http11 import _MAXLINE, parse_header_block
 from .connection import BaseSSLError, HTTPConnection, HTTPException
 from .exceptions import (
     BodyNotHttplibCompatible,
@@ -44,6 +52,7 @@ from .exceptions import (
 )
 from .util.response import is_fp_closed, is_response_to_head
 from .util.retry import Retry
+from .util.wait import wait_for_read
 
 if typing.TYPE_CHECKING:
     from .connectionpool import HTTPConnectionPool
@@ -53,73 +62,123 @@ log = logging.getLogger(__name__)
 # Read in 64 KiB chunks
 _READ_CHUNK_SIZE = 2**16
 
+# Largest amount of data BytesQueueBuffer assembles in one go, holding on to
+# the chunks until the result was allocated. Larger amounts are assembled
+# chunk by chunk, so that peak memory usage doesn't double.
+_MAX_JOIN_SIZE = 2**20
+
+# Least amount of input the zlib decoders take at once when their output is
+# limited, so that the header of a stream isn't fed byte by byte.
+_MIN_DECODER_INPUT = 2**8
+
+# Size of the buffer HTTPResponse.save_to() moves the body through.
+_SAVE_CHUNK_SIZE = 2**20
+
 
 class ContentDecoder:
+    """
+    Decodes a response body with one content coding. A new instance is
+    created for every response, see :func:`register_content_decoder`.
+
+    Responses limit how much data is decoded at once to protect against
+    decompression bombs, so implementations have to follow the ``max_length``
+    contract of :meth:`decompress`.
+    """
+
     def decompress(self, data: bytes, max_length: int = -1) -> bytes:
+        """
+        Feeds ``data`` to the decoder and returns the data which was decoded.
+
+        :param max_length:
+            If positive, at most ``max_length`` bytes are returned. Input which
+            couldn't be decoded within the limit is kept, and
+            :attr:`has_unconsumed_tail` is true until it's decoded by later
+            calls, which may pass empty ``data``. If negative, all of the
+            input is decoded.
+
+        Empty ``data`` may also be passed once the end of the encoded data
+        was reached, which has to return ``b""``.
+        """
         raise NotImplementedError()
 
     @property
     def has_unconsumed_tail(self) -> bool:
+        """Whether input is left which wasn't decoded due to ``max_length``."""
         raise NotImplementedError()
 
     def flush(self) -> bytes:
+        """Returns the rest of the decoded data once the body ended."""
         raise NotImplementedError()
 
 
+def _next_decoder_input(data: BytesQueueBuffer, max_length: int) -> bytes:
+    """
+    Takes the input for the next call of a zlib decompressor. With a limit
+    only about as much input is taken as output is wanted, zlib copies the
+    input which it doesn't consume into ``unconsumed_tail`` on every call.
+    """
+    n = len(data.buffer[0])
+    if max_length >= 0 and n > max_length:
+        n = min(max(max_length, _MIN_DECODER_INPUT), len(data))
+    return data.get(n)
+
+
 class DeflateDecoder(ContentDecoder):
     def __init__(self) -> None:
         self._first_try = True
         self._first_try_data = b""
-        self._unfed_data = b""
+        # Input which wasn't decompressed yet.
+        self._input = BytesQueueBuffer()
         self._obj = zlib.decompressobj()
 
     def decompress(self, data: bytes, max_length: int = -1) -> bytes:
-        data = self._unfed_data + data
-        self._unfed_data = b""
-        if not data and not self._obj.unconsumed_tail:
-            return data
-        original_max_length = max_length
-        if original_max_length < 0:
-            max_length = 0
-        elif original_max_length == 0:
+        if data:
+            self._input.put(data)
+        if max_length == 0:
             # We should not pass 0 to the zlib decompressor because 0 is
             # the default value that will make zlib decompress without a
             # length limit.
             # Data should be stored for subsequent calls.
-            self._unfed_data = data
             return b""
 
-        # Subsequent calls always reuse `self._obj`. zlib requires
-        # passing the unconsumed tail if decompression is to continue.
-        if not self._first_try:
-            return self._obj.decompress(
-                self._obj.unconsumed_tail + data, max_length=max_length
-            )
+        ret: list[bytes] = []
+        length = 0
+        while self._input and (max_length < 0 or length < max_length):
+            chunk = _next_decoder_input(self._input, max_length - length)
+            limit = max(max_length - length, 0)
+            if not self._first_try:
+                decompressed = self._obj.decompress(chunk, max_length=limit)
+            else:
+                # First call tries with RFC 1950 ZLIB format.
+                try:
+                    decompressed = self._obj.decompress(chunk, max_length=limit)
+                # On failure, it falls back to RFC 1951 DEFLATE format.
+                except zlib.error:
+                    self._first_try = False
+                    self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+                    self._input.unget(chunk)
+                    self._input.unget(self._first_try_data)
+                    self._first_try_data = b""
+                    continue
+                if decompressed:
+                    self._first_try = False
+                    self._first_try_data = b""
+                else:
+                    consumed = len(chunk) - len(self._obj.unconsumed_tail)
+                    self._first_try_data += chunk[:consumed]
+            ret.append(decompressed)
+            length += len(decompressed)
 
-        # First call tries with RFC 1950 ZLIB format.
-        self._first_try_data += data
-        try:
-            decompressed = self._obj.decompress(data, max_length=max_length)
-            if decompressed:
-                self._first_try = False
-                self._first_try_data = b""
-            return decompressed
-        # On failure, it falls back to RFC 1951 DEFLATE format.
-        except zlib.error:
-            self._first_try = False
-            self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
-            try:
-                return self.decompress(
-                    self._first_try_data, max_length=original_max_length
-                )
-            finally:
-                self._first_try_data = b""
+            if self._obj.eof:
+                # Data after the end of the stream is ignored.
+                self._input = BytesQueueBuffer()
+            elif self._obj.unconsumed_tail:
+                self._input.unget(self._obj.unconsumed_tail)
+        return b"".join(ret)
 
     @property
     def has_unconsumed_tail(self) -> bool:
-        return bool(self._unfed_data) or (
-            bool(self._obj.unconsumed_tail) and not self._first_try
-        )
+        return bool(self._input)
 
     def flush(self) -> bytes:
         return self._obj.flush()
@@ -135,61 +194,57 @@ class GzipDecoder(ContentDecoder):
     def __init__(self) -> None:
         self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
         self._state = GzipDecoderState.FIRST_MEMBER
-        self._unconsumed_tail = b""
+        # Input which wasn't decompressed yet.
+        self._input = BytesQueueBuffer()
 
     def decompress(self, data: bytes, max_length: int = -1) -> bytes:
-        ret = bytearray()
         if self._state == GzipDecoderState.SWALLOW_DATA:
-            return bytes(ret)
-
+            return b""
+        if data:
+            self._input.put(data)
         if max_length == 0:
             # We should not pass 0 to the zlib decompressor because 0 is
             # the default value that will make zlib decompress without a
             # length limit.
             # Data should be stored for subsequent calls.
-            self._unconsumed_tail += data
             return b""
 
-        # zlib requires passing the unconsumed tail to the subsequent
-        # call if decompression is to continue.
-        data = self._unconsumed_tail + data
-        if not data and self._obj.eof:
-            return bytes(ret)
+        ret: list[bytes] = []
+        length = 0
+        while self._input and (max_length < 0 or length < max_length):
+            # When the end of a gzip member is reached, a new decompressor
+            # must be created for unused (possibly future) data.
+            if self._obj.eof:
+                self._state = GzipDecoderState.OTHER_MEMBERS
+                self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
 
-        while True:
+            chunk = _next_decoder_input(self._input, max_length - length)
             try:
-                ret += self._obj.decompress(
-                    data, max_length=max(max_length - len(ret), 0)
+                decompressed = self._obj.decompress(
+                    chunk, max_length=max(max_length - length, 0)
                 )
             except zlib.error:
                 previous_state = self._state
                 # Ignore data after the first error
                 self._state = GzipDecoderState.SWALLOW_DATA
-                self._unconsumed_tail = b""
+                self._input = BytesQueueBuffer()
                 if previous_state == GzipDecoderState.OTHER_MEMBERS:
                     # Allow trailing garbage acceptable in other gzip clients
-                    return bytes(ret)
+                    return b"".join(ret)
                 raise
+            ret.append(decompressed)
+            length += len(decompressed)
 
-            self._unconsumed_tail = data = (
-                self._obj.unconsumed_tail or self._obj.unused_data
-            )
-            if max_length > 0 and len(ret) >= max_length:
-                break
-
-            if not data:
-                return bytes(ret)
-            # When the end of a gzip member is reached, a new decompressor
-            # must be created for unused (possibly future) data.
-            if self._obj.eof:
-                self._state = GzipDecoderState.OTHER_MEMBERS
-                self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
-
-        return bytes(ret)
+            # Only one of them is set, the rest of the input is kept for
+            # subsequent calls.
+            unconsumed = self._obj.unconsumed_tail or self._obj.unused_data
+            if unconsumed:
+                self._input.unget(unconsumed)
+        return b"".join(ret)
 
     @property
     def has_unconsumed_tail(self) -> bool:
-        return bool(self._unconsumed_tail)
+        return bool(self._input)
 
     def flush(self) -> bytes:
         return self._obj.flush()
@@ -356,24 +411,156 @@ class MultiDecoder(ContentDecoder):
         return any(d.has_unconsumed_tail for d in self._decoders)
 
 
+class _RegisteredDecoder(typing.NamedTuple):
+    factory: typing.Callable[[], ContentDecoder]
+    error_classes: tuple[type[Exception], ...]
+    accept: bool
+
+
+# Content codings with their decoders, in order of preference. The dict is
+# replaced instead of changed, so that responses being decoded in other
+# threads never see it half updated.
+_content_decoders: dict[str, _RegisteredDecoder] = {
+    "gzip": _RegisteredDecoder(GzipDecoder, (zlib.error,), True),
+    "deflate": _RegisteredDecoder(DeflateDecoder, (zlib.error,), True),
+}
+if brotli is not None:
+    _content_decoders["br"] = _RegisteredDecoder(BrotliDecoder, (brotli.error,), True)
+if HAS_ZSTD:
+    _content_decoders["zstd"] = _RegisteredDecoder(ZstdDecoder, (zstd.ZstdError,), True)
+_content_decoders_lock = threading.Lock()
+
+
+def register_content_decoder(
+    content_coding: str,
+    decoder: typing.Callable[[], ContentDecoder],
+    *,
+    error_classes: tuple[type[Exception], ...] = (),
+    accept: bool = True,
+    prefer: bool = False,
+) -> None:
+    """
+    Registers a decoder for a content coding of response bodies, or replaces
+    the decoder of a content coding like ``gzip`` with another
+    implementation. Responses with that coding in their ``Content-Encoding``
+    header are decoded with a new instance of ``decoder``, which has to
+    follow the ``max_length`` contract of
+    :meth:`ContentDecoder.decompress`, see :ref:`custom_content_decoders`.
+
+    :param content_coding:
+        The content coding token, such as ``lz4``.
+    :param decoder:
+        A :class:`ContentDecoder` subclass or another callable which returns
+        a new decoder.
+    :param error_classes:
+        Exceptions raised by the decoder for invalid data, which are raised
+        as :class:`~urllib3.exceptions.DecodeError`.
+    :param accept:
+        Whether the content coding is listed in the ``Accept-Encoding``
+        header created by :func:`~urllib3.util.make_headers`.
+    :param prefer:
+        If True, the content coding is listed first in the ``Accept-Encoding``
+        header. Otherwise, new content codings are listed last and replaced
+        ones keep their place.
+    """
+    content_coding = content_coding.strip().lower()
+    if not content_coding or "," in content_coding:
+        raise ValueError(f"Invalid content coding: {content_coding!r}")
+    global _content_decoders
+    entry = _RegisteredDecoder(decoder, tuple(error_classes), accept)
+    with _content_decoders_lock:
+        if prefer:
+            decoders = {content_coding: entry}
+            decoders.update(
+                (coding, other)
+                for coding, other in _content_decoders.items()
+                if coding != content_coding
+            )
+        else:
+            decoders = {**_content_decoders, content_coding: entry}
+        _content_decoders = decoders
+
+        if content_coding not in BaseHTTPResponse.CONTENT_DECODERS:
+            BaseHTTPResponse.CONTENT_DECODERS.append(content_coding)
+        BaseHTTPResponse.DECODER_ERROR_CLASSES += tuple(
+            e for e in error_classes if e not in BaseHTTPResponse.DECODER_ERROR_CLASSES
+        )
+
+
+def unregister_content_decoder(content_coding: str) -> None:
+    """
+    Removes the decoder of a content coding, responses with that coding are
+    no longer decoded.
+    """
+    global _content_decoders
+    content_coding = content_coding.strip().lower()
+    # x-gzip is decoded as gzip, see _get_decoder().
+    if content_coding == "x-gzip":
+        content_coding = "gzip"
+    with _content_decoders_lock:
+        if content_coding not in _content_decoders:
+            raise KeyError(content_coding)
+        _content_decoders = {
+            coding: entry
+            for coding, entry in _content_decoders.items()
+            if coding != content_coding
+        }
+        aliases = ("gzip", "x-gzip") if content_coding == "gzip" else (content_coding,)
+        for alias in aliases:
+            if alias in BaseHTTPResponse.CONTENT_DECODERS:
+                BaseHTTPResponse.CONTENT_DECODERS.remove(alias)
+
+
+def _accept_encoding() -> str:
+    """The ``Accept-Encoding`` header value listing the registered codings."""
+    return ",".join(
+        coding for coding, entry in _content_decoders.items() if entry.accept
+    )
+
+
 def _get_decoder(mode: str) -> ContentDecoder:
     if "," in mode:
         return MultiDecoder(mode)
 
     # According to RFC 9110 section 8.4.1.3, recipients should
     # consider x-gzip equivalent to gzip
-    if mode in ("gzip", "x-gzip"):
-        return GzipDecoder()
+    if mode == "x-gzip":
+        mode = "gzip"
 
-    if brotli is not None and mode == "br":
-        return BrotliDecoder()
-
-    if HAS_ZSTD and mode == "zstd":
-        return ZstdDecoder()
+    entry = _content_decoders.get(mode)
+    if entry is not None:
+        return entry.factory()
 
     return DeflateDecoder()
 
 
+def _write_all(f: typing.IO[bytes], data: bytes | memoryview[int]) -> None:
+    # Unbuffered files may write only part of the data.
+    view = memoryview(data)
+    while view:
+        view = view[f.write(view) :]
+
+
+def _write_all_fd(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _splice_from_socket(sock: socket.socket, fd: int, count: int) -> int:
+    """
+    Splices up to ``count`` bytes from ``sock`` into the pipe ``fd``, waiting
+    as long as the timeout of ``sock`` for data to arrive.
+    """
+    while True:
+        try:
+            return os.splice(sock.fileno(), fd, count)
+        except BlockingIOError:
+            # Sockets with a timeout are non-blocking.
+            if not wait_for_read(sock, timeout=sock.gettimeout()):
+                raise SocketTimeout("timed out") from None
+
+
 class BytesQueueBuffer:
     """Memory-efficient bytes buffer
 
@@ -386,18 +573,40 @@ class BytesQueueBuffer:
 
      * self.buffer, which contains the full data
      * the largest chunk that we will copy in get()
+
+    Up to 1 MiB is copied into an exact-size result at once, larger amounts
+    are copied chunk by chunk so that the chunks are released as they go.
+    ``high_water_mark`` is the largest number of bytes buffered at once.
     """
 
     def __init__(self) -> None:
-        self.buffer: typing.Deque[bytes | memoryview[bytes]] = collections.deque()
+        self.buffer: typing.Deque[bytes | memoryview[bytes] | memoryview[int]] = (
+            collections.deque()
+        )
         self._size: int = 0
+        self.high_water_mark: int = 0
 
     def __len__(self) -> int:
         return self._size
 
-    def put(self, data: bytes) -> None:
+    def put(self, data: bytes | memoryview[int]) -> None:
         self.buffer.append(data)
         self._size += len(data)
+        if self._size > self.high_water_mark:
+            self.high_water_mark = self._size
+
+    def unget(self, data: bytes) -> None:
+        """Puts ``data`` back in front of the buffer."""
+        if data:
+            self.buffer.appendleft(data)
+            self._size += len(data)
+            if self._size > self.high_water_mark:
+                self.high_water_mark = self._size
+
+    def clear(self) -> None:
+        """Discards the buffered data but keeps ``high_water_mark``."""
+        self.buffer.clear()
+        self._size = 0
 
     def get(self, n: int) -> bytes:
         if n == 0:
@@ -411,8 +620,13 @@ class BytesQueueBuffer:
             self._size -= n
             return self.buffer.popleft()
 
-        fetched = 0
+        join = min(n, self._size) <= _MAX_JOIN_SIZE
+        chunks: list[bytes | memoryview[bytes]] = []
         ret = io.BytesIO()
+        write: typing.Callable[[bytes | memoryview[bytes]], object]
+        write = chunks.append if join else ret.write
+
+        fetched = 0
         while fetched < n:
             remaining = n - fetched
             chunk = self.buffer.popleft()
@@ -420,20 +634,40 @@ class BytesQueueBuffer:
             if remaining < chunk_length:
                 chunk = memoryview(chunk)
                 left_chunk, right_chunk = chunk[:remaining], chunk[remaining:]
-                ret.write(left_chunk)
+                write(left_chunk)
                 self.buffer.appendleft(right_chunk)
                 self._size -= remaining
                 break
             else:
-                ret.write(chunk)
+                write(chunk)
                 self._size -= chunk_length
             fetched += chunk_length
 
             if not self.buffer:
                 break
 
+        if join:
+            # Joining copies the chunks once into a result of the exact size.
+            return b"".join(chunks)
         return ret.getvalue()
 
+    def get_into(self, buffer: memoryview[int]) -> int:
+        """
+        Moves up to ``len(buffer)`` bytes into ``buffer`` and returns how
+        many bytes were moved.
+        """
+        n = min(len(buffer), self._size)
+        fetched = 0
+        while fetched < n:
+            chunk = memoryview(self.buffer.popleft())
+            size = min(len(chunk), n - fetched)
+            buffer[fetched : fetched + size] = chunk[:size]
+            if size < len(chunk):
+                self.buffer.appendleft(chunk[size:])
+            fetched += size
+        self._size -= n
+        return n
+
     def get_all(self) -> bytes:
         buffer = self.buffer
         if not buffer:
@@ -443,6 +677,9 @@ class BytesQueueBuffer:
             result = buffer.pop()
             if isinstance(result, memoryview):
                 result = result.tobytes()
+        elif self._size <= _MAX_JOIN_SIZE:
+            result = b"".join(buffer)
+            buffer.clear()
         else:
             ret = io.BytesIO()
             ret.writelines(buffer.popleft() for _ in range(len(buffer)))
@@ -451,7 +688,111 @@ class BytesQueueBuffer:
         return result
 
 
+class _ReadAhead:
+    """
+    Reads and decodes the body of a response in a background thread while
+    the caller consumes what was decoded so far, so that waiting for the
+    network and decompressing overlap. At most ``limit`` bytes of decoded
+    data are buffered.
+
+    The worker only holds a weak reference to the response between reads, a
+    response which is garbage collected stops it.
+    """
+
+    def __init__(self, response: HTTPResponse, limit: int) -> None:
+        self.limit = limit
+        self.chunk_size = min(limit, _READ_CHUNK_SIZE)
+        self._cond = threading.Condition()
+        self._chunks: collections.deque[bytes] = collections.deque()
+        self._buffered = 0
+        self._error: Exception | None = None
+        self._finished = False
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(weakref.ref(response),),
+            name="urllib3-read-ahead",
+            daemon=True,
+        )
+        weakref.finalize(response, self.stop)
+        self._thread.start()
+
+    def in_worker(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def get(self) -> tuple[bytes, Exception | None]:
+        """
+        Waits for the next chunk of decoded data. Once the body was read
+        completely this returns ``b""`` and the error which stopped the
+        worker, if any.
+        """
+        with self._cond:
+            while not self._chunks and not self._finished:
+                self._cond.wait()
+            if self._chunks:
+                data = self._chunks.popleft()
+                self._buffered -= len(data)
+                self._cond.notify_all()
+                return data, None
+            return b"", self._error
+
+    def stop(self) -> bool:
+        """
+        Stops the worker after the read in progress and discards what was
+        buffered. Returns whether the worker was still reading the body.
+        """
+        with self._cond:
+            self._stopped = True
+            self._chunks.clear()
+            self._buffered = 0
+            self._cond.notify_all()
+            return not self._finished
+
+    def join(self) -> None:
+        if not self.in_worker():
+            self._thread.join()
+
+    def _put(self, data: bytes) -> bool:
+        with self._cond:
+            # A chunk which is larger than the limit, like the rest of the
+            # data a decoder was flushed with, is let through on its own.
+            while (
+                self._buffered
+                and self._buffered + len(data) > self.limit
+                and not self._stopped
+            ):
+                self._cond.wait()
+            if self._stopped:
+                return False
+            self._chunks.append(data)
+            self._buffered += len(data)
+            self._cond.notify_all()
+            return True
+
+    def _run(self, response_ref: weakref.ref[HTTPResponse]) -> None:
+        error = None
+        try:
+            while not self._stopped:
+                response = response_ref()
+                if response is None:
+                    break
+                data, done = response._read_ahead_step(self.chunk_size)
+                del response
+                if data and not self._put(data):
+                    break
+                if done:
+                    break
+        except Exception as e:
+            error = e
+        finally:
+            with self._cond:
+                self._error = error
+                self._finished = True
+                self._cond.notify_all()
+
+
 class BaseHTTPResponse(io.IOBase):
+    # Content codings which are decoded, see register_content_decoder().
     CONTENT_DECODERS = ["gzip", "x-gzip", "deflate"]
     if brotli is not None:
         CONTENT_DECODERS += ["br"]
@@ -762,6 +1103,8 @@ class HTTPResponse(BaseHTTPResponse):
         self._fp: _HttplibHTTPResponse | None = None
         self._original_response = original_response
         self._fp_bytes_read = 0
+        # Body bytes received including chunked bodies, for the pool's statistics.
+        self._bytes_received = 0
         self.msg = msg
 
         if body and isinstance(body, (str, bytes)):
@@ -776,18 +1119,34 @@ class HTTPResponse(BaseHTTPResponse):
 
         # Are we using the chunked-style of transfer encoding?
         self.chunk_left: int | None = None
+        # Receive buffer of a chunked body, position of its unconsumed part
+        # and the rest of the CRLF after the data of the last chunk.
+        self._chunk_buffer = b""
+        self._chunk_pos = 0
+        self._chunk_crlf_left = 0
+
+        #: Trailer fields sent after a chunked body, once it was read
+        #: completely.
+        self.trailers: HTTPHeaderDict | None = None
 
         # Determine length of response
         self.length_remaining = self._init_length(request_method)
 
         # Used to return the correct amount of bytes for partial read()s
         self._decoded_buffer = BytesQueueBuffer()
+        self._read_ahead: _ReadAhead | None = None
 
         # If requested, preload the body.
         if preload_content and not self._body:
             self._body = self.read(decode_content=decode_content)
 
     def release_conn(self) -> None:
+        if self._read_ahead is not None:
+            # The reader releases the connection once it got to the end.
+            if self._read_ahead.in_worker():
+                return None
+            self._stop_read_ahead(interrupt=True)
+
         if not self._pool or not self._connection:
             return None
 
@@ -800,6 +1159,7 @@ class HTTPResponse(BaseHTTPResponse):
 
         Unread data in the HTTPResponse connection blocks the connection from being released back to the pool.
         """
+        self._stop_read_ahead()
         try:
             while self._raw_read(_READ_CHUNK_SIZE):
                 pass
@@ -808,7 +1168,7 @@ class HTTPResponse(BaseHTTPResponse):
         if self._has_decoded_content:
             # `_raw_read` skips decompression, so we should clean up the
             # decoder to avoid keeping unnecessary data in memory.
-            self._decoded_buffer = BytesQueueBuffer()
+            self._decoded_buffer.clear()
             self._decoder = None
 
     @property
@@ -837,6 +1197,15 @@ class HTTPResponse(BaseHTTPResponse):
         """
         return self._fp_bytes_read
 
+    @property
+    def decoded_buffer_high_water_mark(self) -> int:
+        """
+        The largest number of decoded bytes that were buffered at once while
+        reading the body, e.g. when a chunk decompressed to more than
+        :meth:`HTTPResponse.read` was asked for.
+        """
+        return self._decoded_buffer.high_water_mark
+
     def _init_length(self, request_method: str | None) -> int | None:
         """
         Set initial length value for Response content if available.
@@ -971,6 +1340,8 @@ class HTTPResponse(BaseHTTPResponse):
         This happens to urllib3 injected with pyOpenSSL-backed SSL-support.
         """
         assert self._fp
+        if self.chunked and self.supports_chunked_reads():
+            return self._read_chunks(amt, read1=read1)
         c_int_max = 2**31 - 1
         if (
             (amt and amt > c_int_max)
@@ -1056,10 +1427,52 @@ class HTTPResponse(BaseHTTPResponse):
 
         if data:
             self._fp_bytes_read += len(data)
+            self._record_bytes_received(len(data))
             if self.length_remaining is not None:
                 self.length_remaining -= len(data)
         return data
 
+    def _raw_readinto(self, b: memoryview[int]) -> int:
+        """
+        Reads up to ``len(b)`` bytes of the raw body from the socket straight
+        into ``b``.
+        """
+        if self._fp is None:
+            return 0
+
+        fp_closed = getattr(self._fp, "closed", False)
+
+        with self._error_catcher():
+            if fp_closed:
+                n = 0
+            elif hasattr(self._fp, "readinto") and not (
+                self.chunked and self.supports_chunked_reads()
+            ):
+                if util.IS_PYOPENSSL:
+                    # See _fp_read(), larger reads overflow with pyOpenSSL.
+                    b = b[: 2**31 - 1]
+                n = self._fp.readinto(b) or 0
+            else:
+                data = self._fp_read(len(b))
+                n = len(data)
+                b[:n] = data
+            if len(b) and not n:
+                # See _raw_read().
+                self._fp.close()
+                if (
+                    self.enforce_content_length
+                    and self.length_remaining is not None
+                    and self.length_remaining != 0
+                ):
+                    raise IncompleteRead(self._fp_bytes_read, self.length_remaining)
+
+        if n:
+            self._fp_bytes_read += n
+            self._record_bytes_received(n)
+            if self.length_remaining is not None:
+                self.length_remaining -= n
+        return n
+
     def read(
         self,
         amt: int | None = None,
@@ -1093,7 +1506,17 @@ class HTTPResponse(BaseHTTPResponse):
         if amt and amt < 0:
             # Negative numbers and `None` should be treated the same.
             amt = None
-        elif amt is not None:
+
+        if self._read_ahead is not None:
+            self._check_read_ahead_decoding(decode_content)
+            if amt is not None or not cache_content:
+                self._uncached_read_occurred = True
+            data = self._read_ahead_read(amt)
+            if amt is None and cache_content and not self._uncached_read_occurred:
+                self._body = data
+            return data
+
+        if amt is not None:
             cache_content = False
 
             if (
@@ -1168,6 +1591,69 @@ class HTTPResponse(BaseHTTPResponse):
 
         return data
 
+    def readinto(self, b: bytearray | memoryview[int]) -> int:
+        """
+        Reads the body into ``b`` until it's full or the body ended, and
+        returns the number of bytes read. Unlike ``read(len(b))`` this doesn't
+        create intermediate bytes objects: bodies which aren't decoded are
+        read from the socket straight into ``b``, decoded bodies are
+        decompressed with ``len(b)`` as the limit and copied into ``b``.
+        """
+        self._init_decoder()
+        buffer = memoryview(b).cast("B")
+        size = len(buffer)
+        if size == 0:
+            return 0
+        self._uncached_read_occurred = True
+
+        # Decoded data left over from previous reads comes first.
+        filled = self._decoded_buffer.get_into(buffer)
+
+        if self._read_ahead is not None:
+            while filled < size:
+                data = self._read_ahead_next()
+                if not data:
+                    break
+                n = min(len(data), size - filled)
+                buffer[filled : filled + n] = memoryview(data)[:n]
+                filled += n
+                if n < len(data):
+                    self._decoded_buffer.put(memoryview(data)[n:])
+            return filled
+
+        if not self.decode_content or self._decoder is None:
+            if self._has_decoded_content:
+                raise RuntimeError(
+                    "Calling readinto() with decode_content=False is not "
+                    "supported after read(decode_content=True) was called."
+                )
+            while filled < size:
+                n = self._raw_readinto(buffer[filled:])
+                if not n:
+                    break
+                filled += n
+            return filled
+
+        while filled < size:
+            if self._decoder.has_unconsumed_tail:
+                data = b""
+                flush_decoder = False
+            else:
+                data = self._raw_read(size - filled) or b""
+                flush_decoder = not data
+            decoded_data = self._decode(
+                data, True, flush_decoder, max_length=size - filled
+            )
+            # Flushing the decoder ignores the limit, keep what doesn't fit.
+            n = min(len(decoded_data), size - filled)
+            buffer[filled : filled + n] = memoryview(decoded_data)[:n]
+            filled += n
+            if n < len(decoded_data):
+                self._decoded_buffer.put(memoryview(decoded_data)[n:])
+            if flush_decoder:
+                break
+        return filled
+
     def read1(
         self,
         amt: int | None = None,
@@ -1190,6 +1676,16 @@ class HTTPResponse(BaseHTTPResponse):
         if amt and amt < 0:
             # Negative numbers and `None` should be treated the same.
             amt = None
+        if self._read_ahead is not None:
+            self._check_read_ahead_decoding(decode_content)
+            self._uncached_read_occurred = True
+            if amt == 0:
+                return b""
+            if not self._decoded_buffer:
+                self._decoded_buffer.put(self._read_ahead_next())
+            if amt is None:
+                return self._decoded_buffer.get_all()
+            return self._decoded_buffer.get(min(amt, len(self._decoded_buffer)))
         # try and respond without going to the network
         if self._has_decoded_content:
             if not decode_content:
@@ -1260,7 +1756,10 @@ class HTTPResponse(BaseHTTPResponse):
         if amt == 0:
             return
 
-        if self.chunked and self.supports_chunked_reads():
+        if self._read_ahead is not None:
+            while data := self.read(amt=amt, decode_content=decode_content):
+                yield data
+        elif self.chunked and self.supports_chunked_reads():
             yield from self.read_chunked(amt, decode_content=decode_content)
         else:
             while (
@@ -1273,6 +1772,258 @@ class HTTPResponse(BaseHTTPResponse):
                 if data:
                     yield data
 
+    def save_to(
+        self,
+        file: str | os.PathLike[str] | int | typing.IO[bytes],
+        decode_content: bool | None = None,
+        chunk_size: int = _SAVE_CHUNK_SIZE,
+    ) -> int:
+        """
+        Writes the rest of the body to ``file`` and returns the number of
+        bytes written.
+
+        Bodies which aren't decoded are read into a reusable buffer of
+        ``chunk_size`` bytes rather than into new bytes objects. When the
+        body of a plain HTTP response has a ``Content-Length`` and is saved
+        to a regular file on Linux, it's moved from the socket to the file
+        with :func:`os.splice` without passing through Python at all.
+        Encoded bodies are decoded and written in chunks.
+
+        :param file:
+            A path of the file to write to, which is truncated first, a file
+            descriptor which is written to at its current position and isn't
+            closed, or a binary file object.
+
+        :param decode_content:
+            If True, will attempt to decode the body based on the
+            'content-encoding' header.
+
+        :param chunk_size:
+            How much of the body to move at once.
+        """
+        if decode_content is None:
+            decode_content = self.decode_content
+
+        start = time.perf_counter()
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "wb", buffering=0) as f:
+                written = self._save_to(f, decode_content, chunk_size)
+        elif isinstance(file, int):
+            with open(file, "wb", buffering=0, closefd=False) as f:
+                written = self._save_to(f, decode_content, chunk_size)
+        else:
+            written = self._save_to(file, decode_content, chunk_size)
+
+        elapsed = time.perf_counter() - start
+        log.debug(
+            "Saved %d bytes of the response body in %.3fs (%.1f MB/s)",
+            written,
+            elapsed,
+            written / elapsed / 1e6 if elapsed else 0.0,
+        )
+        return written
+
+    def _save_to(
+        self, f: typing.IO[bytes], decode_content: bool, chunk_size: int
+    ) -> int:
+        self._init_decoder()
+        self._uncached_read_occurred = True
+        written = 0
+        if (decode_content and self._decoder) or self._read_ahead is not None:
+            for data in self.stream(chunk_size, decode_content=decode_content):
+                _write_all(f, data)
+                written += len(data)
+            return written
+
+        if self._has_decoded_content:
+            raise RuntimeError(
+                "Calling save_to(decode_content=False) is not supported after "
+                "read(decode_content=True) was called."
+            )
+        if len(self._decoded_buffer):
+            data = self._decoded_buffer.get_all()
+            _write_all(f, data)
+            written += len(data)
+
+        if self._can_splice(f):
+            return written + self._splice_to(f.fileno(), chunk_size)
+
+        buffer = memoryview(bytearray(chunk_size))
+        while n := self._raw_readinto(buffer):
+            _write_all(f, buffer[:n])
+            written += n
+        return written
+
+    def _can_splice(self, f: typing.IO[bytes]) -> bool:
+        """
+        Checks whether the rest of the body can be spliced from the socket
+        into the file, which requires a plain socket, a known length and a
+        regular file which isn't buffered or opened for appending.
+        """
+        if not hasattr(os, "splice") or not isinstance(f, io.FileIO):
+            return False
+        if not self.length_remaining or is_fp_closed(self._fp):
+            return False
+        if not isinstance(getattr(self._fp, "fp", None), io.BufferedReader):
+            return False
+        if type(getattr(self._connection, "sock", None)) is not socket.socket:
+            return False
+
+        import fcntl
+
+        fd = f.fileno()
+        return stat.S_ISREG(os.fstat(fd).st_mode) and not (
+            fcntl.fcntl(fd, fcntl.F_GETFL) & os.O_APPEND
+        )
+
+    def _splice_to(self, fd: int, chunk_size: int) -> int:
+        assert self._fp is not None and self._connection is not None
+        assert self._connection.sock is not None
+        assert self.length_remaining is not None
+        sock = self._connection.sock
+        fp = self._fp.fp
+        written = 0
+
+        with self._error_catcher():
+            # Part of the body may be buffered by http.client already, after
+            # writing that the socket has the rest of the body.
+            buffered = len(fp.peek(1))
+            if buffered >= self.length_remaining:
+                data = self._fp.read()
+                _write_all_fd(fd, data)
+                self._update_body_read(len(data))
+                return len(data)
+            data = fp.read(buffered)
+            _write_all_fd(fd, data)
+            self._update_body_read(len(data), past_fp=True)
+            written += len(data)
+
+            read_fd, write_fd = os.pipe()
+            try:
+                try:
+                    import fcntl
+
+                    fcntl.fcntl(write_fd, fcntl.F_SETPIPE_SZ, chunk_size)
+                except (ImportError, AttributeError, OSError):
+                    pass
+
+                while self.length_remaining:
+                    n = _splice_from_socket(
+                        sock, write_fd, min(chunk_size, self.length_remaining)
+                    )
+                    if not n:
+                        # See _raw_read().
+                        self._fp.close()
+                        if self.enforce_content_length:
+                            raise IncompleteRead(
+                                self._fp_bytes_read, self.length_remaining
+                            )
+                        break
+                    moved = 0
+                    while moved < n:
+                        moved += os.splice(read_fd, fd, n - moved)
+                    self._update_body_read(n, past_fp=True)
+                    written += n
+            finally:
+                os.close(read_fd)
+                os.close(write_fd)
+
+            if not self.length_remaining:
+                # Lets http.client know the body was read, which closes it.
+                self._fp.read()
+        return written
+
+    def _start_read_ahead(self, limit: int) -> None:
+        """
+        Starts reading and decoding the rest of the body in a background
+        thread, up to ``limit`` bytes of decoded data ahead of the reads.
+        """
+        if limit <= 0:
+            raise ValueError(f"read_ahead must be a positive number, not {limit}")
+        if self._read_ahead is not None or self._fp is None or self.isclosed():
+            return
+        self._init_decoder()
+        self._read_ahead = _ReadAhead(self, limit)
+
+    def _read_ahead_step(self, amt: int) -> tuple[bytes, bool]:
+        """
+        Reads and decodes up to ``amt`` bytes of the body in the read-ahead
+        worker, and returns the data and whether the body ended.
+        """
+        if self._decoder and self.decode_content and self._decoder.has_unconsumed_tail:
+            data = b""
+            done = False
+        else:
+            # Hand over whatever arrived instead of waiting for ``amt`` bytes.
+            data = self._raw_read(amt, read1=True) or b""
+            done = not data
+        return self._decode(data, self.decode_content, done, max_length=amt), done
+
+    def _read_ahead_next(self) -> bytes:
+        """
+        Returns the next chunk decoded by the read-ahead worker, or ``b""``
+        once the body ended. Errors of the worker are raised here.
+        """
+        assert self._read_ahead is not None
+        data, error = self._read_ahead.get()
+        if data:
+            return data
+        self._read_ahead.join()
+        self._read_ahead = None
+        if self._original_response and self._original_response.isclosed():
+            self.release_conn()
+        if error is not None:
+            raise error
+        return b""
+
+    def _read_ahead_read(self, amt: int | None) -> bytes:
+        while amt is None or len(self._decoded_buffer) < amt:
+            data = self._read_ahead_next()
+            if not data:
+                break
+            self._decoded_buffer.put(data)
+        if amt is None:
+            return self._decoded_buffer.get_all()
+        return self._decoded_buffer.get(min(amt, len(self._decoded_buffer)))
+
+    def _check_read_ahead_decoding(self, decode_content: bool) -> None:
+        if bool(decode_content) != bool(self.decode_content) and self._decoder:
+            raise RuntimeError(
+                "The body is read ahead with decode_content="
+                f"{self.decode_content}, it can't be read with "
+                f"decode_content={decode_content}."
+            )
+
+    def _stop_read_ahead(self, interrupt: bool = False) -> None:
+        """
+        Stops the read-ahead worker and discards what it decoded. With
+        ``interrupt`` a read in progress is interrupted by shutting down the
+        socket, and the connection is closed as the body wasn't read.
+        """
+        read_ahead = self._read_ahead
+        if read_ahead is None or read_ahead.in_worker():
+            return
+        reading = read_ahead.stop()
+        if reading and interrupt and self._sock_shutdown:
+            try:
+                self._sock_shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
+        read_ahead.join()
+        self._read_ahead = None
+        self._decoded_buffer.clear()
+        if reading and interrupt and self._connection:
+            self._connection.close()
+
+    def _update_body_read(self, n: int, past_fp: bool = False) -> None:
+        assert self._fp is not None and self.length_remaining is not None
+        if past_fp and self._fp.length is not None:
+            # http.client has to know about body bytes read behind its back.
+            self._fp.length -= n
+        self._fp_bytes_read += n
+        self._record_bytes_received(n)
+        self.length_remaining -= n
+
     # Overrides from io.IOBase
     def readable(self) -> bool:
         return True
@@ -1287,6 +2038,7 @@ class HTTPResponse(BaseHTTPResponse):
         self._sock_shutdown(socket.SHUT_RD)
 
     def close(self) -> None:
+        self._stop_read_ahead(interrupt=True)
         self._sock_shutdown = None
 
         if not self.closed and self._fp:
@@ -1339,16 +2091,55 @@ class HTTPResponse(BaseHTTPResponse):
         """
         return hasattr(self._fp, "fp")
 
-    def _update_chunk_length(self) -> None:
-        # First, we'll figure out length of a chunk and then
-        # we'll try to read it from socket.
-        if self.chunk_left is not None:
-            return None
-        line = self._fp.fp.readline()  # type: ignore[union-attr]
-        line = line.split(b";", 1)[0]
+    def _fill_chunk_buffer(self) -> bool:
+        """
+        Receives more of a chunked body into the receive buffer, keeping the
+        unconsumed part. Returns False at the end of the stream.
+        """
+        fp = self._fp.fp  # type: ignore[union-attr]
+        read1 = getattr(fp, "read1", None)
+        # A single receive usually carries many small chunks.
+        data = read1(_READ_CHUNK_SIZE) if read1 is not None else fp.readline()
+        if not data:
+            return False
+        if self._chunk_pos < len(self._chunk_buffer):
+            data = self._chunk_buffer[self._chunk_pos :] + data
+        self._chunk_buffer = data
+        self._chunk_pos = 0
+        return True
+
+    def _update_chunk_length(self, at_eof: bool = False) -> bool:
+        """
+        Parses the size line of the next chunk out of the receive buffer.
+        Returns False if it wasn't received completely yet.
+        """
+        buffer = self._chunk_buffer
+        pos = self._chunk_pos
+        if self._chunk_crlf_left:
+            # Toss the CRLF at the end of the previous chunk.
+            skipped = min(self._chunk_crlf_left, len(buffer) - pos)
+            self._chunk_crlf_left -= skipped
+            self._chunk_pos = pos = pos + skipped
+            if self._chunk_crlf_left:
+                if at_eof:
+                    raise _HttplibIncompleteRead(b"", self._chunk_crlf_left)
+                return False
+
+        end = buffer.find(b"\n", pos)
+        if end < 0:
+            if len(buffer) - pos > _MAXLINE:
+                raise LineTooLong("chunk size")
+            if not at_eof:
+                return False
+            end = len(buffer) - 1
+        self._chunk_pos = end + 1
+        line = buffer[pos : end + 1].split(b";", 1)[0]
         try:
             self.chunk_left = int(line, 16)
+            if self.chunk_left < 0:
+                raise ValueError
         except ValueError:
+            self.chunk_left = None
             self.close()
             if line:
                 # Invalid chunked protocol response, abort.
@@ -1357,27 +2148,122 @@ class HTTPResponse(BaseHTTPResponse):
                 # Truncated at start of next chunk
                 raise ProtocolError("Response ended prematurely") from None
 
-    def _handle_chunk(self, amt: int | None) -> bytes:
-        returned_chunk = None
-        if amt is None:
-            chunk = self._fp._safe_read(self.chunk_left)  # type: ignore[union-attr]
-            returned_chunk = chunk
-            self._fp._safe_read(2)  # type: ignore[union-attr] # Toss the CRLF at the end of the chunk.
-            self.chunk_left = None
-        elif self.chunk_left is not None and amt < self.chunk_left:
-            value = self._fp._safe_read(amt)  # type: ignore[union-attr]
-            self.chunk_left = self.chunk_left - amt
-            returned_chunk = value
-        elif amt == self.chunk_left:
-            value = self._fp._safe_read(amt)  # type: ignore[union-attr]
-            self._fp._safe_read(2)  # type: ignore[union-attr] # Toss the CRLF at the end of the chunk.
-            self.chunk_left = None
-            returned_chunk = value
-        else:  # amt > self.chunk_left
-            returned_chunk = self._fp._safe_read(self.chunk_left)  # type: ignore[union-attr]
-            self._fp._safe_read(2)  # type: ignore[union-attr] # Toss the CRLF at the end of the chunk.
-            self.chunk_left = None
-        return returned_chunk  # type: ignore[no-any-return]
+        if self.chunk_left == 0:
+            self._read_trailers()
+        return True
+
+    def _read_trailers(self) -> None:
+        lines = []
+        while True:
+            buffer = self._chunk_buffer
+            pos = self._chunk_pos
+            end = buffer.find(b"\n", pos)
+            if end < 0:
+                if len(buffer) - pos > _MAXLINE:
+                    raise LineTooLong("trailer line")
+                if self._fill_chunk_buffer():
+                    continue
+                # Some sites may not end with '\r\n'.
+                lines.append(buffer[pos:])
+                break
+            line = buffer[pos : end + 1]
+            self._chunk_pos = end + 1
+            lines.append(line)
+            if line in (b"\r\n", b"\n"):
+                break
+
+        msg, trailers = parse_header_block(b"".join(lines))
+        self.trailers = trailers or HTTPHeaderDict(msg.items())
+        # Whatever was received after the body doesn't belong to it.
+        self._chunk_buffer = b""
+        self._chunk_pos = 0
+
+    def _read_chunks(self, amt: int | None, *, read1: bool = False) -> bytes:
+        """
+        Reads up to ``amt`` bytes of a chunked body, or all of the rest of it.
+
+        The chunks are framed in the receive buffer, so that all chunks which
+        arrived together are returned at once instead of one per call. With
+        ``read1`` this returns as soon as there's any data rather than
+        waiting for ``amt`` bytes.
+        """
+        assert self._fp is not None
+        if self._fp.fp is None or self.length_remaining == 0:
+            return b""
+        if self._original_response and is_response_to_head(self._original_response):
+            self._original_response.close()
+            return b""
+
+        parts: list[bytes | memoryview[int]] = []
+        size = 0
+        at_eof = False
+        while self.chunk_left != 0 and (amt is None or size < amt):
+            if self.chunk_left is None:
+                # Take the chunks which were received completely in one go,
+                # everything else is left to the steps below.
+                buffer = self._chunk_buffer
+                pos = self._chunk_pos
+                crlf_left = self._chunk_crlf_left
+                find = buffer.find
+                while True:
+                    end = find(b"\n", pos + crlf_left)
+                    if end < 0:
+                        break
+                    try:
+                        n = int(buffer[pos + crlf_left : end], 16)
+                    except ValueError:
+                        break
+                    if (
+                        n <= 0
+                        or end + 1 + n > len(buffer)
+                        or (amt is not None and size + n > amt)
+                    ):
+                        break
+                    pos = end + 1 + n
+                    parts.append(buffer[end + 1 : pos])
+                    size += n
+                    crlf_left = 2
+                self._chunk_pos = pos
+                self._chunk_crlf_left = crlf_left
+                if amt is not None and size >= amt:
+                    break
+
+                if self._update_chunk_length(at_eof):
+                    continue
+            elif self._chunk_pos < len(self._chunk_buffer):
+                buffer = self._chunk_buffer
+                pos = self._chunk_pos
+                n = min(self.chunk_left, len(buffer) - pos)
+                if amt is not None:
+                    n = min(n, amt - size)
+                if n == len(buffer):
+                    parts.append(buffer)
+                else:
+                    parts.append(memoryview(buffer)[pos : pos + n])
+                size += n
+                self._chunk_pos += n
+                self.chunk_left -= n
+                if self.chunk_left == 0:
+                    self.chunk_left = None
+                    self._chunk_crlf_left = 2
+                continue
+            elif at_eof:
+                raise _HttplibIncompleteRead(b"".join(parts), self.chunk_left)
+
+            # More of the body has to be received first.
+            if size and read1:
+                break
+            at_eof = not self._fill_chunk_buffer()
+
+        if self.chunk_left == 0:
+            # We read everything; close the "file".
+            self._fp.close()
+        return b"".join(parts)
+
+    def _record_bytes_received(self, amt: int) -> None:
+        self._bytes_received += amt
+        if self._pool is not None:
+            self._pool.stats.bytes_received += amt
 
     def read_chunked(
         self, amt: int | None = None, decode_content: bool | None = None
@@ -1396,6 +2282,9 @@ class HTTPResponse(BaseHTTPResponse):
             'content-encoding' header.
         """
         self._init_decoder()
+        if self._read_ahead is not None:
+            yield from self.stream(amt, decode_content=decode_content)
+            return
         # FIXME: Rewrite this method and make it a class with a better structured logic.
         if not self.chunked:
             raise ResponseNotChunked(
@@ -1431,11 +2320,11 @@ class HTTPResponse(BaseHTTPResponse):
                 if self._decoder and self._decoder.has_unconsumed_tail:
                     chunk = b""
                 else:
-                    self._update_chunk_length()
                     self._uncached_read_occurred = True
-                    if self.chunk_left == 0:
+                    chunk = self._read_chunks(amt, read1=True)
+                    if not chunk:
                         break
-                    chunk = self._handle_chunk(amt)
+                    self._record_bytes_received(len(chunk))
                 decoded = self._decode(
                     chunk,
                     decode_content=decode_content,
@@ -1453,15 +2342,6 @@ class HTTPResponse(BaseHTTPResponse):
                 if decoded:  # Platform-specific: Jython.
                     yield decoded
 
-            # Chunk content ends with \r\n: discard it.
-            while self._fp is not None:
-                line = self._fp.fp.readline()
-                if not line:
-                    # Some sites may not end with '\r\n'.
-                    break
-                if line == b"\r\n":
-                    break
-
             # We read everything; close the "file".
             if self._original_response:
                 self._original_response.close()
@@ -3,18 +3,21 @@ from __future__ import annotations
 
 from .connection import is_connection_dropped
 from .request import SKIP_HEADER, SKIPPABLE_HEADERS, make_headers
+from .resolver import BaseResolver, CachingResolver, SystemResolver
 from .response import is_fp_closed
 from .retry import Retry
 from .ssl_ import (
     ALPN_PROTOCOLS,
     IS_PYOPENSSL,
     SSLContext,
+    TLSSessionCache,
     assert_fingerprint,
     create_urllib3_context,
     resolve_cert_reqs,
     resolve_ssl_version,
     ssl_wrap_socket,
 )
+from .stats import PoolStats
 from .timeout import Timeout
 from .url import Url, parse_url
 from .wait import wait_for_read, wait_for_write
@@ -22,8 +25,13 @@ from .wait import wait_for_read, wait_for_write
 __all__ = (
     "IS_PYOPENSSL",
     "SSLContext",
+    "TLSSessionCache",
     "ALPN_PROTOCOLS",
+    "BaseResolver",
+    "CachingResolver",
+    "PoolStats",
     "Retry",
+    "SystemResolver",
     "Timeout",
     "Url",
     "assert_fingerprint",
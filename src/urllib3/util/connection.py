@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import errno
+import selectors
 import socket
+import time
 import typing
 
 from ..exceptions import LocationParseError
+from .resolver import _TYPE_ADDRINFO, BaseResolver
 from .timeout import _DEFAULT_TIMEOUT, _TYPE_TIMEOUT
 
 _TYPE_SOCKET_OPTIONS = list[tuple[int, int, typing.Union[int, bytes]]]
 
+#: Delay in seconds between starting connection attempts when Happy Eyeballs
+#: is enabled, as recommended by RFC 8305.
+HAPPY_EYEBALLS_DELAY = 0.25
+
+_CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN}
+# Windows reports a non-blocking connect() in progress as WSAEWOULDBLOCK.
+_CONNECT_IN_PROGRESS.add(10035)
+
 if typing.TYPE_CHECKING:
     from .._base_connection import BaseHTTPConnection
 
@@ -29,6 +41,8 @@ def create_connection(
     timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT,
     source_address: tuple[str, int] | None = None,
     socket_options: _TYPE_SOCKET_OPTIONS | None = None,
+    happy_eyeballs: bool | float = False,
+    resolver: BaseResolver | None = None,
 ) -> socket.socket:
     """Connect to *address* and return the socket object.
 
@@ -40,6 +54,16 @@ def create_connection(
     is used.  If *source_address* is set it must be a tuple of (host, port)
     for the socket to bind as a source address before making the connection.
     An host of '' or port 0 tells the OS to use the default.
+
+    If *happy_eyeballs* is enabled and the host resolves to more than one
+    address, connection attempts are raced as described in :rfc:`8305`:
+    addresses are interleaved by address family and a new attempt is started
+    every :data:`HAPPY_EYEBALLS_DELAY` seconds (or every *happy_eyeballs*
+    seconds if a number is given) until one of them connects. Attempts that
+    lose the race are closed.
+
+    If *resolver* is given, it is used to resolve the host instead of
+    :func:`socket.getaddrinfo`.
     """
 
     host, port = address
@@ -47,17 +71,24 @@ def create_connection(
         host = host.strip("[]")
     err = None
 
-    # Using the value from allowed_gai_family() in the context of getaddrinfo lets
-    # us select whether to work with IPv4 DNS records, IPv6 records, or both.
-    # The original create_connection function always returns all records.
-    family = allowed_gai_family()
-
     try:
         host.encode("idna")
     except UnicodeError:
         raise LocationParseError(f"'{host}', label empty or too long") from None
 
-    for res in socket.getaddrinfo(host, port, family, socket.SOCK_STREAM):
+    addrinfos = _getaddrinfo(host, port, resolver)
+
+    if happy_eyeballs is not False and len(addrinfos) > 1:
+        delay = HAPPY_EYEBALLS_DELAY if happy_eyeballs is True else happy_eyeballs
+        return _create_connection_happy_eyeballs(
+            _interleave_addrinfos(addrinfos),
+            delay,
+            timeout,
+            source_address,
+            socket_options,
+        )
+
+    for res in addrinfos:
         af, socktype, proto, canonname, sa = res
         sock = None
         try:
@@ -90,6 +121,117 @@ def create_connection(
         raise OSError("getaddrinfo returns an empty list")
 
 
+def _interleave_addrinfos(
+    addrinfos: typing.Sequence[_TYPE_ADDRINFO],
+) -> list[_TYPE_ADDRINFO]:
+    """Reorders addresses so that address families alternate, starting with
+    the family of the first address returned by the resolver (RFC 8305 4)."""
+    by_family: dict[int, list[_TYPE_ADDRINFO]] = {}
+    for addrinfo in addrinfos:
+        by_family.setdefault(addrinfo[0], []).append(addrinfo)
+
+    interleaved = []
+    queues = list(by_family.values())
+    while queues:
+        for queue in queues:
+            interleaved.append(queue.pop(0))
+        queues = [queue for queue in queues if queue]
+    return interleaved
+
+
+def _create_connection_happy_eyeballs(
+    addrinfos: list[_TYPE_ADDRINFO],
+    delay: float,
+    timeout: _TYPE_TIMEOUT,
+    source_address: tuple[str, int] | None,
+    socket_options: _TYPE_SOCKET_OPTIONS | None,
+) -> socket.socket:
+    if timeout is _DEFAULT_TIMEOUT:
+        timeout = socket.getdefaulttimeout()
+
+    selector = selectors.DefaultSelector()
+    pending: dict[socket.socket, float] = {}
+    err: OSError | None = None
+    winner: socket.socket | None = None
+    next_attempt_at = time.monotonic()
+
+    try:
+        while winner is None and (addrinfos or pending):
+            now = time.monotonic()
+
+            # Start the next attempt once the delay has passed, or right away
+            # if there's nothing left in flight to wait for.
+            if addrinfos and (now >= next_attempt_at or not pending):
+                af, socktype, proto, _, sa = addrinfos.pop(0)
+                sock = None
+                try:
+                    sock = socket.socket(af, socktype, proto)
+                    _set_socket_options(sock, socket_options)
+                    sock.setblocking(False)
+                    if source_address:
+                        sock.bind(source_address)
+                    result = sock.connect_ex(sa)
+                    if result == 0:
+                        winner = sock
+                        break
+                    if result not in _CONNECT_IN_PROGRESS:
+                        raise OSError(result, errno.errorcode.get(result, ""))
+                except OSError as e:
+                    err = e
+                    if sock is not None:
+                        sock.close()
+                    continue
+
+                selector.register(sock, selectors.EVENT_WRITE)
+                pending[sock] = float("inf") if timeout is None else now + timeout
+                next_attempt_at = now + delay
+                continue
+
+            wake_at = min(pending.values())
+            if addrinfos:
+                wake_at = min(wake_at, next_attempt_at)
+            wait = None if wake_at == float("inf") else max(wake_at - now, 0)
+
+            for key, _ in selector.select(wait):
+                sock = typing.cast(socket.socket, key.fileobj)
+                selector.unregister(sock)
+                del pending[sock]
+                result = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if result == 0:
+                    winner = sock
+                    break
+                err = OSError(result, errno.errorcode.get(result, ""))
+                sock.close()
+                # A failed attempt lets the next one start immediately.
+                next_attempt_at = time.monotonic()
+
+            if winner is None:
+                now = time.monotonic()
+                for sock, deadline in list(pending.items()):
+                    if now >= deadline:
+                        selector.unregister(sock)
+                        del pending[sock]
+                        sock.close()
+                        err = TimeoutError("timed out")
+    finally:
+        for sock in pending:
+            if sock is not winner:
+                sock.close()
+        selector.close()
+
+    if winner is None:
+        try:
+            if err is not None:
+                raise err
+            raise OSError("getaddrinfo returns an empty list")
+        finally:
+            # Break explicitly a reference cycle
+            err = None
+
+    winner.settimeout(timeout)
+    return winner
+
+
 def _set_socket_options(
     sock: socket.socket, options: _TYPE_SOCKET_OPTIONS | None
 ) -> None:
@@ -100,6 +242,19 @@ def _set_socket_options(
         sock.setsockopt(*opt)
 
 
+def _getaddrinfo(
+    host: str, port: int, resolver: BaseResolver | None = None
+) -> typing.Sequence[_TYPE_ADDRINFO]:
+    """Resolves the addresses :func:`create_connection` connects to."""
+    # Using the value from allowed_gai_family() in the context of getaddrinfo lets
+    # us select whether to work with IPv4 DNS records, IPv6 records, or both.
+    # The original create_connection function always returns all records.
+    family = allowed_gai_family()
+    if resolver is not None:
+        return resolver.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+    return socket.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+
+
 def allowed_gai_family() -> socket.AddressFamily:
     """This function is designed to work in the context of
     getaddrinfo, where family=socket.AF_UNSPEC is the default and
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import io
+import os
+import stat
 import sys
 import typing
 from base64 import b64encode
@@ -80,7 +82,10 @@ def make_headers(
         Brotli (either the ``brotli`` or ``brotlicffi`` package) and/or
         Zstandard (the ``backports.zstd`` package for Python before 3.14)
         algorithms are installed, then their encodings are
-        included in the string ('br' and 'zstd', respectively).
+        included in the string ('br' and 'zstd', respectively). Content
+        codings registered with
+        :func:`~urllib3.response.register_content_decoder` are included in
+        order of preference as well.
         List will get joined by comma.
         String will be used as provided.
 
@@ -148,7 +153,10 @@ def make_headers(
         elif isinstance(accept_encoding, list):
             accept_encoding = ",".join(accept_encoding)
         else:
-            accept_encoding = ACCEPT_ENCODING
+            # This is needed here to avoid circular import errors
+            from ..response import _accept_encoding
+
+            accept_encoding = _accept_encoding()
         headers["accept-encoding"] = accept_encoding
 
     if user_agent:
@@ -223,6 +231,29 @@ def rewind_body(body: typing.IO[typing.AnyStr], body_pos: _TYPE_BODY_POSITION) -
         )
 
 
+def file_body_length(body: typing.Any) -> int | None:
+    """
+    Returns the number of bytes left in ``body`` if it's a regular file
+    opened in binary mode, which can be sent with :meth:`socket.socket.sendfile`.
+    The length is computed with ``seek()`` and ``tell()``, the position of
+    ``body`` is left unchanged. Returns None for any other body.
+
+    Only plain file objects qualify, wrappers like :class:`gzip.GzipFile`
+    expose the ``fileno()`` of a file whose contents aren't what they read.
+    """
+    if not isinstance(body, (io.FileIO, io.BufferedReader, io.BufferedRandom)):
+        return None
+    try:
+        if not stat.S_ISREG(os.fstat(body.fileno()).st_mode):
+            return None
+        pos: int = body.tell()
+        end: int = body.seek(0, io.SEEK_END)
+        body.seek(pos)
+    except (OSError, ValueError):
+        return None
+    return max(end - pos, 0)
+
+
 class ChunksAndContentLength(typing.NamedTuple):
     chunks: typing.Iterable[bytes] | None
     content_length: int | None
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+import typing
+
+from .._collections import RecentlyUsedContainer
+
+__all__ = ["BaseResolver", "SystemResolver", "CachingResolver"]
+
+_TYPE_ADDRINFO = tuple[
+    socket.AddressFamily,
+    socket.SocketKind,
+    int,
+    str,
+    typing.Union[tuple[str, int], tuple[str, int, int, int], tuple[int, bytes]],
+]
+
+
+class BaseResolver:
+    """
+    Resolves hostnames to the addresses that new connections are made to.
+
+    Pass an instance as ``resolver`` to :class:`~urllib3.PoolManager`, a
+    connection pool or a connection to replace the name resolution done by
+    :func:`socket.getaddrinfo`. Subclasses must implement :meth:`getaddrinfo`.
+    """
+
+    def getaddrinfo(
+        self,
+        host: str,
+        port: int,
+        family: socket.AddressFamily,
+        type: socket.SocketKind,
+    ) -> typing.Sequence[_TYPE_ADDRINFO]:
+        """Returns address info in the same format as :func:`socket.getaddrinfo`.
+
+        Raises :class:`socket.gaierror` if the host can't be resolved.
+        """
+        raise NotImplementedError()
+
+
+class SystemResolver(BaseResolver):
+    """Resolves hostnames with the system resolver via :func:`socket.getaddrinfo`."""
+
+    def getaddrinfo(
+        self,
+        host: str,
+        port: int,
+        family: socket.AddressFamily,
+        type: socket.SocketKind,
+    ) -> typing.Sequence[_TYPE_ADDRINFO]:
+        return socket.getaddrinfo(host, port, family, type)
+
+
+class CachingResolver(BaseResolver):
+    """
+    Caches the results of another resolver in memory.
+
+    Connection churn to the same few hosts otherwise pays for a blocking
+    :func:`socket.getaddrinfo` call on every new connection.
+
+    :param resolver:
+        Resolver to cache results of. Defaults to :class:`SystemResolver`.
+    :param ttl:
+        Number of seconds a successful lookup is cached for.
+    :param negative_ttl:
+        Number of seconds a failed lookup is cached for. The cached
+        :class:`socket.gaierror` is raised again until it expires.
+        Set to ``0`` to disable negative caching.
+    :param stale_ttl:
+        Number of seconds after ``ttl`` during which an expired lookup is
+        still returned while it is refreshed in a background thread.
+        Set to ``0`` to always resolve expired hosts before connecting.
+    :param maxsize:
+        Maximum number of lookups to cache. The least recently used lookup
+        is discarded when the cache is full.
+    """
+
+    def __init__(
+        self,
+        resolver: BaseResolver | None = None,
+        *,
+        ttl: float = 60.0,
+        negative_ttl: float = 5.0,
+        stale_ttl: float = 30.0,
+        maxsize: int = 256,
+    ) -> None:
+        self.resolver = resolver if resolver is not None else SystemResolver()
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self._cache: RecentlyUsedContainer[
+            typing.Hashable,
+            tuple[typing.Sequence[_TYPE_ADDRINFO] | socket.gaierror, float],
+        ] = RecentlyUsedContainer(maxsize)
+        self._refreshing: set[typing.Hashable] = set()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(resolver={self.resolver!r}, ttl={self.ttl}, "
+            f"negative_ttl={self.negative_ttl}, stale_ttl={self.stale_ttl})"
+        )
+
+    def getaddrinfo(
+        self,
+        host: str,
+        port: int,
+        family: socket.AddressFamily,
+        type: socket.SocketKind,
+    ) -> typing.Sequence[_TYPE_ADDRINFO]:
+        key = (host, port, family, type)
+        now = time.monotonic()
+        with self._cache.lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                result, expires_at = entry
+                if now < expires_at:
+                    if isinstance(result, socket.gaierror):
+                        raise socket.gaierror(*result.args)
+                    return list(result)
+
+                # Serve the expired addresses while a single background
+                # lookup refreshes them.
+                if (
+                    not isinstance(result, socket.gaierror)
+                    and now < expires_at + self.stale_ttl
+                ):
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        threading.Thread(
+                            target=self._refresh,
+                            args=(key,),
+                            name="urllib3-resolver-refresh",
+                            daemon=True,
+                        ).start()
+                    return list(result)
+
+        return list(self._resolve(key))
+
+    def clear(self) -> None:
+        """Discards all cached lookups."""
+        self._cache.clear()
+
+    def _resolve(
+        self,
+        key: tuple[str, int, socket.AddressFamily, socket.SocketKind],
+        cache_failure: bool = True,
+    ) -> typing.Sequence[_TYPE_ADDRINFO]:
+        try:
+            result = self.resolver.getaddrinfo(*key)
+        except socket.gaierror as e:
+            if cache_failure and self.negative_ttl > 0:
+                # Don't keep the traceback and its frames alive in the cache.
+                error = socket.gaierror(*e.args)
+                self._cache[key] = (error, time.monotonic() + self.negative_ttl)
+            raise
+        self._cache[key] = (result, time.monotonic() + self.ttl)
+        return result
+
+    def _refresh(
+        self, key: tuple[str, int, socket.AddressFamily, socket.SocketKind]
+    ) -> None:
+        try:
+            self._resolve(key, cache_failure=False)
+        except OSError:
+            # Keep serving the stale addresses until they run out.
+            pass
+        finally:
+            with self._cache.lock:
+                self._refreshing.discard(key)
@@ -5,10 +5,13 @@ import hmac
 import os
 import socket
 import sys
+import time
 import typing
 import warnings
+import weakref
 from binascii import unhexlify
 
+from .._collections import RecentlyUsedContainer
 from ..exceptions import ProxySchemeUnsupported, SSLError
 from .url import _BRACELESS_IPV6_ADDRZ_RE, _IPV4_RE
 
@@ -324,6 +327,300 @@ def create_urllib3_context(
     return context
 
 
+def _file_identity(path: str | None) -> tuple[str, int, int] | None:
+    """Identifies a file by its path, modification time and size so that
+    replacing a CA bundle or client certificate on disk invalidates any
+    :class:`ssl.SSLContext` that was built from the old contents.
+    """
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (path, -1, -1)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+class _SSLContextCache:
+    """
+    Process-wide cache of fully configured :class:`ssl.SSLContext` objects.
+
+    Creating a context and loading the system CA bundle into it is expensive,
+    so connections that don't supply their own ``ssl_context`` share one
+    context per distinct set of TLS settings instead of building a new one
+    for every handshake.
+    """
+
+    __slots__ = ("_contexts", "_owned")
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self._contexts: RecentlyUsedContainer[typing.Hashable, ssl.SSLContext] = (
+            RecentlyUsedContainer(maxsize)
+        )
+        self._owned: weakref.WeakSet[ssl.SSLContext] = weakref.WeakSet()
+
+    def get(
+        self,
+        *,
+        ssl_version: int | None = None,
+        cert_reqs: int | None = None,
+        ssl_minimum_version: int | None = None,
+        ssl_maximum_version: int | None = None,
+        ciphers: str | None = None,
+        ca_certs: str | None = None,
+        ca_cert_dir: str | None = None,
+        ca_cert_data: None | str | bytes = None,
+        cert_file: str | None = None,
+        key_file: str | None = None,
+        key_password: str | None = None,
+        check_hostname: bool = True,
+        alpn_protocols: typing.Sequence[str] | None = None,
+    ) -> ssl.SSLContext:
+        if alpn_protocols is None:
+            alpn_protocols = ALPN_PROTOCOLS
+        key = (
+            SSLContext,
+            ssl_version,
+            cert_reqs,
+            ssl_minimum_version,
+            ssl_maximum_version,
+            ciphers,
+            _file_identity(ca_certs),
+            _file_identity(ca_cert_dir),
+            ca_cert_data,
+            _file_identity(cert_file),
+            _file_identity(key_file),
+            key_password,
+            check_hostname,
+            tuple(alpn_protocols),
+            os.environ.get("SSLKEYLOGFILE"),
+        )
+        with self._contexts.lock:
+            context = self._contexts.get(key)
+            if context is None:
+                context = _build_context(
+                    ssl_version=ssl_version,
+                    cert_reqs=cert_reqs,
+                    ssl_minimum_version=ssl_minimum_version,
+                    ssl_maximum_version=ssl_maximum_version,
+                    ciphers=ciphers,
+                    ca_certs=ca_certs,
+                    ca_cert_dir=ca_cert_dir,
+                    ca_cert_data=ca_cert_data,
+                    cert_file=cert_file,
+                    key_file=key_file,
+                    key_password=key_password,
+                    check_hostname=check_hostname,
+                    alpn_protocols=alpn_protocols,
+                )
+                self._contexts[key] = context
+                self._owned.add(context)
+        return context
+
+    def owns(self, context: ssl.SSLContext) -> bool:
+        return context in self._owned
+
+    def clear(self) -> None:
+        self._contexts.clear()
+
+    def __len__(self) -> int:
+        return len(self._contexts)
+
+
+def _build_context(
+    *,
+    ssl_version: int | None,
+    cert_reqs: int | None,
+    ssl_minimum_version: int | None,
+    ssl_maximum_version: int | None,
+    ciphers: str | None,
+    ca_certs: str | None,
+    ca_cert_dir: str | None,
+    ca_cert_data: None | str | bytes,
+    cert_file: str | None,
+    key_file: str | None,
+    key_password: str | None,
+    check_hostname: bool,
+    alpn_protocols: typing.Sequence[str],
+) -> ssl.SSLContext:
+    context = create_urllib3_context(
+        ssl_version=ssl_version,
+        cert_reqs=cert_reqs,
+        ciphers=ciphers,
+        ssl_minimum_version=ssl_minimum_version,
+        ssl_maximum_version=ssl_maximum_version,
+    )
+    context.verify_mode = resolve_cert_reqs(cert_reqs)
+    if not check_hostname:
+        context.check_hostname = False
+
+    if ca_certs or ca_cert_dir or ca_cert_data:
+        try:
+            context.load_verify_locations(ca_certs, ca_cert_dir, ca_cert_data)
+        except OSError as e:
+            raise SSLError(e) from e
+    elif hasattr(context, "load_default_certs"):
+        # Custom pyOpenSSL SSLContext objects don't support load_default_certs().
+        context.load_default_certs()
+
+    if key_file and key_password is None and _is_key_file_encrypted(key_file):
+        raise SSLError("Client private key is encrypted, password is required")
+
+    if cert_file:
+        if key_password is None:
+            context.load_cert_chain(cert_file, key_file)
+        else:
+            context.load_cert_chain(cert_file, key_file, key_password)
+
+    context.set_alpn_protocols(alpn_protocols)
+    return context
+
+
+_SSL_CONTEXT_CACHE = _SSLContextCache()
+
+
+def get_cached_urllib3_context(
+    *,
+    ssl_version: int | None = None,
+    cert_reqs: int | None = None,
+    ssl_minimum_version: int | None = None,
+    ssl_maximum_version: int | None = None,
+    ciphers: str | None = None,
+    ca_certs: str | None = None,
+    ca_cert_dir: str | None = None,
+    ca_cert_data: None | str | bytes = None,
+    cert_file: str | None = None,
+    key_file: str | None = None,
+    key_password: str | None = None,
+    check_hostname: bool = True,
+    alpn_protocols: typing.Sequence[str] | None = None,
+) -> ssl.SSLContext:
+    """Returns a shared :class:`ssl.SSLContext` configured for the given TLS settings.
+
+    This is what :class:`~urllib3.connection.HTTPSConnection` uses when no
+    ``ssl_context`` is given, so that every pool and :class:`~urllib3.PoolManager`
+    in the process reuses one context (and one copy of the loaded CA certificates)
+    per distinct configuration. The returned context already has its CA
+    certificates, client certificate and ALPN protocols loaded and must not be
+    modified, as it is shared between threads.
+
+    Changes to the files referenced by ``ca_certs``, ``ca_cert_dir``, ``cert_file``
+    and ``key_file`` are detected by their modification time and size. Call
+    :func:`clear_ssl_context_cache` after changing the system CA certificates.
+
+    :param check_hostname:
+        Whether the context should verify the hostname itself. Set to ``False``
+        when urllib3 does the verification, for example with ``assert_hostname``
+        or ``assert_fingerprint``.
+    :param alpn_protocols:
+        Protocols offered with ALPN. Defaults to the protocols urllib3 supports,
+        which include ``h2`` when HTTP/2 support is injected.
+    """
+    return _SSL_CONTEXT_CACHE.get(
+        ssl_version=ssl_version,
+        cert_reqs=cert_reqs,
+        ssl_minimum_version=ssl_minimum_version,
+        ssl_maximum_version=ssl_maximum_version,
+        ciphers=ciphers,
+        ca_certs=ca_certs,
+        ca_cert_dir=ca_cert_dir,
+        ca_cert_data=ca_cert_data,
+        cert_file=cert_file,
+        key_file=key_file,
+        key_password=key_password,
+        check_hostname=check_hostname,
+        alpn_protocols=alpn_protocols,
+    )
+
+
+def clear_ssl_context_cache() -> None:
+    """Discards all shared :class:`ssl.SSLContext` objects.
+
+    New connections will build fresh contexts, for example to pick up
+    updated system CA certificates. Existing connections are not affected.
+    """
+    _SSL_CONTEXT_CACHE.clear()
+
+
+class TLSSessionCache:
+    """
+    Opt-in cache of TLS sessions used to resume handshakes with origins that
+    were connected to before.
+
+    When a :class:`~urllib3.connection.HTTPSConnection` with a session cache
+    is closed its :class:`ssl.SSLSession` is stored, keyed by the
+    :class:`ssl.SSLContext`, the TLS server name and the origin. The next
+    connection to the same origin offers that session during the handshake so
+    that the server can skip the full key exchange and certificate exchange.
+
+    Pass the same instance to every pool that should share sessions, for
+    example via ``PoolManager(tls_session_cache=TLSSessionCache())``.
+
+    :param maxsize:
+        Maximum number of sessions to keep. The least recently used session is
+        discarded when the cache is full.
+    :param ttl:
+        Number of seconds a session is kept for. Sessions also expire after the
+        lifetime hint the server gave for them, whichever comes first.
+        ``None`` only honors the server's lifetime hint.
+    """
+
+    #: Number of handshakes that resumed a cached session.
+    hits: int
+    #: Number of handshakes that did a full handshake.
+    misses: int
+
+    def __init__(self, maxsize: int = 100, ttl: float | None = 300.0) -> None:
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._sessions: RecentlyUsedContainer[
+            typing.Hashable, tuple[ssl.SSLSession, float]
+        ] = RecentlyUsedContainer(maxsize)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(size={len(self)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def get(self, key: typing.Hashable) -> ssl.SSLSession | None:
+        """Returns the unexpired session stored under ``key``, if any."""
+        with self._sessions.lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                return None
+            session, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._sessions[key]
+                return None
+            return session
+
+    def put(self, key: typing.Hashable, session: ssl.SSLSession) -> None:
+        """Stores ``session`` under ``key``, replacing any older session."""
+        lifetime = float(session.timeout)
+        if self.ttl is not None:
+            lifetime = min(lifetime, self.ttl)
+        if lifetime <= 0:
+            return
+        self._sessions[key] = (session, time.monotonic() + lifetime)
+
+    def record(self, reused: bool) -> None:
+        """Counts a handshake made with this cache as a hit or a miss."""
+        with self._sessions.lock:
+            if reused:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def clear(self) -> None:
+        """Discards all cached sessions."""
+        self._sessions.clear()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
 @typing.overload
 def ssl_wrap_socket(
     sock: socket.socket,
@@ -339,6 +636,7 @@ def ssl_wrap_socket(
     key_password: str | None = ...,
     ca_cert_data: None | str | bytes = ...,
     tls_in_tls: typing.Literal[False] = ...,
+    session: ssl.SSLSession | None = ...,
 ) -> ssl.SSLSocket: ...
 
 
@@ -357,6 +655,7 @@ def ssl_wrap_socket(
     key_password: str | None = ...,
     ca_cert_data: None | str | bytes = ...,
     tls_in_tls: bool = ...,
+    session: ssl.SSLSession | None = ...,
 ) -> ssl.SSLSocket | SSLTransportType: ...
 
 
@@ -374,6 +673,7 @@ def ssl_wrap_socket(
     key_password: str | None = None,
     ca_cert_data: None | str | bytes = None,
     tls_in_tls: bool = False,
+    session: ssl.SSLSession | None = None,
 ) -> ssl.SSLSocket | SSLTransportType:
     """
     All arguments except for server_hostname, ssl_context, tls_in_tls, ca_cert_data and
@@ -399,6 +699,9 @@ def ssl_wrap_socket(
         passing as the cadata parameter to SSLContext.load_verify_locations()
     :param tls_in_tls:
         Use SSLTransport to wrap the existing socket.
+    :param session:
+        A previously established :class:`ssl.SSLSession` to resume. Ignored
+        when ``tls_in_tls`` is used.
     """
     context = ssl_context
     if context is None:
@@ -428,9 +731,14 @@ def ssl_wrap_socket(
         else:
             context.load_cert_chain(certfile, keyfile, key_password)
 
-    context.set_alpn_protocols(ALPN_PROTOCOLS)
+    # Shared contexts from the context cache are configured with ALPN
+    # protocols up front and must not be mutated while in use by other threads.
+    if not _SSL_CONTEXT_CACHE.owns(context):
+        context.set_alpn_protocols(ALPN_PROTOCOLS)
 
-    ssl_sock = _ssl_wrap_socket_impl(sock, context, tls_in_tls, server_hostname)
+    ssl_sock = _ssl_wrap_socket_impl(
+        sock, context, tls_in_tls, server_hostname, session
+    )
     return ssl_sock
 
 
@@ -463,6 +771,7 @@ def _ssl_wrap_socket_impl(
     ssl_context: ssl.SSLContext,
     tls_in_tls: bool,
     server_hostname: str | None = None,
+    session: ssl.SSLSession | None = None,
 ) -> ssl.SSLSocket | SSLTransportType:
     if tls_in_tls:
         if not SSLTransport:
@@ -474,4 +783,8 @@ def _ssl_wrap_socket_impl(
         SSLTransport._validate_ssl_context_for_tls_in_tls(ssl_context)
         return SSLTransport(sock, ssl_context, server_hostname)
 
+    if session is not None:
+        return ssl_context.wrap_socket(
+            sock, server_hostname=server_hostname, session=session
+        )
     return ssl_context.wrap_socket(sock, server_hostname=server_hostname)
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import typing
+
+__all__ = ["Histogram", "PoolStats"]
+
+#: Default upper bounds in seconds of :class:`Histogram` buckets.
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    """
+    Distribution of durations in seconds, counted in buckets with the given
+    upper bounds like a Prometheus histogram.
+
+    :param buckets:
+        Sorted upper bounds of the buckets. Values larger than the last bound
+        are counted in an implicit ``+Inf`` bucket.
+    """
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        #: Number of values in each bucket, not cumulative. The last item
+        #: counts the values larger than all bucket bounds.
+        self.counts = [0] * (len(self.buckets) + 1)
+        #: Number of values observed.
+        self.count = 0
+        #: Sum of all values observed.
+        self.sum = 0.0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(count={self.count}, sum={self.sum})"
+
+    def observe(self, value: float) -> None:
+        """Adds a value to the histogram."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def merge(self, other: Histogram) -> None:
+        """Adds the values counted by another histogram with the same buckets."""
+        if other.buckets != self.buckets:
+            raise ValueError("Can't merge histograms with different buckets")
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.sum += other.sum
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        """
+        Returns ``(upper_bound, count)`` pairs where ``count`` is the number of
+        values less than or equal to ``upper_bound``, ending with ``+Inf``.
+        """
+        result = []
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        """Returns the histogram as a dictionary with cumulative bucket counts."""
+        return {
+            "buckets": dict(self.cumulative_counts()),
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+# Name, Prometheus type and help text of each metric exported by PoolStats.
+_METRICS = (
+    ("requests", "counter", "Requests made through the pool."),
+    ("connections_opened", "counter", "Connections opened or reconnected."),
+    (
+        "connections_reused",
+        "counter",
+        "Checkouts served by an already open pooled connection.",
+    ),
+    (
+        "connections_dropped",
+        "counter",
+        "Pooled connections found dropped by the server and reset.",
+    ),
+    (
+        "connections_discarded",
+        "counter",
+        "Connections closed because the pool was full.",
+    ),
+    (
+        "connections_expired",
+        "counter",
+        "Connections closed after max_idle_time or max_connection_lifetime.",
+    ),
+    ("bytes_sent", "counter", "Request bytes sent, including headers."),
+    ("bytes_received", "counter", "Response body bytes received."),
+    ("in_use", "gauge", "Connections checked out of the pool."),
+    ("idle", "gauge", "Open connections waiting in the pool."),
+    ("reuse_ratio", "gauge", "Share of checkouts served by a pooled connection."),
+    ("checkout_wait_seconds", "histogram", "Time spent waiting for a connection."),
+    ("tls_handshake_seconds", "histogram", "Duration of TLS handshakes."),
+)
+
+
+class PoolStats:
+    """
+    Counters describing how a connection pool is used, available as
+    :attr:`urllib3.HTTPConnectionPool.stats`. :attr:`urllib3.PoolManager.stats`
+    combines the statistics of all of its pools.
+
+    The ``in_use`` gauge is updated under a lock so that it doesn't drift.
+    The other counters are updated without locking to stay cheap, so reading
+    them while requests are in flight may observe a slightly stale value.
+    """
+
+    def __init__(self, idle: typing.Callable[[], int] | None = None) -> None:
+        self._idle = idle
+        self._lock = threading.Lock()
+
+        #: Number of requests made through the pool.
+        self.requests = 0
+        #: Number of connections opened or reconnected.
+        self.connections_opened = 0
+        #: Number of times an already open connection was taken from the pool.
+        self.connections_reused = 0
+        #: Number of pooled connections found dropped by the server and reset.
+        self.connections_dropped = 0
+        #: Number of connections closed because the pool was full. Frequent
+        #: discards mean that ``maxsize`` should be increased.
+        self.connections_discarded = 0
+        #: Number of connections closed because they exceeded ``max_idle_time``
+        #: or ``max_connection_lifetime``.
+        self.connections_expired = 0
+        #: Number of request bytes sent, including the request line and headers.
+        self.bytes_sent = 0
+        #: Number of response body bytes received, before any decoding.
+        self.bytes_received = 0
+        #: Number of connections currently checked out of the pool.
+        self.in_use = 0
+        #: Time spent waiting to take a connection out of the pool.
+        self.checkout_wait_seconds = Histogram()
+        #: Duration of the TLS handshakes of new connections.
+        self.tls_handshake_seconds = Histogram()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(requests={self.requests}, "
+            f"in_use={self.in_use}, idle={self.idle}, "
+            f"reuse_ratio={self.reuse_ratio:.2f})"
+        )
+
+    @property
+    def idle(self) -> int:
+        """Number of open connections waiting in the pool."""
+        return self._idle() if self._idle is not None else 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """
+        Share of connection checkouts which reused an already open connection
+        instead of opening a new one.
+        """
+        total = self.connections_reused + self.connections_opened
+        return self.connections_reused / total if total else 0.0
+
+    @classmethod
+    def combine(cls, stats: typing.Iterable[PoolStats]) -> PoolStats:
+        """Returns the sum of the statistics of several pools."""
+        stats = list(stats)
+        combined = cls(idle=lambda: sum(s.idle for s in stats))
+        for s in stats:
+            combined.merge(s)
+            combined.in_use += s.in_use
+        return combined
+
+    def merge(self, other: PoolStats) -> None:
+        """
+        Adds the counters and histograms of another pool's statistics. Gauges
+        describe the current state of a pool and aren't added.
+        """
+        with self._lock:
+            for name, kind, _ in _METRICS:
+                if kind == "counter":
+                    setattr(self, name, getattr(self, name) + getattr(other, name))
+            self.checkout_wait_seconds.merge(other.checkout_wait_seconds)
+            self.tls_handshake_seconds.merge(other.tls_handshake_seconds)
+
+    def _add_in_use(self, n: int) -> None:
+        # Connections are checked out and returned from many threads.
+        with self._lock:
+            self.in_use += n
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        """
+        Returns the current statistics as a dictionary. Histograms are
+        dictionaries as returned by :meth:`Histogram.snapshot`.
+        """
+        result: dict[str, typing.Any] = {}
+        for name, kind, _ in _METRICS:
+            value = getattr(self, name)
+            result[name] = value.snapshot() if kind == "histogram" else value
+        return result
+
+    def to_prometheus(
+        self,
+        prefix: str = "urllib3_pool",
+        labels: typing.Mapping[str, str] | None = None,
+    ) -> str:
+        """
+        Returns the current statistics in the Prometheus text exposition format.
+
+        :param prefix:
+            Prefix of the metric names.
+        :param labels:
+            Labels added to every sample, for example the pool's host.
+        """
+        lines = []
+        for name, kind, help_text in _METRICS:
+            metric = f"{prefix}_{name}"
+            if kind == "counter":
+                metric += "_total"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+
+            value = getattr(self, name)
+            if isinstance(value, Histogram):
+                for bound, count in value.cumulative_counts():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    bucket_labels = _format_labels({**(labels or {}), "le": le})
+                    lines.append(f"{metric}_bucket{bucket_labels} {count}")
+                lines.append(f"{metric}_sum{_format_labels(labels)} {value.sum!r}")
+                lines.append(f"{metric}_count{_format_labels(labels)} {value.count}")
+            else:
+                lines.append(f"{metric}{_format_labels(labels)} {value!r}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: typing.Mapping[str, str] | None) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in labels.items():
+        escaped = value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{key}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
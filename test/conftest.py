@@ -249,6 +249,19 @@ def ipv4_san_server(
         yield cfg
 
 
+@pytest.fixture
+def wildcard_san_server(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> typing.Generator[ServerConfig]:
+    tmpdir = tmp_path_factory.mktemp("certs")
+    ca = trustme.CA()
+    # One certificate for all of the virtual hosts of the server.
+    server_cert = ca.issue_cert("*.example.com")
+
+    with run_server_in_thread("https", "127.0.0.1", tmpdir, ca, server_cert) as cfg:
+        yield cfg
+
+
 @pytest.fixture
 def ipv6_san_server(
     tmp_path_factory: pytest.TempPathFactory,
@@ -396,3 +409,12 @@ def reset_http2_probe_cache() -> typing.Generator[None]:
         yield
     finally:
         http2_probe._reset()
+
+
+@pytest.fixture(autouse=True, scope="function")
+def reset_ssl_context_cache() -> typing.Generator[None]:
+    # Contexts may be mocked per test case so never share them between tests.
+    try:
+        yield
+    finally:
+        ssl_.clear_ssl_context_cache()
@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+import pytest
+
+import urllib3.http2
+from dummyserver.socketserver import DEFAULT_CA
+from dummyserver.testcase import (
+    HTTPSHypercornDummyServerTestCase,
+    HypercornDummyServerTestCase,
+)
+from urllib3.contrib.aio import (
+    AsyncHTTPConnectionPool,
+    AsyncHTTPResponse,
+    AsyncHTTPSConnectionPool,
+    AsyncPoolManager,
+)
+from urllib3.exceptions import (
+    EmptyPoolError,
+    MaxRetryError,
+    NewConnectionError,
+    ReadTimeoutError,
+)
+from urllib3.util.retry import Retry
+
+from ..port_helpers import find_unused_port
+
+_T = typing.TypeVar("_T")
+
+
+def run(coro: typing.Coroutine[typing.Any, typing.Any, _T]) -> _T:
+    return asyncio.run(coro)
+
+
+class TestAsyncConnectionPool(HypercornDummyServerTestCase):
+    def test_request(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request("GET", "/")
+                assert isinstance(r, AsyncHTTPResponse)
+                assert r.status == 200
+                assert r.data == b"Dummy server!"
+
+                r = await pool.request("GET", "/echo", fields={"a": "b"})
+                assert r.data == b"a=b"
+
+                r = await pool.request("POST", "/echo", body=b"hello")
+                assert r.data == b"hello"
+                assert pool.num_connections == 1
+
+        run(main())
+
+    def test_json(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request("POST", "/echo_json", json={"a": [1, 2]})
+                assert r.json() == {"a": [1, 2]}
+
+        run(main())
+
+    def test_async_iterable_body(self) -> None:
+        async def body() -> typing.AsyncIterator[bytes]:
+            yield b"foo"
+            yield b"bar"
+
+        async def main() -> None:
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request("POST", "/echo", body=body())
+                assert r.data == b"foobar"
+
+        run(main())
+
+    def test_chunked_response(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request("GET", "/chunked")
+                assert r.data == b"123" * 4
+
+                r = await pool.request("GET", "/chunked_gzip")
+                assert r.data == b"123" * 4
+
+        run(main())
+
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+    def test_decode_content(self, encoding: str) -> None:
+        async def main() -> None:
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                headers = {"Accept-Encoding": encoding}
+                r = await pool.request("GET", "/encodingrequest", headers=headers)
+                assert r.data == b"hello, world!"
+
+                r = await pool.request(
+                    "GET", "/encodingrequest", headers=headers, decode_content=False
+                )
+                assert r.headers["Content-Encoding"] == encoding
+                assert r.data != b"hello, world!"
+
+        run(main())
+
+    def test_stream(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request("GET", "/", preload_content=False)
+                assert await r.read(5) == b"Dummy"
+                assert [chunk async for chunk in r.stream(2)] == [
+                    b" s",
+                    b"er",
+                    b"ve",
+                    b"r!",
+                ]
+                # The connection is released once the body was read.
+                assert pool.pool is not None
+                assert pool.pool.qsize() == 1
+                assert pool.stats.in_use == 0
+
+                r = await pool.request("GET", "/", preload_content=False)
+                assert b"".join([chunk async for chunk in r]) == b"Dummy server!"
+
+                with pytest.raises(RuntimeError):
+                    (await pool.request("GET", "/", preload_content=False)).data
+
+        run(main())
+
+    def test_release_conn_unread_body(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request("GET", "/", preload_content=False)
+                r.release_conn()
+                # The connection wasn't read to the end so it can't be reused.
+                r = await pool.request("GET", "/")
+                assert r.data == b"Dummy server!"
+                assert pool.num_connections == 1
+                assert pool.stats.connections_opened == 2
+
+        run(main())
+
+    def test_redirect(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                r = await pool.request(
+                    "GET", "/redirect", fields={"target": "/"}, redirect=False
+                )
+                assert r.status == 303
+
+                r = await pool.request("GET", "/redirect", fields={"target": "/"})
+                assert r.status == 200
+                assert r.data == b"Dummy server!"
+                assert r.retries is not None
+                assert len(r.retries.history) == 1
+
+        run(main())
+
+    def test_retry_status(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPConnectionPool(self.host, self.port) as pool:
+                retries = Retry(total=1, status_forcelist=[418])
+                with pytest.raises(MaxRetryError):
+                    await pool.request(
+                        "GET",
+                        "/status",
+                        fields={"status": "418 I'm a teapot"},
+                        retries=retries,
+                    )
+
+        run(main())
+
+    def test_read_timeout(self) -> None:
+        async def main() -> None:
+            done = asyncio.Event()
+
+            async def silent(
+                reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+            ) -> None:
+                await done.wait()
+                writer.close()
+
+            server = await asyncio.start_server(silent, self.host, 0)
+            port = server.sockets[0].getsockname()[1]
+            async with (
+                server,
+                AsyncHTTPConnectionPool(
+                    self.host, port, timeout=0.01, retries=False
+                ) as pool,
+            ):
+                with pytest.raises(ReadTimeoutError):
+                    await pool.request("GET", "/")
+                done.set()
+                await asyncio.sleep(0)
+
+        run(main())
+
+    def test_chunked_head_response(self) -> None:
+        async def main() -> None:
+            closed = asyncio.Event()
+
+            async def respond(
+                reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+            ) -> None:
+                try:
+                    while line := await reader.readline():
+                        if line == b"\r\n":
+                            writer.write(
+                                b"HTTP/1.1 200 OK\r\n"
+                                b"Transfer-Encoding: chunked\r\n\r\n"
+                            )
+                finally:
+                    writer.close()
+                    closed.set()
+
+            server = await asyncio.start_server(respond, self.host, 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                async with AsyncHTTPConnectionPool(
+                    self.host, port, timeout=1, retries=False
+                ) as pool:
+                    r = await pool.request("HEAD", "/")
+                    assert r.status == 200
+                    assert r.data == b""
+
+                    r = await pool.request("HEAD", "/", preload_content=False)
+                    assert await r.read() == b""
+                    await r.drain_conn()
+                    assert pool.num_connections == 1
+                    assert pool.stats.connections_reused == 1
+                await closed.wait()
+
+        run(main())
+
+    def test_connection_refused(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPConnectionPool(
+                self.host, find_unused_port(), retries=Retry(connect=1)
+            ) as pool:
+                with pytest.raises(MaxRetryError) as e:
+                    await pool.request("GET", "/")
+                assert isinstance(e.value.reason, NewConnectionError)
+                assert pool.num_connections == 2
+
+        run(main())
+
+    def test_concurrent_requests(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPConnectionPool(
+                self.host, self.port, maxsize=4, block=True
+            ) as pool:
+                responses = await asyncio.gather(
+                    *(pool.request("GET", "/") for _ in range(50))
+                )
+                assert {r.data for r in responses} == {b"Dummy server!"}
+                assert pool.num_connections == 4
+                assert pool.stats.requests == 50
+                assert pool.stats.idle == 4
+
+        run(main())
+
+    def test_block_pool_timeout(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPConnectionPool(
+                self.host, self.port, maxsize=1, block=True
+            ) as pool:
+                r = await pool.request("GET", "/", preload_content=False)
+                with pytest.raises(EmptyPoolError):
+                    await pool.request("GET", "/", pool_timeout=0.01)
+                await r.drain_conn()
+                assert (await pool.request("GET", "/")).status == 200
+
+        run(main())
+
+    def test_prewarm(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPConnectionPool(self.host, self.port, maxsize=3) as pool:
+                assert await pool.prewarm() == 3
+                assert pool.stats.idle == 3
+                assert await pool.prewarm() == 0
+                assert pool.stats.idle == 3
+                assert (await pool.request("GET", "/")).status == 200
+                assert pool.stats.idle == 3
+            assert pool.stats.idle == 0
+
+        run(main())
+
+
+class TestAsyncPoolManager(HypercornDummyServerTestCase):
+    @classmethod
+    def setup_class(cls) -> None:
+        super().setup_class()
+        cls.base_url = f"http://{cls.host}:{cls.port}"
+        cls.base_url_alt = f"http://{cls.host_alt}:{cls.port}"
+
+    def test_request(self) -> None:
+        async def main() -> None:
+            async with AsyncPoolManager() as http:
+                r = await http.request("GET", self.base_url)
+                assert r.data == b"Dummy server!"
+                r = await http.request("GET", self.base_url_alt)
+                assert r.data == b"Dummy server!"
+                assert len(http.pools) == 2
+                assert http.stats.requests == 2
+
+        run(main())
+
+    def test_cross_host_redirect(self) -> None:
+        async def main() -> None:
+            async with AsyncPoolManager() as http:
+                r = await http.request(
+                    "GET",
+                    f"{self.base_url}/redirect",
+                    fields={"target": f"{self.base_url_alt}/echo?a=b"},
+                )
+                assert r.status == 200
+                assert r.data == b"a=b"
+
+        run(main())
+
+    def test_request_many(self) -> None:
+        async def main() -> None:
+            async with AsyncPoolManager(maxsize=2) as http:
+                requests = [
+                    *(("GET", f"{self.base_url}/echo?i={i}") for i in range(10)),
+                    ("GET", f"http://{self.host}:{find_unused_port()}/"),
+                ]
+                results = {
+                    result.position: result
+                    async for result in http.request_many(requests)
+                }
+                assert sorted(results) == list(range(11))
+                for i in range(10):
+                    assert results[i].result().data == f"i={i}".encode()
+                assert isinstance(results[10].error, MaxRetryError)
+                assert http.connection_from_url(self.base_url).num_connections == 2
+
+        run(main())
+
+    def test_clear_closes_pools(self) -> None:
+        async def main() -> None:
+            http = AsyncPoolManager()
+            await http.request("GET", self.base_url)
+            pool = http.connection_from_url(self.base_url)
+            http.clear()
+            assert pool.pool is None
+
+        run(main())
+
+
+class TestAsyncHTTPS(HTTPSHypercornDummyServerTestCase):
+    def test_verified(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPSConnectionPool(
+                self.host, self.port, ca_certs=DEFAULT_CA
+            ) as pool:
+                r = await pool.request("GET", "/", preload_content=False)
+                assert r.connection is not None
+                assert r.connection.is_verified
+                assert await r.read() == b"Dummy server!"
+
+        run(main())
+
+    def test_http2_injected(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPSConnectionPool(
+                self.host, self.port, ca_certs=DEFAULT_CA
+            ) as pool:
+                r = await pool.request("GET", "/")
+                assert r.data == b"Dummy server!"
+                assert r.headers["server"] == "hypercorn-h11"
+
+        # Async connections only speak HTTP/1.1 and mustn't offer HTTP/2.
+        urllib3.http2.inject_into_urllib3()
+        try:
+            run(main())
+        finally:
+            urllib3.http2.extract_from_urllib3()
+
+    def test_unverified(self) -> None:
+        async def main() -> None:
+            async with AsyncHTTPSConnectionPool(
+                self.host, self.port, retries=False
+            ) as pool:
+                with pytest.raises(Exception, match="CERTIFICATE_VERIFY_FAILED"):
+                    await pool.request("GET", "/")
+
+        run(main())
@@ -131,6 +131,13 @@ class TestLRUContainer:
         with pytest.raises(NotImplementedError):
             d.__iter__()
 
+    def test_values(self) -> None:
+        d: Container[int, str] = Container(2)
+        for i in range(3):
+            d[i] = str(i)
+
+        assert d.values() == ["1", "2"]
+
 
 class NonMappingHeaderContainer:
     def __init__(self, **kwargs: str) -> None:
@@ -213,6 +213,14 @@ class TestConnection:
         conn = HTTPSConnection("not.a.real.host", port=443)
         assert conn.socket_options == [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
 
+    def test_happy_eyeballs_passed_to_create_connection(self) -> None:
+        conn = HTTPSConnection("example.com", port=443, happy_eyeballs=0.1)
+        with mock.patch(
+            "urllib3.util.connection.create_connection"
+        ) as create_connection:
+            conn._new_conn()
+        assert create_connection.call_args.kwargs["happy_eyeballs"] == 0.1
+
     @pytest.mark.parametrize(
         "proxy_scheme, err_part",
         [
@@ -326,3 +334,57 @@ class TestConnection:
             assert "User-Agent" in request_headers
         else:
             assert user_agent not in request_headers
+
+    @pytest.mark.parametrize(
+        "body, chunked, expected_body, sendmsg_calls",
+        [
+            (b"foo", False, b"foo", 1),
+            (memoryview(b"foobar"), False, b"foobar", 1),
+            (b"foo", True, b"3\r\nfoo\r\n0\r\n\r\n", 1),
+            (
+                iter([b"foo", b"", b"quux"]),
+                False,
+                b"3\r\nfoo\r\n4\r\nquux\r\n0\r\n\r\n",
+                3,
+            ),
+        ],
+    )
+    def test_request_sendmsg(
+        self,
+        body: typing.Any,
+        chunked: bool,
+        expected_body: bytes,
+        sendmsg_calls: int,
+    ) -> None:
+        calls = []
+
+        def sendmsg(sock: socket.socket, buffers: list[memoryview]) -> int:
+            calls.append(buffers)
+            return socket_sendmsg(sock, buffers)
+
+        socket_sendmsg = socket.socket.sendmsg
+        conn = HTTPConnection("example.com")
+        conn.sock, server = socket.socketpair()
+        with conn.sock, server, mock.patch.object(socket.socket, "sendmsg", sendmsg):
+            conn.request("POST", "/", body=body, chunked=chunked)
+            data = server.recv(65536)
+
+        head, _, sent_body = data.partition(b"\r\n\r\n")
+        assert head.startswith(b"POST / HTTP/1.1\r\n")
+        assert sent_body == expected_body
+        # The head is sent together with the start of the body.
+        assert len(calls) == sendmsg_calls
+        assert conn._bytes_sent == len(data)
+
+    def test_request_sendmsg_partial(self) -> None:
+        def send_some(sock: socket.socket, buffers: list[memoryview]) -> int:
+            return sock.send(buffers[0][:3])
+
+        conn = HTTPConnection("example.com")
+        conn.sock, server = socket.socketpair()
+        with conn.sock, server, mock.patch.object(socket.socket, "sendmsg", send_some):
+            conn.request("POST", "/", body=b"hello world")
+            data = server.recv(65536)
+
+        assert data.endswith(b"\r\n\r\nhello world")
+        assert conn._bytes_sent == len(data)
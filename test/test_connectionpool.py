@@ -1,20 +1,23 @@
 from __future__ import annotations
 
 import http.client as httplib
+import socket
 import ssl
+import threading
+import time
 import typing
 from http.client import HTTPException
 from queue import Empty
 from socket import error as SocketError
 from ssl import SSLError as BaseSSLError
-from test import SHORT_TIMEOUT
+from test import LONG_TIMEOUT, SHORT_TIMEOUT
 from unittest.mock import Mock, patch
 
 import pytest
 
 from dummyserver.socketserver import DEFAULT_CA
 from urllib3 import Retry
-from urllib3.connection import HTTPConnection
+from urllib3.connection import HTTPConnection, HTTPSConnection
 from urllib3.connectionpool import (
     HTTPConnectionPool,
     HTTPSConnectionPool,
@@ -34,9 +37,11 @@ from urllib3.exceptions import (
     SSLError,
     TimeoutError,
 )
+from urllib3.http2.connection import HTTP2CleartextConnection, HTTP2Connection
 from urllib3.response import HTTPResponse
 from urllib3.util.ssl_match_hostname import CertificateError
 from urllib3.util.timeout import _DEFAULT_TIMEOUT, Timeout
+from urllib3.util.url import parse_url
 
 from .test_response import MockChunkedEncodingResponse, MockSock
 
@@ -466,6 +471,70 @@ class TestConnectionPool:
         except AttributeError:
             pytest.fail("Pool of the ConnectionPool is None and has no attribute get.")
 
+    def test_max_idle_time(self) -> None:
+        sock, peer = socket.socketpair()
+        with HTTPConnectionPool(host="localhost", max_idle_time=10) as pool:
+            conn = pool._get_conn()
+            conn.sock = sock  # type: ignore[attr-defined]
+            with patch("time.monotonic", return_value=100.0):
+                pool._put_conn(conn)
+            with patch("time.monotonic", return_value=109.0):
+                assert pool._get_conn() is conn
+                assert not conn.is_closed
+                pool._put_conn(conn)
+            with patch("time.monotonic", return_value=119.0):
+                assert pool._get_conn() is conn
+                assert conn.is_closed
+            assert pool.num_connections_reaped == 1
+        peer.close()
+
+    def test_max_connection_lifetime(self) -> None:
+        sock, peer = socket.socketpair()
+        with HTTPConnectionPool(host="localhost", max_connection_lifetime=30) as pool:
+            with patch("time.monotonic", return_value=100.0):
+                conn = pool._get_conn()
+            conn.sock = sock  # type: ignore[attr-defined]
+            with patch("time.monotonic", return_value=129.0):
+                pool._put_conn(conn)
+                assert pool._get_conn() is conn
+                assert not conn.is_closed
+                pool._put_conn(conn)
+            with patch("time.monotonic", return_value=130.0):
+                assert pool._reap_expired_conns() == 1
+                assert conn.is_closed
+                # The connection is reopened with a fresh lifetime.
+                assert pool._get_conn() is conn
+            with patch("time.monotonic", return_value=159.0):
+                conn.sock = sock
+                pool._put_conn(conn)
+                assert pool._reap_expired_conns() == 0
+            assert pool.num_connections_reaped == 1
+        peer.close()
+
+    def test_reaper_thread(self) -> None:
+        sock, peer = socket.socketpair()
+        pool = HTTPConnectionPool(
+            host="localhost", max_idle_time=0, reaper_interval=0.01
+        )
+        reapers = [
+            t for t in threading.enumerate() if t.name.startswith("urllib3-reaper")
+        ]
+        assert len(reapers) == 1
+
+        conn = pool._get_conn()
+        conn.sock = sock  # type: ignore[attr-defined]
+        pool._put_conn(conn)
+        deadline = time.monotonic() + LONG_TIMEOUT
+        while not conn.is_closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert conn.is_closed
+        assert pool.num_connections_reaped == 1
+
+        pool.close()
+        reapers[0].join(LONG_TIMEOUT)
+        assert not reapers[0].is_alive()
+        peer.close()
+
     def test_pool_timeouts(self) -> None:
         with HTTPConnectionPool(host="localhost") as pool:
             conn = pool._new_conn()
@@ -480,6 +549,38 @@ class TestConnectionPool:
             assert pool.timeout._connect == SHORT_TIMEOUT
             assert pool.timeout.total is None
 
+    def test_http2_options_ignored_by_http11_connections(self) -> None:
+        with HTTPSConnectionPool(
+            host="localhost", h2_initial_window_size=2**20, h2_max_frame_size=2**15
+        ) as pool:
+            conn = pool._new_conn()
+            assert conn.__class__ == HTTPSConnection
+
+    def test_http2_options(self) -> None:
+        with HTTPSConnectionPool(
+            host="localhost", h2_initial_window_size=2**20, h2_max_frame_size=2**15
+        ) as pool:
+            pool.ConnectionCls = HTTP2Connection
+            conn = pool._new_conn()
+            assert isinstance(conn, HTTP2Connection)
+            h2_conn = conn._h2_conn._obj
+            assert h2_conn.local_settings.initial_window_size == 2**20
+            assert h2_conn.local_settings.max_frame_size == 2**15
+
+    def test_http2_prior_knowledge(self) -> None:
+        with HTTPConnectionPool(host="localhost", http2_prior_knowledge=True) as pool:
+            conn = pool._new_conn()
+            assert isinstance(conn, HTTP2CleartextConnection)
+            assert conn.port == 80
+        with HTTPSConnectionPool(host="localhost", http2_prior_knowledge=True) as pool:
+            assert pool._new_conn().__class__ == HTTPSConnection
+        with HTTPConnectionPool(
+            host="localhost",
+            http2_prior_knowledge=True,
+            _proxy=parse_url("http://proxy:8080"),
+        ) as pool:
+            assert pool._new_conn().__class__ == HTTPConnection
+
     def test_no_host(self) -> None:
         with pytest.raises(LocationValueError):
             HTTPConnectionPool(None)  # type: ignore[arg-type]
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import http.client
+import io
+import time
+import typing
+
+import pytest
+
+from urllib3._collections import HTTPHeaderDict
+from urllib3._http11 import HTTP11Response, parse_header_block, read_header_block
+from urllib3.util.response import assert_header_parsing
+
+
+class FakeSocket:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def makefile(self, mode: str) -> io.BufferedReader:
+        return io.BufferedReader(io.BytesIO(self.data))
+
+
+def begin(data: bytes, method: str = "GET") -> HTTP11Response:
+    response = HTTP11Response(FakeSocket(data), method=method)  # type: ignore[arg-type]
+    response.begin()
+    return response
+
+
+class TestParseHeaderBlock:
+    @pytest.mark.parametrize(
+        "block",
+        [
+            b"\r\n",
+            b"Content-Type: text/plain\r\nContent-Length: 2\r\n\r\n",
+            b"Set-Cookie: a=1\r\nX-Other: x\r\nset-cookie: b=2\r\n\r\n",
+            b"Empty:\r\nSpaces:   padded  \r\nTab:\tvalue\r\n\r\n",
+            b"Lf-Only: value\nOther: value\n\n",
+            b"Latin-1: caf\xe9\r\n\r\n",
+        ],
+    )
+    def test_plain_headers(self, block: bytes) -> None:
+        expected = http.client.parse_headers(io.BytesIO(block))
+        msg, headers = parse_header_block(block)
+        assert msg.items() == expected.items()
+        assert headers is not None
+        assert list(headers.iteritems()) == list(
+            HTTPHeaderDict(expected.items()).iteritems()
+        )
+
+    @pytest.mark.parametrize(
+        "block",
+        [
+            b"Folded: a\r\n b\r\n\r\n",
+            b"No colon\r\nOther: value\r\n\r\n",
+            b": no name\r\n\r\n",
+            b"Space : before colon\r\n\r\n",
+            b"Carriage: a\rb\r\n\r\n",
+            b"Control: a\x0cb\r\n\r\n",
+            b"Unfinished: value\r\n",
+        ],
+    )
+    def test_other_headers_use_email_parser(self, block: bytes) -> None:
+        expected = http.client.parse_headers(io.BytesIO(block))
+        msg, headers = parse_header_block(block)
+        assert headers is None
+        assert msg.items() == expected.items()
+        assert [type(d) for d in msg.defects] == [type(d) for d in expected.defects]
+        assert msg.get_payload() == expected.get_payload()
+
+
+class TestReadHeaderBlock:
+    @pytest.mark.parametrize(
+        "wrap", [io.BytesIO, lambda data: io.BufferedReader(io.BytesIO(data))]
+    )
+    @pytest.mark.parametrize(
+        "block", [b"\r\n", b"\n", b"A: 1\r\nB: 2\r\n\r\n", b"A: 1\nB: 2\n\n"]
+    )
+    def test_read(
+        self, wrap: typing.Callable[[bytes], typing.IO[bytes]], block: bytes
+    ) -> None:
+        fp = wrap(block + b"body\r\n\r\n")
+        assert read_header_block(fp) == block
+        assert fp.read() == b"body\r\n\r\n"
+
+    def test_unfinished(self) -> None:
+        fp = io.BufferedReader(io.BytesIO(b"A: 1\r\nB: 2"))
+        assert read_header_block(fp) == b"A: 1\r\nB: 2"
+
+    def test_larger_than_read_buffer(self) -> None:
+        block = b"".join(b"X-Header-%d: %s\r\n" % (i, b"x" * 500) for i in range(50))
+        fp = io.BufferedReader(io.BytesIO(block + b"\r\nbody"), buffer_size=1024)
+        assert read_header_block(fp) == block + b"\r\n"
+        assert fp.read() == b"body"
+
+    @pytest.mark.parametrize(
+        "wrap", [io.BytesIO, lambda data: io.BufferedReader(io.BytesIO(data))]
+    )
+    def test_too_many_headers(
+        self, wrap: typing.Callable[[bytes], typing.IO[bytes]]
+    ) -> None:
+        block = b"X-Header: value\r\n" * 100 + b"\r\n"
+        with pytest.raises(http.client.HTTPException, match="got more than 100"):
+            read_header_block(wrap(block))
+        # The empty line counts as well.
+        assert read_header_block(wrap(block[17:])) == block[17:]
+
+    def test_line_too_long(self) -> None:
+        fp = io.BufferedReader(io.BytesIO(b"X-Header: " + b"x" * 2**16 + b"\r\n\r\n"))
+        with pytest.raises(http.client.LineTooLong):
+            read_header_block(fp)
+
+
+class TestHTTP11Response:
+    def test_content_length(self) -> None:
+        r = begin(
+            b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\nX-Value: a\r\n"
+            b"x-value: b\r\n\r\nhello"
+        )
+        assert (r.status, r.reason, r.version) == (200, "OK", 11)
+        assert r.header_dict is not None
+        assert r.header_dict["x-value"] == "a, b"
+        assert r.getheader("x-value") == "a, b"
+        assert r.length == 5
+        assert not r.chunked
+        assert not r.will_close
+        assert r.read() == b"hello"
+
+    def test_chunked(self) -> None:
+        r = begin(
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\nContent-Length: 99\r\n"
+            b"\r\n5\r\nhello\r\n0\r\n\r\n"
+        )
+        assert r.chunked
+        assert r.length is None
+        assert not r.will_close
+        assert r.read() == b"hello"
+
+    @pytest.mark.parametrize(
+        "head, will_close",
+        [
+            (b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n", False),
+            (b"HTTP/1.1 200 OK\r\nConnection: close\r\nContent-Length: 0\r\n", True),
+            (b"HTTP/1.1 200 OK\r\n", True),
+            (b"HTTP/1.0 200 OK\r\nContent-Length: 0\r\n", True),
+            (b"HTTP/1.0 200 OK\r\nKeep-Alive: 5\r\nContent-Length: 0\r\n", False),
+            (
+                b"HTTP/1.0 200 OK\r\nConnection: keep-alive\r\nContent-Length: 0\r\n",
+                False,
+            ),
+        ],
+    )
+    def test_will_close(self, head: bytes, will_close: bool) -> None:
+        assert begin(head + b"\r\n").will_close is will_close
+
+    @pytest.mark.parametrize(
+        "head, method",
+        [
+            (b"HTTP/1.1 204 No Content\r\n", "GET"),
+            (b"HTTP/1.1 304 Not Modified\r\nContent-Length: 5\r\n", "GET"),
+            (b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n", "HEAD"),
+        ],
+    )
+    def test_no_body(self, head: bytes, method: str) -> None:
+        r = begin(head + b"\r\n", method)
+        assert r.length == 0
+        assert r.read() == b""
+
+    def test_invalid_content_length(self) -> None:
+        r = begin(b"HTTP/1.1 200 OK\r\nContent-Length: -1\r\n\r\n")
+        assert r.length is None
+        assert r.will_close
+
+    def test_skips_continue(self) -> None:
+        r = begin(
+            b"HTTP/1.1 100 Continue\r\nX-Skipped: 1\r\n\r\n"
+            b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
+        )
+        assert r.status == 200
+        assert r.header_dict == {"Content-Length": "2"}
+        assert r.read() == b"ok"
+
+    def test_email_parser_fallback(self) -> None:
+        r = begin(b"HTTP/1.1 200 OK\r\nFolded: a\r\n b\r\nContent-Length: 0\r\n\r\n")
+        assert r.header_dict is None
+        assert r.msg["folded"] == "a\r\n b"
+        assert r.length == 0
+
+    def test_unknown_protocol(self) -> None:
+        with pytest.raises(http.client.UnknownProtocol):
+            begin(b"HTTP/2.0 200 OK\r\n\r\n")
+
+    @pytest.mark.parametrize("num_headers", [5, 20, 60])
+    def test_many_headers(
+        self,
+        num_headers: int,
+        record_property: typing.Callable[[str, object], None],
+    ) -> None:
+        head = (
+            b"HTTP/1.1 200 OK\r\n"
+            + b"".join(
+                b"X-Header-%d: value %d; with=params\r\n" % (i, i)
+                for i in range(num_headers)
+            )
+            + b"Content-Length: 2\r\n\r\n{}"
+        )
+
+        def parse_with_http_client() -> HTTPHeaderDict:
+            r = http.client.HTTPResponse(FakeSocket(head))  # type: ignore[arg-type]
+            r.begin()
+            assert_header_parsing(r.msg)
+            return HTTPHeaderDict(r.msg.items())
+
+        def parse() -> HTTPHeaderDict:
+            headers = begin(head).header_dict
+            assert headers is not None
+            return headers
+
+        assert parse() == parse_with_http_client()
+        elapsed = {}
+        for func in (parse_with_http_client, parse):
+            start = time.perf_counter()
+            for _ in range(200):
+                func()
+            elapsed[func] = time.perf_counter() - start
+        record_property(
+            "speedup", round(elapsed[parse_with_http_client] / elapsed[parse], 1)
+        )
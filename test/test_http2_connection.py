@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 import socket
+import ssl
+import threading
+import typing
+import zlib
 from unittest import mock
 
+import h2.exceptions
+import h2.settings
 import pytest
 
-from urllib3.connection import _get_default_user_agent
-from urllib3.exceptions import ConnectionError
+from urllib3._collections import HTTPHeaderDict
+from urllib3.connection import HTTPSConnection, _get_default_user_agent
+from urllib3.exceptions import ConnectionError, ProtocolError
 from urllib3.http2.connection import (
+    HTTP2CleartextConnection,
     HTTP2Connection,
+    HTTP2Response,
+    _HTTP2Session,
+    _HTTP2Sessions,
+    _HTTP2Stream,
     _is_illegal_header_value,
     _is_legal_header_name,
 )
@@ -184,6 +196,92 @@ class TestHTTP2Connection:
         )
         conn._h2_conn._obj.end_stream.assert_called_with(1)
 
+    def test_send_splits_frames(self) -> None:
+        conn = HTTP2Connection("example.com")
+        conn.sock = mock.MagicMock()
+        h2_conn = conn._h2_conn._obj
+        send_data = h2_conn.send_data = mock.Mock(return_value=None)  # type: ignore[method-assign]
+        h2_conn.local_flow_control_window = mock.Mock(return_value=65535)  # type: ignore[method-assign]
+        h2_conn.max_outbound_frame_size = 16384
+
+        conn.putrequest("POST", "/")
+        conn.endheaders()
+        conn.send(b"x" * 40000)
+
+        assert send_data.call_args_list == [
+            mock.call(1, b"x" * 16384, end_stream=False),
+            mock.call(1, b"x" * 16384, end_stream=False),
+            mock.call(1, b"x" * 7232, end_stream=True),
+        ]
+
+    def test_send_waits_for_window(self) -> None:
+        conn = HTTP2Connection("example.com")
+        conn.sock = mock.MagicMock()
+        h2_conn = conn._h2_conn._obj
+        send_data = h2_conn.send_data = mock.Mock(return_value=None)  # type: ignore[method-assign]
+        window = h2_conn.local_flow_control_window = mock.Mock(  # type: ignore[method-assign]
+            side_effect=[10, 0, 0, 100]
+        )
+
+        conn.putrequest("POST", "/")
+        conn.endheaders()
+        with (
+            mock.patch.object(conn, "_has_data_to_read", return_value=True),
+            mock.patch.object(conn, "_read_frames") as read_frames,
+        ):
+            conn.send(b"x" * 25)
+
+        # The window update was read from the socket while waiting.
+        read_frames.assert_called_once_with()
+        assert window.call_count == 4
+        assert send_data.call_args_list == [
+            mock.call(1, b"x" * 10, end_stream=False),
+            mock.call(1, b"x" * 15, end_stream=True),
+        ]
+
+    def test_send_stops_if_stream_closed(self) -> None:
+        conn = HTTP2Connection("example.com")
+        conn.sock = mock.MagicMock()
+        h2_conn = conn._h2_conn._obj
+        send_data = h2_conn.send_data = mock.Mock(return_value=None)  # type: ignore[method-assign]
+        h2_conn.local_flow_control_window = mock.Mock(  # type: ignore[method-assign]
+            side_effect=h2.exceptions.StreamClosedError(1)
+        )
+
+        conn.putrequest("POST", "/")
+        conn.endheaders()
+        # The server answered early, the response says why.
+        conn.send(b"x" * 25)
+        send_data.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"h2_initial_window_size": 2**31},
+            {"h2_max_frame_size": 1024},
+            {"h2_connection_window_size": 1024},
+        ],
+    )
+    def test_invalid_settings(self, kwargs: dict[str, typing.Any]) -> None:
+        with pytest.raises(ValueError):
+            HTTP2Connection("example.com", **kwargs)
+
+    def test_settings(self) -> None:
+        conn = HTTP2Connection(
+            "example.com",
+            h2_initial_window_size=2**20,
+            h2_connection_window_size=2**24,
+            h2_max_frame_size=2**15,
+        )
+        h2_conn = conn._h2_conn._obj
+        assert h2_conn.local_settings.initial_window_size == 2**20
+        assert h2_conn.local_settings.max_frame_size == 2**15
+
+        with mock.patch.object(HTTPSConnection, "connect"):
+            conn.sock = mock.MagicMock()
+            conn.connect()
+        assert h2_conn.inbound_flow_control_window == 2**24
+
     def test_send_file_str(self) -> None:
         conn = HTTP2Connection("example.com")
         mock_open = mock.mock_open(read_data="foo\r\nbar\r\n")
@@ -271,6 +369,36 @@ class TestHTTP2Connection:
 
         close_connection.assert_called_with()
 
+    def test_cleartext_request_GET(self) -> None:
+        conn = HTTP2CleartextConnection("example.com")
+        sock = mock.MagicMock(sendall=mock.Mock(return_value=None))
+        send_headers = conn._h2_conn._obj.send_headers = mock.Mock(return_value=None)  # type: ignore[method-assign]
+        with mock.patch.object(conn, "_new_conn", return_value=sock) as new_conn:
+            conn.request("GET", "/")
+
+        # Pools don't connect HTTP connections before the request, and there's
+        # no TLS handshake before the connection preface.
+        new_conn.assert_called_once_with()
+        assert conn.sock is sock
+        assert not conn.is_verified
+        assert (
+            sock.sendall.call_args_list[0]
+            .args[0]
+            .startswith(b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n")
+        )
+        send_headers.assert_called_with(
+            stream_id=1,
+            headers=[
+                (b":scheme", b"http"),
+                (b":method", b"GET"),
+                (b":authority", b"example.com:80"),
+                (b":path", b"/"),
+                (b"user-agent", _get_default_user_agent().encode()),
+            ],
+            end_stream=True,
+        )
+        conn.close()
+
     def test_request_POST(self) -> None:
         conn = HTTP2Connection("example.com")
         conn.sock = mock.MagicMock(
@@ -281,6 +409,7 @@ class TestHTTP2Connection:
         send_headers = conn._h2_conn._obj.send_headers = mock.Mock(return_value=None)  # type: ignore[method-assign]
         send_data = conn._h2_conn._obj.send_data = mock.Mock(return_value=None)  # type: ignore[method-assign]
         conn._h2_conn._obj.get_next_available_stream_id = mock.Mock(return_value=1)  # type: ignore[method-assign]
+        conn._h2_conn._obj.local_flow_control_window = mock.Mock(return_value=65535)  # type: ignore[method-assign]
         close_connection = conn._h2_conn._obj.close_connection = mock.Mock(  # type: ignore[method-assign]
             return_value=None
         )
@@ -326,6 +455,35 @@ class TestHTTP2Connection:
         assert conn._h2_stream is None
         assert conn._headers == []
 
+    def test_read_frames_locked_while_receiving(self) -> None:
+        conn = HTTP2Connection("example.com")
+        lock = conn._h2_conn.lock
+        acquired = []
+
+        def acquire() -> None:
+            acquired.append(lock.acquire(blocking=False))
+
+        def recv(bufsize: int) -> bytes:
+            # Other streams can't send while the socket is receiving.
+            thread = threading.Thread(target=acquire)
+            thread.start()
+            thread.join()
+            return b""
+
+        conn.sock = mock.Mock(recv=recv, gettimeout=mock.Mock(return_value=5.0))
+        conn._read_frames()
+        assert acquired == [False]
+        assert conn._session.eof
+        # The socket doesn't block while the HTTP/2 state is locked.
+        conn.sock.setblocking.assert_called_once_with(False)
+        conn.sock.settimeout.assert_called_once_with(5.0)
+
+    def test_read_frames_partial_tls_record(self) -> None:
+        conn = HTTP2Connection("example.com")
+        conn.sock = mock.Mock(recv=mock.Mock(side_effect=ssl.SSLWantReadError))
+        conn._read_frames()
+        assert not conn._session.eof
+
     def test_request_ignore_chunked(self) -> None:
         conn = HTTP2Connection("example.com")
         conn.sock = mock.MagicMock(
@@ -358,3 +516,243 @@ class TestHTTP2Connection:
         )
 
         close_connection.assert_called_with()
+
+    def test_sessions_join_and_leave(self) -> None:
+        sessions = _HTTP2Sessions()
+        conn = HTTP2Connection("example.com", h2_sessions=sessions)
+        session = conn._session
+        assert sessions.join() is None
+
+        sessions.add(session)
+        assert sessions.join() is session
+        assert session.users == 2
+        assert len(sessions) == 1
+
+        assert not sessions.leave(session)
+        assert sessions.leave(session)
+        assert len(sessions) == 0
+
+    def test_sessions_join_respects_max_concurrent_streams(self) -> None:
+        sessions = _HTTP2Sessions()
+        session = _HTTP2Session(HTTP2Connection("example.com")._new_h2_conn())
+        sessions.add(session)
+        session.h2_conn._obj.remote_settings[
+            h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS
+        ] = 2
+        session.h2_conn._obj.remote_settings.acknowledge()
+
+        assert sessions.join() is session
+        assert sessions.join() is None
+
+        # A session which received GOAWAY doesn't take new streams.
+        sessions.leave(session)
+        session.terminated = True
+        assert sessions.join() is None
+
+    def test_connect_joins_session(self) -> None:
+        sessions = _HTTP2Sessions()
+        session = _HTTP2Session(HTTP2Connection("example.com")._new_h2_conn())
+        session.origin = ("example.com", 443)
+        sock = mock.Mock()
+        session.sock = sock
+        session.is_verified = True
+        session.ready.set()
+        sessions.add(session)
+
+        # Only connections to the same origin share a session by default.
+        assert sessions.join(("example.org", 443)) is None
+
+        conn = HTTP2Connection("example.com", h2_sessions=sessions)
+        conn.connect()
+        assert conn._session is session
+        assert conn.sock is session.sock
+        assert conn.is_verified
+        assert session.users == 2
+
+        # Closing a connection which shares the socket only leaves the session.
+        conn.close()
+        assert session.users == 1
+        sock.close.assert_not_called()
+        assert conn._session is not session
+
+    def test_connect_failed_session_is_not_joined(self) -> None:
+        sessions = _HTTP2Sessions()
+        session = _HTTP2Session(HTTP2Connection("example.com")._new_h2_conn())
+        session.eof = True
+        session.ready.set()
+        sessions.add(session)
+        assert sessions.join() is None
+
+    def _coalescing_session(self, sessions: _HTTP2Sessions) -> _HTTP2Session:
+        session = _HTTP2Session(HTTP2Connection("a.example.com")._new_h2_conn())
+        session.origin = ("a.example.com", 443)
+        session.sock = mock.Mock()
+        session.is_verified = True
+        session.peer_address = "192.0.2.1"
+        session.peer_cert = {"subjectAltName": (("DNS", "*.example.com"),)}
+        session.ready.set()
+        sessions.add(session)
+        return session
+
+    def test_connect_coalesces_session(self) -> None:
+        sessions = _HTTP2Sessions(coalesce=True)
+        session = self._coalescing_session(sessions)
+
+        conn = HTTP2Connection("b.example.com", h2_sessions=sessions)
+        addrinfo = (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", 443))
+        with mock.patch(
+            "urllib3.http2.connection._getaddrinfo", return_value=[addrinfo]
+        ) as getaddrinfo:
+            conn.connect()
+        getaddrinfo.assert_called_once_with("b.example.com", 443, None)
+        assert conn._session is session
+        assert conn.sock is session.sock
+        assert session.users == 2
+
+        conn.putrequest("GET", "/")
+        assert (b":authority", b"b.example.com:443") in conn._headers
+
+    @pytest.mark.parametrize(
+        "host, port, addresses",
+        [
+            # The certificate doesn't cover the host.
+            ("example.org", 443, ["192.0.2.1"]),
+            ("a.b.example.com", 443, ["192.0.2.1"]),
+            # The host resolves to other servers.
+            ("b.example.com", 443, ["192.0.2.2", "2001:db8::1"]),
+            # Another port may be another server.
+            ("b.example.com", 8443, ["192.0.2.1"]),
+        ],
+    )
+    def test_coalesce_requires_authoritative_server(
+        self, host: str, port: int, addresses: list[str]
+    ) -> None:
+        sessions = _HTTP2Sessions(coalesce=True)
+        session = self._coalescing_session(sessions)
+        assert sessions.coalesce(host, port, lambda: addresses) is None
+        assert session.users == 1
+
+    def test_coalesce_skips_misdirected_hosts(self) -> None:
+        sessions = _HTTP2Sessions(coalesce=True)
+        session = self._coalescing_session(sessions)
+        session.misdirected.add("b.example.com")
+        resolve = mock.Mock(return_value=["192.0.2.1"])
+        assert sessions.coalesce("b.example.com", 443, resolve) is None
+        assert sessions.coalesce("c.example.com", 443, resolve) is session
+        # Names are only resolved if a certificate matches.
+        resolve.assert_called_once_with()
+
+    def test_coalesce_not_without_verified_certificate(self) -> None:
+        sessions = _HTTP2Sessions(coalesce=True)
+        session = self._coalescing_session(sessions)
+        session.peer_cert = None
+        resolve = mock.Mock(return_value=["192.0.2.1"])
+        assert sessions.coalesce("b.example.com", 443, resolve) is None
+        resolve.assert_not_called()
+
+    def _mock_stream(self, *events: list[typing.Any]) -> tuple[_HTTP2Stream, mock.Mock]:
+        conn = mock.Mock(spec=HTTP2Connection)
+        conn._receive_events.side_effect = list(events)
+        return _HTTP2Stream(conn, 1), conn
+
+    @staticmethod
+    def _data(data: bytes, padding: int = 0) -> mock.Mock:
+        return mock.Mock(
+            spec=h2.events.DataReceived,
+            stream_id=1,
+            data=data,
+            flow_controlled_length=len(data) + padding,
+        )
+
+    def test_stream_acknowledges_data_as_read(self) -> None:
+        stream, conn = self._mock_stream(
+            [self._data(b"foo", padding=2)],
+            [self._data(b"bar"), mock.Mock(spec=h2.events.StreamEnded)],
+        )
+
+        assert stream.read(2) == b"fo"
+        # The padding is acknowledged right away, data only once read.
+        assert conn._acknowledge_data.call_args_list == [
+            mock.call(1, 2),
+            mock.call(1, 2),
+        ]
+        assert conn._receive_events.call_count == 1
+
+        # Waiting for more data gives the rest of the buffer's window back
+        # first, the server may not send more otherwise.
+        assert stream.read() == b"obar"
+        assert conn._acknowledge_data.call_args_list[2:] == [
+            mock.call(1, 1),
+            mock.call(1, 3),
+        ]
+        assert stream.isclosed()
+        conn._end_stream.assert_called_once_with(1)
+        assert stream.read() == b""
+
+    def test_stream_close_acknowledges_unread_data(self) -> None:
+        stream, conn = self._mock_stream([self._data(b"foobar")])
+        assert stream.read1(3) == b"foo"
+        stream.close()
+
+        assert conn._acknowledge_data.call_args_list[-1] == mock.call(1, 3)
+        # The stream didn't end, closing the connection resets it.
+        conn._end_stream.assert_not_called()
+        assert stream.read() == b""
+
+    def test_stream_reset(self) -> None:
+        reset = mock.Mock(spec=h2.events.StreamReset, stream_id=1, error_code=8)
+        stream, conn = self._mock_stream([self._data(b"foo")], [reset])
+
+        with pytest.raises(ProtocolError, match="Stream 1 was reset"):
+            stream.read()
+        assert stream.isclosed()
+
+    @pytest.mark.parametrize("preload_content", [True, False])
+    def test_response_decodes_stream(self, preload_content: bool) -> None:
+        body = zlib.compress(b"hello, world!" * 100)
+        stream, conn = self._mock_stream(
+            [self._data(body[:10])],
+            [self._data(body[10:]), mock.Mock(spec=h2.events.StreamEnded)],
+        )
+        r = HTTP2Response(
+            status=200,
+            headers=HTTPHeaderDict({"content-encoding": "deflate"}),
+            request_url="/",
+            body=stream,
+            preload_content=preload_content,
+        )
+        if preload_content:
+            assert r.data == b"hello, world!" * 100
+        else:
+            assert r.read(5) == b"hello"
+            assert b"".join(r.stream(100)) == b", world!" + b"hello, world!" * 99
+        assert r.tell() == len(body)
+        assert r.closed
+
+    def test_response_read_chunked(self) -> None:
+        stream, conn = self._mock_stream(
+            [self._data(b"foo"), self._data(b"barbaz")],
+            [mock.Mock(spec=h2.events.StreamEnded)],
+        )
+        r = HTTP2Response(
+            status=200,
+            headers=HTTPHeaderDict({"content-length": "9"}),
+            request_url="/",
+            body=stream,
+            preload_content=False,
+        )
+        assert list(r.read_chunked(4)) == [b"foob", b"arba", b"z"]
+
+    def test_response_incomplete(self) -> None:
+        stream, conn = self._mock_stream(
+            [self._data(b"foo"), mock.Mock(spec=h2.events.StreamEnded)]
+        )
+        r = HTTP2Response(
+            status=200,
+            headers=HTTPHeaderDict({"content-length": "9"}),
+            request_url="/",
+            body=stream,
+            preload_content=False,
+        )
+        with pytest.raises(ProtocolError, match="IncompleteRead"):
+            r.read()
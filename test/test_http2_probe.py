@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from urllib3.connection import HTTPSConnection
+from urllib3.http2.probe import HTTP2SupportCache, http2_support_cache
+from urllib3.util import ssl_
+
+
+class TestHTTP2SupportCache:
+    def test_probe(self) -> None:
+        cache = HTTP2SupportCache()
+        assert cache.acquire_and_get("example.com", 443) is None
+        cache.set_and_release("example.com", 443, True)
+        assert cache.acquire_and_get("example.com", 443) is True
+        assert cache._values() == {("example.com", 443): True}
+
+    def test_failed_probe_is_retried(self) -> None:
+        cache = HTTP2SupportCache()
+        assert cache.acquire_and_get("example.com", 443) is None
+        cache.set_and_release("example.com", 443, None)
+        assert cache.acquire_and_get("example.com", 443) is None
+        cache.set_and_release("example.com", 443, False)
+        assert cache.acquire_and_get("example.com", 443) is False
+
+    def test_concurrent_probe_waits(self) -> None:
+        cache = HTTP2SupportCache()
+        assert cache.acquire_and_get("example.com", 443) is None
+
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(cache.acquire_and_get("example.com", 443))
+        )
+        thread.start()
+        thread.join(0.1)
+        assert thread.is_alive()
+
+        cache.set_and_release("example.com", 443, True)
+        thread.join()
+        assert results == [True]
+
+    @pytest.mark.parametrize("value, ttl", [(True, 100.0), (False, 10.0)])
+    def test_results_expire(self, value: bool, ttl: float) -> None:
+        cache = HTTP2SupportCache(ttl=100.0, negative_ttl=10.0)
+        now = time.time()
+        with mock.patch("time.time", return_value=now):
+            assert cache.acquire_and_get("example.com", 443) is None
+            cache.set_and_release("example.com", 443, value)
+        with mock.patch("time.time", return_value=now + ttl - 1):
+            assert cache.acquire_and_get("example.com", 443) is value
+        with mock.patch("time.time", return_value=now + ttl + 1):
+            assert cache.acquire_and_get("example.com", 443) is None
+            cache.set_and_release("example.com", 443, not value)
+            assert cache.acquire_and_get("example.com", 443) is (not value)
+
+    def test_maxsize(self) -> None:
+        cache = HTTP2SupportCache(maxsize=2)
+        for host in ("a.example.com", "b.example.com"):
+            assert cache.acquire_and_get(host, 443) is None
+            cache.set_and_release(host, 443, True)
+        # Using an origin keeps it in the cache.
+        assert cache.acquire_and_get("a.example.com", 443) is True
+
+        assert cache.acquire_and_get("c.example.com", 443) is None
+        assert cache._values() == {
+            ("a.example.com", 443): True,
+            ("c.example.com", 443): None,
+        }
+
+        # Origins being probed aren't discarded.
+        assert cache.acquire_and_get("d.example.com", 443) is None
+        assert len(cache) == 2
+        cache.set_and_release("c.example.com", 443, False)
+        cache.set_and_release("d.example.com", 443, True)
+        assert cache._values() == {
+            ("c.example.com", 443): False,
+            ("d.example.com", 443): True,
+        }
+
+    @pytest.mark.parametrize(
+        "alt_svc, expected_ttl",
+        [
+            ('h2=":443"', 86400),
+            ('h3=":443"; ma=60, h2=":443"; ma=3600', 3600),
+            ('h2="example.com:443"; ma="60"; persist=1', 60),
+            ('h2=":443"; ma=999999999', 100000),
+        ],
+    )
+    def test_alt_svc(self, alt_svc: str, expected_ttl: int) -> None:
+        cache = HTTP2SupportCache(ttl=100000)
+        now = time.time()
+        with mock.patch("time.time", return_value=now):
+            cache.update_from_alt_svc("example.com", 443, alt_svc)
+        assert cache.acquire_and_get("example.com", 443) is True
+        assert cache._entries["example.com", 443].expires_at == now + expected_ttl
+
+    @pytest.mark.parametrize(
+        "alt_svc",
+        [
+            'h3=":443"',
+            'h2=":8443"',
+            'h2="alt.example.com:443"',
+            "invalid",
+        ],
+    )
+    def test_alt_svc_other_alternatives_ignored(self, alt_svc: str) -> None:
+        cache = HTTP2SupportCache()
+        cache.update_from_alt_svc("example.com", 443, alt_svc)
+        assert cache._values() == {}
+
+    def test_alt_svc_clear(self) -> None:
+        cache = HTTP2SupportCache()
+        cache.update_from_alt_svc("example.com", 443, 'h2=":443"')
+        cache.update_from_alt_svc("example.com", 443, "clear")
+        assert cache._values() == {}
+
+    def test_alt_svc_during_probe(self) -> None:
+        cache = HTTP2SupportCache()
+        assert cache.acquire_and_get("example.com", 443) is None
+        cache.update_from_alt_svc("example.com", 443, 'h2=":443"')
+        cache.update_from_alt_svc("example.com", 443, "clear")
+        # A failed probe keeps the result learned meanwhile.
+        cache.set_and_release("example.com", 443, None)
+        assert cache.acquire_and_get("example.com", 443) is True
+
+    def test_snapshot(self, tmp_path: Path) -> None:
+        path = tmp_path / "http2.json"
+        cache = HTTP2SupportCache()
+        for host, value in (("a.example.com", True), ("b.example.com", False)):
+            assert cache.acquire_and_get(host, 443) is None
+            cache.set_and_release(host, 443, value)
+        # Probes in progress aren't saved.
+        assert cache.acquire_and_get("c.example.com", 443) is None
+        cache.save(path)
+        assert list(tmp_path.iterdir()) == [path]
+
+        other = HTTP2SupportCache()
+        assert other.load(path) == 2
+        assert other.acquire_and_get("a.example.com", 443) is True
+        assert other.acquire_and_get("b.example.com", 443) is False
+        assert (
+            other._entries["a.example.com", 443].expires_at
+            == cache._entries["a.example.com", 443].expires_at
+        )
+        # Results which are known already aren't replaced by older ones.
+        assert other.load(path) == 0
+
+    def test_load_skips_expired_results(self, tmp_path: Path) -> None:
+        path = tmp_path / "http2.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "origins": [
+                        ["a.example.com", 443, True, time.time() - 1],
+                        ["b.example.com", 443, True, time.time() + 60],
+                    ],
+                }
+            )
+        )
+        cache = HTTP2SupportCache()
+        assert cache.load(path) == 1
+        assert cache._values() == {("b.example.com", 443): True}
+
+    def test_load_missing_snapshot(self, tmp_path: Path) -> None:
+        assert HTTP2SupportCache().load(tmp_path / "http2.json") == 0
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            [],
+            {"version": 2, "origins": []},
+            {"version": 1, "origins": [["example.com", 443, True]]},
+            {"version": 1, "origins": [["example.com", "443", True, 0]]},
+        ],
+    )
+    def test_load_invalid_snapshot(self, tmp_path: Path, data: object) -> None:
+        path = tmp_path / "http2.json"
+        path.write_text(json.dumps(data))
+        with pytest.raises(ValueError):
+            HTTP2SupportCache().load(path)
+
+    def test_clear(self) -> None:
+        cache = HTTP2SupportCache()
+        cache.update_from_alt_svc("a.example.com", 443, 'h2=":443"')
+        assert cache.acquire_and_get("b.example.com", 443) is None
+        cache.clear()
+        assert cache._values() == {("b.example.com", 443): None}
+        cache.set_and_release("b.example.com", 443, True)
+
+    @pytest.mark.parametrize("alpn_protocols", [["h2"], ["http/1.1"]])
+    def test_https_connection_records_alt_svc(self, alpn_protocols: list[str]) -> None:
+        conn = HTTPSConnection("example.com")
+        response = mock.Mock(headers={"alt-svc": 'h2=":443"; ma=60'})
+        with (
+            mock.patch.object(ssl_, "ALPN_PROTOCOLS", alpn_protocols),
+            mock.patch(
+                "urllib3.connection.HTTPConnection.getresponse", return_value=response
+            ),
+        ):
+            assert conn.getresponse() is response
+
+        if "h2" in alpn_protocols:
+            assert http2_support_cache._values() == {("example.com", 443): True}
+        else:
+            assert http2_support_cache._values() == {}
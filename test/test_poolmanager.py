@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import gc
 import socket
+import threading
+import time
+import typing
 from test import resolvesLocalhostFQDN
 from unittest import mock
 from unittest.mock import MagicMock, patch
@@ -11,13 +14,15 @@ import pytest
 from urllib3 import connection_from_url
 from urllib3.connectionpool import HTTPSConnectionPool
 from urllib3.exceptions import LocationValueError
+from urllib3.http2.connection import HTTP2Connection
 from urllib3.poolmanager import (
     _DEFAULT_BLOCKSIZE,
     PoolKey,
     PoolManager,
+    RequestResult,
     key_fn_by_scheme,
 )
-from urllib3.util import retry, timeout
+from urllib3.util import TLSSessionCache, retry, timeout
 from urllib3.util.url import Url
 
 
@@ -260,6 +265,64 @@ class TestPoolManager:
         with pytest.raises(AttributeError):
             _ = pool.assert_fingerprint  # type: ignore[attr-defined]
 
+    def test_tls_session_cache_passed_to_https_pools(self) -> None:
+        cache = TLSSessionCache()
+        p = PoolManager(tls_session_cache=cache)
+        https_pool = p.connection_from_url("https://example.com/")
+        http_pool = p.connection_from_url("http://example.com/")
+        assert https_pool.conn_kw["tls_session_cache"] is cache
+        assert "tls_session_cache" not in http_pool.conn_kw
+
+        # Pools with different session caches aren't shared.
+        other = p.connection_from_host(
+            "example.com",
+            scheme="https",
+            pool_kwargs={"tls_session_cache": TLSSessionCache()},
+        )
+        assert other is not https_pool
+
+    def test_http2_coalescing_shares_sessions(self) -> None:
+        p = PoolManager(http2_coalescing=True)
+        with mock.patch.object(HTTPSConnectionPool, "ConnectionCls", HTTP2Connection):
+            a = p.connection_from_url("https://a.example.com/")
+            b = p.connection_from_url("https://b.example.com/")
+            other_port = p.connection_from_url("https://b.example.com:8443/")
+            other_ca = p.connection_from_host(
+                "b.example.com", scheme="https", pool_kwargs={"ca_certs": "ca.pem"}
+            )
+        sessions = a.conn_kw["h2_sessions"]
+        assert sessions.coalesce_origins
+        assert b.conn_kw["h2_sessions"] is sessions
+        assert other_port.conn_kw["h2_sessions"] is not sessions
+        assert other_ca.conn_kw["h2_sessions"] is not sessions
+
+        # Connections which don't multiplex don't get the sessions.
+        c = p.connection_from_url("https://c.example.com/")
+        assert "h2_sessions" not in c.conn_kw
+        assert (
+            "h2_sessions"
+            not in PoolManager().connection_from_url("https://d.example.com/").conn_kw
+        )
+
+    def test_http2_coalescing_sessions_dropped_with_pools(self) -> None:
+        p = PoolManager(num_pools=2, http2_coalescing=True)
+        with mock.patch.object(HTTPSConnectionPool, "ConnectionCls", HTTP2Connection):
+            a = p.connection_from_url("https://a.example.com/")
+            p.connection_from_url("https://b.example.com/")
+            assert len(p._http2_sessions) == 1
+
+            # Evicting one of the pools sharing the sessions keeps them.
+            p.connection_from_url("https://a.example.com:8443/")
+            assert len(p._http2_sessions) == 2
+            p.connection_from_url("https://b.example.com:8443/")
+            assert len(p._http2_sessions) == 1
+            # Pools created later get new sessions.
+            new_a = p.connection_from_url("https://a.example.com/")
+            assert new_a.conn_kw["h2_sessions"] is not a.conn_kw["h2_sessions"]
+
+        p.clear()
+        assert len(p._http2_sessions) == 0
+
     def test_http_connection_from_context_case_insensitive(self) -> None:
         """Assert scheme case is ignored when getting the https key class."""
         p = PoolManager()
@@ -514,3 +577,108 @@ class TestPoolManager:
 
         # Connection should be closed, because reference to pool_1 is gone.
         assert conn_queue.qsize() == 0
+
+    def test_request_many(self) -> None:
+        lock = threading.Lock()
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        def request(method: str, url: str, **kw: object) -> mock.Mock:
+            host = url.split("/")[2]
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.01)
+            with lock:
+                active[host] -= 1
+            if url.endswith("/fail"):
+                raise LocationValueError("failed")
+            return mock.Mock(status=200, url=url, kw=kw)
+
+        p = PoolManager(maxsize=3)
+        requests: list[tuple[str, str] | dict[str, typing.Any]] = [
+            *(("GET", f"http://a.example.com/{i}") for i in range(10)),
+            *(("GET", f"http://b.example.com/{i}") for i in range(10)),
+            ("GET", "http://a.example.com/fail"),
+            {"method": "POST", "url": "http://b.example.com/kw", "body": b"x"},
+            ("GET", "foo://unknown.example.com/"),
+        ]
+        with patch.object(p, "request", side_effect=request):
+            results = list(p.request_many(requests, per_host_limit=2))
+
+        assert sorted(result.position for result in results) == list(range(23))
+        assert peak == {"a.example.com": 2, "b.example.com": 2}
+
+        by_position = {result.position: result for result in results}
+        assert by_position[0].result().url == "http://a.example.com/0"
+        assert by_position[21].method == "POST"
+        response = by_position[21].result()
+        assert isinstance(response, mock.Mock)
+        assert response.kw == {"body": b"x"}
+        for index in (20, 22):
+            assert by_position[index].response is None
+            with pytest.raises(LocationValueError):
+                by_position[index].result()
+
+    def test_request_many_max_concurrency(self) -> None:
+        lock = threading.Lock()
+        active = peak = 0
+
+        def request(method: str, url: str) -> mock.Mock:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return mock.Mock()
+
+        p = PoolManager(maxsize=10)
+        requests = [("GET", f"http://host{i}.example.com/") for i in range(20)]
+        with patch.object(p, "request", side_effect=request):
+            results = list(p.request_many(requests, max_concurrency=4))
+        assert len(results) == 20
+        assert all(isinstance(result, RequestResult) for result in results)
+        assert peak == 4
+
+    @pytest.mark.parametrize(
+        ["per_host_limit", "expected_peak"], [(None, 3), (2, 2), (10, 3)]
+    )
+    def test_request_many_per_host_limit(
+        self, per_host_limit: int | None, expected_peak: int
+    ) -> None:
+        lock = threading.Lock()
+        active = peak = 0
+
+        def request(method: str, url: str) -> mock.Mock:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return mock.Mock()
+
+        # The limit defaults to and is capped by the size of the host's pool.
+        p = PoolManager(maxsize=3)
+        requests = [("GET", "http://example.com/") for _ in range(12)]
+        with patch.object(p, "request", side_effect=request):
+            results = list(p.request_many(requests, per_host_limit=per_host_limit))
+        assert len(results) == 12
+        assert peak == expected_peak
+
+    def test_request_many_stop_early(self) -> None:
+        p = PoolManager()
+        requests = [("GET", "http://example.com/") for _ in range(50)]
+        with patch.object(p, "request", return_value=mock.Mock()) as request:
+            results = p.request_many(requests, max_concurrency=1)
+            next(results)
+            results.close()
+        assert request.call_count < 50
+
+    @pytest.mark.parametrize("kwargs", [{"max_concurrency": 0}, {"per_host_limit": 0}])
+    def test_request_many_invalid_limits(self, kwargs: dict[str, int]) -> None:
+        with pytest.raises(ValueError):
+            PoolManager().request_many([], **kwargs)
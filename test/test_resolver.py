@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import socket
+import threading
+import typing
+from unittest import mock
+
+import pytest
+
+from urllib3.util.resolver import (
+    _TYPE_ADDRINFO,
+    BaseResolver,
+    CachingResolver,
+    SystemResolver,
+)
+
+ADDRINFO: list[_TYPE_ADDRINFO] = [
+    (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", 80))
+]
+
+
+class CountingResolver(BaseResolver):
+    def __init__(self, result: list[_TYPE_ADDRINFO] | Exception) -> None:
+        self.result = result
+        self.calls = 0
+        self.called = threading.Event()
+
+    def getaddrinfo(
+        self,
+        host: str,
+        port: int,
+        family: socket.AddressFamily,
+        type: socket.SocketKind,
+    ) -> list[_TYPE_ADDRINFO]:
+        self.calls += 1
+        self.called.set()
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def resolve(resolver: BaseResolver, host: str = "example.com") -> typing.Any:
+    return resolver.getaddrinfo(host, 80, socket.AF_UNSPEC, socket.SOCK_STREAM)
+
+
+class TestSystemResolver:
+    @mock.patch("socket.getaddrinfo", return_value=ADDRINFO)
+    def test_uses_getaddrinfo(self, getaddrinfo: mock.MagicMock) -> None:
+        assert resolve(SystemResolver()) == ADDRINFO
+        getaddrinfo.assert_called_once_with(
+            "example.com", 80, socket.AF_UNSPEC, socket.SOCK_STREAM
+        )
+
+
+class TestCachingResolver:
+    def test_caches_lookups(self) -> None:
+        upstream = CountingResolver(ADDRINFO)
+        resolver = CachingResolver(upstream)
+        assert resolve(resolver) == ADDRINFO
+        assert resolve(resolver) == ADDRINFO
+        assert upstream.calls == 1
+
+        resolve(resolver, "example.org")
+        assert upstream.calls == 2
+
+        resolver.clear()
+        resolve(resolver)
+        assert upstream.calls == 3
+
+    def test_lookups_expire(self) -> None:
+        upstream = CountingResolver(ADDRINFO)
+        resolver = CachingResolver(upstream, ttl=10, stale_ttl=0)
+        with mock.patch("time.monotonic", return_value=100.0):
+            resolve(resolver)
+        with mock.patch("time.monotonic", return_value=109.0):
+            resolve(resolver)
+            assert upstream.calls == 1
+        with mock.patch("time.monotonic", return_value=110.0):
+            resolve(resolver)
+            assert upstream.calls == 2
+
+    def test_stale_lookups_are_refreshed_in_background(self) -> None:
+        upstream = CountingResolver(ADDRINFO)
+        resolver = CachingResolver(upstream, ttl=10, stale_ttl=10)
+        with mock.patch("time.monotonic", return_value=100.0):
+            resolve(resolver)
+        upstream.called.clear()
+
+        new_addrinfo: list[_TYPE_ADDRINFO] = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.2", 80))
+        ]
+        upstream.result = new_addrinfo
+        with mock.patch("time.monotonic", return_value=115.0):
+            # The stale result is served right away.
+            assert resolve(resolver) == ADDRINFO
+            assert upstream.called.wait(5)
+
+        for thread in threading.enumerate():
+            if thread.name == "urllib3-resolver-refresh":
+                thread.join(5)
+        assert upstream.calls == 2
+        assert resolve(resolver) == new_addrinfo
+
+    def test_failed_refresh_keeps_stale_lookup(self) -> None:
+        upstream = CountingResolver(ADDRINFO)
+        resolver = CachingResolver(upstream, ttl=10, stale_ttl=10)
+        with mock.patch("time.monotonic", return_value=100.0):
+            resolve(resolver)
+
+        upstream.result = socket.gaierror(socket.EAI_NONAME, "Name not known")
+        with (
+            mock.patch("threading.Thread") as thread,
+            mock.patch("time.monotonic", return_value=115.0),
+        ):
+            assert resolve(resolver) == ADDRINFO
+            # Run the refresh in this thread instead.
+            resolver._refresh(*thread.call_args.kwargs["args"])
+            assert resolve(resolver) == ADDRINFO
+        assert upstream.calls == 2
+
+    def test_negative_caching(self) -> None:
+        upstream = CountingResolver(
+            socket.gaierror(socket.EAI_NONAME, "Name not known")
+        )
+        resolver = CachingResolver(upstream, negative_ttl=5)
+        with mock.patch("time.monotonic", return_value=100.0):
+            with pytest.raises(socket.gaierror):
+                resolve(resolver)
+            with pytest.raises(socket.gaierror, match="Name not known"):
+                resolve(resolver)
+            assert upstream.calls == 1
+
+        upstream.result = ADDRINFO
+        with mock.patch("time.monotonic", return_value=105.0):
+            assert resolve(resolver) == ADDRINFO
+        assert upstream.calls == 2
+
+    def test_negative_caching_disabled(self) -> None:
+        upstream = CountingResolver(socket.gaierror(socket.EAI_NONAME, "nope"))
+        resolver = CachingResolver(upstream, negative_ttl=0)
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                resolve(resolver)
+        assert upstream.calls == 2
+
+    def test_maxsize(self) -> None:
+        upstream = CountingResolver(ADDRINFO)
+        resolver = CachingResolver(upstream, maxsize=2)
+        for host in ("a.example", "b.example", "c.example"):
+            resolve(resolver, host)
+        assert upstream.calls == 3
+
+        resolve(resolver, "c.example")
+        assert upstream.calls == 3
+        resolve(resolver, "a.example")
+        assert upstream.calls == 4
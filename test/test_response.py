@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import bz2
 import contextlib
 import gzip
 import http.client as httplib
+import random
+import shutil
 import socket
 import ssl
 import sys
+import threading
+import time
 import typing
 import zlib
 from base64 import b64decode
@@ -16,6 +21,7 @@ from unittest import mock
 
 import pytest
 
+import urllib3.response
 from urllib3.exceptions import (
     BodyNotHttplibCompatible,
     DecodeError,
@@ -29,8 +35,15 @@ from urllib3.exceptions import (
 from urllib3.response import (  # type: ignore[attr-defined]
     BaseHTTPResponse,
     BytesQueueBuffer,
+    ContentDecoder,
+    DeflateDecoder,
+    GzipDecoder,
     HTTPResponse,
+    _accept_encoding,
+    _get_decoder,
     brotli,
+    register_content_decoder,
+    unregister_content_decoder,
 )
 from urllib3.util.response import is_fp_closed
 from urllib3.util.retry import RequestHistory, Retry
@@ -64,6 +77,36 @@ except ModuleNotFoundError:
     _zstd_available = False
 
 
+class BZ2Decoder(ContentDecoder):
+    def __init__(self) -> None:
+        self._obj = bz2.BZ2Decompressor()
+
+    def decompress(self, data: bytes, max_length: int = -1) -> bytes:
+        if self._obj.eof:
+            return b""
+        return self._obj.decompress(data, max_length=max_length)
+
+    @property
+    def has_unconsumed_tail(self) -> bool:
+        return not self._obj.eof and not self._obj.needs_input
+
+    def flush(self) -> bytes:
+        return b""
+
+
+@pytest.fixture
+def content_decoders() -> typing.Generator[None]:
+    decoders = urllib3.response._content_decoders
+    content_decoders = list(BaseHTTPResponse.CONTENT_DECODERS)
+    error_classes = BaseHTTPResponse.DECODER_ERROR_CLASSES
+    try:
+        yield
+    finally:
+        urllib3.response._content_decoders = decoders
+        BaseHTTPResponse.CONTENT_DECODERS[:] = content_decoders
+        BaseHTTPResponse.DECODER_ERROR_CLASSES = error_classes
+
+
 class TestBytesQueueBuffer:
     def test_single_chunk(self) -> None:
         buffer = BytesQueueBuffer()
@@ -120,6 +163,54 @@ class TestBytesQueueBuffer:
         assert q.get_all() == b"abc"
         assert len(q) == 0
 
+    def test_get_into(self) -> None:
+        buffer = BytesQueueBuffer()
+        buffer.put(b"foo")
+        buffer.put(b"bar")
+        target = bytearray(4)
+        assert buffer.get_into(memoryview(target)) == 4
+        assert target == b"foob"
+        assert len(buffer) == 2
+
+        target = bytearray(4)
+        assert buffer.get_into(memoryview(target)) == 2
+        assert target == b"ar\x00\x00"
+        assert len(buffer) == 0
+        assert buffer.get_into(memoryview(target)) == 0
+
+    def test_clear_keeps_high_water_mark(self) -> None:
+        buffer = BytesQueueBuffer()
+        buffer.put(b"foobar")
+        buffer.clear()
+        assert len(buffer) == 0
+        assert buffer.high_water_mark == 6
+        buffer.put(b"baz")
+        assert buffer.get_all() == b"baz"
+
+    def test_high_water_mark(self) -> None:
+        buffer = BytesQueueBuffer()
+        assert buffer.high_water_mark == 0
+        buffer.put(b"foo")
+        buffer.put(b"bar")
+        assert buffer.get(5) == b"fooba"
+        buffer.unget(b"a")
+        buffer.put(b"baz")
+        assert buffer.high_water_mark == 6
+        buffer.put(b"qux")
+        assert buffer.get_all() == b"arbazqux"
+        assert buffer.high_water_mark == 8
+
+    @pytest.mark.parametrize("amt", [100, 1000, 10000])
+    def test_decoded_read_high_water_mark(self, amt: int) -> None:
+        data = b"".join(b"%d," % i for i in range(100000))
+        fp = BytesIO(zlib.compress(data))
+        r = HTTPResponse(
+            fp, headers={"content-encoding": "deflate"}, preload_content=False
+        )
+        assert b"".join(iter(lambda: r.read(amt), b"")) == data
+        # Only as much as was asked for is decompressed ahead.
+        assert 0 < r.decoded_buffer_high_water_mark <= amt
+
     @pytest.mark.parametrize(
         "get_func",
         (lambda b: b.get(len(b)), lambda b: b.get_all()),
@@ -203,6 +294,58 @@ def sock() -> typing.Generator[socket.socket]:
     s.close()
 
 
+class CountingDecompressor:
+    """Counts the input a zlib decompressor was fed."""
+
+    def __init__(self, obj: typing.Any) -> None:
+        self._obj = obj
+        self.fed = 0
+
+    def decompress(self, data: bytes, max_length: int = 0) -> bytes:
+        self.fed += len(data)
+        return self._obj.decompress(data, max_length)  # type: ignore[no-any-return]
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self._obj, name)
+
+
+class TestZlibDecoders:
+    @pytest.mark.parametrize("amt", [256, 4096, 65536])
+    @pytest.mark.parametrize(
+        "decoder_class, compress",
+        [
+            (GzipDecoder, lambda data: gzip.compress(data, compresslevel=1)),
+            (DeflateDecoder, lambda data: zlib.compress(data, 1)),
+        ],
+        ids=["gzip", "deflate"],
+    )
+    def test_input_not_copied_again(
+        self,
+        decoder_class: type[ContentDecoder],
+        compress: typing.Callable[[bytes], bytes],
+        amt: int,
+        record_property: typing.Callable[[str, object], None],
+    ) -> None:
+        body = bytes(random.Random(0).choices(b"abcd", k=2**20))
+        data = compress(body)
+        decoder = decoder_class()
+        obj = decoder._obj = CountingDecompressor(decoder._obj)  # type: ignore[attr-defined]
+
+        start = time.perf_counter()
+        chunks = [decoder.decompress(data, max_length=amt)]
+        while decoder.has_unconsumed_tail:
+            chunks.append(decoder.decompress(b"", max_length=amt))
+        chunks.append(decoder.flush())
+        elapsed = time.perf_counter() - start
+        record_property("throughput_mb_s", round(len(body) / elapsed / 1e6, 1))
+
+        assert b"".join(chunks) == body
+        assert all(len(chunk) <= amt for chunk in chunks)
+        # The input left over because of the limit isn't fed again as a
+        # whole on every call, so decoding stays linear in the body size.
+        assert obj.fed <= 2 * (len(data) + len(chunks) * amt)
+
+
 class TestResponse:
     def test_cache_content(self) -> None:
         r = HTTPResponse(b"foo")
@@ -989,6 +1132,158 @@ class TestResponse:
         assert len(r._decoded_buffer) == 0
         assert r.read() == b"barbaz"
 
+    @pytest.mark.usefixtures("content_decoders")
+    def test_register_content_decoder(self) -> None:
+        msg = b"foobarbaz" * 1000
+        register_content_decoder("bzip2", BZ2Decoder)
+        assert "bzip2" in BaseHTTPResponse.CONTENT_DECODERS
+        assert _accept_encoding().endswith(",bzip2")
+
+        r = HTTPResponse(
+            BytesIO(bz2.compress(msg)),
+            headers={"content-encoding": "BZIP2"},
+            preload_content=False,
+        )
+        assert r.read(9) == b"foobarbaz"
+        # Only as much as requested is decoded.
+        assert len(r._decoded_buffer) == 0
+        assert r.read() == msg[9:]
+
+        r = HTTPResponse(
+            BytesIO(zlib.compress(bz2.compress(msg))),
+            headers={"content-encoding": "bzip2, deflate"},
+        )
+        assert r.data == msg
+
+    @pytest.mark.usefixtures("content_decoders")
+    def test_register_content_decoder_error_classes(self) -> None:
+        register_content_decoder("bzip2", BZ2Decoder, error_classes=(OSError,))
+        with pytest.raises(DecodeError):
+            HTTPResponse(BytesIO(b"foo"), headers={"content-encoding": "bzip2"})
+
+    @pytest.mark.usefixtures("content_decoders")
+    def test_register_content_decoder_order(self) -> None:
+        register_content_decoder("bzip2", BZ2Decoder, prefer=True)
+        register_content_decoder("x-private", BZ2Decoder, accept=False)
+        assert _accept_encoding().startswith("bzip2,gzip,deflate")
+        assert "x-private" not in _accept_encoding()
+
+        # Replacing a decoder keeps its place unless it's preferred.
+        register_content_decoder("gzip", BZ2Decoder)
+        assert _accept_encoding().startswith("bzip2,gzip,deflate")
+        register_content_decoder("deflate", BZ2Decoder, prefer=True)
+        assert _accept_encoding().startswith("deflate,bzip2,gzip")
+
+        with pytest.raises(ValueError, match="Invalid content coding"):
+            register_content_decoder("gzip, deflate", BZ2Decoder)
+
+    @pytest.mark.usefixtures("content_decoders")
+    def test_replace_content_decoder(self) -> None:
+        register_content_decoder("gzip", BZ2Decoder)
+        for encoding in ("gzip", "x-gzip"):
+            r = HTTPResponse(
+                BytesIO(bz2.compress(b"foo")),
+                headers={"content-encoding": encoding},
+            )
+            assert r.data == b"foo"
+
+    @pytest.mark.usefixtures("content_decoders")
+    @pytest.mark.parametrize("content_coding", ["gzip", "x-gzip"])
+    def test_unregister_content_decoder(self, content_coding: str) -> None:
+        unregister_content_decoder(content_coding)
+        assert not _accept_encoding().startswith("gzip")
+        data = gzip.compress(b"foo")
+        r = HTTPResponse(BytesIO(data), headers={"content-encoding": "x-gzip"})
+        assert r.data == data
+
+        with pytest.raises(KeyError):
+            unregister_content_decoder("gzip")
+
+    @pytest.mark.usefixtures("content_decoders")
+    def test_register_content_decoder_concurrently(self) -> None:
+        done = threading.Event()
+
+        def register() -> None:
+            while not done.is_set():
+                register_content_decoder("bzip2", BZ2Decoder, prefer=True)
+                register_content_decoder("deflate", DeflateDecoder, prefer=True)
+
+        thread = threading.Thread(target=register)
+        thread.start()
+        try:
+            # The registered decoders are always found while being reordered.
+            for _ in range(10000):
+                assert isinstance(_get_decoder("gzip"), GzipDecoder)
+        finally:
+            done.set()
+            thread.join()
+
+    @pytest.mark.parametrize("content_encoding", ["gzip", None])
+    def test_read_ahead(self, content_encoding: str | None) -> None:
+        msg = bytes(range(256)) * 4096
+        data = gzip.compress(msg) if content_encoding else msg
+        headers = {"content-encoding": content_encoding} if content_encoding else {}
+        r = HTTPResponse(BytesIO(data), headers=headers, preload_content=False)
+        r._start_read_ahead(2**14)
+        read_ahead = r._read_ahead
+        assert read_ahead is not None
+
+        assert r.read(10) == msg[:10]
+        assert r.read1(10) == msg[10:20]
+        buffer = bytearray(2**15)
+        assert r.readinto(buffer) == len(buffer)
+        assert buffer == msg[20 : 20 + len(buffer)]
+        # No more than the limit is decoded ahead of the reads.
+        assert read_ahead._buffered <= 2**14
+        assert b"".join(r.stream(1000)) == msg[20 + len(buffer) :]
+        assert r._read_ahead is None
+        assert not read_ahead._thread.is_alive()
+        assert r.read() == b""
+
+    def test_read_ahead_cache_content(self) -> None:
+        r = HTTPResponse(
+            BytesIO(gzip.compress(b"foo")),
+            headers={"content-encoding": "gzip"},
+            preload_content=False,
+        )
+        r._start_read_ahead(2**16)
+        assert r.data == b"foo"
+        assert r.data == b"foo"
+
+    def test_read_ahead_decode_error(self) -> None:
+        r = HTTPResponse(
+            BytesIO(b"foo" * 100),
+            headers={"content-encoding": "gzip"},
+            preload_content=False,
+        )
+        r._start_read_ahead(2**16)
+        with pytest.raises(DecodeError):
+            r.read(10)
+        assert r._read_ahead is None
+
+    def test_read_ahead_decode_content_mismatch(self) -> None:
+        r = HTTPResponse(
+            BytesIO(gzip.compress(b"foo")),
+            headers={"content-encoding": "gzip"},
+            preload_content=False,
+        )
+        r._start_read_ahead(2**16)
+        with pytest.raises(RuntimeError, match="read ahead with decode_content"):
+            r.read(decode_content=False)
+        with pytest.raises(ValueError, match="positive number"):
+            HTTPResponse(BytesIO(b"foo"), preload_content=False)._start_read_ahead(0)
+
+    def test_read_ahead_drain_conn(self) -> None:
+        data = gzip.compress(b"foo" * 2**16)
+        r = HTTPResponse(
+            BytesIO(data), headers={"content-encoding": "gzip"}, preload_content=False
+        )
+        r._start_read_ahead(16)
+        assert r.read(3) == b"foo"
+        r.drain_conn()
+        assert r._read_ahead is None
+        assert r.tell() == len(data)
+
     def test_body_blob(self) -> None:
         resp = HTTPResponse(b"foo")
         assert resp.data == b"foo"
@@ -1215,6 +1510,67 @@ class TestResponse:
         n3 = resp.readinto(buf3)
         assert n3 == 0
 
+    def test_readinto_reads_into_buffer(self) -> None:
+        fp = BytesIO(b"hello world")
+        resp = HTTPResponse(fp, headers={"content-length": "11"}, preload_content=False)
+        buf = bytearray(8)
+        with mock.patch.object(fp, "read", side_effect=AssertionError):
+            assert resp.readinto(buf) == 8
+            assert buf == b"hello wo"
+            assert resp.readinto(buf) == 3
+            assert buf[:3] == b"rld"
+        assert resp.tell() == 11
+        assert resp.length_remaining == 0
+
+    def test_readinto_incomplete(self) -> None:
+        fp = BytesIO(b"hello")
+        resp = HTTPResponse(fp, headers={"content-length": "11"}, preload_content=False)
+        with pytest.raises(ProtocolError):
+            resp.readinto(bytearray(11))
+
+    @pytest.mark.parametrize("size", [1, 7, 1000, 100000])
+    def test_readinto_gzip(self, size: int) -> None:
+        data = b"".join(b"%d," % i for i in range(10000))
+        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        fp = BytesIO(compress.compress(data) + compress.flush())
+        resp = HTTPResponse(
+            fp, headers={"content-encoding": "gzip"}, preload_content=False
+        )
+
+        buf = bytearray(size)
+        parts = []
+        while n := resp.readinto(buf):
+            parts.append(bytes(buf[:n]))
+        assert b"".join(parts) == data
+        assert all(len(part) == size for part in parts[:-1])
+
+    def test_readinto_gzip_mixed_with_read(self) -> None:
+        data = b"foo" * 1000
+        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        fp = BytesIO(compress.compress(data) + compress.flush())
+        resp = HTTPResponse(
+            fp, headers={"content-encoding": "gzip"}, preload_content=False
+        )
+        buf = bytearray(100)
+        assert resp.read(5) == b"foofo"
+        assert resp.readinto(buf) == 100
+        assert buf == data[5:105]
+        assert resp.read() == data[105:]
+
+    def test_shutil_copyfileobj_gzip(self) -> None:
+        data = b"foo" * 100000
+        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        fp = BytesIO(compress.compress(data) + compress.flush())
+        resp = HTTPResponse(
+            fp,
+            headers={"content-encoding": "gzip"},
+            preload_content=False,
+            auto_close=False,
+        )
+        out = BytesIO()
+        shutil.copyfileobj(BufferedReader(resp), out)
+        assert out.getvalue() == data
+
     def test_io_not_autoclose_bufferedreader(self) -> None:
         fp = BytesIO(b"hello\nworld")
         resp = HTTPResponse(fp, preload_content=False, auto_close=False)
@@ -1783,8 +2139,9 @@ class TestResponse:
         resp = HTTPResponse(
             r, preload_content=False, headers={"transfer-encoding": "chunked"}
         )
+        # What was received of the chunk is returned before the body ends.
         with pytest.raises(ProtocolError) as ctx:
-            next(resp.read_chunked())
+            list(resp.read_chunked())
 
         orig_ex = ctx.value.args[1]
         assert isinstance(orig_ex, httplib_IncompleteRead)
@@ -1850,6 +2207,72 @@ class TestResponse:
         )
         assert stream == list(resp.stream())
 
+    @staticmethod
+    def _chunked_response(
+        body: bytes, fp_class: type[typing.IO[bytes]] = BufferedReader
+    ) -> HTTPResponse:
+        r = httplib.HTTPResponse(MockSock)  # type: ignore[arg-type]
+        r.fp = fp_class(BytesIO(body))  # type: ignore[assignment, call-arg]
+        r.chunked = True
+        return HTTPResponse(
+            r, preload_content=False, headers={"transfer-encoding": "chunked"}
+        )
+
+    def test_read_chunked_coalesces_received_chunks(self) -> None:
+        body = b"".join(b"1\r\n%d\r\n" % (i % 10) for i in range(1000)) + b"0\r\n\r\n"
+        expected = b"".join(b"%d" % (i % 10) for i in range(1000))
+
+        resp = self._chunked_response(body)
+        chunks = list(resp.read_chunked(100))
+        assert b"".join(chunks) == expected
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        # Many chunks are returned at once rather than one per call.
+        assert len(chunks) < 100
+        assert resp.trailers == {}
+
+        resp = self._chunked_response(body)
+        assert resp.read(300) == expected[:300]
+        assert resp.read() == expected[300:]
+        assert resp.trailers == {}
+
+    def test_read_chunked_byte_by_byte(self) -> None:
+        class OneByteReader(BufferedReader):
+            def read1(self, size: int = -1) -> bytes:
+                return super().read1(1)
+
+        body = (
+            b"3;ext=1\r\nfoo\r\n5\r\nbarba\r\n1\r\nz\r\n0\r\n"
+            b"Expires: never\r\nX-Checksum: 42\r\n\r\n"
+        )
+        resp = self._chunked_response(body, OneByteReader)
+        assert list(resp.read_chunked()) == [bytes([c]) for c in b"foobarbaz"]
+        assert resp.trailers == {"Expires": "never", "X-Checksum": "42"}
+        assert resp.isclosed()
+
+    @pytest.mark.parametrize("read_method", ["read", "read1", "readinto", "stream"])
+    def test_chunked_trailers(self, read_method: str) -> None:
+        body = b"3\r\nfoo\r\n3\r\nbar\r\n0\r\nX-Checksum: 42\r\n\r\n"
+        resp = self._chunked_response(body)
+        assert resp.trailers is None
+        if read_method == "readinto":
+            b = bytearray(10)
+            assert resp.readinto(b) == 6
+            data = bytes(b[:6])
+        elif read_method == "stream":
+            data = b"".join(resp.stream())
+        else:
+            data = b""
+            while chunk := getattr(resp, read_method)(4):
+                data += chunk
+        assert data == b"foobar"
+        assert resp.trailers == {"X-Checksum": "42"}
+
+    def test_negative_chunk_length(self) -> None:
+        resp = self._chunked_response(b"-1\r\nfoo\r\n0\r\n\r\n")
+        with pytest.raises(ProtocolError) as ctx:
+            next(resp.read_chunked())
+        assert isinstance(ctx.value.args[1], InvalidChunkLength)
+
     def test_chunked_head_response(self) -> None:
         r = httplib.HTTPResponse(MockSock, method="HEAD")  # type: ignore[arg-type]
         r.chunked = True
@@ -3,6 +3,7 @@ from __future__ import annotations
 import ssl
 import sys
 import typing
+from pathlib import Path
 from unittest import mock
 
 import pytest
@@ -124,6 +125,96 @@ class TestSSL:
 
         context.load_default_certs.assert_called_with()
 
+    def test_cached_context_is_shared(self) -> None:
+        first = ssl_.get_cached_urllib3_context()
+        assert ssl_.get_cached_urllib3_context() is first
+        assert ssl_.get_cached_urllib3_context(check_hostname=False) is not first
+        assert (
+            ssl_.get_cached_urllib3_context(
+                cert_reqs=ssl.CERT_NONE, check_hostname=False
+            )
+            is not first
+        )
+
+    def test_cached_context_is_configured(self, tmp_path: Path) -> None:
+        context = ssl_.get_cached_urllib3_context(check_hostname=False)
+        assert context.verify_mode == ssl.CERT_REQUIRED
+        assert not context.check_hostname
+
+        context = ssl_.get_cached_urllib3_context(
+            cert_reqs=ssl.CERT_NONE, check_hostname=False
+        )
+        assert context.verify_mode == ssl.CERT_NONE
+
+        with pytest.raises(SSLError):
+            ssl_.get_cached_urllib3_context(ca_certs=str(tmp_path / "missing.pem"))
+
+    def test_cached_context_loads_certs_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        context = mock.create_autospec(ssl_.SSLContext)
+        context.load_default_certs = mock.Mock()
+        context.options = 0
+
+        monkeypatch.setattr(ssl_, "SSLContext", lambda *_, **__: context)
+
+        for _ in range(3):
+            assert ssl_.get_cached_urllib3_context() is context
+            ssl_.ssl_wrap_socket(mock.Mock(), ssl_context=context)
+
+        context.load_default_certs.assert_called_once_with()
+        context.set_alpn_protocols.assert_called_once_with(ssl_.ALPN_PROTOCOLS)
+
+    def test_cached_context_invalidated_on_file_change(self, tmp_path: Path) -> None:
+        ca_certs = tmp_path / "ca.pem"
+        ca_certs.write_bytes(b"")
+        with mock.patch.object(ssl_, "_build_context") as build_context:
+            first = ssl_.get_cached_urllib3_context(ca_certs=str(ca_certs))
+            assert ssl_.get_cached_urllib3_context(ca_certs=str(ca_certs)) is first
+            assert build_context.call_count == 1
+
+            ca_certs.write_bytes(b"changed")
+            ssl_.get_cached_urllib3_context(ca_certs=str(ca_certs))
+            assert build_context.call_count == 2
+
+            ssl_.clear_ssl_context_cache()
+            ssl_.get_cached_urllib3_context(ca_certs=str(ca_certs))
+            assert build_context.call_count == 3
+
+    def test_tls_session_cache_expires_sessions(self) -> None:
+        cache = ssl_.TLSSessionCache(ttl=10)
+        session = mock.Mock(timeout=7200)
+        with mock.patch("time.monotonic", return_value=100.0):
+            cache.put("origin", session)
+            assert cache.get("origin") is session
+        with mock.patch("time.monotonic", return_value=110.0):
+            assert cache.get("origin") is None
+        assert len(cache) == 0
+
+    def test_tls_session_cache_honors_session_lifetime(self) -> None:
+        cache = ssl_.TLSSessionCache(ttl=None)
+        with mock.patch("time.monotonic", return_value=100.0):
+            cache.put("origin", mock.Mock(timeout=5))
+        with mock.patch("time.monotonic", return_value=105.0):
+            assert cache.get("origin") is None
+
+        cache.put("origin", mock.Mock(timeout=0))
+        assert len(cache) == 0
+
+    def test_tls_session_cache_is_bounded(self) -> None:
+        cache = ssl_.TLSSessionCache(maxsize=2)
+        sessions = [mock.Mock(timeout=300) for _ in range(3)]
+        for i, session in enumerate(sessions):
+            cache.put(i, session)
+        assert len(cache) == 2
+        assert cache.get(0) is None
+        assert cache.get(2) is sessions[2]
+
+        cache.record(True)
+        cache.record(False)
+        cache.record(False)
+        assert (cache.hits, cache.misses) == (1, 2)
+
     def test_wrap_socket_no_ssltransport(self) -> None:
         with mock.patch("urllib3.util.ssl_.SSLTransport", None):
             with pytest.raises(ProxySchemeUnsupported):
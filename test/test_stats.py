@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import pytest
+
+from urllib3.util.stats import Histogram, PoolStats
+
+
+class TestHistogram:
+    def test_observe(self) -> None:
+        h = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            h.observe(value)
+        assert h.counts == [2, 1, 1]
+        assert h.count == 4
+        assert h.sum == pytest.approx(2.65)
+        assert h.cumulative_counts() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+
+    def test_merge(self) -> None:
+        a = Histogram(buckets=(1.0,))
+        b = Histogram(buckets=(1.0,))
+        a.observe(0.5)
+        b.observe(1.5)
+        a.merge(b)
+        assert a.counts == [1, 1]
+        assert a.count == 2
+        assert a.sum == 2.0
+
+    def test_merge_different_buckets(self) -> None:
+        with pytest.raises(ValueError, match="different buckets"):
+            Histogram(buckets=(1.0,)).merge(Histogram(buckets=(2.0,)))
+
+
+class TestPoolStats:
+    def test_reuse_ratio(self) -> None:
+        stats = PoolStats()
+        assert stats.reuse_ratio == 0.0
+        stats.connections_opened = 1
+        stats.connections_reused = 3
+        assert stats.reuse_ratio == 0.75
+
+    def test_idle(self) -> None:
+        assert PoolStats().idle == 0
+        assert PoolStats(idle=lambda: 2).idle == 2
+
+    def test_combine(self) -> None:
+        a = PoolStats(idle=lambda: 1)
+        a.requests = 2
+        a.in_use = 1
+        a.checkout_wait_seconds.observe(0.01)
+        b = PoolStats(idle=lambda: 3)
+        b.requests = 5
+        b.bytes_received = 10
+        b.checkout_wait_seconds.observe(0.02)
+
+        combined = PoolStats.combine([a, b])
+        assert combined.requests == 7
+        assert combined.bytes_received == 10
+        assert combined.in_use == 1
+        assert combined.idle == 4
+        assert combined.checkout_wait_seconds.count == 2
+
+    def test_merge(self) -> None:
+        a = PoolStats()
+        a.requests = 2
+        b = PoolStats(idle=lambda: 3)
+        b.requests = 5
+        b.in_use = 1
+        b.tls_handshake_seconds.observe(0.02)
+
+        a.merge(b)
+        assert a.requests == 7
+        assert a.tls_handshake_seconds.count == 1
+        # Gauges aren't added.
+        assert a.in_use == 0
+        assert a.idle == 0
+
+    def test_snapshot(self) -> None:
+        stats = PoolStats(idle=lambda: 1)
+        stats.requests = 3
+        stats.tls_handshake_seconds.observe(0.02)
+        snapshot = stats.snapshot()
+        assert snapshot["requests"] == 3
+        assert snapshot["idle"] == 1
+        assert snapshot["reuse_ratio"] == 0.0
+        assert snapshot["tls_handshake_seconds"]["count"] == 1
+        assert snapshot["tls_handshake_seconds"]["buckets"][0.025] == 1
+        assert snapshot["checkout_wait_seconds"]["count"] == 0
+
+    def test_to_prometheus(self) -> None:
+        stats = PoolStats()
+        stats.requests = 3
+        stats.checkout_wait_seconds.observe(0.5)
+        text = stats.to_prometheus(labels={"host": 'ex"ample'})
+        lines = text.splitlines()
+        assert "# TYPE urllib3_pool_requests_total counter" in lines
+        assert 'urllib3_pool_requests_total{host="ex\\"ample"} 3' in lines
+        assert "# TYPE urllib3_pool_in_use gauge" in lines
+        assert (
+            'urllib3_pool_checkout_wait_seconds_bucket{host="ex\\"ample",le="0.25"} 0'
+            in lines
+        )
+        assert (
+            'urllib3_pool_checkout_wait_seconds_bucket{host="ex\\"ample",le="+Inf"} 1'
+            in lines
+        )
+        assert 'urllib3_pool_checkout_wait_seconds_count{host="ex\\"ample"} 1' in lines
+        assert text.endswith("\n")
+
+    def test_to_prometheus_prefix(self) -> None:
+        text = PoolStats().to_prometheus(prefix="app")
+        assert "app_idle 0" in text.splitlines()
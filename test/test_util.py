@@ -1,13 +1,27 @@
 from __future__ import annotations
 
+import contextlib
+import gzip
 import io
 import logging
+import os
 import socket
 import ssl
 import sys
+import time
 import typing
 import warnings
-from test import ImportBlocker, ModuleStash, notBrotli, notZstd, onlyBrotli, onlyZstd
+from pathlib import Path
+from test import (
+    LONG_TIMEOUT,
+    SHORT_TIMEOUT,
+    ImportBlocker,
+    ModuleStash,
+    notBrotli,
+    notZstd,
+    onlyBrotli,
+    onlyZstd,
+)
 from unittest import mock
 from unittest.mock import MagicMock, Mock, patch
 from urllib.parse import urlparse
@@ -22,10 +36,25 @@ from urllib3.exceptions import (
     TimeoutStateError,
     UnrewindableBodyError,
 )
+from urllib3.response import (
+    ContentDecoder,
+    register_content_decoder,
+    unregister_content_decoder,
+)
 from urllib3.util import is_fp_closed
-from urllib3.util.connection import _has_ipv6, allowed_gai_family, create_connection
+from urllib3.util.connection import (
+    _has_ipv6,
+    _interleave_addrinfos,
+    allowed_gai_family,
+    create_connection,
+)
 from urllib3.util.proxy import connection_requires_http_tunnel
-from urllib3.util.request import _FAILEDTELL, make_headers, rewind_body
+from urllib3.util.request import (
+    _FAILEDTELL,
+    file_body_length,
+    make_headers,
+    rewind_body,
+)
 from urllib3.util.response import assert_header_parsing
 from urllib3.util.ssl_ import (
     _is_has_never_check_common_name_reliable,
@@ -45,6 +74,31 @@ from . import clear_warnings
 TIMEOUT_EPOCH = 1000
 
 
+@contextlib.contextmanager
+def _blackhole_listener() -> typing.Iterator[tuple[str, int]]:
+    """Listens on a local port whose accept queue is full, so that the kernel
+    drops any further SYNs and connection attempts hang until they time out."""
+    listener = socket.create_server(("127.0.0.1", 0), backlog=0)
+    filler = []
+    try:
+        address = listener.getsockname()
+        for _ in range(16):
+            sock = socket.socket()
+            sock.settimeout(0.2)
+            filler.append(sock)
+            try:
+                sock.connect(address)
+            except TimeoutError:
+                break
+        else:
+            pytest.skip("Unable to fill the accept queue of a local listener")
+        yield address
+    finally:
+        for sock in filler:
+            sock.close()
+        listener.close()
+
+
 class TestUtil:
     url_host_map = [
         # Hosts
@@ -701,6 +755,15 @@ class TestUtil:
         else:
             assert parse_url(url) == expected_url
 
+    def test_make_headers_registered_content_decoder(self) -> None:
+        register_content_decoder("bzip2", ContentDecoder, prefer=True)
+        try:
+            headers = make_headers(accept_encoding=True)
+            assert headers["accept-encoding"].startswith("bzip2,gzip,deflate")
+        finally:
+            unregister_content_decoder("bzip2")
+        assert "bzip2" not in make_headers(accept_encoding=True)["accept-encoding"]
+
     def test_parse_url_bytes_type_error(self) -> None:
         with pytest.raises(TypeError):
             parse_url(b"https://www.google.com/")  # type: ignore[arg-type]
@@ -859,6 +922,27 @@ class TestUtil:
         with pytest.raises(UnrewindableBodyError):
             rewind_body(BadSeek(), body_pos=2)
 
+    def test_file_body_length(self, tmp_path: Path) -> None:
+        path = tmp_path / "body"
+        path.write_bytes(b"test data")
+        with open(path, "rb") as body:
+            assert file_body_length(body) == 9
+            body.read(5)
+            assert file_body_length(body) == 4
+            assert body.read() == b"data"
+        with open(path) as text_body:
+            assert file_body_length(text_body) is None
+        with open(path, "rb", buffering=0) as raw_body:
+            assert file_body_length(raw_body) == 9
+        with gzip.open(path, "rb") as gzip_body:
+            assert file_body_length(gzip_body) is None
+
+        assert file_body_length(b"test data") is None
+        assert file_body_length(io.BytesIO(b"test data")) is None
+        read_fd, write_fd = os.pipe()
+        with open(read_fd, "rb") as pipe, open(write_fd, "wb"):
+            assert file_body_length(pipe) is None
+
     def test_add_stderr_logger(self) -> None:
         handler = add_stderr_logger(level=logging.INFO)  # Don't actually print debug
         logger = logging.getLogger("urllib3")
@@ -1160,6 +1244,73 @@ class TestUtil:
         assert getaddrinfo.call_args[0][0] == "a::b%iface"
         fake_sock.connect.assert_called_once_with(fake_scoped_sa6)
 
+    def test_interleave_addrinfos(self) -> None:
+        v6 = [
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", (f"::{i}", 80)) for i in (1, 2)
+        ]
+        v4 = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", (f"10.0.0.{i}", 80))
+            for i in (1, 2, 3)
+        ]
+        interleaved = _interleave_addrinfos(v6 + v4)
+        assert interleaved == [v6[0], v4[0], v6[1], v4[1], v4[2]]
+
+    @patch("socket.getaddrinfo")
+    def test_create_connection_happy_eyeballs_skips_blackhole(
+        self, getaddrinfo: MagicMock
+    ) -> None:
+        with (
+            _blackhole_listener() as blackhole,
+            socket.create_server(("127.0.0.1", 0)) as listener,
+        ):
+            getaddrinfo.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", blackhole),
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", listener.getsockname()),
+            ]
+            start = time.monotonic()
+            sock = create_connection(
+                ("example.com", 80), timeout=LONG_TIMEOUT, happy_eyeballs=0.05
+            )
+            try:
+                assert time.monotonic() - start < LONG_TIMEOUT
+                assert sock.getpeername() == listener.getsockname()
+                assert sock.gettimeout() == LONG_TIMEOUT
+            finally:
+                sock.close()
+
+    @patch("socket.getaddrinfo")
+    def test_create_connection_happy_eyeballs_refused(
+        self, getaddrinfo: MagicMock
+    ) -> None:
+        with socket.create_server(("127.0.0.1", 0)) as listener:
+            closed_port = socket.create_server(("127.0.0.1", 0))
+            closed_addr = closed_port.getsockname()
+            closed_port.close()
+            getaddrinfo.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", closed_addr),
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", listener.getsockname()),
+            ]
+            # A refused attempt starts the next one without waiting for the delay.
+            sock = create_connection(("example.com", 80), happy_eyeballs=LONG_TIMEOUT)
+            try:
+                assert sock.getpeername() == listener.getsockname()
+            finally:
+                sock.close()
+
+    @patch("socket.getaddrinfo")
+    def test_create_connection_happy_eyeballs_timeout(
+        self, getaddrinfo: MagicMock
+    ) -> None:
+        with _blackhole_listener() as blackhole:
+            getaddrinfo.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", blackhole),
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", blackhole),
+            ]
+            with pytest.raises(TimeoutError):
+                create_connection(
+                    ("example.com", 80), timeout=SHORT_TIMEOUT, happy_eyeballs=True
+                )
+
     @pytest.mark.parametrize(
         "input,params,expected",
         (
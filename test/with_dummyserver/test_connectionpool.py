@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 import io
 import logging
 import platform
@@ -7,6 +8,8 @@ import socket
 import time
 import typing
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from test import LONG_TIMEOUT, SHORT_TIMEOUT
 from threading import Event
 from unittest import mock
@@ -20,6 +23,7 @@ from urllib3 import HTTPConnectionPool, encode_multipart_formdata
 from urllib3._collections import HTTPHeaderDict
 from urllib3.connection import _get_default_user_agent
 from urllib3.exceptions import (
+    ClosedPoolError,
     ConnectTimeoutError,
     DecodeError,
     EmptyPoolError,
@@ -233,6 +237,81 @@ class TestConnectionPool(HypercornDummyServerTestCase):
             f'http://{self.host}:{self.port} "GET / HTTP/1.1" 200 0',
         ]
 
+    def test_prewarm(self) -> None:
+        with HTTPConnectionPool(self.host, self.port, maxsize=3) as pool:
+            assert pool.prewarm() == 3
+            assert pool.num_connections == 3
+            # Connections which are already open are kept.
+            assert pool.prewarm(2) == 0
+            assert pool.num_connections == 3
+
+            r = pool.request("GET", "/")
+            assert r.status == 200
+            assert pool.num_connections == 3
+
+    def test_prewarm_connection_error(self, caplog: pytest.LogCaptureFixture) -> None:
+        with HTTPConnectionPool(self.host, find_unused_port(), maxsize=2) as pool:
+            assert pool.prewarm() == 0
+            assert pool.pool is not None
+            assert pool.pool.qsize() == 2
+        assert "Failed to prewarm connection" in caplog.text
+
+    def test_stats(self) -> None:
+        with HTTPConnectionPool(self.host, self.port, maxsize=1) as pool:
+            for _ in range(3):
+                r = pool.request("GET", "/")
+                assert r.status == 200
+
+            r = pool.request("GET", "/", preload_content=False)
+            assert pool.stats.in_use == 1
+            assert pool.stats.idle == 0
+            r.read()
+            r.release_conn()
+
+            stats = pool.stats.snapshot()
+            assert stats["requests"] == 4
+            assert stats["connections_opened"] == 1
+            assert stats["connections_reused"] == 3
+            assert stats["reuse_ratio"] == 0.75
+            assert stats["in_use"] == 0
+            assert stats["idle"] == 1
+            assert stats["bytes_sent"] > 0
+            assert stats["bytes_received"] == 4 * len(b"Dummy server!")
+            assert stats["checkout_wait_seconds"]["count"] == 4
+
+    def test_stats_discarded(self) -> None:
+        with HTTPConnectionPool(self.host, self.port, maxsize=1) as pool:
+            conn1 = pool._get_conn()
+            conn2 = pool._get_conn()
+            assert pool.stats.in_use == 2
+            pool._put_conn(conn1)
+            pool._put_conn(conn2)
+            assert pool.stats.in_use == 0
+            assert pool.stats.connections_discarded == 1
+
+    def test_stats_in_use_after_errors(self) -> None:
+        with HTTPConnectionPool(self.host, find_unused_port(), retries=False) as pool:
+            with pytest.raises(NewConnectionError):
+                pool.request("GET", "/")
+            assert pool.stats.in_use == 0
+
+        pool = HTTPConnectionPool(self.host, self.port)
+        pool.close()
+        with pytest.raises(ClosedPoolError):
+            pool.request("GET", "/")
+        assert pool.stats.in_use == 0
+
+    def test_stats_in_use_concurrent(self) -> None:
+        with HTTPConnectionPool(self.host, self.port, maxsize=4) as pool:
+
+            def request(_: int) -> int:
+                return pool.request("GET", "/").status
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                assert set(executor.map(request, range(400))) == {200}
+            assert pool.stats.requests == 400
+            assert pool.stats.in_use == 0
+
     def test_post_url(self) -> None:
         with HTTPConnectionPool(self.host, self.port) as pool:
             r = pool.request("POST", "/specific_method", fields={"method": "POST"})
@@ -867,8 +946,8 @@ class TestConnectionPool(HypercornDummyServerTestCase):
                     preload_content=False,
                     retries=False,
                 )
-                for chunk in response.stream():
-                    assert chunk == b"123"
+                # Chunks which arrive together are returned together.
+                assert b"".join(response.stream()) == b"123" * 4
 
             assert pool.num_connections == 1
             assert pool.num_requests == x
@@ -1454,6 +1533,62 @@ class TestFileBodiesOnRetryOrRedirect(HypercornDummyServerTestCase):
                 pool.urlopen("PUT", url, headers=headers, body=body)
 
 
+class TestFileBodiesSendfile(HypercornDummyServerTestCase):
+    def test_upload_file(self, tmp_path: Path) -> None:
+        data = bytes(range(256)) * 4096
+        path = tmp_path / "body"
+        path.write_bytes(data)
+        with (
+            HTTPConnectionPool(self.host, self.port, timeout=LONG_TIMEOUT) as pool,
+            open(path, "rb") as body,
+            mock.patch.object(
+                socket.socket,
+                "sendfile",
+                autospec=True,
+                side_effect=socket.socket.sendfile,
+            ) as sendfile,
+        ):
+            body.read(256)
+            r = pool.request("POST", "/echo", body=body)
+            assert r.status == 200
+            assert r.data == data[256:]
+            assert body.tell() == len(data)
+            assert sendfile.call_count == 1
+            assert pool.stats.bytes_sent > len(data) - 256
+
+            # The connection is reused for the next request.
+            body.seek(0)
+            r = pool.request("PUT", "/echo", body=body)
+            assert r.data == data
+            assert sendfile.call_count == 2
+            assert pool.num_connections == 1
+
+    def test_upload_file_chunked(self, tmp_path: Path) -> None:
+        path = tmp_path / "body"
+        path.write_bytes(b"test data")
+        with (
+            HTTPConnectionPool(self.host, self.port, timeout=LONG_TIMEOUT) as pool,
+            open(path, "rb") as body,
+            mock.patch.object(socket.socket, "sendfile") as sendfile,
+        ):
+            r = pool.request("POST", "/echo", body=body, chunked=True)
+            assert r.data == b"test data"
+            sendfile.assert_not_called()
+
+    def test_upload_gzip_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "body.gz"
+        path.write_bytes(gzip.compress(b"test data"))
+        with (
+            HTTPConnectionPool(self.host, self.port, timeout=LONG_TIMEOUT) as pool,
+            gzip.open(path, "rb") as body,
+            mock.patch.object(socket.socket, "sendfile") as sendfile,
+        ):
+            # The decompressed contents are sent, not the file on disk.
+            r = pool.request("POST", "/echo", body=body)
+            assert r.data == b"test data"
+            sendfile.assert_not_called()
+
+
 class TestRetryPoolSize(HypercornDummyServerTestCase):
     def test_pool_size_retry(self) -> None:
         retries = Retry(total=1, raise_on_status=False, status_forcelist=[404])
@@ -1474,3 +1609,36 @@ class TestRedirectPoolSize(HypercornDummyServerTestCase):
         ) as pool:
             pool.urlopen("GET", "/redirect", preload_content=False)
             assert pool.num_connections == 1
+
+
+class TestHTTP2PriorKnowledge(HypercornDummyServerTestCase):
+    def test_request(self) -> None:
+        with HTTPConnectionPool(
+            self.host, self.port, http2_prior_knowledge=True
+        ) as pool:
+            r = pool.request("GET", "/")
+            assert r.status == 200
+            assert r.version_string == "HTTP/2"
+            assert r.data == b"Dummy server!"
+
+            r = pool.request("GET", "/echo_uri", fields={"a": "b"})
+            assert r.data == b"/echo_uri?a=b"
+
+            r = pool.request("POST", "/echo", body=b"x" * 2**20)
+            assert r.data == b"x" * 2**20
+
+            r = pool.request("GET", "/redirect", fields={"target": "/"})
+            assert r.status == 200
+            assert r.data == b"Dummy server!"
+
+    def test_concurrent_requests(self) -> None:
+        with HTTPConnectionPool(
+            self.host, self.port, maxsize=10, http2_prior_knowledge=True
+        ) as pool:
+            with ThreadPoolExecutor(10) as executor:
+                responses = list(
+                    executor.map(lambda _: pool.request("GET", "/"), range(50))
+                )
+            assert {r.data for r in responses} == {b"Dummy server!"}
+            # All of the requests were multiplexed over a single socket.
+            assert len(pool._conn_sessions) == 1
@@ -3,8 +3,10 @@ from __future__ import annotations
 import concurrent.futures
 import contextlib
 import datetime
+import io
 import os.path
 import shutil
+import socket
 import ssl
 import sys
 import tempfile
@@ -36,7 +38,7 @@ from dummyserver.socketserver import (
     encrypt_key_pem,
 )
 from dummyserver.testcase import HTTPSHypercornDummyServerTestCase
-from urllib3 import HTTPSConnectionPool
+from urllib3 import HTTPSConnectionPool, PoolManager
 from urllib3.connection import RECENT_DATE, HTTPSConnection, VerifiedHTTPSConnection
 from urllib3.exceptions import (
     ConnectTimeoutError,
@@ -46,6 +48,7 @@ from urllib3.exceptions import (
     SSLError,
     SystemTimeWarning,
 )
+from urllib3.util.resolver import _TYPE_ADDRINFO, BaseResolver
 from urllib3.util.ssl_match_hostname import CertificateError
 from urllib3.util.timeout import Timeout
 
@@ -151,6 +154,56 @@ class BaseTestHTTPS(HTTPSHypercornDummyServerTestCase):
             assert r.headers["server"] == f"hypercorn-{http_version}"
             assert r.data == b"Dummy server!"
 
+    def test_upload_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "body"
+        path.write_bytes(b"test data" * 1000)
+        with (
+            HTTPSConnectionPool(
+                self.host,
+                self.port,
+                ca_certs=DEFAULT_CA,
+                ssl_minimum_version=self.tls_version(),
+            ) as https_pool,
+            open(path, "rb") as body,
+            mock.patch.object(socket.socket, "sendfile") as sendfile,
+        ):
+            r = https_pool.request("POST", "/echo", body=body)
+            assert r.data == b"test data" * 1000
+            # TLS sockets can't send files with sendfile().
+            sendfile.assert_not_called()
+
+    def test_prewarm(self) -> None:
+        with HTTPSConnectionPool(
+            self.host,
+            self.port,
+            ca_certs=DEFAULT_CA,
+            ssl_minimum_version=self.tls_version(),
+            maxsize=2,
+        ) as https_pool:
+            assert https_pool.prewarm() == 2
+            conn = https_pool._get_conn()
+            # The TLS handshake was done ahead of the request.
+            assert not conn.is_closed
+            assert conn.is_verified
+            https_pool._put_conn(conn)
+
+            r = https_pool.request("GET", "/")
+            assert r.status == 200
+            assert https_pool.num_connections == 2
+
+    def test_stats_tls_handshake(self) -> None:
+        with HTTPSConnectionPool(
+            self.host,
+            self.port,
+            ca_certs=DEFAULT_CA,
+            ssl_minimum_version=self.tls_version(),
+        ) as https_pool:
+            https_pool.request("GET", "/")
+            https_pool.request("GET", "/")
+            handshakes = https_pool.stats.tls_handshake_seconds
+            assert handshakes.count == 1
+            assert handshakes.sum > 0
+
     def test_default_port(self) -> None:
         conn = HTTPSConnection(self.host, port=None)
         assert conn.port == 443
@@ -1004,6 +1057,66 @@ class BaseTestHTTPS(HTTPSHypercornDummyServerTestCase):
                 assert http_version == "h11"
                 assert http2_probe._values() == {}
 
+    def test_concurrent_requests(self, http_version: str) -> None:
+        with HTTPSConnectionPool(
+            self.host, self.port, ca_certs=DEFAULT_CA, maxsize=10, block=True
+        ) as pool:
+
+            def request(i: int) -> bytes:
+                r = pool.request("GET", "/echo_params", fields={"i": str(i)})
+                assert r.status == 200
+                return r.data
+
+            with concurrent.futures.ThreadPoolExecutor(10) as executor:
+                results = list(executor.map(request, range(50)))
+
+            assert results == [repr([("i", str(i))]).encode() for i in range(50)]
+            if http_version == "h2":
+                # All of the requests were multiplexed over a single socket.
+                assert len(pool._conn_sessions) == 1
+                assert http2_probe._values() == {(self.host, self.port): True}
+
+    def test_stream_response(self, http_version: str) -> None:
+        with HTTPSConnectionPool(
+            self.host, self.port, ca_certs=DEFAULT_CA, maxsize=1
+        ) as pool:
+            body = bytes(range(256)) * 50
+            r = pool.request("POST", "/echo", body=body, preload_content=False)
+            assert r.version_string == {"h11": "HTTP/1.1", "h2": "HTTP/2"}[http_version]
+            assert r.read(10) == body[:10]
+            assert b"".join(r.stream(1000)) == body[10:]
+            # The connection was released once the body was read.
+            assert pool.pool is not None and pool.pool.qsize() == 1
+
+            r = pool.request(
+                "GET",
+                "/encodingrequest",
+                headers={"accept-encoding": "gzip"},
+                preload_content=False,
+            )
+            assert b"".join(r.stream(4)) == b"hello, world!"
+
+    @pytest.mark.parametrize("h2_options", [{}, {"h2_connection_window_size": 2**24}])
+    def test_large_body(
+        self, http_version: str, h2_options: dict[str, typing.Any]
+    ) -> None:
+        # Larger than the default flow control windows and maximum frame size.
+        body = os.urandom(1_000_000)
+        with HTTPSConnectionPool(
+            self.host,
+            self.port,
+            ca_certs=DEFAULT_CA,
+            h2_initial_window_size=2**20 if h2_options else None,
+            **h2_options,
+        ) as pool:
+            r = pool.request("POST", "/echo", body=body)
+            assert r.data == body
+
+            r = pool.request(
+                "POST", "/echo", body=io.BytesIO(body), preload_content=False
+            )
+            assert b"".join(r.stream(2**16)) == body
+
     @pytest.mark.xfail(reason="Hypercorn always supports both HTTP/2 and HTTP/1.1")
     def test_http2_probe_result_failed(self, http_version: str) -> None:
         if http_version == "h2":
@@ -1350,3 +1463,40 @@ class TestHTTPS_IPV6SAN:
             r = https_pool.request("GET", "/")
             assert r.status == 200
             assert r.headers["server"] == f"hypercorn-{http_version}"
+
+
+class TestHTTP2Coalescing:
+    def test_coalesce_connections(
+        self, wildcard_san_server: ServerConfig, http_version: str
+    ) -> None:
+        class VirtualHostResolver(BaseResolver):
+            def getaddrinfo(
+                self,
+                host: str,
+                port: int,
+                family: socket.AddressFamily,
+                type: socket.SocketKind,
+            ) -> typing.Sequence[_TYPE_ADDRINFO]:
+                assert host.endswith(".example.com")
+                return socket.getaddrinfo(wildcard_san_server.host, port, family, type)
+
+        port = wildcard_san_server.port
+        with PoolManager(
+            http2_coalescing=True,
+            resolver=VirtualHostResolver(),
+            ca_certs=wildcard_san_server.ca_certs,
+        ) as http:
+            r1 = http.request(
+                "GET", f"https://a.example.com:{port}/echo_uri?a", preload_content=False
+            )
+            r2 = http.request(
+                "GET", f"https://b.example.com:{port}/echo_uri?b", preload_content=False
+            )
+            assert r2.headers["server"] == f"hypercorn-{http_version}"
+            assert isinstance(r1.connection, HTTPSConnection)
+            assert isinstance(r2.connection, HTTPSConnection)
+            # Over HTTP/2, both hosts share a single TCP connection.
+            assert (r1.connection.sock is r2.connection.sock) == (http_version == "h2")
+            assert r1.read() == b"/echo_uri?a"
+            assert r2.read() == b"/echo_uri?b"
+            assert len(http.pools) == 2
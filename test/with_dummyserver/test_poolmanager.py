@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import gzip
+import socket
 import typing
 from test import LONG_TIMEOUT
 from unittest import mock
@@ -16,8 +17,11 @@ from urllib3 import HTTPHeaderDict, HTTPResponse, request
 from urllib3.connectionpool import port_by_scheme
 from urllib3.exceptions import MaxRetryError, URLSchemeUnknown
 from urllib3.poolmanager import PoolManager
+from urllib3.util.resolver import _TYPE_ADDRINFO, BaseResolver, CachingResolver
 from urllib3.util.retry import Retry
 
+from ..port_helpers import find_unused_port
+
 
 class TestPoolManager(HypercornDummyServerTestCase):
     @classmethod
@@ -26,6 +30,85 @@ class TestPoolManager(HypercornDummyServerTestCase):
         cls.base_url = f"http://{cls.host}:{cls.port}"
         cls.base_url_alt = f"http://{cls.host_alt}:{cls.port}"
 
+    def test_custom_resolver(self) -> None:
+        target_host = self.host
+
+        class StaticResolver(BaseResolver):
+            def getaddrinfo(
+                self,
+                host: str,
+                port: int,
+                family: socket.AddressFamily,
+                type: socket.SocketKind,
+            ) -> typing.Sequence[_TYPE_ADDRINFO]:
+                assert host == "urllib3.invalid"
+                return socket.getaddrinfo(target_host, port, family, type)
+
+        with PoolManager(resolver=CachingResolver(StaticResolver())) as http:
+            r = http.request("GET", f"http://urllib3.invalid:{self.port}/")
+            assert r.status == 200
+            assert r.data == b"Dummy server!"
+
+    def test_prewarm(self) -> None:
+        with PoolManager(maxsize=2) as http:
+            urls = [self.base_url, f"{self.base_url}/echo", self.base_url_alt]
+            assert http.prewarm(urls, per_host=2) == 4
+            assert len(http.pools) == 2
+
+            r = http.request("GET", self.base_url)
+            assert r.status == 200
+            assert http.connection_from_url(self.base_url).num_connections == 2
+
+    def test_stats(self) -> None:
+        with PoolManager() as http:
+            http.request("GET", self.base_url)
+            http.request("GET", self.base_url)
+            http.request("GET", self.base_url_alt)
+
+            stats = http.stats
+            assert stats.requests == 3
+            assert stats.connections_opened == 2
+            assert stats.connections_reused == 1
+            assert stats.idle == 2
+            assert stats.checkout_wait_seconds.count == 3
+
+            # The counters of pools which are cleared or evicted are kept.
+            http.clear()
+            assert http.stats.requests == 3
+            assert http.stats.idle == 0
+
+        with PoolManager(num_pools=1) as http:
+            http.request("GET", self.base_url)
+            http.request("GET", self.base_url_alt)
+            assert len(http.pools) == 1
+            assert http.stats.requests == 2
+            assert http.stats.connections_opened == 2
+
+    def test_request_many(self) -> None:
+        with PoolManager(maxsize=2) as http:
+            requests: list[tuple[str, str] | dict[str, typing.Any]] = [
+                *(("GET", f"{self.base_url}/echo?i={i}") for i in range(10)),
+                *(("GET", f"{self.base_url_alt}/echo?i={i}") for i in range(10)),
+                {"method": "POST", "url": f"{self.base_url}/echo", "body": b"x"},
+                ("GET", f"http://{self.host}:{find_unused_port()}/"),
+            ]
+            results = {
+                result.position: result
+                for result in http.request_many(requests, max_concurrency=4)
+            }
+
+            assert sorted(results) == list(range(22))
+            for i in range(10):
+                assert results[i].result().data == f"i={i}".encode()
+                assert results[10 + i].result().data == f"i={i}".encode()
+            assert results[20].result().data == b"x"
+            assert isinstance(results[21].error, MaxRetryError)
+
+            # No more connections were opened than the pools can keep.
+            assert http.connection_from_url(self.base_url).num_connections <= 2
+            assert http.connection_from_url(self.base_url_alt).num_connections <= 2
+            assert http.stats.in_use == 0
+
     @pytest.mark.parametrize(
         "pool_manager_kwargs",
         ({}, {"retries": None}, {"retries": 1}, {"retries": Retry(1)}),
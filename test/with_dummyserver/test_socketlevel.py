@@ -37,12 +37,17 @@ from dummyserver.testcase import SocketDummyServerTestCase, consume_socket
 from urllib3 import (
     BaseHTTPResponse,
     HTTPConnectionPool,
+    HTTPResponse,
     HTTPSConnectionPool,
     ProxyManager,
     util,
 )
 from urllib3._collections import HTTPHeaderDict
-from urllib3.connection import HTTPConnection, _get_default_user_agent
+from urllib3.connection import (
+    HTTPConnection,
+    HTTPSConnection,
+    _get_default_user_agent,
+)
 from urllib3.connectionpool import _url_from_pool
 from urllib3.exceptions import (
     InsecureRequestWarning,
@@ -1981,6 +1986,50 @@ class TestSSL(SocketDummyServerTestCase):
         ) as pool:
             method(self, pool, content_length)
 
+    def test_tls_session_resumed_after_close(self) -> None:
+        if ssl_.IS_PYOPENSSL:
+            pytest.skip("pyOpenSSL sockets don't support session resumption")
+
+        server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        server_context.load_cert_chain(
+            DEFAULT_CERTS["certfile"], DEFAULT_CERTS["keyfile"]
+        )
+
+        def socket_handler(listener: socket.socket) -> None:
+            for _ in range(2):
+                sock = listener.accept()[0]
+                ssl_sock = server_context.wrap_socket(sock, server_side=True)
+                consume_socket(ssl_sock)
+                ssl_sock.sendall(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Length: 2\r\n"
+                    b"Connection: close\r\n"
+                    b"\r\n"
+                    b"Hi"
+                )
+                ssl_sock.close()
+
+        self._start_server(socket_handler)
+        cache = ssl_.TLSSessionCache()
+        with HTTPSConnectionPool(
+            self.host,
+            self.port,
+            ca_certs=DEFAULT_CA,
+            tls_session_cache=cache,
+            retries=False,
+        ) as pool:
+            r = pool.request("GET", "/")
+            assert r.data == b"Hi"
+            assert r.connection is None
+            assert len(cache) == 1
+
+            r = pool.request("GET", "/", preload_content=False)
+            assert isinstance(r.connection, HTTPSConnection)
+            assert r.connection.session_reused is True
+            assert r.read() == b"Hi"
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
 
 class TestErrorWrapping(SocketDummyServerTestCase):
     def test_bad_statusline(self) -> None:
@@ -2374,6 +2423,211 @@ class TestStream(SocketDummyServerTestCase):
 
             done_event.set()
 
+    @pytest.mark.parametrize("target", ["path", "fd", "file"])
+    def test_save_to(self, tmp_path: Path, target: str) -> None:
+        body = os.urandom(3 * 2**20 + 17)
+
+        def socket_handler(listener: socket.socket) -> None:
+            sock = listener.accept()[0]
+            for _ in range(2):
+                buf = b""
+                while not buf.endswith(b"\r\n\r\n"):
+                    buf += sock.recv(65536)
+                sock.sendall(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Length: %d\r\n"
+                    b"\r\n" % len(body) + body[:1000]
+                )
+                # The rest of the body arrives later.
+                time.sleep(0.05)
+                sock.sendall(body[1000:])
+            sock.close()
+
+        self._start_server(socket_handler)
+        path = tmp_path / "body"
+        with HTTPConnectionPool(self.host, self.port, retries=False) as pool:
+            for _ in range(2):
+                r = pool.request(
+                    "GET", "/", timeout=LONG_TIMEOUT, preload_content=False
+                )
+                assert isinstance(r, HTTPResponse)
+                if target == "path":
+                    assert r.save_to(path) == len(body)
+                elif target == "fd":
+                    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+                    try:
+                        os.write(fd, b"head")
+                        assert r.save_to(fd) == len(body)
+                    finally:
+                        os.close(fd)
+                else:
+                    with open(path, "wb") as f:
+                        assert r.save_to(f) == len(body)
+
+                expected = b"head" + body if target == "fd" else body
+                assert path.read_bytes() == expected
+                assert r.length_remaining == 0
+                assert r.tell() == len(body)
+            # The connection was released and reused.
+            assert pool.num_connections == 1
+            assert pool.pool is not None and pool.pool.qsize() == 1
+
+    def test_save_to_incomplete(self, tmp_path: Path) -> None:
+        def socket_handler(listener: socket.socket) -> None:
+            sock = listener.accept()[0]
+            consume_socket(sock)
+            sock.sendall(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Length: 100000\r\n"
+                b"\r\n" + b"x" * 50000
+            )
+            sock.close()
+
+        self._start_server(socket_handler)
+        with HTTPConnectionPool(self.host, self.port, retries=False) as pool:
+            r = pool.request("GET", "/", timeout=LONG_TIMEOUT, preload_content=False)
+            assert isinstance(r, HTTPResponse)
+            with pytest.raises(ProtocolError):
+                r.save_to(tmp_path / "body")
+            assert r.length_remaining == 50000
+
+    def test_save_to_gzip(self, tmp_path: Path) -> None:
+        body = b"x" * 296085
+        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        data = compress.compress(body) + compress.flush()
+
+        def socket_handler(listener: socket.socket) -> None:
+            sock = listener.accept()[0]
+            for _ in range(2):
+                consume_socket(sock)
+                sock.sendall(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Length: %d\r\n"
+                    b"Content-Encoding: gzip\r\n"
+                    b"\r\n" % len(data) + data
+                )
+            sock.close()
+
+        self._start_server(socket_handler)
+        path = tmp_path / "body"
+        with HTTPConnectionPool(self.host, self.port, retries=False) as pool:
+            r = pool.request("GET", "/", timeout=LONG_TIMEOUT, preload_content=False)
+            assert isinstance(r, HTTPResponse)
+            assert r.save_to(path) == len(body)
+            assert path.read_bytes() == body
+
+            r = pool.request("GET", "/", timeout=LONG_TIMEOUT, preload_content=False)
+            assert isinstance(r, HTTPResponse)
+            assert r.save_to(path, decode_content=False) == len(data)
+            assert path.read_bytes() == data
+
+    def test_read_ahead(self) -> None:
+        body = os.urandom(2**16) * 16
+        compress = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        data = compress.compress(body) + compress.flush()
+
+        def socket_handler(listener: socket.socket) -> None:
+            sock = listener.accept()[0]
+            for headers in (b"Content-Length: %d\r\n" % len(data), b""):
+                consume_socket(sock)
+                if not headers:
+                    headers = b"Transfer-Encoding: chunked\r\n"
+                    payload = b"%x\r\n%s\r\n0\r\n\r\n" % (len(data), data)
+                else:
+                    payload = data
+                sock.sendall(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Encoding: gzip\r\n" + headers + b"\r\n" + payload
+                )
+            sock.close()
+
+        self._start_server(socket_handler)
+        with HTTPConnectionPool(self.host, self.port, retries=False) as pool:
+            for _ in range(2):
+                r = pool.request(
+                    "GET",
+                    "/",
+                    timeout=LONG_TIMEOUT,
+                    preload_content=False,
+                    read_ahead=2**17,
+                )
+                assert isinstance(r, HTTPResponse)
+                assert r.read(10) == body[:10]
+                assert b"".join(r.stream(2**15)) == body[10:]
+                assert r._read_ahead is None
+                assert r.tell() == len(data)
+            # The connection was released and reused.
+            assert pool.num_connections == 1
+            assert pool.stats.in_use == 0
+
+    def test_read_ahead_close(self) -> None:
+        done_event = Event()
+        server_closed = Event()
+
+        def socket_handler(listener: socket.socket) -> None:
+            sock = listener.accept()[0]
+            consume_socket(sock)
+            sock.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 100\r\n\r\nfoo")
+            done_event.wait(LONG_TIMEOUT)
+            server_closed.set()
+            sock.close()
+
+        self._start_server(socket_handler)
+        with HTTPConnectionPool(self.host, self.port, retries=False) as pool:
+            r = pool.request(
+                "GET", "/", timeout=LONG_TIMEOUT, preload_content=False, read_ahead=10
+            )
+            assert isinstance(r, HTTPResponse)
+            assert r.read(3) == b"foo"
+            read_ahead = r._read_ahead
+            assert read_ahead is not None
+            # The worker waits for the rest of the body, closing the response
+            # interrupts it rather than the server closing the connection.
+            r.close()
+            assert r._read_ahead is None
+            assert not read_ahead._thread.is_alive()
+            assert not server_closed.is_set()
+            done_event.set()
+
+    def test_chunked_trailers(self) -> None:
+        done_event = Event()
+        rest_sent = Event()
+
+        def socket_handler(listener: socket.socket) -> None:
+            sock = listener.accept()[0]
+            consume_socket(sock)
+            sock.sendall(
+                b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                + b"1\r\nx\r\n" * 1000
+                + b"3\r\nfoo"
+            )
+            # The chunk which is still being received doesn't hold back the
+            # data which arrived already.
+            done_event.wait(LONG_TIMEOUT)
+            rest_sent.set()
+            sock.sendall(b"\r\n0\r\nX-Checksum: 42\r\n\r\n")
+            consume_socket(sock)
+            sock.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            sock.close()
+
+        self._start_server(socket_handler)
+        with HTTPConnectionPool(self.host, self.port, retries=False) as pool:
+            r = pool.request("GET", "/", timeout=LONG_TIMEOUT, preload_content=False)
+            assert isinstance(r, HTTPResponse)
+            data = b""
+            while len(data) < 1003:
+                data += r.read1()
+            assert not rest_sent.is_set()
+            done_event.set()
+            assert data == b"x" * 1000 + b"foo"
+            assert r.read() == b""
+            assert r.trailers == {"X-Checksum": "42"}
+
+            # The connection was released and reused.
+            r = pool.request("GET", "/", timeout=LONG_TIMEOUT)
+            assert r.data == b"ok"
+            assert pool.num_connections == 1
+
 
 class TestBadContentLength(SocketDummyServerTestCase):
     def test_enforce_content_length_get(self) -> None: